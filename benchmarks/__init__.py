@@ -0,0 +1 @@
+"""Reproducible offline benchmarks for DataPulse hot paths; see :mod:`benchmarks.run`."""
@@ -0,0 +1,155 @@
+"""Seeded synthetic corpora for the offline benchmarks.
+
+Items mix five languages, a handful of recurring entities, several source
+types and review states, and roughly one near-duplicate in ten, so dedup,
+clustering and scoring do the same kind of work they do on a real inbox.
+The same ``(size, seed)`` always yields the same corpus.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from datapulse.core.models import DataPulseItem, SourceType
+
+DUPLICATE_RATIO = 0.1
+
+ENTITIES = (
+    "OpenAI", "Anthropic", "NVIDIA", "TSMC", "DeepSeek", "Mistral", "Apple", "Tesla",
+    "Alibaba", "ByteDance", "Samsung", "Siemens", "SAP", "Toyota", "Sony", "Telefonica",
+)
+
+TOPICS = (
+    "chip export controls", "model launch", "earnings call", "data center expansion",
+    "open-weight release", "safety evaluation", "supply chain delay", "pricing change",
+    "regulatory filing", "research paper", "partnership deal", "security incident",
+)
+
+TEMPLATES = {
+    "en": (
+        "{entity} announced a {topic} today, and analysts expect {other} to respond within weeks.",
+        "Sources close to {entity} say the {topic} was accelerated after pressure from {other}.",
+        "A new report links the {topic} at {entity} to earlier moves by {other}.",
+    ),
+    "zh": (
+        "{entity} 今天宣布了{topic}，分析人士预计 {other} 将在数周内作出回应。",
+        "据知情人士透露，{entity} 的{topic}因 {other} 的压力而提前。",
+    ),
+    "ja": (
+        "{entity} は本日 {topic} を発表し、アナリストは {other} の対応を予想している。",
+        "関係者によると、{entity} の {topic} は {other} の動きを受けて前倒しされた。",
+    ),
+    "es": (
+        "{entity} anunció hoy un {topic} y los analistas esperan que {other} responda pronto.",
+        "Fuentes cercanas a {entity} dicen que el {topic} se adelantó por la presión de {other}.",
+    ),
+    "de": (
+        "{entity} hat heute einen {topic} angekündigt; Analysten erwarten eine Reaktion von {other}.",
+        "Laut Insidern wurde der {topic} bei {entity} wegen {other} vorgezogen.",
+    ),
+}
+
+SOURCES = (
+    (SourceType.GENERIC, "Example News", "news.example.com", "generic"),
+    (SourceType.GENERIC, "Tech Daily", "techdaily.example.org", "generic"),
+    (SourceType.RSS, "Industry Feed", "feeds.example.net", "rss"),
+    (SourceType.TWITTER, "@marketwatcher", "x.com", "twitter"),
+    (SourceType.REDDIT, "r/technology", "reddit.com", "reddit"),
+    (SourceType.HACKERNEWS, "Hacker News", "news.ycombinator.com", "hackernews"),
+)
+
+REVIEW_STATES = ("new", "new", "new", "triaged", "verified", "escalated", "ignored")
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+
+
+def parse_size(label: str) -> int:
+    """Accept ``1k`` / ``10k`` / ``100k`` or a plain integer."""
+    text = str(label).strip().lower()
+    if text in SIZES:
+        return SIZES[text]
+    if text.endswith("k"):
+        return int(float(text[:-1]) * 1_000)
+    return int(text)
+
+
+def _body(rng: random.Random, language: str, entity: str, other: str, topic: str, sentences: int) -> str:
+    templates = TEMPLATES[language]
+    return " ".join(
+        rng.choice(templates).format(entity=entity, other=other, topic=topic) for _ in range(sentences)
+    )
+
+
+def generate_corpus(size: int, *, seed: int = 7, now: datetime | None = None) -> list[DataPulseItem]:
+    """Build ``size`` items; about :data:`DUPLICATE_RATIO` of them re-post an earlier item's content."""
+    rng = random.Random(seed)
+    anchor = (now or datetime.now(timezone.utc)).replace(microsecond=0)
+    languages = tuple(TEMPLATES)
+    items: list[DataPulseItem] = []
+    for index in range(size):
+        source_type, source_name, host, parser = rng.choice(SOURCES)
+        fetched_at = (anchor - timedelta(minutes=rng.randint(0, 60 * 24 * 7))).isoformat()
+        if items and rng.random() < DUPLICATE_RATIO:
+            original = rng.choice(items)
+            title = original.title
+            content = original.content
+            language = original.language
+            entity = str(original.extra.get("benchmark_entity", ""))
+        else:
+            language = rng.choice(languages)
+            entity, other = rng.sample(ENTITIES, 2)
+            topic = rng.choice(TOPICS)
+            title = f"{entity}: {topic} ({index})"
+            content = _body(rng, language, entity, other, topic, rng.randint(3, 12))
+        items.append(
+            DataPulseItem(
+                source_type=source_type,
+                source_name=source_name,
+                title=title,
+                content=content,
+                url=f"https://{host}/story/{index}",
+                parser=parser,
+                fetched_at=fetched_at,
+                confidence=round(rng.uniform(0.4, 0.98), 3),
+                language=language,
+                tags=[entity.lower()] if entity else [],
+                review_state=rng.choice(REVIEW_STATES),
+                extra={"benchmark_entity": entity},
+            )
+        )
+    return items
+
+
+def catalog_payload() -> dict[str, Any]:
+    """A source catalog whose ``default`` subscription covers half of :data:`SOURCES`."""
+    sources = [
+        {
+            "id": f"bench_{index}",
+            "name": source_name,
+            "source_type": source_type.value,
+            "config": {"url": f"https://{host}/"},
+            "match": {"domain": host},
+        }
+        for index, (source_type, source_name, host, _parser) in enumerate(SOURCES)
+    ]
+    return {
+        "version": 1,
+        "sources": sources,
+        "subscriptions": {"default": [row["id"] for row in sources[::2]]},
+        "packs": [],
+    }
+
+
+def alert_mission_payload() -> dict[str, Any]:
+    """Watch mission fields with one rule per matcher family."""
+    return {
+        "name": "Benchmark Watch",
+        "query": "model launch",
+        "alert_rules": [
+            {"name": "confident", "min_confidence": 0.8, "min_results": 1},
+            {"name": "entities", "keyword_any": ["OpenAI", "NVIDIA", "DeepSeek"], "max_age_minutes": 60 * 24},
+            {"name": "launch", "keyword_all": ["launch"], "domains": ["news.example.com", "x.com"]},
+        ],
+    }
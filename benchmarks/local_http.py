@@ -0,0 +1,116 @@
+"""Loopback HTTP fixture for benchmarking ``read_batch`` without the network.
+
+:class:`LocalPageServer` serves deterministic article pages on 127.0.0.1 and
+:class:`LocalPageCollector` fetches and parses them, so a batch read exercises
+the router, collector span, inbox add/save and ops counters end to end. The
+collector is installed as the reader's only parser: the stock collectors
+refuse loopback URLs by design.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from datapulse.collectors.base import BaseCollector, ParseResult
+from datapulse.core.models import SourceType
+
+from .corpus import ENTITIES, TEMPLATES, TOPICS
+
+_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.S)
+_PARAGRAPH_RE = re.compile(r"<p>(.*?)</p>", re.S)
+# Loopback only: never route through HTTP(S)_PROXY from the environment.
+_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+
+def render_page(page_id: int) -> str:
+    entity = ENTITIES[page_id % len(ENTITIES)]
+    other = ENTITIES[(page_id * 7 + 3) % len(ENTITIES)]
+    topic = TOPICS[page_id % len(TOPICS)]
+    languages = tuple(TEMPLATES)
+    templates = TEMPLATES[languages[page_id % len(languages)]]
+    paragraphs = "".join(
+        f"<p>{html.escape(templates[offset % len(templates)].format(entity=entity, other=other, topic=topic))}</p>"
+        for offset in range(8)
+    )
+    title = html.escape(f"{entity}: {topic} #{page_id}")
+    return f"<html><head><title>{title}</title></head><body><article>{paragraphs}</article></body></html>"
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        match = re.fullmatch(r"/page/(\d+)", self.path)
+        if match is None:
+            self.send_error(404)
+            return
+        body = render_page(int(match.group(1))).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - http.server signature
+        return
+
+
+class LocalPageServer:
+    """``with LocalPageServer() as server: server.url(3)`` — a threaded loopback page server."""
+
+    def __init__(self) -> None:
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="datapulse-bench-http", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, page_id: int) -> str:
+        return f"{self.base_url}/page/{page_id}"
+
+    def __enter__(self) -> LocalPageServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+
+
+class LocalPageCollector(BaseCollector):
+    """Fetches pages from a :class:`LocalPageServer`; handles nothing else."""
+
+    name = "benchmark_local"
+    source_type = SourceType.GENERIC
+    tier = 0
+    timeout = 10
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+
+    def can_handle(self, url: str) -> bool:
+        return url.startswith(self.base_url + "/")
+
+    def parse(self, url: str) -> ParseResult:
+        try:
+            with _OPENER.open(url, timeout=self.timeout) as response:
+                page = response.read().decode("utf-8")
+        except OSError as exc:
+            return ParseResult.failure(url, str(exc))
+        title_match = _TITLE_RE.search(page)
+        content = "\n\n".join(html.unescape(text) for text in _PARAGRAPH_RE.findall(page))
+        return ParseResult(
+            url=url,
+            title=html.unescape(title_match.group(1)) if title_match else url,
+            content=content,
+            author="benchmark",
+            source_type=self.source_type,
+            excerpt=self._safe_excerpt(content),
+            tags=["benchmark"],
+        )
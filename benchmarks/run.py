@@ -0,0 +1,365 @@
+"""Offline benchmark runner: ``python -m benchmarks --sizes 1k,10k --output bench.json``.
+
+Every case runs against a seeded synthetic corpus (see :mod:`benchmarks.corpus`)
+inside a throwaway directory: all ``DATAPULSE_*`` store paths point there for
+the duration of the run and are restored afterwards, markdown projection is
+off and inbox retention is lifted so the corpus survives pruning. Each case
+has an untimed ``prepare`` step and a timed body; the runner records
+min/median/max milliseconds per case and corpus size.
+
+``--compare baseline.json`` diffs the fresh results against an earlier run and
+exits with status 1 when any case's median grew by more than ``--threshold``
+(and by at least ``--min-delta-ms``, so sub-millisecond jitter never fails).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from datapulse.core.alerts import evaluate_watch_alerts
+from datapulse.core.models import DataPulseItem
+from datapulse.core.scoring import rank_items
+from datapulse.core.storage import UnifiedInbox
+from datapulse.core.story import build_story_clusters
+from datapulse.core.watchlist import WatchMission
+from datapulse.reader import DataPulseReader
+
+from .corpus import alert_mission_payload, catalog_payload, generate_corpus, parse_size
+from .local_http import LocalPageCollector, LocalPageServer
+
+RESULT_VERSION = 1
+DEFAULT_SIZES = "1k,10k"
+DEFAULT_REPEAT = 3
+DEFAULT_BATCH_URLS = 20
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MIN_DELTA_MS = 1.0
+
+_ISOLATED_PATHS = {
+    "DATAPULSE_MEMORY_DIR": "memory",
+    "DATAPULSE_WATCHLIST_PATH": "watchlist.json",
+    "DATAPULSE_RUN_HISTORY_DIR": "watchlist_runs",
+    "DATAPULSE_ALERTS_PATH": "alerts.json",
+    "DATAPULSE_ALERTS_MARKDOWN_PATH": "alerts.md",
+    "DATAPULSE_ALERT_ROUTING_PATH": "alert-routes.json",
+    "DATAPULSE_STORIES_PATH": "stories.json",
+    "DATAPULSE_REPORTS_PATH": "reports.json",
+    "DATAPULSE_SOURCE_CATALOG": "catalog.json",
+    "DATAPULSE_WATCH_STATUS_PATH": "watch-status.json",
+    "DATAPULSE_WATCH_STATUS_HTML": "watch-status.html",
+    "DATAPULSE_MARKDOWN_PATH": "markdown",
+    "DATAPULSE_MODELBUS_VALIDATION_COUNTER_PATH": "modelbus-counter.json",
+}
+
+
+@contextmanager
+def isolated_environment(workdir: Path) -> Iterator[None]:
+    """Point every store at ``workdir`` and lift retention; restores ``os.environ`` on exit."""
+    overrides = {name: str(workdir / relative) for name, relative in _ISOLATED_PATHS.items()}
+    overrides.update(
+        {
+            "DATAPULSE_MAX_INBOX": "10000000",
+            "DATAPULSE_KEEP_DAYS": "36500",
+            "DATAPULSE_MARKDOWN_PROJECTION": "disabled",
+        }
+    )
+    saved = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+@dataclass
+class BenchContext:
+    """Per-size fixtures shared by the cases; built once, outside the timings."""
+
+    workdir: Path
+    items: list[DataPulseItem]
+    inbox_path: Path
+    reader: DataPulseReader
+    server: LocalPageServer
+    batch_urls: int
+    duplicate_ids: list[str] = field(default_factory=list)
+
+    def scratch(self, name: str) -> Path:
+        path = self.workdir / "scratch" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.unlink(missing_ok=True)
+        return path
+
+
+Prepared = Callable[[], Any]
+Case = Callable[[BenchContext], Prepared]
+
+
+def _inbox_load(ctx: BenchContext) -> Prepared:
+    return lambda: UnifiedInbox(str(ctx.inbox_path))
+
+
+def _inbox_save(ctx: BenchContext) -> Prepared:
+    inbox = UnifiedInbox(str(ctx.inbox_path))
+    inbox.path = ctx.scratch("inbox-save.json")
+    return inbox.save
+
+
+def _inbox_add(ctx: BenchContext) -> Prepared:
+    inbox = UnifiedInbox(str(ctx.scratch("inbox-add.json")))
+
+    def run() -> None:
+        for item in ctx.items:
+            inbox.add(item)
+
+    return run
+
+
+def _scoring_rank(ctx: BenchContext) -> Prepared:
+    authority = ctx.reader.catalog.build_authority_map()
+    return lambda: rank_items(ctx.items, authority_map=authority)
+
+
+def _story_cluster(ctx: BenchContext) -> Prepared:
+    return lambda: build_story_clusters(ctx.items, max_stories=20)
+
+
+def _triage_stats(ctx: BenchContext) -> Prepared:
+    return lambda: ctx.reader.triage.stats()
+
+
+def _triage_explain_duplicate(ctx: BenchContext) -> Prepared:
+    def run() -> None:
+        for item_id in ctx.duplicate_ids:
+            ctx.reader.triage.explain_duplicate(item_id)
+
+    return run
+
+
+def _digest_build(ctx: BenchContext) -> Prepared:
+    return lambda: ctx.reader.build_digest(items=ctx.items, top_n=3, secondary_n=7)
+
+
+def _catalog_filter(ctx: BenchContext) -> Prepared:
+    return lambda: ctx.reader.catalog.filter_by_subscription(ctx.items, profile="default")
+
+
+def _alerts_evaluate(ctx: BenchContext) -> Prepared:
+    mission = WatchMission.from_dict(alert_mission_payload())
+    return lambda: evaluate_watch_alerts(mission, ctx.items)
+
+
+def _reader_read_batch(ctx: BenchContext) -> Prepared:
+    # A fresh copy of the seeded inbox per repeat: every read saves the whole inbox.
+    inbox_copy = ctx.scratch("inbox-read-batch.json")
+    shutil.copyfile(ctx.inbox_path, inbox_copy)
+    ctx.reader.inbox = UnifiedInbox(str(inbox_copy))
+    ctx.reader.triage.inbox = ctx.reader.inbox
+    urls = [ctx.server.url(page_id) for page_id in range(ctx.batch_urls)]
+
+    def run() -> None:
+        results = asyncio.run(ctx.reader.read_batch(urls))
+        if len(results) != len(urls):
+            raise RuntimeError(f"read_batch returned {len(results)} of {len(urls)} items")
+
+    return run
+
+
+CASES: dict[str, Case] = {
+    "inbox.load": _inbox_load,
+    "inbox.save": _inbox_save,
+    "inbox.add": _inbox_add,
+    "scoring.rank": _scoring_rank,
+    "story.cluster": _story_cluster,
+    "triage.stats": _triage_stats,
+    "triage.explain_duplicate": _triage_explain_duplicate,
+    "digest.build": _digest_build,
+    "catalog.filter_by_subscription": _catalog_filter,
+    "alerts.evaluate": _alerts_evaluate,
+    "reader.read_batch": _reader_read_batch,
+}
+
+
+def _timings(case: Case, ctx: BenchContext, repeat: int) -> dict[str, Any]:
+    samples: list[float] = []
+    for _ in range(max(1, repeat)):
+        body = case(ctx)
+        started = time.perf_counter()
+        body()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return {
+        "runs": len(samples),
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def _build_context(workdir: Path, size: int, *, seed: int, batch_urls: int, server: LocalPageServer) -> BenchContext:
+    items = generate_corpus(size, seed=seed)
+    inbox_path = workdir / "inbox.json"
+    inbox_path.write_text(json.dumps([item.to_dict() for item in items], ensure_ascii=False), encoding="utf-8")
+    (workdir / "catalog.json").write_text(json.dumps(catalog_payload()), encoding="utf-8")
+    reader = DataPulseReader(inbox_path=str(inbox_path))
+    reader.router.parsers = [LocalPageCollector(server.base_url)]
+    seen: set[str] = set()
+    duplicate_ids: list[str] = []
+    for item in items:
+        if item.content in seen:
+            duplicate_ids.append(item.id)
+        seen.add(item.content)
+    return BenchContext(
+        workdir=workdir,
+        items=items,
+        inbox_path=inbox_path,
+        reader=reader,
+        server=server,
+        batch_urls=batch_urls,
+        duplicate_ids=duplicate_ids[:3],
+    )
+
+
+def run_suite(
+    sizes: list[str],
+    *,
+    repeat: int = DEFAULT_REPEAT,
+    seed: int = 7,
+    only: list[str] | None = None,
+    batch_urls: int = DEFAULT_BATCH_URLS,
+    log: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Run the selected cases for every size and return the result document."""
+    selected = [name for name in CASES if not only or any(name.startswith(prefix) for prefix in only)]
+    if not selected:
+        raise ValueError(f"No benchmark cases match {only}; known cases: {', '.join(CASES)}")
+    results: dict[str, dict[str, Any]] = {}
+    with LocalPageServer() as server:
+        for label in sizes:
+            size = parse_size(label)
+            with tempfile.TemporaryDirectory(prefix="datapulse-bench-") as tmp, isolated_environment(Path(tmp)):
+                ctx = _build_context(Path(tmp), size, seed=seed, batch_urls=batch_urls, server=server)
+                per_size: dict[str, Any] = {}
+                for name in selected:
+                    per_size[name] = _timings(CASES[name], ctx, repeat)
+                    if log is not None:
+                        log(f"{label:>6} {name:<32} median {per_size[name]['median_ms']:>10.3f} ms")
+                results[label] = per_size
+    return {
+        "version": RESULT_VERSION,
+        "created_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+        "batch_urls": batch_urls,
+        "results": results,
+    }
+
+
+def compare_results(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+) -> list[dict[str, Any]]:
+    """One row per case present in both documents; ``regressed`` marks medians beyond the threshold."""
+    rows: list[dict[str, Any]] = []
+    baseline_results = baseline.get("results", {}) if isinstance(baseline, dict) else {}
+    for size, cases in current.get("results", {}).items():
+        for name, timing in cases.items():
+            previous = baseline_results.get(size, {}).get(name)
+            if not isinstance(previous, dict):
+                continue
+            before = float(previous.get("median_ms", 0.0) or 0.0)
+            after = float(timing.get("median_ms", 0.0) or 0.0)
+            ratio = after / before if before > 0 else None
+            rows.append(
+                {
+                    "size": size,
+                    "case": name,
+                    "baseline_ms": before,
+                    "current_ms": after,
+                    "ratio": round(ratio, 3) if ratio is not None else None,
+                    "regressed": ratio is not None and ratio > 1.0 + threshold and after - before >= min_delta_ms,
+                }
+            )
+    return rows
+
+
+def _format_comparison(rows: list[dict[str, Any]]) -> str:
+    lines = [f"{'size':>6} {'case':<32} {'baseline':>11} {'current':>11} {'ratio':>7}"]
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        flag = "  REGRESSION" if row["regressed"] else ""
+        lines.append(
+            f"{row['size']:>6} {row['case']:<32} {row['baseline_ms']:>9.3f}ms {row['current_ms']:>9.3f}ms {ratio:>7}{flag}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="DataPulse offline hot-path benchmarks")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Comma-separated corpus sizes, e.g. 1k,10k,100k")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per case")
+    parser.add_argument("--seed", type=int, default=7, help="Corpus seed")
+    parser.add_argument("--only", default="", help="Comma-separated case name prefixes, e.g. inbox,story")
+    parser.add_argument("--batch-urls", type=int, default=DEFAULT_BATCH_URLS, help="URLs per read_batch run")
+    parser.add_argument("--output", default="", help="Write the result JSON here")
+    parser.add_argument("--compare", default="", help="Baseline result JSON to diff against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed median growth (0.2 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS, help="Ignore smaller slowdowns")
+    parser.add_argument("--list", action="store_true", help="List case names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+
+    sizes = [part.strip() for part in args.sizes.split(",") if part.strip()]
+    only = [part.strip() for part in args.only.split(",") if part.strip()] or None
+    try:
+        document = run_suite(
+            sizes,
+            repeat=args.repeat,
+            seed=args.seed,
+            only=only,
+            batch_urls=args.batch_urls,
+            log=lambda line: print(line, file=sys.stderr),
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.output:
+        output = Path(args.output).expanduser()
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    else:
+        print(json.dumps(document, indent=2))
+
+    if not args.compare:
+        return 0
+    baseline = json.loads(Path(args.compare).expanduser().read_text(encoding="utf-8"))
+    rows = compare_results(document, baseline, threshold=args.threshold, min_delta_ms=args.min_delta_ms)
+    print(_format_comparison(rows), file=sys.stderr)
+    return 1 if any(row["regressed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,14 +1,43 @@
 """DataPulse Intelligence Hub."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from ._runtime import ensure_supported_python
 
 ensure_supported_python()
 
-from .core import DataPulseItem, MediaType, SourceType  # noqa: E402
 from .core.logging_config import configure_logging  # noqa: E402
-from .reader import DataPulseReader  # noqa: E402
+
+if TYPE_CHECKING:
+    from .core.models import DataPulseItem, MediaType, SourceType
+    from .reader import DataPulseReader
 
 configure_logging()
 
+# Resolved on first access (PEP 562) so `datapulse --version` and single MCP
+# calls do not pay for the reader, every store, and all collectors up front.
+_LAZY_EXPORTS: dict[str, str] = {
+    "DataPulseReader": ".reader",
+    "DataPulseItem": ".core.models",
+    "SourceType": ".core.models",
+    "MediaType": ".core.models",
+}
+
 __all__ = ["DataPulseReader", "DataPulseItem", "SourceType", "MediaType"]
 __version__ = "0.8.0"
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
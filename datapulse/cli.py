@@ -11,14 +11,12 @@ import shlex
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from typing import TYPE_CHECKING, Any, Iterable
 
 import datapulse
 from datapulse.core.config import SearchGatewayConfig
+from datapulse.core.filestore import atomic_write_text
 from datapulse.core.security import get_secret, mask_secret
-from datapulse.reader import DataPulseReader
 from datapulse.surface_capabilities import (
     build_runtime_surface_introspection,
     build_surface_capability_projection,
@@ -27,12 +25,31 @@ from datapulse.surface_capabilities import (
 )
 from datapulse.tools.session import login_platform, supported_platforms
 
+if TYPE_CHECKING:
+    from datapulse.reader import DataPulseReader
+
 _GITHUB_RELEASES_API = "https://api.github.com/repos/sunyifei83/DataPulse/releases/latest"
 _GITHUB_REPO = "https://github.com/sunyifei83/DataPulse"
 _AI_SURFACE_PRECHECK_CHOICES = governed_ai_surface_ids()
 _SURFACE_CAPABILITY_SURFACES = supported_surface_ids()
 
 
+def __getattr__(name: str) -> Any:
+    # DataPulseReader pulls in every store, report and story module; resolve it on first use
+    # so `datapulse --version` and other short commands skip that import entirely.
+    if name == "DataPulseReader":
+        from datapulse.reader import DataPulseReader
+
+        globals()["DataPulseReader"] = DataPulseReader
+        return DataPulseReader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _reader_class() -> type[DataPulseReader]:
+    # Attribute lookup (not a bare global) so tests can monkeypatch cli.DataPulseReader.
+    return sys.modules[__name__].DataPulseReader
+
+
 def _print_list(items, limit: int = 20):
     if not items:
         print("📦 Inbox is empty")
@@ -140,6 +157,22 @@ def _print_json_payload(payload: Any) -> None:
     print(json.dumps(payload, ensure_ascii=False, indent=2))
 
 
+def _write_stream(chunks: Iterable[str], output_path: str | None = None) -> None:
+    """Write streamed export chunks to a file (when given) or stdout without buffering the document."""
+    if output_path:
+        path = Path(output_path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+        print(f"wrote: {path}", file=sys.stderr)
+        return
+    for chunk in chunks:
+        sys.stdout.write(chunk)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
 def _print_ops_overview(payload):
     collector_summary = payload.get("collector_summary", {}) if isinstance(payload, dict) else {}
     collector_tiers = payload.get("collector_tiers", {}) if isinstance(payload, dict) else {}
@@ -815,7 +848,7 @@ def _collect_fix_commands(collector_name: str, setup_hint: str) -> list[str]:
     return out
 
 
-def _print_doctor_report(report: dict[str, list[dict[str, str | bool]]]) -> None:
+def _print_doctor_report(report: dict[str, list[dict[str, str | bool | float]]]) -> None:
     tier_labels = {
         "tier_0": "Zero-config",
         "tier_1": "Network / Free",
@@ -970,6 +1003,9 @@ def _version_tuple(version: str) -> tuple[int, ...]:
 
 
 def _fetch_latest_release_tag() -> tuple[str | None, str | None]:
+    from urllib.error import HTTPError, URLError
+    from urllib.request import Request, urlopen
+
     try:
         request = Request(
             _GITHUB_RELEASES_API,
@@ -1210,11 +1246,11 @@ def _print_skill_contract() -> None:
 
 
 def _print_troubleshoot_report(
-    report: dict[str, list[dict[str, str | bool]]],
+    report: dict[str, list[dict[str, str | bool | float]]],
     target: str | None = None,
 ) -> None:
     target_norm = (target or "").strip().lower()
-    filtered: list[tuple[str, dict[str, str | bool]]] = []
+    filtered: list[tuple[str, dict[str, str | bool | float]]] = []
     found_target = False
 
     for tier_key, entries in report.items():
@@ -1386,6 +1422,13 @@ def main() -> None:
     management_group.add_argument("--query-feed", action="store_true", help="Print JSON feed output")
     management_group.add_argument("--query-rss", action="store_true", help="Print RSS feed output")
     management_group.add_argument("--query-atom", action="store_true", help="Print Atom 1.0 feed output")
+    management_group.add_argument(
+        "--feed-format",
+        default="json",
+        choices=["json", "jsonl"],
+        help="Stream format for --feed-bundle/--query-feed (jsonl = header record + one item per line)",
+    )
+    management_group.add_argument("--feed-output", metavar="PATH", help="Stream feed/bundle output to a file instead of stdout")
     management_group.add_argument("--digest", action="store_true", help="Build curated digest")
     management_group.add_argument("--emit-digest-package", action="store_true", help="Export minimal office-ready digest package")
     management_group.add_argument("--prepare-digest-payload", action="store_true", help="Export deterministic digest preparation payload")
@@ -1633,58 +1676,61 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    reader = DataPulseReader()
+    if not args.list:
+        # Commands that never touch the stores run before DataPulseReader (and its import) is loaded.
+        if args.login:
+            try:
+                path = login_platform(args.login)
+                print(f"✅ Saved {args.login} session: {path}")
+            except KeyboardInterrupt:
+                print("⚠️ Login cancelled.")
+            except Exception as exc:
+                print(f"❌ Login failed: {exc}")
+            return
+
+        if not args.doctor and args.troubleshoot is None:
+            if args.self_update:
+                _run_self_update()
+                return
+
+            if args.skill_contract:
+                _print_skill_contract()
+                return
+
+            if args.check_update:
+                _print_update_status()
+                return
+
+            if args.version:
+                _print_version()
+                return
+
+            if args.config_check:
+                _print_config_check()
+                return
+
+    reader = _reader_class()()
 
     if args.list:
         _print_list(reader.list_memory(limit=args.limit, min_confidence=args.min_confidence), limit=args.limit)
         return
 
-    if args.login:
-        try:
-            path = login_platform(args.login)
-            print(f"✅ Saved {args.login} session: {path}")
-        except KeyboardInterrupt:
-            print("⚠️ Login cancelled.")
-        except Exception as exc:
-            print(f"❌ Login failed: {exc}")
-        return
-
     if args.doctor:
-        report = reader.doctor()
+        report = reader.doctor(fresh=True)
         _print_doctor_report(report)
         return
 
     if args.troubleshoot is not None:
-        report = reader.doctor()
+        report = reader.doctor(fresh=True)
         target = args.troubleshoot.strip() if isinstance(args.troubleshoot, str) else None
         target = target or None
         _print_troubleshoot_report(report, target=target)
         return
 
-    if args.self_update:
-        _run_self_update()
-        return
-
-    if args.skill_contract:
-        _print_skill_contract()
-        return
-
-    if args.check_update:
-        _print_update_status()
-        return
-
-    if args.version:
-        _print_version()
-        return
-
-    if args.config_check:
-        _print_config_check()
-        return
-
     if args.clear:
         inbox_path = reader.inbox.path
         if inbox_path.exists():
-            inbox_path.write_text("[]", encoding="utf-8")
+            atomic_write_text(inbox_path, "[]")
             print(f"✅ Cleared inbox: {inbox_path}")
         else:
             print("ℹ️ Inbox already empty")
@@ -2420,44 +2466,54 @@ def main() -> None:
         return
 
     if args.feed_bundle:
-        bundle_payload = reader.build_feed_bundle(
-            profile=args.source_profile,
-            source_ids=_normalize_csv_ids(args.source_ids),
-            limit=args.limit,
-            min_confidence=args.min_confidence,
+        _write_stream(
+            reader.iter_feed_bundle(
+                profile=args.source_profile,
+                source_ids=_normalize_csv_ids(args.source_ids),
+                limit=args.limit,
+                min_confidence=args.min_confidence,
+                output_format=args.feed_format,
+                indent=2,
+            ),
+            args.feed_output,
         )
-        print(json.dumps(bundle_payload, ensure_ascii=False, indent=2))
         return
 
     if args.query_feed:
-        feed_payload = reader.build_json_feed(
-            profile=args.source_profile,
-            source_ids=_normalize_csv_ids(args.source_ids),
-            limit=args.limit,
-            min_confidence=args.min_confidence,
+        _write_stream(
+            reader.iter_json_feed(
+                profile=args.source_profile,
+                source_ids=_normalize_csv_ids(args.source_ids),
+                limit=args.limit,
+                min_confidence=args.min_confidence,
+                output_format=args.feed_format,
+                indent=2,
+            ),
+            args.feed_output,
         )
-        print(json.dumps(feed_payload, ensure_ascii=False, indent=2))
         return
 
     if args.query_rss:
-        print(
-            reader.build_rss_feed(
+        _write_stream(
+            reader.iter_rss_feed(
                 profile=args.source_profile,
                 source_ids=_normalize_csv_ids(args.source_ids),
                 limit=args.limit,
                 min_confidence=args.min_confidence,
-            )
+            ),
+            args.feed_output,
         )
         return
 
     if args.query_atom:
-        print(
-            reader.build_atom_feed(
+        _write_stream(
+            reader.iter_atom_feed(
                 profile=args.source_profile,
                 source_ids=_normalize_csv_ids(args.source_ids),
                 limit=args.limit,
                 min_confidence=args.min_confidence,
-            )
+            ),
+            args.feed_output,
         )
         return
 
@@ -1,27 +1,58 @@
-"""Collector exports."""
-
-from .arxiv import ArxivCollector
-from .base import BaseCollector, ParseResult
-from .bilibili import BilibiliCollector
-from .generic import GenericCollector
-from .github import GitHubCollector
-from .hackernews import HackerNewsCollector
-from .jina import JinaCollector
-from .native_bridge import NativeBridgeCollector
-from .reddit import RedditCollector
-from .rss import RssCollector
-from .telegram import TelegramCollector
-from .trending import TrendingCollector
-from .twitter import TwitterCollector
-from .wechat import WeChatCollector
-from .weibo import WeiboCollector
-from .xhs import XiaohongshuCollector
-from .youtube import YouTubeCollector
-
-try:
+"""Collector exports.
+
+Collectors resolve lazily (PEP 562): each one drags in its own HTTP/HTML/feed
+stack, so a collector module is only imported when its class is first used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .arxiv import ArxivCollector
+    from .base import BaseCollector, ParseResult
+    from .bilibili import BilibiliCollector
     from .browser import BrowserCollector
-except ImportError:
-    BrowserCollector = None  # type: ignore[assignment,misc]
+    from .generic import GenericCollector
+    from .github import GitHubCollector
+    from .hackernews import HackerNewsCollector
+    from .jina import JinaCollector
+    from .native_bridge import NativeBridgeCollector
+    from .reddit import RedditCollector
+    from .rss import RssCollector
+    from .telegram import TelegramCollector
+    from .trending import TrendingCollector
+    from .twitter import TwitterCollector
+    from .wechat import WeChatCollector
+    from .weibo import WeiboCollector
+    from .xhs import XiaohongshuCollector
+    from .youtube import YouTubeCollector
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "BaseCollector": ".base",
+    "ParseResult": ".base",
+    "ArxivCollector": ".arxiv",
+    "TwitterCollector": ".twitter",
+    "RedditCollector": ".reddit",
+    "YouTubeCollector": ".youtube",
+    "BilibiliCollector": ".bilibili",
+    "RssCollector": ".rss",
+    "TelegramCollector": ".telegram",
+    "WeChatCollector": ".wechat",
+    "WeiboCollector": ".weibo",
+    "XiaohongshuCollector": ".xhs",
+    "HackerNewsCollector": ".hackernews",
+    "GitHubCollector": ".github",
+    "TrendingCollector": ".trending",
+    "GenericCollector": ".generic",
+    "JinaCollector": ".jina",
+    "NativeBridgeCollector": ".native_bridge",
+    "BrowserCollector": ".browser",
+}
+
+# Optional collectors resolve to None when their extra is not installed.
+_OPTIONAL_EXPORTS = {"BrowserCollector"}
 
 __all__ = [
     "BaseCollector",
@@ -44,3 +75,21 @@ __all__ = [
     "NativeBridgeCollector",
     "BrowserCollector",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        if name not in _OPTIONAL_EXPORTS:
+            raise
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,12 +2,35 @@
 
 from __future__ import annotations
 
+import contextvars
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from typing import Iterator
 
 from datapulse.core.models import SourceType
 from datapulse.core.utils import generate_excerpt
 
+_READ_SCOPE: contextvars.ContextVar[str] = contextvars.ContextVar("datapulse_read_scope", default="")
+
+
+@contextmanager
+def read_scope(scope: str) -> Iterator[None]:
+    """Tag collector reads in this block, and the tasks and threads it starts, with ``scope`` (e.g. ``watch:<id>``).
+
+    Collectors that keep incremental state, such as Telegram message cursors,
+    key it by scope. Reads outside any scope are ad hoc and leave it alone.
+    """
+    token = _READ_SCOPE.set(scope)
+    try:
+        yield
+    finally:
+        _READ_SCOPE.reset(token)
+
+
+def current_read_scope() -> str:
+    return _READ_SCOPE.get()
+
 
 @dataclass
 class ParseResult:
@@ -36,6 +59,7 @@ class BaseCollector(ABC):
     timeout = 30
     tier: int = 2  # 0=zero-config, 1=network/free, 2=needs setup
     setup_hint: str = ""
+    health_ttl_seconds: float | None = None  # None = DATAPULSE_HEALTH_TTL_SECONDS
 
     @abstractmethod
     def can_handle(self, url: str) -> bool:
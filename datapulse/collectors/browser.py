@@ -1,4 +1,8 @@
-"""Optional Playwright browser collector used as hard anti-scraping fallback."""
+"""Optional Playwright browser collector used as hard anti-scraping fallback.
+
+Reads go through the shared warm browser pool (``browser_pool.py``) unless
+``DATAPULSE_BROWSER_POOL=0``, in which case each call launches its own browser.
+"""
 
 from __future__ import annotations
 
@@ -13,6 +17,7 @@ from datapulse.core.models import SourceType
 from datapulse.core.utils import clean_text, run_sync
 
 from .base import BaseCollector, ParseResult
+from .browser_pool import browser_pool_enabled, get_browser_pool, launch_chromium
 
 _BROWSER_REQUEST_LOCK = asyncio.Lock()
 _LAST_HUMAN_REQUEST_MONO = 0.0
@@ -63,6 +68,12 @@ def _human_wait_ms(min_ms: int, max_ms: int) -> int:
     return random.randint(min_ms, max_ms)
 
 
+def _random_viewport() -> dict[str, int] | None:
+    if not _env_bool("DATAPULSE_BROWSER_RANDOMIZE_VIEWPORT", True):
+        return None
+    return {"width": random.randint(1180, 1440), "height": random.randint(780, 980)}
+
+
 async def _throttle_requests(interval_seconds: float, jitter_seconds: float) -> None:
     if interval_seconds <= 0:
         return
@@ -138,7 +149,7 @@ class BrowserCollector(BaseCollector):
         traffic_profile: str = "generic",
     ) -> ParseResult:
         try:
-            from playwright.async_api import async_playwright
+            import playwright.async_api  # noqa: F401
         except Exception:
             return ParseResult.failure(url, "Playwright is not installed")
 
@@ -172,88 +183,106 @@ class BrowserCollector(BaseCollector):
             maximum=8000,
         )
 
-        async def _run() -> ParseResult:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                await _throttle_requests(min_interval, interval_jitter)
-                kwargs: dict[str, Any] = {}
+        def _context_options() -> dict[str, Any]:
+            kwargs: dict[str, Any] = {}
+            if _env_bool("DATAPULSE_BROWSER_USE_STEALTH_HEADERS", True):
+                locale = os.getenv("DATAPULSE_BROWSER_LOCALE", "zh-CN").strip()
+                if locale:
+                    kwargs["locale"] = locale
+                timezone = os.getenv("DATAPULSE_BROWSER_TIMEZONE", "Asia/Shanghai").strip()
+                if timezone:
+                    kwargs["timezone_id"] = timezone
+            if viewport := _random_viewport():
+                kwargs["viewport"] = viewport
+            if ua := os.getenv("DATAPULSE_BROWSER_USER_AGENT"):
+                kwargs["user_agent"] = ua
+            return kwargs
+
+        init_scripts: list[str] = []
+        if human_like:
+            if _env_bool("DATAPULSE_BROWSER_DISABLE_WEBDRIVER", True):
+                init_scripts.append(
+                    """
+                    Object.defineProperty(navigator, 'webdriver', {
+                        get: () => false
+                    });
+                    """
+                )
+            init_scripts.append(
+                """
+                window.chrome = { runtime: {} };
+                """
+            )
+
+        async def _read(page: Any) -> ParseResult:
+            # Pooled contexts outlive a single read, so each page gets a fresh viewport.
+            if viewport := _random_viewport():
+                await page.set_viewport_size(viewport)
+            await _throttle_requests(min_interval, interval_jitter)
+            await page.wait_for_timeout(_human_wait_ms(min_start_wait, max_start_wait))
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            if human_like:
+                await _simulate_human_page_read(page)
+                await _simulate_scroll(page, traffic_profile=traffic_profile)
+            else:
+                await page.wait_for_timeout(1200)
+            title = await page.title()
+            if human_like:
+                await page.wait_for_timeout(_human_wait_ms(min_settle_wait, max_settle_wait))
+            content = await page.evaluate(
+                """() => {
+                const selectors = [
+                  'article .note-content',
+                  '.note-content',
+                  '.note-text',
+                  'article',
+                  'main',
+                  '.content',
+                  'body',
+                ];
+                for (const selector of selectors) {
+                  const el = document.querySelector(selector);
+                  if (el && typeof el.innerText === 'string' && el.innerText.trim()) {
+                    return el.innerText;
+                  }
+                }
+                return '';
+            }"""
+            )
+            return ParseResult(
+                url=url,
+                title=(title or "").strip()[:200],
+                content=clean_text(content or ""),
+                author="",
+                source_type=self.source_type,
+                tags=["playwright", "browser"],
+                confidence_flags=["browser-fallback"],
+                extra={"source": "playwright"},
+            )
+
+        if browser_pool_enabled():
+            return get_browser_pool().run_page(
+                (traffic_profile, storage_state or "", bool(human_like)),
+                _read,
+                options=_context_options,
+                init_scripts=tuple(init_scripts),
+            )
+
+        async def _run_once() -> ParseResult:
+            playwright, browser = await launch_chromium()
+            try:
+                kwargs = _context_options()
                 if storage_state and Path(storage_state).exists():
                     kwargs["storage_state"] = storage_state
-                if _env_bool("DATAPULSE_BROWSER_USE_STEALTH_HEADERS", True):
-                    locale = os.getenv("DATAPULSE_BROWSER_LOCALE", "zh-CN").strip()
-                    if locale:
-                        kwargs["locale"] = locale
-                    timezone = os.getenv("DATAPULSE_BROWSER_TIMEZONE", "Asia/Shanghai").strip()
-                    if timezone:
-                        kwargs["timezone_id"] = timezone
-                if _env_bool("DATAPULSE_BROWSER_RANDOMIZE_VIEWPORT", True):
-                    kwargs["viewport"] = {
-                        "width": random.randint(1180, 1440),
-                        "height": random.randint(780, 980),
-                    }
-                if ua := os.getenv("DATAPULSE_BROWSER_USER_AGENT"):
-                    kwargs["user_agent"] = ua
-
                 context = await browser.new_context(**kwargs)
-                page: Any = await context.new_page()
+                for script in init_scripts:
+                    await context.add_init_script(script)
                 try:
-                    if human_like:
-                        if _env_bool("DATAPULSE_BROWSER_DISABLE_WEBDRIVER", True):
-                            await page.add_init_script(
-                                """
-                                Object.defineProperty(navigator, 'webdriver', {
-                                    get: () => false
-                                });
-                                """
-                            )
-                        await page.add_init_script(
-                            """
-                            window.chrome = { runtime: {} };
-                            """
-                        )
-
-                    await page.wait_for_timeout(_human_wait_ms(min_start_wait, max_start_wait))
-                    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                    if human_like:
-                        await _simulate_human_page_read(page)
-                        await _simulate_scroll(page, traffic_profile=traffic_profile)
-                    else:
-                        await page.wait_for_timeout(1200)
-                    title = await page.title()
-                    if human_like:
-                        await page.wait_for_timeout(_human_wait_ms(min_settle_wait, max_settle_wait))
-                    content = await page.evaluate(
-                        """() => {
-                        const selectors = [
-                          'article .note-content',
-                          '.note-content',
-                          '.note-text',
-                          'article',
-                          'main',
-                          '.content',
-                          'body',
-                        ];
-                        for (const selector of selectors) {
-                          const el = document.querySelector(selector);
-                          if (el && typeof el.innerText === 'string' && el.innerText.trim()) {
-                            return el.innerText;
-                          }
-                        }
-                        return '';
-                    }"""
-                    )
-                    return ParseResult(
-                        url=url,
-                        title=(title or "").strip()[:200],
-                        content=clean_text(content or ""),
-                        author="",
-                        source_type=self.source_type,
-                        tags=["playwright", "browser"],
-                        confidence_flags=["browser-fallback"],
-                        extra={"source": "playwright"},
-                    )
+                    return await _read(await context.new_page())
                 finally:
                     await context.close()
-                    await browser.close()
+            finally:
+                await browser.close()
+                await playwright.stop()
 
-        return run_sync(_run())
+        return run_sync(_run_once())
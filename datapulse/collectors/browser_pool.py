@@ -0,0 +1,353 @@
+"""Warm Playwright browser pool shared by every ``BrowserCollector.parse`` call.
+
+Launching Chromium costs seconds, and the old collector paid that once per URL.
+The pool keeps one headless browser alive on a dedicated event-loop thread, so
+sync callers on any thread share it. Each (profile, storage_state,
+human_like) key gets its own long-lived context: the session cookies load once,
+and the context is rebuilt only after ``max_pages_per_context`` pages or when
+the session file changes on disk (re-login). Finished pages go back to
+``about:blank`` and are reused by the next read on the same context. A reaper
+closes contexts that have sat idle for ``idle_seconds``, then the browser
+itself once no context is left and no page is leased (a retired context can
+still be serving its last read).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Coroutine, TypeVar
+
+from datapulse.core.utils import BackgroundLoop
+
+logger = logging.getLogger("datapulse.parsers.browser_pool")
+
+DEFAULT_MAX_PAGES_PER_CONTEXT = 40
+DEFAULT_IDLE_SECONDS = 300.0
+DEFAULT_CALL_TIMEOUT_SECONDS = 120.0
+_REAPER_MIN_INTERVAL = 1.0
+
+_T = TypeVar("_T")
+ContextKey = tuple[str, str, bool]
+Launcher = Callable[[], Awaitable[tuple[Any, Any]]]
+
+
+def browser_pool_enabled() -> bool:
+    value = os.getenv("DATAPULSE_BROWSER_POOL", "1").strip().lower()
+    return value not in {"0", "false", "no", "off", "n", "f"}
+
+
+def _env_number(name: str, default: float, *, minimum: float) -> float:
+    raw = os.getenv(name, "").strip()
+    try:
+        return max(minimum, float(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+async def launch_chromium() -> tuple[Any, Any]:
+    """Start Playwright and a headless Chromium; returns ``(playwright, browser)``."""
+    from playwright.async_api import async_playwright
+
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch(headless=True)
+    except Exception:
+        await playwright.stop()
+        raise
+    return playwright, browser
+
+
+def _storage_mtime(storage_state: str) -> float:
+    try:
+        return Path(storage_state).stat().st_mtime if storage_state else 0.0
+    except OSError:
+        return 0.0
+
+
+@dataclass
+class _PooledContext:
+    context: Any
+    storage_mtime: float
+    pages_served: int = 0
+    in_use: int = 0
+    retiring: bool = False
+    last_used: float = field(default_factory=time.monotonic)
+    idle_pages: list[Any] = field(default_factory=list)
+
+
+class BrowserPool:
+    """Long-lived headless browser with per-session contexts, driven from one loop thread."""
+
+    def __init__(
+        self,
+        *,
+        max_pages_per_context: int | None = None,
+        idle_seconds: float | None = None,
+        launcher: Launcher | None = None,
+    ):
+        self.max_pages_per_context = int(
+            max_pages_per_context
+            if max_pages_per_context is not None
+            else _env_number("DATAPULSE_BROWSER_POOL_MAX_PAGES", DEFAULT_MAX_PAGES_PER_CONTEXT, minimum=1)
+        )
+        self.idle_seconds = float(
+            idle_seconds
+            if idle_seconds is not None
+            else _env_number("DATAPULSE_BROWSER_POOL_IDLE_SECONDS", DEFAULT_IDLE_SECONDS, minimum=0.0)
+        )
+        self._launcher = launcher or launch_chromium
+        self._loop = BackgroundLoop("datapulse-browser-pool")
+        # Everything below is only touched on the pool loop.
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._launch_lock: asyncio.Lock | None = None
+        self._contexts: dict[ContextKey, _PooledContext] = {}
+        self._reaper: asyncio.Task[None] | None = None
+        self._leases = 0
+        self.launches = 0
+        self.contexts_created = 0
+        self.pages_created = 0
+        self.pages_reused = 0
+
+    def call(self, coro_factory: Callable[[], Coroutine[Any, Any, _T]], *, timeout: float = DEFAULT_CALL_TIMEOUT_SECONDS) -> _T:
+        """Run ``coro_factory()`` on the pool loop and block the calling thread for its result."""
+        return self._loop.call(coro_factory, timeout=timeout)
+
+    # -- browser and contexts -------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._browser is not None
+
+    @property
+    def context_count(self) -> int:
+        return len(self._contexts)
+
+    @property
+    def leased_pages(self) -> int:
+        return self._leases
+
+    async def _ensure_browser(self) -> Any:
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+        async with self._launch_lock:
+            browser = self._browser
+            if browser is not None and _is_connected(browser):
+                return browser
+            if browser is not None:
+                logger.warning("Pooled browser disconnected; relaunching")
+                await self._close_browser()
+            self._playwright, self._browser = await self._launcher()
+            self.launches += 1
+            if self._reaper is None or self._reaper.done():
+                self._reaper = asyncio.get_running_loop().create_task(self._reap_forever())
+            return self._browser
+
+    async def _context_for(
+        self,
+        key: ContextKey,
+        options: Callable[[], dict[str, Any]],
+        init_scripts: tuple[str, ...],
+    ) -> _PooledContext:
+        browser = await self._ensure_browser()
+        storage_state = key[1]
+        mtime = _storage_mtime(storage_state)
+        assert self._launch_lock is not None
+        async with self._launch_lock:  # concurrent first reads on one key must not race two contexts
+            pooled = self._contexts.get(key)
+            if pooled is not None and (pooled.retiring or pooled.storage_mtime != mtime):
+                self._retire(key, pooled)
+                pooled = None
+            if pooled is None:
+                kwargs = dict(options())
+                if storage_state and mtime:
+                    kwargs["storage_state"] = storage_state
+                context = await browser.new_context(**kwargs)
+                for script in init_scripts:
+                    await context.add_init_script(script)
+                pooled = _PooledContext(context=context, storage_mtime=mtime)
+                self._contexts[key] = pooled
+                self.contexts_created += 1
+            return pooled
+
+    def _retire(self, key: ContextKey, pooled: _PooledContext) -> None:
+        """Stop handing out ``pooled``; it closes once its in-flight pages are released."""
+        pooled.retiring = True
+        if self._contexts.get(key) is pooled:
+            del self._contexts[key]
+        if pooled.in_use == 0:
+            asyncio.get_running_loop().create_task(_close_quietly(pooled.context))
+
+    async def _acquire_page(self, key: ContextKey, pooled: _PooledContext) -> Any:
+        self._leases += 1
+        pooled.in_use += 1
+        pooled.pages_served += 1
+        pooled.last_used = time.monotonic()
+        if pooled.pages_served >= self.max_pages_per_context:
+            pooled.retiring = True
+            if self._contexts.get(key) is pooled:
+                del self._contexts[key]
+        while pooled.idle_pages:
+            page = pooled.idle_pages.pop()
+            if not _is_closed(page):
+                self.pages_reused += 1
+                return page
+        try:
+            page = await pooled.context.new_page()
+        except Exception:
+            pooled.in_use -= 1
+            self._leases -= 1
+            raise
+        self.pages_created += 1
+        return page
+
+    async def _release_page(self, pooled: _PooledContext, page: Any, *, healthy: bool) -> None:
+        self._leases -= 1
+        pooled.in_use -= 1
+        pooled.last_used = time.monotonic()
+        if pooled.retiring:
+            if pooled.in_use == 0:
+                await _close_quietly(pooled.context)
+            return
+        if healthy and not _is_closed(page):
+            try:
+                await page.goto("about:blank")
+                pooled.idle_pages.append(page)
+                return
+            except Exception as exc:  # noqa: BLE001 - a page that cannot reset is simply dropped
+                logger.debug("Dropping pooled page after reset failure: %s", exc)
+        await _close_quietly(page)
+
+    async def use_page(
+        self,
+        key: ContextKey,
+        work: Callable[[Any], Awaitable[_T]],
+        *,
+        options: Callable[[], dict[str, Any]] = dict,
+        init_scripts: tuple[str, ...] = (),
+    ) -> _T:
+        """Run ``work(page)`` on a pooled page of the context for ``key``; call on the pool loop."""
+        pooled = await self._context_for(key, options, init_scripts)
+        page = await self._acquire_page(key, pooled)
+        healthy = False
+        try:
+            result = await work(page)
+            healthy = True
+            return result
+        finally:
+            await self._release_page(pooled, page, healthy=healthy)
+
+    def run_page(
+        self,
+        key: ContextKey,
+        work: Callable[[Any], Awaitable[_T]],
+        *,
+        options: Callable[[], dict[str, Any]] = dict,
+        init_scripts: tuple[str, ...] = (),
+        timeout: float = DEFAULT_CALL_TIMEOUT_SECONDS,
+    ) -> _T:
+        """Sync entry point: borrow a page for ``work`` from any thread."""
+        return self.call(lambda: self.use_page(key, work, options=options, init_scripts=init_scripts), timeout=timeout)
+
+    # -- shutdown ---------------------------------------------------------------
+
+    async def reap_idle(self, now: float | None = None) -> int:
+        """Close contexts idle past ``idle_seconds``, then the browser if none remain and no page is leased.
+
+        Returns how many contexts were closed.
+        """
+        now = time.monotonic() if now is None else now
+        closed = 0
+        for key, pooled in list(self._contexts.items()):
+            if pooled.in_use == 0 and now - pooled.last_used >= self.idle_seconds:
+                del self._contexts[key]
+                await _close_quietly(pooled.context)
+                closed += 1
+        if not self._contexts and self._leases == 0 and self._browser is not None:
+            await self._close_browser()
+        return closed
+
+    async def _reap_forever(self) -> None:
+        while self._browser is not None:
+            await asyncio.sleep(max(_REAPER_MIN_INTERVAL, self.idle_seconds / 4))
+            try:
+                await self.reap_idle()
+            except Exception as exc:  # noqa: BLE001 - reaping must not kill the loop
+                logger.warning("Browser pool reaper failed: %s", exc)
+
+    async def _close_browser(self) -> None:
+        browser, playwright = self._browser, self._playwright
+        self._browser = self._playwright = None
+        # Contexts die with their browser; in-flight pages still release against their own entry.
+        self._contexts.clear()
+        if browser is not None:
+            await _close_quietly(browser)
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Playwright stop failed: %s", exc)
+
+    async def aclose(self) -> None:
+        for pooled in list(self._contexts.values()):
+            await _close_quietly(pooled.context)
+        self._contexts.clear()
+        await self._close_browser()
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+
+    def close(self, *, timeout: float = 10.0) -> None:
+        """Close everything and stop the loop thread; safe to call when the pool never started."""
+        self._loop.stop(self.aclose, timeout=timeout)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": self.running,
+            "contexts": self.context_count,
+            "leased_pages": self.leased_pages,
+            "launches": self.launches,
+            "contexts_created": self.contexts_created,
+            "pages_created": self.pages_created,
+            "pages_reused": self.pages_reused,
+            "max_pages_per_context": self.max_pages_per_context,
+            "idle_seconds": self.idle_seconds,
+        }
+
+
+def _is_connected(browser: Any) -> bool:
+    check = getattr(browser, "is_connected", None)
+    return bool(check()) if callable(check) else True
+
+
+def _is_closed(page: Any) -> bool:
+    check = getattr(page, "is_closed", None)
+    return bool(check()) if callable(check) else False
+
+
+async def _close_quietly(target: Any) -> None:
+    try:
+        await target.close()
+    except Exception as exc:  # noqa: BLE001 - already gone
+        logger.debug("Closing pooled browser object failed: %s", exc)
+
+
+_SHARED_POOL: BrowserPool | None = None
+_SHARED_POOL_LOCK = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Process-wide pool, created on first use and closed at interpreter exit."""
+    global _SHARED_POOL
+    with _SHARED_POOL_LOCK:
+        if _SHARED_POOL is None:
+            _SHARED_POOL = BrowserPool()
+            atexit.register(_SHARED_POOL.close)
+        return _SHARED_POOL
@@ -8,10 +8,12 @@ import re
 import ssl
 
 import certifi
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 from requests.adapters import HTTPAdapter
 
+from datapulse.core.cpu_pool import run_cpu_bound, should_offload
 from datapulse.core.models import SourceType
 from datapulse.core.security import get_secret, has_secret
 from datapulse.core.utils import clean_text, generate_excerpt, validate_external_url
@@ -27,6 +29,56 @@ GENERIC_FALLBACK_POLICY = (
 _MIN_EXTRACTED_CONTENT_LENGTH = 50
 _MIN_CHINESE_CHARACTER_COUNT = 20
 _CHINESE_CHARACTER_RE = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff]")
+_CHINESE_LANG_MARKERS = ('lang="zh', "lang='zh", "zh-cn", "zh-hans", "zh-hant")
+_BOILERPLATE_TAGS = frozenset({"script", "style", "header", "footer", "nav", "aside"})
+_OUTSIDE_BOILERPLATE = "not(ancestor::header or ancestor::footer or ancestor::nav or ancestor::aside)"
+_MAIN_CONTENT_XPATHS = tuple(
+    f"(//{step}[{_OUTSIDE_BOILERPLATE}])[1]"
+    for step in ("article", "main", "div[@role='main']", "body")
+)
+# Same parser settings trafilatura uses internally, so the tree can be handed to it as-is.
+_HTML_PARSER = lxml.html.HTMLParser(
+    collect_ids=False,
+    default_doctype=False,
+    encoding="utf-8",
+    remove_comments=True,
+    remove_pis=True,
+)
+
+
+class ParsedDocument:
+    """A fetched HTML page, parsed at most once and shared by every extraction strategy."""
+
+    def __init__(self, html: str, url: str = ""):
+        self.html = html or ""
+        self.url = url
+        self._tree: lxml.html.HtmlElement | None = None
+        self._parsed = False
+
+    @property
+    def tree(self) -> lxml.html.HtmlElement | None:
+        """The lxml tree, built lazily so strategies that only need the raw string never pay for it."""
+        if not self._parsed:
+            self._parsed = True
+            try:
+                self._tree = lxml.html.document_fromstring(
+                    self.html.encode("utf-8", errors="replace"), parser=_HTML_PARSER
+                )
+            except (etree.LxmlError, ValueError) as exc:
+                logger.info("GenericCollector could not parse HTML for %s: %s", self.url, exc)
+        return self._tree
+
+    def may_be_chinese(self) -> bool:
+        """Cheap pre-check: without a zh lang marker or enough CJK characters no extractor can succeed."""
+        sample = self.html[:20_000].lower()
+        if any(marker in sample for marker in _CHINESE_LANG_MARKERS):
+            return True
+        count = 0
+        for _ in _CHINESE_CHARACTER_RE.finditer(self.html):
+            count += 1
+            if count >= _MIN_CHINESE_CHARACTER_COUNT:
+                return True
+        return False
 
 
 class _SSLContextAdapter(HTTPAdapter):
@@ -55,7 +107,7 @@ class GenericCollector(BaseCollector):
     max_response_bytes = 5_000_000
 
     def check(self) -> dict[str, str | bool]:
-        backends = ["beautifulsoup"]
+        backends = ["beautifulsoup"]  # compatibility label for the lxml-walk fallback tier
         has_gne = False
         try:
             from gne import GeneralNewsExtractor  # noqa: F401
@@ -90,67 +142,12 @@ class GenericCollector(BaseCollector):
                 return ParseResult.failure(url, reason)
 
             html = self._fetch_html(url)
-            extracted = ""
-            chinese_news_payload = self._extract_with_general_news_extractor(html, url)
-            title, author = self._extract_metadata(html, url)
-
-            if chinese_news_payload:
-                content = chinese_news_payload["content"]
-                return self._build_result(
-                    url=url,
-                    title=title,
-                    author=author,
-                    content=content,
-                    extracted_title=chinese_news_payload.get("title", ""),
-                    extracted_author=chinese_news_payload.get("author", ""),
-                    tags=["generic", CHINESE_NEWS_BACKEND_PROFILE, "chinese-news-body"],
-                    confidence_flags=[CHINESE_NEWS_BACKEND_PROFILE],
-                    bridge_profile=CHINESE_NEWS_BACKEND_PROFILE,
-                    collector_family="native_library",
-                    transport="in_process",
-                )
-
-            try:
-                import trafilatura  # type: ignore[import-not-found]
-
-                extracted = trafilatura.extract(
-                    html,
-                    url=url,
-                    include_comments=False,
-                    include_tables=True,
-                    include_links=True,
-                    output_format="txt",
-                    favor_precision=True,
-                ) or ""
-            except Exception as exc:
-                logger.info("GenericCollector trafilatura unavailable for %s: %s", url, exc)
-
-            if self._is_meaningful_text(extracted):
-                return self._build_result(
-                    url=url,
-                    title=title,
-                    author=author,
-                    content=extracted,
-                    tags=["generic", "trafilatura"],
-                    confidence_flags=["trafilatura"],
-                    bridge_profile="trafilatura",
-                    collector_family="html_parser",
-                    transport="in_process",
-                )
-
-            bs_content = self._extract_with_bs(html)
-            if bs_content:
-                return self._build_result(
-                    url=url,
-                    title=title,
-                    author=author,
-                    content=bs_content,
-                    tags=["generic", "beautifulsoup"],
-                    confidence_flags=["fallback_bs4"],
-                    bridge_profile="beautifulsoup",
-                    collector_family="html_parser",
-                    transport="in_process",
-                )
+            if should_offload(len(html)):
+                result = run_cpu_bound(_extract_generic_page, html, url)
+            else:
+                result = self._extract_document(ParsedDocument(html, url))
+            if result is not None:
+                return result
             last_error = "Could not extract meaningful text."
         except Exception as exc:  # noqa: BLE001
             last_error = str(exc)
@@ -168,6 +165,80 @@ class GenericCollector(BaseCollector):
 
         return ParseResult.failure(url, last_error or "Generic parse failed")
 
+    def _extract_document(self, document: ParsedDocument) -> ParseResult | None:
+        """Run the in-process extractors over one parsed page; ``None`` when none found meaningful text."""
+        url = document.url
+        extracted = ""
+        chinese_news_payload = self._extract_with_general_news_extractor(document, url)
+
+        if chinese_news_payload:
+            content = chinese_news_payload["content"]
+            if chinese_news_payload.get("title") and chinese_news_payload.get("author"):
+                title, author = "", ""
+            else:
+                title, author = self._extract_metadata(document)
+            return self._build_result(
+                url=url,
+                title=title,
+                author=author,
+                content=content,
+                extracted_title=chinese_news_payload.get("title", ""),
+                extracted_author=chinese_news_payload.get("author", ""),
+                tags=["generic", CHINESE_NEWS_BACKEND_PROFILE, "chinese-news-body"],
+                confidence_flags=[CHINESE_NEWS_BACKEND_PROFILE],
+                bridge_profile=CHINESE_NEWS_BACKEND_PROFILE,
+                collector_family="native_library",
+                transport="in_process",
+            )
+
+        title, author = self._extract_metadata(document)
+        try:
+            import trafilatura  # type: ignore[import-not-found]
+
+            # trafilatura copies an lxml tree it is given, so the shared tree stays intact.
+            tree = document.tree
+            extracted = trafilatura.extract(
+                tree if tree is not None else document.html,
+                url=url,
+                include_comments=False,
+                include_tables=True,
+                include_links=True,
+                output_format="txt",
+                favor_precision=True,
+            ) or ""
+        except Exception as exc:
+            logger.info("GenericCollector trafilatura unavailable for %s: %s", url, exc)
+
+        if self._is_meaningful_text(extracted):
+            return self._build_result(
+                url=url,
+                title=title,
+                author=author,
+                content=extracted,
+                tags=["generic", "trafilatura"],
+                confidence_flags=["trafilatura"],
+                bridge_profile="trafilatura",
+                collector_family="html_parser",
+                transport="in_process",
+            )
+
+        walked_content = self._extract_with_lxml_walk(document)
+        if walked_content:
+            # "beautifulsoup"/"fallback_bs4" name this fallback tier for existing
+            # consumers of tags and provenance; the extraction itself walks the lxml tree.
+            return self._build_result(
+                url=url,
+                title=title,
+                author=author,
+                content=walked_content,
+                tags=["generic", "beautifulsoup"],
+                confidence_flags=["fallback_bs4"],
+                bridge_profile="beautifulsoup",
+                collector_family="html_parser",
+                transport="in_process",
+            )
+        return None
+
     def _build_result(
         self,
         *,
@@ -256,7 +327,9 @@ class GenericCollector(BaseCollector):
     def _looks_like_chinese_text(text: str) -> bool:
         return len(_CHINESE_CHARACTER_RE.findall(text or "")) >= _MIN_CHINESE_CHARACTER_COUNT
 
-    def _extract_with_general_news_extractor(self, html: str, url: str) -> dict[str, str] | None:
+    def _extract_with_general_news_extractor(self, document: ParsedDocument, url: str) -> dict[str, str] | None:
+        if not document.may_be_chinese():
+            return None
         try:
             from gne import GeneralNewsExtractor  # type: ignore[import-not-found]
         except Exception as exc:
@@ -264,7 +337,8 @@ class GenericCollector(BaseCollector):
             return None
 
         try:
-            payload = GeneralNewsExtractor().extract(html) or {}
+            # GNE only accepts markup strings and runs its own pre-cleaning on them.
+            payload = GeneralNewsExtractor().extract(document.html) or {}
         except Exception as exc:
             logger.info("GenericCollector gne extraction failed for %s: %s", url, exc)
             return None
@@ -273,10 +347,8 @@ class GenericCollector(BaseCollector):
         if not self._is_meaningful_text(content):
             return None
 
-        sample = html[:20_000].lower()
-        if not self._looks_like_chinese_text(content) and not any(
-            marker in sample for marker in ('lang="zh', "lang='zh", "zh-cn", "zh-hans", "zh-hant")
-        ):
+        sample = document.html[:20_000].lower()
+        if not self._looks_like_chinese_text(content) and not any(marker in sample for marker in _CHINESE_LANG_MARKERS):
             return None
 
         return {
@@ -346,33 +418,48 @@ class GenericCollector(BaseCollector):
             session.close()
 
     @staticmethod
-    def _extract_metadata(html: str, url: str) -> tuple[str, str]:
-        soup = BeautifulSoup(html, "lxml")
+    def _extract_metadata(document: ParsedDocument) -> tuple[str, str]:
+        tree = document.tree
+        if tree is None:
+            return "", ""
         title = ""
-        title_tag = soup.find("title")
-        if title_tag:
-            title = title_tag.get_text(strip=True)
-        og_title = soup.find("meta", property="og:title")
-        if og_title and og_title.get("content"):  # type: ignore[union-attr]
-            title = str(og_title.get("content"))  # type: ignore[union-attr]
+        title_tags = tree.xpath("//title")
+        if title_tags:
+            title = title_tags[0].text_content().strip()
+        og_title = tree.xpath("//meta[@property='og:title']/@content")
+        if og_title and og_title[0]:
+            title = str(og_title[0])
         author = ""
-        meta_author = soup.find("meta", attrs={"name": "author"})
+        meta_author = tree.xpath("//meta[@name='author']")
         if meta_author:
-            author = str(meta_author.get("content", ""))  # type: ignore[union-attr]
+            author = str(meta_author[0].get("content", ""))
         return title, author
 
     @staticmethod
-    def _extract_with_bs(html: str) -> str:
-        soup = BeautifulSoup(html, "lxml")
-        for node in soup.find_all(["script", "style", "header", "footer", "nav", "aside"]):
-            node.decompose()
-
-        main = soup.find("article") or soup.find("main") or soup.find("div", attrs={"role": "main"})
-        if not main:
-            main = soup.body
-        if not main:
+    def _extract_with_lxml_walk(document: ParsedDocument) -> str:
+        tree = document.tree
+        if tree is None:
+            return ""
+        for xpath in _MAIN_CONTENT_XPATHS:
+            found = tree.xpath(xpath)
+            if found:
+                main = found[0]
+                break
+        else:
             return ""
-        content = main.get_text("\n", strip=True)
+
+        # Walk the shared tree without mutating it, skipping boilerplate subtrees but keeping their tails.
+        parts: list[str] = []
+        walker = etree.iterwalk(main, events=("start", "end"))
+        for event, node in walker:
+            if event == "start":
+                if node.tag in _BOILERPLATE_TAGS:
+                    walker.skip_subtree()
+                elif node.text:
+                    parts.append(node.text)
+            elif node is not main and node.tail:
+                parts.append(node.tail)
+        content = "\n".join(text for part in parts if (text := part.strip()))
         return clean_text(content)
 
     def _extract_with_firecrawl(self, url: str) -> ParseResult | None:
@@ -454,3 +541,8 @@ class GenericCollector(BaseCollector):
             )
         except Exception:
             return None
+
+
+def _extract_generic_page(html: str, url: str) -> ParseResult | None:
+    """Worker-process entry point: extract a fetched page and return the compact result."""
+    return GenericCollector()._extract_document(ParsedDocument(html, url))
@@ -1,16 +1,145 @@
-"""GitHub repository collector using GitHub REST API."""
+"""GitHub repository collector using GitHub REST API.
+
+Repo metadata and the latest release are cached per repo in a JSON store
+(``DATAPULSE_GITHUB_CACHE_PATH``). Entries younger than
+``DATAPULSE_GITHUB_CACHE_TTL`` are served without a request. Older entries
+are revalidated with ``If-None-Match``; GitHub does not count ``304``
+answers against the rate limit. Once the API reports an exhausted rate
+limit, requests stop until the reset time and cached entries are served
+stale.
+"""
 
 from __future__ import annotations
 
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
 from urllib.parse import urlparse
 
 import requests
 
+from datapulse.core.config import read_env_int
+from datapulse.core.filestore import ReloadableStore
 from datapulse.core.models import SourceType
-from datapulse.core.utils import clean_text, generate_excerpt
+from datapulse.core.security import get_secret
+from datapulse.core.utils import clean_text, generate_excerpt, github_repo_cache_path_from_env
 
 from .base import BaseCollector, ParseResult
 
+_CACHED_REPO_FIELDS = (
+    "full_name",
+    "description",
+    "stargazers_count",
+    "forks_count",
+    "open_issues_count",
+    "subscribers_count",
+    "language",
+    "license",
+    "topics",
+    "default_branch",
+    "pushed_at",
+    "created_at",
+    "updated_at",
+    "archived",
+    "disabled",
+    "html_url",
+    "homepage",
+)
+
+
+class GitHubRepoCache(ReloadableStore):
+    """JSON map of ``owner/repo`` -> trimmed repo payload, latest release, ETag and fetch time."""
+
+    def __init__(self, path: str | None = None):
+        self.path = Path(path or github_repo_cache_path_from_env()).expanduser()
+        self.repos: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        self._mark_loaded()
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8")) if self.path.exists() else {}
+        except (OSError, json.JSONDecodeError):
+            raw = {}
+        repos = raw.get("repos", {}) if isinstance(raw, dict) else {}
+        self.repos = {str(key): dict(value) for key, value in repos.items() if isinstance(value, dict)}
+
+    def get(self, slug: str) -> dict[str, Any] | None:
+        with self._lock:
+            self.reload_if_changed()
+            entry = self.repos.get(slug.lower())
+            return dict(entry) if entry else None
+
+    def put(self, slug: str, repo: dict[str, Any], release: dict[str, Any], *, etag: str = "") -> None:
+        with self._lock, self._transaction():
+            self.repos[slug.lower()] = {
+                "repo": {key: repo[key] for key in _CACHED_REPO_FIELDS if key in repo},
+                "release": dict(release),
+                "etag": etag,
+                "fetched_at": time.time(),
+            }
+            self._write_json({"repos": self.repos})
+
+    def touch(self, slug: str) -> None:
+        """Mark an entry fresh again after a ``304 Not Modified``."""
+        with self._lock, self._transaction():
+            entry = self.repos.get(slug.lower())
+            if entry is None:
+                return
+            entry["fetched_at"] = time.time()
+            self._write_json({"repos": self.repos})
+
+    def drop(self, slug: str) -> None:
+        with self._lock, self._transaction():
+            if self.repos.pop(slug.lower(), None) is not None:
+                self._write_json({"repos": self.repos})
+
+    @staticmethod
+    def is_fresh(entry: dict[str, Any], ttl: float) -> bool:
+        try:
+            return time.time() - float(entry.get("fetched_at", 0) or 0) < ttl
+        except (TypeError, ValueError):
+            return False
+
+
+_REPO_CACHES: dict[str, GitHubRepoCache] = {}
+_REPO_CACHES_LOCK = threading.Lock()
+_rate_limit_reset_at = 0.0
+
+
+def shared_repo_cache() -> GitHubRepoCache:
+    """Process-wide cache for the current ``DATAPULSE_GITHUB_CACHE_PATH``."""
+    path = github_repo_cache_path_from_env()
+    with _REPO_CACHES_LOCK:
+        cache = _REPO_CACHES.get(path)
+        if cache is None:
+            cache = _REPO_CACHES[path] = GitHubRepoCache(path)
+        return cache
+
+
+def github_rate_limited() -> bool:
+    return time.time() < _rate_limit_reset_at
+
+
+def _response_header(response: Any, name: str) -> str:
+    headers = getattr(response, "headers", None) or {}
+    return str(headers.get(name, "") or "").strip()
+
+
+def _note_rate_limit(response: Any) -> None:
+    """Remember when GitHub said the quota runs out so later calls stop early."""
+    global _rate_limit_reset_at
+    if _response_header(response, "X-RateLimit-Remaining") != "0":
+        return
+    try:
+        reset_at = float(_response_header(response, "X-RateLimit-Reset") or 0)
+    except (TypeError, ValueError):
+        reset_at = 0.0
+    _rate_limit_reset_at = max(_rate_limit_reset_at, reset_at or time.time() + 60)
+
 
 class GitHubCollector(BaseCollector):
     name = "github"
@@ -69,34 +198,55 @@ class GitHubCollector(BaseCollector):
         owner, repo_name = repo
         slug = f"{owner}/{repo_name}"
 
-        headers = {
-            "Accept": "application/vnd.github+json",
-            "User-Agent": self.github_user_agent,
-        }
+        headers = self._api_headers()
         api_url = f"{self.api_base}/repos/{owner}/{repo_name}"
+        cache = shared_repo_cache()
+        cached = cache.get(slug)
+        ttl = read_env_int("DATAPULSE_GITHUB_CACHE_TTL", 3600, min_value=0, max_value=7 * 86400)
 
         degraded = False
         degraded_reason = ""
         repo_payload: dict = {}
-        try:
-            response = requests.get(api_url, headers=headers, timeout=self.timeout)
-            if response.status_code == 404:
-                return ParseResult.failure(url, f"GitHub repo not found: {slug}")
-            if response.status_code >= 400:
-                degraded = True
-                degraded_reason = f"github_api_http_{response.status_code}"
-            else:
-                parsed_payload = response.json()
-                if isinstance(parsed_payload, dict):
-                    repo_payload = parsed_payload
+        release: dict = {}
+        cache_state = "miss"
+        if cached is not None and GitHubRepoCache.is_fresh(cached, ttl):
+            repo_payload, release, cache_state = cached.get("repo") or {}, cached.get("release") or {}, "hit"
+        elif github_rate_limited():
+            degraded_reason = "github_rate_limited"
+        else:
+            request_headers = dict(headers)
+            if cached is not None and cached.get("etag"):
+                request_headers["If-None-Match"] = str(cached["etag"])
+            try:
+                response = requests.get(api_url, headers=request_headers, timeout=self.timeout)
+                _note_rate_limit(response)
+                if response.status_code == 404:
+                    cache.drop(slug)
+                    return ParseResult.failure(url, f"GitHub repo not found: {slug}")
+                if response.status_code == 304 and cached is not None:
+                    cache.touch(slug)
+                    repo_payload, release, cache_state = cached.get("repo") or {}, cached.get("release") or {}, "revalidated"
+                elif response.status_code >= 400:
+                    degraded_reason = f"github_api_http_{response.status_code}"
                 else:
-                    degraded = True
-                    degraded_reason = "github_api_non_json"
-        except requests.RequestException as exc:
-            degraded = True
-            degraded_reason = str(exc)
+                    parsed_payload = response.json()
+                    if isinstance(parsed_payload, dict):
+                        repo_payload = parsed_payload
+                        release = self._fetch_latest_release(owner, repo_name, headers=headers)
+                        cache.put(slug, repo_payload, release, etag=_response_header(response, "ETag"))
+                    else:
+                        degraded_reason = "github_api_non_json"
+            except requests.RequestException as exc:
+                degraded_reason = str(exc)
 
-        release = self._fetch_latest_release(owner, repo_name, headers=headers)
+        if degraded_reason:
+            if cached is not None and cached.get("repo"):
+                # Serve the last known metadata rather than a bare degraded stub.
+                repo_payload, release, cache_state = cached["repo"], cached.get("release") or {}, "stale"
+            else:
+                degraded = True
+                if not github_rate_limited():
+                    release = self._fetch_latest_release(owner, repo_name, headers=headers)
 
         if repo_payload:
             title = str(repo_payload.get("full_name", slug))
@@ -164,6 +314,7 @@ class GitHubCollector(BaseCollector):
                     "collector": "github",
                     "api_degraded": degraded,
                     "degraded_reason": degraded_reason,
+                    "cache": cache_state,
                 },
             )
 
@@ -191,12 +342,22 @@ class GitHubCollector(BaseCollector):
             },
         )
 
+    def _api_headers(self) -> dict[str, str]:
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": self.github_user_agent,
+        }
+        if token := get_secret("GITHUB_TOKEN").strip():
+            headers["Authorization"] = f"Bearer {token}"
+        return headers
+
     def _fetch_latest_release(self, owner: str, repo_name: str, *, headers: dict[str, str]) -> dict:
         url = f"{self.api_base}/repos/{owner}/{repo_name}/releases/latest"
         try:
             resp = requests.get(url, headers=headers, timeout=self.timeout)
         except requests.RequestException:
             return {}
+        _note_rate_limit(resp)
         if resp.status_code != 200:
             return {}
         payload = resp.json()
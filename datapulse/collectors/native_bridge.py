@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 import shlex
 import subprocess
 from pathlib import Path
 from urllib.parse import urlparse
 
+from datapulse.core.config import read_env_int
 from datapulse.core.models import SourceType
 from datapulse.core.utils import clean_text, session_dir, session_path
 
 from .base import BaseCollector, ParseResult
+from .native_bridge_pool import BridgeWorkerError, get_bridge_pool
+
+logger = logging.getLogger("datapulse.parsers.native_bridge")
 
 REQUEST_SCHEMA_VERSION = "native_collector_bridge_request.v1"
 RESULT_SCHEMA_VERSION = "native_collector_bridge_result.v1"
@@ -22,6 +27,11 @@ BRIDGE_CMD_ENV = "DATAPULSE_NATIVE_COLLECTOR_BRIDGE_CMD"
 BRIDGE_WORKDIR_ENV = "DATAPULSE_NATIVE_COLLECTOR_BRIDGE_WORKDIR"
 BRIDGE_TIMEOUT_ENV = "DATAPULSE_NATIVE_COLLECTOR_BRIDGE_TIMEOUT_SECONDS"
 BRIDGE_STATE_DIR_ENV = "DATAPULSE_NATIVE_COLLECTOR_STATE_DIR"
+BRIDGE_MODE_ENV = "DATAPULSE_NATIVE_COLLECTOR_BRIDGE_MODE"
+BRIDGE_WORKERS_ENV = "DATAPULSE_NATIVE_COLLECTOR_BRIDGE_WORKERS"
+
+BRIDGE_MODE_ONESHOT = "oneshot"
+BRIDGE_MODE_PERSISTENT = "persistent"
 
 DEFAULT_TIMEOUT_SECONDS = 45
 DEFAULT_STATE_DIR = Path.home() / ".datapulse" / "native_collectors"
@@ -74,7 +84,9 @@ class NativeBridgeCollector(BaseCollector):
         f"Set {BRIDGE_CMD_ENV} to enable the MediaCrawler-class sidecar bridge "
         "(optional: DATAPULSE_NATIVE_COLLECTOR_BRIDGE_WORKDIR / "
         "DATAPULSE_NATIVE_COLLECTOR_BRIDGE_TIMEOUT_SECONDS / "
-        "DATAPULSE_NATIVE_COLLECTOR_STATE_DIR)"
+        "DATAPULSE_NATIVE_COLLECTOR_STATE_DIR / "
+        "DATAPULSE_NATIVE_COLLECTOR_BRIDGE_MODE=persistent / "
+        "DATAPULSE_NATIVE_COLLECTOR_BRIDGE_WORKERS)"
     )
 
     def check(self) -> dict[str, str | bool]:
@@ -85,9 +97,17 @@ class NativeBridgeCollector(BaseCollector):
                 "message": f"{BRIDGE_CMD_ENV} not set; native sidecar bridge disabled",
                 "available": False,
             }
+        message = f"native sidecar bridge configured for profile {self.bridge_profile}"
+        if self._persistent_mode():
+            pool = get_bridge_pool(self._command(), cwd=self._workdir(), env=self._bridge_env(), workers=self._worker_count())
+            health = pool.health_check()
+            message += (
+                f" (persistent: {health['healthy']}/{health['workers']} workers healthy, "
+                f"{health['restarts']} restarts)"
+            )
         return {
             "status": "ok",
-            "message": f"native sidecar bridge configured for profile {self.bridge_profile}",
+            "message": message,
             "available": True,
         }
 
@@ -106,6 +126,11 @@ class NativeBridgeCollector(BaseCollector):
         timeout_seconds = self._timeout_seconds()
         request_payload = self._build_request(url, source_type_hint, timeout_seconds)
 
+        if self._persistent_mode():
+            persistent = self._parse_persistent(command, url, source_type_hint, request_payload, timeout_seconds)
+            if persistent is not None:
+                return persistent
+
         try:
             completed = subprocess.run(
                 command,
@@ -145,6 +170,35 @@ class NativeBridgeCollector(BaseCollector):
 
         return self._normalize_response(url, source_type_hint, payload)
 
+    def _parse_persistent(
+        self,
+        command: list[str],
+        url: str,
+        source_type_hint: str,
+        request_payload: dict[str, object],
+        timeout_seconds: int,
+    ) -> ParseResult | None:
+        """Serve the request from a long-running worker; ``None`` means fall back to one-shot."""
+        pool = get_bridge_pool(command, cwd=self._workdir(), env=self._bridge_env(), workers=self._worker_count())
+        try:
+            payload = pool.request(dict(request_payload), timeout=timeout_seconds)
+        except TimeoutError:
+            return ParseResult.failure(
+                url,
+                f"bridge_unavailable: native bridge timed out after {timeout_seconds}s",
+            )
+        except BridgeWorkerError as exc:
+            logger.warning("Persistent native bridge unavailable, using one-shot mode: %s", exc)
+            return None
+        payload.pop("request_id", None)
+        return self._normalize_response(url, source_type_hint, payload, transport="subprocess_jsonl")
+
+    def _persistent_mode(self) -> bool:
+        return os.getenv(BRIDGE_MODE_ENV, BRIDGE_MODE_ONESHOT).strip().lower() == BRIDGE_MODE_PERSISTENT
+
+    def _worker_count(self) -> int:
+        return read_env_int(BRIDGE_WORKERS_ENV, 1, min_value=1, max_value=16)
+
     def _command(self) -> list[str]:
         raw = os.getenv(BRIDGE_CMD_ENV, "").strip()
         if not raw:
@@ -226,6 +280,8 @@ class NativeBridgeCollector(BaseCollector):
         url: str,
         source_type_hint: str,
         payload: object,
+        *,
+        transport: str = "subprocess_json",
     ) -> ParseResult:
         if not isinstance(payload, dict):
             return ParseResult.failure(url, "bridge_unavailable: native bridge result must be a JSON object")
@@ -265,7 +321,7 @@ class NativeBridgeCollector(BaseCollector):
         provenance: dict[str, object] = {
             "collector_family": str(provenance_payload.get("collector_family", "native_sidecar")),
             "bridge_profile": str(provenance_payload.get("bridge_profile", self.bridge_profile)),
-            "transport": str(provenance_payload.get("transport", "subprocess_json")),
+            "transport": str(provenance_payload.get("transport", transport)),
             "session_key": session_key,
             "session_mode": str(
                 provenance_payload.get(
@@ -0,0 +1,331 @@
+"""Persistent native bridge workers speaking a pipelined JSON-lines protocol.
+
+One-shot mode spawns ``DATAPULSE_NATIVE_COLLECTOR_BRIDGE_CMD`` per URL, so
+every read pays the sidecar's startup (crawler imports, browser bootstraps).
+In persistent mode (``DATAPULSE_NATIVE_COLLECTOR_BRIDGE_MODE=persistent``) the
+same command is started once per worker with
+``DATAPULSE_NATIVE_COLLECTOR_BRIDGE_PROTOCOL=jsonl`` and kept alive:
+
+- each request is the usual request document plus a ``request_id``, written
+  as one line on ``stdin``;
+- each response is the usual result document echoing that ``request_id``,
+  written as one line on ``stdout`` in any order, so many requests can be in
+  flight per worker;
+- a ``native_collector_bridge_ping.v1`` line is a health check and must be
+  answered with ``{"request_id": ..., "ok": true}``.
+
+A worker that exits fails its in-flight requests and is restarted on the next
+request after an exponential backoff. Each process gets its own pending map,
+so the exiting process's reader thread can only fail its own requests.
+"""
+
+from __future__ import annotations
+
+import atexit
+import itertools
+import json
+import logging
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+logger = logging.getLogger("datapulse.parsers.native_bridge_pool")
+
+PING_SCHEMA_VERSION = "native_collector_bridge_ping.v1"
+PROTOCOL_ENV = "DATAPULSE_NATIVE_COLLECTOR_BRIDGE_PROTOCOL"
+PROTOCOL_JSONL = "jsonl"
+
+DEFAULT_PING_TIMEOUT_SECONDS = 5.0
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+_STDERR_TAIL_LINES = 20
+
+
+class BridgeWorkerError(RuntimeError):
+    """The persistent bridge could not serve a request (start failure, crash, broken pipe)."""
+
+
+class BridgeWorker:
+    """One long-running sidecar process with request-id multiplexing over stdin/stdout."""
+
+    def __init__(self, command: list[str], *, cwd: str | None, env: dict[str, str], name: str = "bridge-worker"):
+        self.command = list(command)
+        self.cwd = cwd
+        self.env = {**env, PROTOCOL_ENV: PROTOCOL_JSONL}
+        self.name = name
+        self._process: subprocess.Popen[str] | None = None
+        self._pending: dict[str, Future[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._stderr_tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+        self.started_at = 0.0
+        self.completed = 0
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self._process is not None else None
+
+    def last_error_line(self) -> str:
+        return self._stderr_tail[-1] if self._stderr_tail else ""
+
+    def start(self) -> None:
+        pending: dict[str, Future[dict[str, Any]]] = {}
+        try:
+            process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+                cwd=self.cwd,
+                env=self.env,
+            )
+        except OSError as exc:
+            raise BridgeWorkerError(str(exc)) from exc
+        with self._lock:
+            self._process, self._pending = process, pending
+        self.started_at = time.monotonic()
+        threading.Thread(
+            target=self._read_stdout, args=(process, pending), name=f"{self.name}-stdout", daemon=True
+        ).start()
+        threading.Thread(target=self._read_stderr, args=(process,), name=f"{self.name}-stderr", daemon=True).start()
+
+    def _read_stdout(self, process: subprocess.Popen[str], pending: dict[str, Future[dict[str, Any]]]) -> None:
+        assert process.stdout is not None
+        for line in process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("%s wrote a non-JSON line; ignoring", self.name)
+                continue
+            request_id = str(payload.get("request_id", "")) if isinstance(payload, dict) else ""
+            with self._lock:
+                future = pending.pop(request_id, None)
+            if future is None:
+                logger.debug("%s answered unknown or expired request %r", self.name, request_id)
+                continue
+            self.completed += 1
+            future.set_result(payload)
+        process.wait()
+        detail = self.last_error_line()
+        self._fail_pending(
+            pending,
+            f"native bridge worker exited with code {process.returncode}" + (f" ({detail})" if detail else ""),
+        )
+
+    def _read_stderr(self, process: subprocess.Popen[str]) -> None:
+        assert process.stderr is not None
+        for line in process.stderr:
+            if line.strip():
+                self._stderr_tail.append(line.strip())
+
+    def _fail_pending(self, pending: dict[str, Future[dict[str, Any]]], reason: str) -> None:
+        with self._lock:
+            futures = list(pending.values())
+            pending.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(BridgeWorkerError(reason))
+
+    def submit(self, payload: dict[str, Any]) -> tuple[str, Future[dict[str, Any]]]:
+        with self._lock:
+            process, pending = self._process, self._pending
+        if process is None or process.poll() is not None or process.stdin is None:
+            raise BridgeWorkerError("native bridge worker is not running")
+        request_id = f"{self.name}-{next(self._ids)}"
+        future: Future[dict[str, Any]] = Future()
+        with self._lock:
+            pending[request_id] = future
+        line = json.dumps({**payload, "request_id": request_id}, ensure_ascii=True) + "\n"
+        try:
+            with self._write_lock:
+                process.stdin.write(line)
+                process.stdin.flush()
+        except (OSError, ValueError) as exc:
+            with self._lock:
+                pending.pop(request_id, None)
+            raise BridgeWorkerError(f"native bridge worker pipe closed: {exc}") from exc
+        return request_id, future
+
+    def forget(self, request_id: str) -> None:
+        with self._lock:
+            self._pending.pop(request_id, None)
+
+    def ping(self, timeout: float = DEFAULT_PING_TIMEOUT_SECONDS) -> bool:
+        try:
+            request_id, future = self.submit({"schema_version": PING_SCHEMA_VERSION})
+        except BridgeWorkerError:
+            return False
+        try:
+            return bool(future.result(timeout=timeout).get("ok", False))
+        except (FutureTimeoutError, BridgeWorkerError):
+            self.forget(request_id)
+            return False
+
+    def stop(self, timeout: float = 3.0) -> None:
+        with self._lock:
+            process, self._process = self._process, None
+            pending = self._pending
+        if process is None:
+            return
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+            process.wait(timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        self._fail_pending(pending, "native bridge worker stopped")
+
+
+class BridgeWorkerPool:
+    """Fixed-size set of :class:`BridgeWorker` with least-loaded dispatch and crash backoff."""
+
+    def __init__(self, command: list[str], *, cwd: str | None, env: dict[str, str], workers: int = 1):
+        self.command = list(command)
+        self.cwd = cwd
+        self.size = max(1, int(workers))
+        self._workers = [BridgeWorker(command, cwd=cwd, env=env, name=f"bridge-worker-{index}") for index in range(self.size)]
+        self._failures = [0] * self.size
+        self._retry_at = [0.0] * self.size
+        self._lock = threading.Lock()
+        self.restarts = 0
+
+    def _ready_worker(self) -> BridgeWorker:
+        """Least-loaded live worker, (re)starting dead ones whose backoff has elapsed."""
+        now = time.monotonic()
+        with self._lock:
+            candidates: list[BridgeWorker] = []
+            for index, worker in enumerate(self._workers):
+                if not worker.alive:
+                    if now < self._retry_at[index]:
+                        continue
+                    if worker.started_at:
+                        self.restarts += 1
+                        logger.warning(
+                            "Restarting native bridge worker %s after exit (%s)", worker.name, worker.last_error_line() or "no stderr"
+                        )
+                    try:
+                        worker.start()
+                    except BridgeWorkerError as exc:
+                        self._record_failure(index, now)
+                        logger.warning("Native bridge worker %s failed to start: %s", worker.name, exc)
+                        continue
+                candidates.append(worker)
+            if not candidates:
+                raise BridgeWorkerError("no native bridge worker available (restart backoff in effect)")
+            return min(candidates, key=lambda worker: worker.in_flight)
+
+    def _record_failure(self, index: int, now: float) -> None:
+        self._failures[index] += 1
+        delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** (self._failures[index] - 1)))
+        self._retry_at[index] = now + delay
+
+    def _record_outcome(self, worker: BridgeWorker, *, ok: bool) -> None:
+        index = self._workers.index(worker)
+        with self._lock:
+            if ok:
+                self._failures[index] = 0
+                self._retry_at[index] = 0.0
+            else:
+                self._record_failure(index, time.monotonic())
+
+    def request(self, payload: dict[str, Any], *, timeout: float) -> dict[str, Any]:
+        """Send one request and wait for its response; raises ``TimeoutError`` or :class:`BridgeWorkerError`."""
+        worker = self._ready_worker()
+        try:
+            request_id, future = worker.submit(payload)
+        except BridgeWorkerError:
+            self._record_outcome(worker, ok=False)
+            raise
+        try:
+            response = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            worker.forget(request_id)
+            raise TimeoutError(f"native bridge timed out after {timeout}s") from None
+        except BridgeWorkerError:
+            self._record_outcome(worker, ok=False)
+            raise
+        self._record_outcome(worker, ok=True)
+        return response
+
+    def health_check(self, timeout: float = DEFAULT_PING_TIMEOUT_SECONDS) -> dict[str, Any]:
+        """Ping every idle running worker; unresponsive ones are stopped so the next request restarts them.
+
+        Busy workers are counted healthy without a ping: a slow in-flight read
+        would miss the ping deadline, and stopping the worker would fail it.
+        """
+        healthy = 0
+        for worker in self._workers:
+            if not worker.alive:
+                continue
+            if worker.in_flight > 0 or worker.ping(timeout):
+                healthy += 1
+            else:
+                logger.warning("Native bridge worker %s failed its health check; stopping it", worker.name)
+                worker.stop()
+                self._record_outcome(worker, ok=False)
+        return {**self.stats(), "healthy": healthy}
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.size,
+            "alive": sum(1 for worker in self._workers if worker.alive),
+            "in_flight": sum(worker.in_flight for worker in self._workers),
+            "completed": sum(worker.completed for worker in self._workers),
+            "restarts": self.restarts,
+        }
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+
+
+_POOLS: dict[tuple[Any, ...], BridgeWorkerPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_bridge_pool(command: list[str], *, cwd: str | None, env: dict[str, str], workers: int) -> BridgeWorkerPool:
+    """Process-wide pool per (command, workdir, size); a changed config gets a fresh pool."""
+    key = (tuple(command), cwd, max(1, int(workers)))
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = BridgeWorkerPool(command, cwd=cwd, env=env, workers=workers)
+            _POOLS[key] = pool
+        return pool
+
+
+def running_bridge_pools() -> list[BridgeWorkerPool]:
+    with _POOLS_LOCK:
+        return list(_POOLS.values())
+
+
+def close_bridge_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_bridge_pools)
@@ -1,15 +1,28 @@
-"""Telegram collector using Telethon API (optional dependency)."""
+"""Telegram collector using Telethon API (optional dependency).
+
+Reads share one long-lived client (see ``telegram_pool.py``). With
+``DATAPULSE_TG_INCREMENTAL`` on (the default), reads made inside a
+:func:`~datapulse.collectors.base.read_scope` (watch runs) persist each
+channel's newest read message id for that scope, and the scope's later reads
+only return messages after it. Ad-hoc reads always return the recent window
+and never move a cursor.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import os
 from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
 
 from datapulse.core.models import SourceType
-from datapulse.core.utils import run_sync
 
-from .base import BaseCollector, ParseResult
+from .base import BaseCollector, ParseResult, current_read_scope
+from .telegram_pool import TelegramCursorStore, get_telegram_manager
+
+
+def _incremental_enabled() -> bool:
+    return os.getenv("DATAPULSE_TG_INCREMENTAL", "1").strip().lower() not in {"0", "false", "no", "off"}
 
 
 class TelegramCollector(BaseCollector):
@@ -41,7 +54,7 @@ class TelegramCollector(BaseCollector):
             return ParseResult.failure(url, "Cannot parse Telegram channel")
 
         try:
-            from telethon import TelegramClient
+            import telethon  # noqa: F401
         except ImportError:
             return ParseResult.failure(url, "Telethon not installed. pip install -e '.[telegram]'")
 
@@ -54,26 +67,27 @@ class TelegramCollector(BaseCollector):
         max_chars = int(os.getenv("DATAPULSE_TG_MAX_CHARS", "800"))
         cutoff_hours = int(os.getenv("DATAPULSE_TG_CUTOFF_HOURS", "24"))
         cutoff = datetime.now(timezone.utc) - timedelta(hours=cutoff_hours)
-        messages: list[str] = []
+        scope = current_read_scope()
+        cursors = TelegramCursorStore() if scope and _incremental_enabled() else None
+        min_id = cursors.min_id(channel, scope=scope) if cursors is not None else 0
         try:
-            async def fetch() -> list[str]:
-                from telethon.tl.types import Message
-
-                async with TelegramClient(os.getenv("TG_SESSION_PATH", "./tg_session"), int(api_id), api_hash) as client:
-                    entity = await client.get_entity(channel)
-                    async for msg in client.iter_messages(entity, limit=max_messages):
-                        if not isinstance(msg, Message) or not msg.text:
-                            continue
-                        if msg.date < cutoff:
-                            break
-                        messages.append(f"[{msg.date.isoformat()}] {msg.text[:max_chars]}")
-                return messages
-
-            content_rows = run_sync(asyncio.wait_for(fetch(), timeout=30))
-            if not content_rows:
+            batch = get_telegram_manager().fetch_sync(
+                (os.getenv("TG_SESSION_PATH", "./tg_session"), int(api_id), api_hash),
+                channel,
+                timeout=30,
+                limit=max_messages,
+                min_id=min_id,
+                cutoff=cutoff,
+                max_chars=max_chars,
+            )
+            if cursors is not None:
+                cursors.advance(channel, batch.newest_id, scope=scope)
+            if not batch.rows:
+                if min_id:
+                    return ParseResult.failure(url, f"No new Telegram messages since message {min_id}")
                 return ParseResult.failure(url, "No recent Telegram messages found")
 
-            content = "\n\n".join(content_rows)
+            content = "\n\n".join(batch.rows)
             return ParseResult(
                 url=url,
                 title=f"Telegram: {channel}",
@@ -83,7 +97,7 @@ class TelegramCollector(BaseCollector):
                 source_type=self.source_type,
                 tags=["telegram", "latest-messages"],
                 confidence_flags=["telethon"],
-                extra={"channel": channel, "count": len(content_rows)},
+                extra={"channel": channel, "count": len(batch.rows), "min_id": min_id, "newest_id": batch.newest_id},
             )
         except asyncio.TimeoutError:
             return ParseResult.failure(url, "Telegram fetch timed out (30s)")
@@ -94,7 +108,8 @@ class TelegramCollector(BaseCollector):
 
     @staticmethod
     def _extract_channel(url: str) -> str:
-        parts = [p for p in url.split("/") if p and not p.startswith("http")]
+        parsed = urlparse(url if "://" in url else f"https://{url}")
+        parts = [p for p in parsed.path.split("/") if p]
         if not parts:
             return ""
         return parts[0]
@@ -0,0 +1,253 @@
+"""Long-lived Telethon client and per-channel message cursors.
+
+``TelegramCollector.parse`` used to open a client, resolve the channel and
+page from the newest message on every call. The manager below keeps one
+connected client per (session, api id) on a background loop, so concurrent
+reads of many channels share one connection. Resolved entities are cached per
+client. :class:`TelegramCursorStore` remembers, per read scope (a watch
+mission), the newest message id read from each channel; the next read in that
+scope passes it as ``min_id`` so it fetches only newer messages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from datapulse.core.filestore import ReloadableStore
+from datapulse.core.utils import BackgroundLoop, telegram_cursors_path_from_env
+
+logger = logging.getLogger("datapulse.parsers.telegram_pool")
+
+DEFAULT_FETCH_CONCURRENCY = 4
+
+ClientKey = tuple[str, int, str]
+SessionKey = tuple[str, int]
+ClientFactory = Callable[[str, int, str], Any]
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def _channel_key(channel: str) -> str:
+    return channel.strip().lstrip("@").lower()
+
+
+def _cursor_key(scope: str, channel: str) -> str:
+    return f"{scope}|{_channel_key(channel)}"
+
+
+class TelegramCursorStore(ReloadableStore):
+    """JSON map of (scope, channel) -> newest message id already read in that scope."""
+
+    def __init__(self, path: str | None = None):
+        self.path = Path(path or telegram_cursors_path_from_env())
+        self.cursors: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        self._mark_loaded()
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8")) if self.path.exists() else {}
+        except (OSError, json.JSONDecodeError):
+            raw = {}
+        cursors = raw.get("cursors", {}) if isinstance(raw, dict) else {}
+        self.cursors = {str(key): dict(value) for key, value in cursors.items() if isinstance(value, dict)}
+
+    def min_id(self, channel: str, *, scope: str) -> int:
+        self.reload_if_changed()
+        try:
+            return int(self.cursors.get(_cursor_key(scope, channel), {}).get("min_id", 0) or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def advance(self, channel: str, message_id: int, *, scope: str) -> bool:
+        """Move the scope's cursor forward to ``message_id``; never moves it back."""
+        with self._transaction():
+            if message_id <= self.min_id(channel, scope=scope):
+                return False
+            self.cursors[_cursor_key(scope, channel)] = {"min_id": int(message_id), "updated_at": _utcnow()}
+            self._write_json({"cursors": self.cursors})
+            return True
+
+    def reset(self, channel: str | None = None, *, scope: str | None = None) -> None:
+        """Drop cursors matching ``channel`` and/or ``scope``; with neither, drop them all."""
+        with self._transaction():
+            channel_key = _channel_key(channel) if channel is not None else None
+            self.cursors = {
+                key: value
+                for key, value in self.cursors.items()
+                if not (
+                    (scope is None or key.partition("|")[0] == scope)
+                    and (channel_key is None or key.partition("|")[2] == channel_key)
+                )
+            }
+            self._write_json({"cursors": self.cursors})
+
+
+@dataclass
+class ChannelBatch:
+    """Messages read from one channel: formatted rows plus the newest id seen."""
+
+    rows: list[str]
+    newest_id: int
+
+
+def default_client_factory(session_path: str, api_id: int, api_hash: str) -> Any:
+    from telethon import TelegramClient
+
+    return TelegramClient(session_path, api_id, api_hash)
+
+
+class TelegramClientManager:
+    """Keeps one connected Telethon client (and entity cache) per (session, api id) on a background loop."""
+
+    def __init__(self, *, client_factory: ClientFactory | None = None, concurrency: int = DEFAULT_FETCH_CONCURRENCY):
+        self._client_factory = client_factory or default_client_factory
+        self._loop = BackgroundLoop("datapulse-telegram")
+        self._concurrency = max(1, int(concurrency))
+        # Only touched on the manager loop. Clients remember the api hash they were started with.
+        self._clients: dict[SessionKey, tuple[Any, str]] = {}
+        self._connect_lock: asyncio.Lock | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._entities: dict[SessionKey, dict[str, Any]] = {}
+        self.connects = 0
+        self.entity_lookups = 0
+
+    async def _connected_client(self, key: ClientKey) -> Any:
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        session = (key[0], key[1])
+        async with self._connect_lock:
+            current = self._clients.get(session)
+            if current is not None and current[1] == key[2] and _is_connected(current[0]):
+                return current[0]
+            if current is not None:
+                await self._disconnect(session)
+            client = self._client_factory(*key)
+            await client.start()
+            self._clients[session] = (client, key[2])
+            self.connects += 1
+            return client
+
+    async def _entity(self, session: SessionKey, client: Any, channel: str) -> Any:
+        entities = self._entities.setdefault(session, {})
+        key = _channel_key(channel)
+        entity = entities.get(key)
+        if entity is None:
+            entity = await client.get_entity(channel)
+            entities[key] = entity
+            self.entity_lookups += 1
+        return entity
+
+    async def fetch(
+        self,
+        key: ClientKey,
+        channel: str,
+        *,
+        limit: int,
+        min_id: int = 0,
+        cutoff: datetime | None = None,
+        max_chars: int = 800,
+    ) -> ChannelBatch:
+        """Read up to ``limit`` messages newer than ``min_id`` (and ``cutoff``); reconnects once on a dropped link."""
+        session = (key[0], key[1])
+        for attempt in (1, 2):
+            client = await self._connected_client(key)
+            assert self._semaphore is not None
+            try:
+                async with self._semaphore:
+                    return await self._read(
+                        session, client, channel, limit=limit, min_id=min_id, cutoff=cutoff, max_chars=max_chars
+                    )
+            except (ConnectionError, OSError) as exc:
+                if attempt == 2:
+                    raise
+                logger.warning("Telegram connection dropped (%s); reconnecting", exc)
+                async with self._connect_lock:  # type: ignore[union-attr]
+                    current = self._clients.get(session)
+                    if current is not None and current[0] is client:
+                        await self._disconnect(session)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _read(
+        self,
+        session: SessionKey,
+        client: Any,
+        channel: str,
+        *,
+        limit: int,
+        min_id: int,
+        cutoff: datetime | None,
+        max_chars: int,
+    ) -> ChannelBatch:
+        entity = await self._entity(session, client, channel)
+        rows: list[str] = []
+        newest_id = min_id
+        async for msg in client.iter_messages(entity, limit=limit, min_id=min_id):
+            newest_id = max(newest_id, int(getattr(msg, "id", 0) or 0))
+            text = getattr(msg, "text", None)
+            if not text:
+                continue
+            if cutoff is not None and msg.date < cutoff:
+                break
+            rows.append(f"[{msg.date.isoformat()}] {text[:max_chars]}")
+        return ChannelBatch(rows=rows, newest_id=newest_id)
+
+    def fetch_sync(self, key: ClientKey, channel: str, *, timeout: float, **kwargs: Any) -> ChannelBatch:
+        """Blocking wrapper for sync callers; raises ``asyncio.TimeoutError`` past ``timeout``."""
+        return self._loop.call(lambda: asyncio.wait_for(self.fetch(key, channel, **kwargs), timeout=timeout))
+
+    async def _disconnect(self, session: SessionKey) -> None:
+        current = self._clients.pop(session, None)
+        self._entities.pop(session, None)
+        if current is None:
+            return
+        try:
+            await current[0].disconnect()
+        except Exception as exc:  # noqa: BLE001 - already gone
+            logger.debug("Telegram disconnect failed: %s", exc)
+
+    async def _disconnect_all(self) -> None:
+        for session in list(self._clients):
+            await self._disconnect(session)
+
+    def close(self) -> None:
+        self._loop.stop(self._disconnect_all)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "connected": bool(self._clients),
+            "clients": len(self._clients),
+            "connects": self.connects,
+            "cached_entities": sum(len(entities) for entities in self._entities.values()),
+            "entity_lookups": self.entity_lookups,
+        }
+
+
+def _is_connected(client: Any) -> bool:
+    check = getattr(client, "is_connected", None)
+    return bool(check()) if callable(check) else True
+
+
+_SHARED_MANAGER: TelegramClientManager | None = None
+_SHARED_MANAGER_LOCK = threading.Lock()
+
+
+def get_telegram_manager() -> TelegramClientManager:
+    """Process-wide manager, created on first use and disconnected at interpreter exit."""
+    global _SHARED_MANAGER
+    with _SHARED_MANAGER_LOCK:
+        if _SHARED_MANAGER is None:
+            _SHARED_MANAGER = TelegramClientManager()
+            atexit.register(_SHARED_MANAGER.close)
+        return _SHARED_MANAGER
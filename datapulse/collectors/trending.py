@@ -1,15 +1,36 @@
-"""Trending topics collector via trends24.in (server-side rendered)."""
+"""Trending topics collector via trends24.in (server-side rendered).
+
+trends24.in refreshes each location once an hour, so parsed snapshots are
+cached per page until the top of the next hour. Empty or placeholder-only
+pages are kept for only ``DEGRADED_SNAPSHOT_TTL_SECONDS``, so a bad fetch is
+retried soon instead of being served for the rest of the hour. Concurrent
+callers asking for the same page share one fetch, and all page requests to the
+host are spaced by ``DATAPULSE_TRENDING_MIN_INTERVAL``. With
+``DATAPULSE_TRENDING_HISTORY_PATH`` set, every fetched page is also merged
+into a persisted per-location history so callers can compute trend deltas.
+"""
 
 from __future__ import annotations
 
+import json
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
 from urllib.parse import quote, urlparse
 
 import requests
 from bs4 import BeautifulSoup
 
+from datapulse.core.cache import TTLCache
+from datapulse.core.config import read_env_float, read_env_int, read_env_str
+from datapulse.core.cpu_pool import run_cpu_bound, should_offload
+from datapulse.core.filestore import ReloadableStore
 from datapulse.core.models import SourceType
 from datapulse.core.retry import retry
 from datapulse.core.utils import generate_excerpt
@@ -120,6 +141,170 @@ def build_trending_url(location: str = "") -> str:
     return f"https://trends24.in/{quote(slug, safe='-')}/"
 
 
+def location_key(location: str = "") -> str:
+    """Stable key for a location: its trends24.in slug, or ``worldwide``."""
+    return normalize_location(location) or "worldwide"
+
+
+DEGRADED_SNAPSHOT_TTL_SECONDS = 60.0
+
+
+def _seconds_until_next_hour(now: float | None = None) -> float:
+    now = time.time() if now is None else now
+    return max(1.0, 3600.0 - (now % 3600.0))
+
+
+def _copy_snapshots(snapshots: list[TrendSnapshot], top_n: int = 0) -> list[TrendSnapshot]:
+    """Copies callers may trim without touching the cached page."""
+    return [
+        TrendSnapshot(
+            timestamp=snap.timestamp,
+            timestamp_utc=snap.timestamp_utc,
+            trends=list(snap.trends[:top_n] if top_n > 0 else snap.trends),
+        )
+        for snap in snapshots
+    ]
+
+
+class _HostRateLimiter:
+    """Spaces request starts to one host across all threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self, min_interval: float) -> None:
+        if min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Parsed pages by URL, expiring at the top of the hour when trends24.in refreshes.
+_snapshot_cache = TTLCache(maxsize=512, ttl=3600)
+_fetch_locks: dict[str, threading.Lock] = {}
+_fetch_locks_guard = threading.Lock()
+_trends24_limiter = _HostRateLimiter()
+
+
+def clear_snapshot_cache() -> None:
+    """Drop cached trends24.in pages (the next read of every location refetches)."""
+    _snapshot_cache.clear()
+
+
+def _fetch_lock(url: str) -> threading.Lock:
+    with _fetch_locks_guard:
+        lock = _fetch_locks.get(url)
+        if lock is None:
+            lock = _fetch_locks[url] = threading.Lock()
+        return lock
+
+
+class TrendingHistoryStore(ReloadableStore):
+    """Per-location trend snapshots persisted across runs, newest first.
+
+    Snapshots are keyed by their UTC timestamp so re-reading a page (which lists
+    the last day of hourly snapshots) never duplicates entries.
+    """
+
+    def __init__(self, path: str, *, max_snapshots: int = 168):
+        self.path = Path(path).expanduser()
+        self.max_snapshots = max(2, int(max_snapshots))
+        self.locations: dict[str, list[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        self._mark_loaded()
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8")) if self.path.exists() else {}
+        except (OSError, json.JSONDecodeError):
+            raw = {}
+        locations = raw.get("locations", {}) if isinstance(raw, dict) else {}
+        self.locations = {
+            str(key): [row for row in rows if isinstance(row, dict)]
+            for key, rows in locations.items()
+            if isinstance(rows, list)
+        }
+
+    def record(self, location: str, snapshots: list[TrendSnapshot], *, fetched_at: datetime | None = None) -> int:
+        """Merge ``snapshots`` into the location history; returns how many were new."""
+        if not snapshots:
+            return 0
+        fetched_hour = (fetched_at or datetime.now(timezone.utc)).replace(minute=0, second=0, microsecond=0)
+        rows: list[dict[str, Any]] = []
+        for index, snap in enumerate(snapshots):
+            key = snap.timestamp_utc
+            if not key:
+                # Without a UTC stamp only the newest snapshot can be placed in time.
+                if index:
+                    continue
+                key = fetched_hour.isoformat()
+            rows.append({
+                "snapshot_time": key,
+                "trends": [{"rank": t.rank, "name": t.name, "volume_raw": t.volume_raw} for t in snap.trends],
+            })
+
+        with self._lock, self._transaction():
+            loc = location_key(location)
+            existing = {row.get("snapshot_time"): row for row in self.locations.get(loc, [])}
+            added = sum(1 for row in rows if row["snapshot_time"] not in existing)
+            if not added:
+                return 0
+            existing.update({row["snapshot_time"]: row for row in rows})
+            merged = sorted(existing.values(), key=lambda row: str(row.get("snapshot_time", "")), reverse=True)
+            self.locations[loc] = merged[: self.max_snapshots]
+            self._write_json({"locations": self.locations})
+            return added
+
+    def snapshots(self, location: str) -> list[dict[str, Any]]:
+        self.reload_if_changed()
+        return list(self.locations.get(location_key(location), []))
+
+    def deltas(self, location: str) -> dict[str, Any]:
+        """Compare the two newest recorded snapshots: new, dropped and moving topics."""
+        rows = self.snapshots(location)
+        payload: dict[str, Any] = {
+            "location": location_key(location),
+            "current": rows[0]["snapshot_time"] if rows else "",
+            "previous": rows[1]["snapshot_time"] if len(rows) > 1 else "",
+            "new": [],
+            "dropped": [],
+            "movers": [],
+        }
+        if len(rows) < 2:
+            return payload
+        current = {t["name"]: t for t in rows[0].get("trends", []) if t.get("name")}
+        previous = {t["name"]: t for t in rows[1].get("trends", []) if t.get("name")}
+        payload["new"] = [name for name in current if name not in previous]
+        payload["dropped"] = [name for name in previous if name not in current]
+        for name, trend in current.items():
+            before = previous.get(name)
+            if before is None or before.get("rank") == trend.get("rank"):
+                continue
+            payload["movers"].append({
+                "name": name,
+                "rank": trend.get("rank"),
+                "previous_rank": before.get("rank"),
+                "change": int(before.get("rank", 0)) - int(trend.get("rank", 0)),
+            })
+        payload["movers"].sort(key=lambda row: -abs(row["change"]))
+        return payload
+
+
+def trending_history_from_env() -> TrendingHistoryStore | None:
+    """History store at ``DATAPULSE_TRENDING_HISTORY_PATH``, or ``None`` when unset."""
+    path = read_env_str("DATAPULSE_TRENDING_HISTORY_PATH")
+    if not path:
+        return None
+    max_snapshots = read_env_int("DATAPULSE_TRENDING_HISTORY_MAX", 168, min_value=2, max_value=5000)
+    return TrendingHistoryStore(path, max_snapshots=max_snapshots)
+
+
 class TrendingCollector(BaseCollector):
     name = "trending"
     source_type = SourceType.TRENDING
@@ -137,11 +322,10 @@ class TrendingCollector(BaseCollector):
     def parse(self, url: str) -> ParseResult:
         """Parse a trends24.in page and return the latest snapshot as content."""
         try:
-            html = self._fetch_page(url)
+            snapshots = self._load_snapshots(url)
         except requests.RequestException as exc:
             return ParseResult.failure(url, f"Trending fetch failed: {exc}")
 
-        snapshots = self._parse_html(html, url)
         if not snapshots:
             return ParseResult.failure(url, "No trending data found on page")
 
@@ -194,13 +378,7 @@ class TrendingCollector(BaseCollector):
         self, location: str = "", top_n: int = 20
     ) -> list[TrendSnapshot]:
         """Public method for reader.trending() — returns all hourly snapshots."""
-        url = build_trending_url(location)
-        html = self._fetch_page(url)
-        snapshots = self._parse_html(html, url)
-        # Limit trends per snapshot
-        if top_n > 0:
-            for snap in snapshots:
-                snap.trends = snap.trends[:top_n]
+        snapshots = _copy_snapshots(self._load_snapshots(build_trending_url(location)), top_n)
         location_slug = normalize_location(location)
         if (
             snapshots
@@ -210,6 +388,66 @@ class TrendingCollector(BaseCollector):
             raise ValueError("Low-signal trending snapshot (placeholder topics)")
         return snapshots
 
+    def fetch_snapshots_many(
+        self,
+        locations: list[str],
+        top_n: int = 20,
+        *,
+        concurrency: int | None = None,
+    ) -> tuple[dict[str, list[TrendSnapshot]], dict[str, str]]:
+        """Fetch several locations in parallel under the trends24.in rate limit.
+
+        Returns ``(snapshots_by_location, errors_by_location)``, both keyed by
+        :func:`location_key`; duplicate or aliased locations are fetched once.
+        """
+        keys = list(dict.fromkeys(location_key(loc) for loc in locations))
+        results: dict[str, list[TrendSnapshot]] = {}
+        errors: dict[str, str] = {}
+        if not keys:
+            return results, errors
+        if concurrency is None:
+            concurrency = read_env_int("DATAPULSE_TRENDING_CONCURRENCY", 4, min_value=1, max_value=32)
+
+        def _one(key: str) -> list[TrendSnapshot]:
+            return self.fetch_snapshots("" if key == "worldwide" else key, top_n)
+
+        with ThreadPoolExecutor(max_workers=min(max(1, concurrency), len(keys)), thread_name_prefix="datapulse-trending") as pool:
+            futures = {key: pool.submit(_one, key) for key in keys}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    errors[key] = str(exc) or exc.__class__.__name__
+        return results, errors
+
+    def _load_snapshots(self, url: str) -> list[TrendSnapshot]:
+        """Parsed snapshots for ``url``, fetched at most once per hour (shared, do not mutate)."""
+        cached = _snapshot_cache.get(url)
+        if cached is not None:
+            return cached
+        with _fetch_lock(url):
+            cached = _snapshot_cache.get(url)
+            if cached is not None:
+                return cached
+            html = self._fetch_page(url)
+            if should_offload(len(html)):
+                snapshots = run_cpu_bound(_parse_trending_page, html, url)
+            else:
+                snapshots = self._parse_html(html, url)
+            degraded = not snapshots or self._is_low_signal_snapshot(snapshots[0])
+            ttl = DEGRADED_SNAPSHOT_TTL_SECONDS if degraded else _seconds_until_next_hour()
+            _snapshot_cache.set(url, snapshots, ttl=ttl)
+        self._record_history(url, snapshots)
+        return snapshots
+
+    def _record_history(self, url: str, snapshots: list[TrendSnapshot]) -> None:
+        try:
+            history = trending_history_from_env()
+            if history is not None:
+                history.record(self._extract_location(url), snapshots)
+        except OSError as exc:
+            logger.warning("Trending history write failed for %s: %s", url, exc)
+
     @staticmethod
     def _is_placeholder_topic(name: str) -> bool:
         lowered = (name or "").strip().lower()
@@ -230,6 +468,7 @@ class TrendingCollector(BaseCollector):
 
     @retry(max_attempts=2, retryable=(requests.RequestException,))
     def _fetch_page(self, url: str) -> str:
+        _trends24_limiter.wait(read_env_float("DATAPULSE_TRENDING_MIN_INTERVAL", 0.5, min_value=0.0, max_value=30.0))
         resp = requests.get(
             url,
             timeout=20,
@@ -367,3 +606,8 @@ class TrendingCollector(BaseCollector):
 
         lines.append(f"\nTotal trending topics: {len(snapshot.trends)}")
         return "\n".join(lines)
+
+
+def _parse_trending_page(html: str, url: str) -> list[TrendSnapshot]:
+    """Worker-process entry point for :meth:`TrendingCollector._parse_html`."""
+    return TrendingCollector()._parse_html(html, url)
@@ -7,15 +7,19 @@ import logging
 import os
 import random
 import re
+import threading
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from typing import Any
 from urllib.parse import urlparse
 
 import requests
 from bs4 import BeautifulSoup
 
+from datapulse.core.cache import TTLCache
 from datapulse.core.config import read_env_bool, read_env_int
 from datapulse.core.jina_client import JinaAPIClient, JinaBlockedByPolicyError, JinaReadOptions
 from datapulse.core.models import MediaType, SourceType
@@ -37,6 +41,10 @@ _DEFAULT_NITTER = [
 _nitter_env = os.getenv("NITTER_INSTANCES")
 NITTER_INSTANCES = _nitter_env.split(",") if _nitter_env else _DEFAULT_NITTER
 
+# Generated alt-text per image URL; retweets and quote tweets carry the same
+# media URLs, so a hit skips a paid Jina VLM call.
+_media_alt_cache = TTLCache(maxsize=1024, ttl=24 * 3600)
+
 
 class TwitterCollector(BaseCollector):
     name = "twitter"
@@ -50,6 +58,11 @@ class TwitterCollector(BaseCollector):
     twitter_media_extract_env = "DATAPULSE_TWITTER_MEDIA_EXTRACT"
     twitter_media_timeout_env = "DATAPULSE_TWITTER_MEDIA_TIMEOUT"
     twitter_media_max_items_env = "DATAPULSE_TWITTER_MEDIA_MAX_ITEMS"
+    twitter_media_concurrency_env = "DATAPULSE_TWITTER_MEDIA_CONCURRENCY"
+    twitter_media_deadline_env = "DATAPULSE_TWITTER_MEDIA_DEADLINE"
+
+    _media_client: JinaAPIClient | None = None
+    _media_client_lock = threading.Lock()
 
     def check(self) -> dict[str, str | bool]:
         try:
@@ -234,42 +247,49 @@ class TwitterCollector(BaseCollector):
         enable_generated_alt = read_env_bool(self.twitter_media_extract_env, False)
         max_items = read_env_int(self.twitter_media_max_items_env, 4, min_value=1, max_value=12)
         timeout = read_env_int(self.twitter_media_timeout_env, 20, min_value=5, max_value=90)
+        concurrency = read_env_int(self.twitter_media_concurrency_env, 4, min_value=1, max_value=12)
+        deadline = read_env_int(self.twitter_media_deadline_env, 45, min_value=5, max_value=300)
         has_jina_api_key = bool(get_secret("JINA_API_KEY").strip()) if enable_generated_alt else False
 
-        items: list[dict[str, Any]] = []
-        methods_used: set[str] = set()
-        attempted = 0
-        failed = 0
-        error_code = ""
-        error_hint = ""
-
+        candidates: list[tuple[int, str, str, str]] = []
         for index, media in enumerate(media_items[:max_items], 1):
             media_url = str(media.get("url", "")).strip()
             media_type = str(media.get("type", "unknown")).strip().lower() or "unknown"
             if not media_url:
                 continue
+            candidates.append((index, media_url, media_type, self._extract_media_text_from_metadata(media)))
+
+        error_code = ""
+        error_hint = ""
+        pending_urls: list[str] = []
+        if enable_generated_alt:
+            for _, media_url, media_type, text in candidates:
+                if text or media_type not in {"photo", "image"} or media_url in pending_urls:
+                    continue
+                if not has_jina_api_key:
+                    error_code = "auth_missing"
+                    error_hint = "JINA_API_KEY is required when DATAPULSE_TWITTER_MEDIA_EXTRACT=1"
+                    break
+                pending_urls.append(media_url)
+
+        generated, attempted, failed, gen_error_code, gen_error_hint = self._generate_media_alt_texts(
+            pending_urls,
+            timeout=timeout,
+            concurrency=concurrency,
+            deadline=deadline,
+        )
+        if not error_code:
+            error_code, error_hint = gen_error_code, gen_error_hint
 
-            text = self._extract_media_text_from_metadata(media)
+        items: list[dict[str, Any]] = []
+        methods_used: set[str] = set()
+        for index, media_url, media_type, text in candidates:
             method = "fxtwitter_metadata"
             confidence = 0.78
-
-            if not text and enable_generated_alt and media_type in {"photo", "image"}:
-                if not has_jina_api_key:
-                    if not error_code:
-                        error_code = "auth_missing"
-                        error_hint = "JINA_API_KEY is required when DATAPULSE_TWITTER_MEDIA_EXTRACT=1"
-                    continue
-                attempted += 1
-                try:
-                    text = self._extract_media_text_via_jina(media_url, timeout=timeout)
-                    if text:
-                        method = "jina_generated_alt"
-                        confidence = 0.55
-                except Exception as exc:  # noqa: BLE001
-                    failed += 1
-                    if not error_code:
-                        error_code, error_hint = self._classify_media_extraction_error(exc)
-                    logger.info("Twitter media extraction degraded for %s: %s", media_url, exc)
+            if not text and generated.get(media_url):
+                text = generated[media_url]
+                method = "jina_generated_alt"
+                confidence = 0.55
 
             if not text:
                 continue
@@ -313,8 +333,81 @@ class TwitterCollector(BaseCollector):
             "error_hint": error_hint,
         }
 
+    def _generate_media_alt_texts(
+        self,
+        media_urls: list[str],
+        *,
+        timeout: int,
+        concurrency: int,
+        deadline: int,
+    ) -> tuple[dict[str, str], int, int, str, str]:
+        """Fetch Jina generated alt-text for ``media_urls`` concurrently under one overall deadline.
+
+        Returns ``(texts_by_url, attempted, failed, error_code, error_hint)``; cached URLs
+        are not counted as attempted and calls still running at the deadline count as failed.
+        """
+        texts: dict[str, str] = {}
+        uncached: list[str] = []
+        for media_url in media_urls:
+            cached = _media_alt_cache.get(media_url)
+            if cached is None:
+                uncached.append(media_url)
+            else:
+                texts[media_url] = cached
+        if not uncached:
+            return texts, 0, 0, "", ""
+
+        failed = 0
+        error_code = ""
+        error_hint = ""
+        pool = ThreadPoolExecutor(
+            max_workers=min(concurrency, len(uncached)),
+            thread_name_prefix="datapulse-twitter-media",
+        )
+        try:
+            futures = {
+                pool.submit(self._extract_media_text_via_jina, media_url, timeout=timeout): media_url
+                for media_url in uncached
+            }
+            done, not_done = wait_futures(futures, timeout=deadline)
+            for future in futures:
+                media_url = futures[future]
+                if future in not_done:
+                    failed += 1
+                    if not error_code:
+                        error_code = "deadline_exceeded"
+                        error_hint = f"Media extraction exceeded {deadline}s overall deadline"
+                    continue
+                try:
+                    text = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    failed += 1
+                    if not error_code:
+                        error_code, error_hint = self._classify_media_extraction_error(exc)
+                    logger.info("Twitter media extraction degraded for %s: %s", media_url, exc)
+                    continue
+                if text:  # an empty answer is retried next time, like a failure
+                    _media_alt_cache.set(media_url, text)
+                texts[media_url] = text
+            if not_done:
+                logger.info("Twitter media extraction hit %ss deadline with %d image(s) pending", deadline, len(not_done))
+        finally:
+            # Late calls finish in the background; the tweet does not wait for them.
+            pool.shutdown(wait=False, cancel_futures=True)
+        return texts, len(uncached), failed, error_code, error_hint
+
+    @classmethod
+    def _jina_media_client(cls, timeout: int) -> JinaAPIClient:
+        """One Jina client (and connection pool) shared by every collector instance."""
+        with cls._media_client_lock:
+            client = cls._media_client
+            if client is None or client.timeout != timeout:
+                client = JinaAPIClient(timeout=timeout)
+                cls._media_client = client
+            return client
+
     def _extract_media_text_via_jina(self, media_url: str, *, timeout: int) -> str:
-        client = JinaAPIClient(timeout=timeout)
+        client = self._jina_media_client(timeout)
         result = client.read(
             media_url,
             options=JinaReadOptions(
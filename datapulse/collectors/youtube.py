@@ -1,4 +1,12 @@
-"""YouTube collector with transcript-first strategy."""
+"""YouTube collector with transcript-first strategy.
+
+Metadata, chapters and transcripts (including Whisper transcriptions) are
+cached per video (see ``youtube_cache.py``) unless
+``DATAPULSE_YOUTUBE_CACHE=0``, so rereading a video with a transcript in a
+preferred language makes no network or transcription calls. Without one, the
+live transcript list is checked first and other cached languages (then a
+cached Whisper transcription) are used only if it has nothing.
+"""
 
 from __future__ import annotations
 
@@ -10,11 +18,14 @@ import tempfile
 
 import requests
 
+from datapulse.core.config import read_env_bool
+from datapulse.core.media import multipart_file_body
 from datapulse.core.models import MediaType, SourceType
 from datapulse.core.security import get_secret, has_secret
 from datapulse.core.utils import clean_text, generate_excerpt
 
 from .base import BaseCollector, ParseResult
+from .youtube_cache import WHISPER_LANGUAGE, YouTubeCache
 
 logger = logging.getLogger("datapulse.parsers.youtube")
 
@@ -52,8 +63,38 @@ class YouTubeCollector(BaseCollector):
         if not video_id:
             return ParseResult.failure(url, "Cannot extract YouTube video ID.")
 
-        title, author, description = self._fetch_metadata(url)
-        transcript, transcript_lang = self._fetch_transcript(video_id)
+        cache = YouTubeCache() if read_env_bool("DATAPULSE_YOUTUBE_CACHE", True) else None
+        cache_hits: list[str] = []
+
+        metadata = cache.metadata(video_id) if cache is not None else None
+        if metadata is not None:
+            cache_hits.append("metadata")
+            title = str(metadata.get("title", ""))
+            author = str(metadata.get("author", ""))
+            description = str(metadata.get("description", ""))
+            chapters = [row for row in metadata.get("chapters", []) if isinstance(row, dict)]
+        else:
+            title, author, description = self._fetch_metadata(url)
+            chapters = self._parse_chapters(description) if description else []
+            if cache is not None and (title or description):
+                cache.store_metadata(video_id, title=title, author=author, description=description, chapters=chapters)
+
+        cached_transcript = cache.transcript(video_id, self.preferred_languages) if cache is not None else None
+        whisper = ""
+        if cached_transcript is None:
+            transcript, transcript_lang = self._fetch_transcript(video_id)
+            if transcript and cache is not None:
+                cache.store_transcript(video_id, transcript_lang, transcript)
+            elif cache is not None:
+                cached_transcript = cache.transcript(video_id, self.preferred_languages, any_language=True)
+        if cached_transcript is not None:
+            cache_hits.append("transcript")
+            text, cached_lang = cached_transcript
+            if cached_lang == WHISPER_LANGUAGE:
+                transcript, transcript_lang, whisper = "", "", text
+            else:
+                transcript, transcript_lang = text, cached_lang
+
         flags = []
         if transcript:
             flags.extend(["transcript", "youtube-transcript-api"])
@@ -61,8 +102,11 @@ class YouTubeCollector(BaseCollector):
             if transcript_lang:
                 flags.append(f"lang:{transcript_lang}")
         else:
-            logger.info("No transcript available for %s, try Whisper fallback via yt-dlp", video_id)
-            whisper = self._fallback_whisper(url)
+            if not whisper:
+                logger.info("No transcript available for %s, try Whisper fallback via yt-dlp", video_id)
+                whisper = self._fallback_whisper(url)
+                if whisper and cache is not None:
+                    cache.store_transcript(video_id, WHISPER_LANGUAGE, whisper)
             if whisper:
                 flags.extend(["whisper", "groq"])
                 content = whisper
@@ -73,11 +117,14 @@ class YouTubeCollector(BaseCollector):
         if not content:
             return ParseResult.failure(url, "No YouTube content extracted")
 
-        extra: dict[str, object] = {"video_id": video_id, "lang": transcript_lang if transcript else "", "has_transcript": bool(transcript)}
-        if description:
-            chapters = self._parse_chapters(description)
-            if chapters:
-                extra["chapters"] = chapters
+        extra: dict[str, object] = {
+            "video_id": video_id,
+            "lang": transcript_lang if transcript else "",
+            "has_transcript": bool(transcript),
+            "cache_hits": cache_hits,
+        }
+        if chapters:
+            extra["chapters"] = chapters
 
         return ParseResult(
             url=url,
@@ -92,6 +139,13 @@ class YouTubeCollector(BaseCollector):
             extra=extra,
         )
 
+    def invalidate_cache(self, url_or_video_id: str | None = None, *, language: str | None = None) -> int:
+        """Drop cached metadata/transcripts for one video (URL or id), one of its languages, or everything."""
+        video_id = None
+        if url_or_video_id is not None:
+            video_id = self._extract_video_id(url_or_video_id) or url_or_video_id.strip()
+        return YouTubeCache().invalidate(video_id, language=language)
+
     @staticmethod
     def _parse_chapters(description: str) -> list[dict[str, object]]:
         """Parse YouTube chapters from video description.
@@ -246,16 +300,19 @@ class YouTubeCollector(BaseCollector):
             if os.path.getsize(audio_file) > 25 * 1024 * 1024:
                 return ""
 
-            with open(audio_file, "rb") as f:
-                files = {"file": (os.path.basename(audio_file), f, "audio/mp4")}
-                payload = {"model": "whisper-large-v3", "response_format": "text"}
-                headers = {"Authorization": f"Bearer {api_key}"}
+            # Stream the audio from disk instead of building the multipart body in memory.
+            with multipart_file_body(
+                "file",
+                audio_file,
+                content_type="audio/mp4",
+                fields={"model": "whisper-large-v3", "response_format": "text"},
+            ) as body:
+                headers = {"Authorization": f"Bearer {api_key}", "Content-Type": body.content_type}
                 try:
                     response = requests.post(
                         "https://api.groq.com/openai/v1/audio/transcriptions",
                         headers=headers,
-                        files=files,
-                        data=payload,
+                        data=body,
                         timeout=120,
                     )
                     if response.status_code == 200:
@@ -0,0 +1,134 @@
+"""Persistent per-video cache for YouTube metadata, chapters and transcripts.
+
+Each video gets one JSON file under ``DATAPULSE_YOUTUBE_CACHE_DIR`` holding
+the page metadata, parsed chapters and every transcript fetched for it,
+keyed by language (``"en"``, ``"ja (auto)"``, or ``"whisper"`` for a Groq
+transcription). Entries never expire on their own; drop them with
+:meth:`YouTubeCache.invalidate`.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from datapulse.core.filestore import atomic_replace_text, file_lock
+from datapulse.core.utils import youtube_cache_dir_from_env
+
+WHISPER_LANGUAGE = "whisper"
+
+_SAFE_ID = re.compile(r"[^A-Za-z0-9_-]")
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+class YouTubeCache:
+    """One JSON file per video id: ``{"metadata": {...}, "transcripts": {lang: {...}}}``."""
+
+    def __init__(self, root: str | None = None):
+        self.root = Path(root or youtube_cache_dir_from_env()).expanduser()
+
+    def _path(self, video_id: str) -> Path:
+        return self.root / f"{_SAFE_ID.sub('_', video_id)}.json"
+
+    def _read(self, video_id: str) -> dict[str, Any]:
+        path = self._path(video_id)
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        except (OSError, json.JSONDecodeError):
+            raw = {}
+        return raw if isinstance(raw, dict) else {}
+
+    def _update(self, video_id: str, edit: Callable[[dict[str, Any]], bool]) -> bool:
+        """Re-read the entry, apply ``edit`` and write it back, all under the entry's lock.
+
+        ``edit`` returns False to leave the file untouched. Concurrent parses of
+        one video would otherwise drop each other's transcripts.
+        """
+        path = self._path(video_id)
+        with file_lock(path):
+            entry = self._read(video_id)
+            if not edit(entry):
+                return False
+            entry["video_id"] = video_id
+            entry["updated_at"] = _utcnow()
+            atomic_replace_text(path, json.dumps(entry, ensure_ascii=False))
+            return True
+
+    @staticmethod
+    def _transcripts(entry: dict[str, Any]) -> dict[str, Any]:
+        stored = entry.get("transcripts")
+        transcripts: dict[str, Any] = stored if isinstance(stored, dict) else {}
+        entry["transcripts"] = transcripts
+        return transcripts
+
+    def metadata(self, video_id: str) -> dict[str, Any] | None:
+        metadata = self._read(video_id).get("metadata")
+        return metadata if isinstance(metadata, dict) else None
+
+    def store_metadata(
+        self,
+        video_id: str,
+        *,
+        title: str,
+        author: str,
+        description: str,
+        chapters: list[dict[str, Any]],
+    ) -> None:
+        def _edit(entry: dict[str, Any]) -> bool:
+            entry["metadata"] = {"title": title, "author": author, "description": description, "chapters": chapters}
+            return True
+
+        self._update(video_id, _edit)
+
+    def transcript(self, video_id: str, languages: list[str], *, any_language: bool = False) -> tuple[str, str] | None:
+        """Best cached transcript as ``(text, lang)``, mirroring the live preference order.
+
+        Manual transcripts in ``languages`` order win, then auto-generated
+        ones. With ``any_language`` (for when a live fetch came back empty),
+        any other cached language follows, and a Whisper transcription last.
+        """
+        transcripts = self._read(video_id).get("transcripts")
+        if not isinstance(transcripts, dict) or not transcripts:
+            return None
+        order = [*languages, *(f"{lang} (auto)" for lang in languages)]
+        if any_language:
+            order += sorted(key for key in transcripts if key not in order and key != WHISPER_LANGUAGE)
+            order.append(WHISPER_LANGUAGE)
+        for lang in order:
+            row = transcripts.get(lang)
+            if isinstance(row, dict) and row.get("text"):
+                return str(row["text"]), lang
+        return None
+
+    def store_transcript(self, video_id: str, lang: str, text: str) -> None:
+        def _edit(entry: dict[str, Any]) -> bool:
+            self._transcripts(entry)[lang or "unknown"] = {"text": text, "stored_at": _utcnow()}
+            return True
+
+        self._update(video_id, _edit)
+
+    def invalidate(self, video_id: str | None = None, *, language: str | None = None) -> int:
+        """Drop cached data; all videos when ``video_id`` is None, one transcript when ``language`` is set.
+
+        Returns how many videos (or transcripts) were removed.
+        """
+        if video_id is None:
+            removed = 0
+            for path in self.root.glob("*.json") if self.root.exists() else []:
+                path.unlink(missing_ok=True)
+                removed += 1
+            return removed
+        if language is not None:
+            return int(self._update(video_id, lambda entry: self._transcripts(entry).pop(language, None) is not None))
+        path = self._path(video_id)
+        with file_lock(path):
+            if not path.exists():
+                return 0
+            path.unlink(missing_ok=True)
+            return 1
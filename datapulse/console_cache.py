@@ -0,0 +1,141 @@
+"""Generation-keyed response cache and ETags for read-only console routes.
+
+Every file-backed store bumps ``<file>.gen`` on write, so the tuple of those
+generations identifies the data a console payload was built from. The cache
+learns the store paths from the first reader it sees; after that, a request
+costs one small read per ``.gen`` file: a matching ``If-None-Match`` gets
+``304 Not Modified`` and a cache hit returns the serialized body without
+building a reader. Writes from the daemon, the CLI or another console process
+change a generation and so invalidate the entry on their own; the console
+also clears the cache after its own write requests.
+
+Payloads that depend on the clock (due flags, rolling windows) are bounded by
+``DATAPULSE_CONSOLE_CACHE_TTL`` seconds (default 30; ``0`` turns caching off).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from datapulse.core.config import read_env_float
+from datapulse.core.filestore import ReloadableStore, read_generation
+
+DEFAULT_TTL_SECONDS = 30.0
+DEFAULT_MAX_ENTRIES = 128
+
+CacheKey = tuple[str, str]
+Versions = tuple[int, ...]
+
+
+def cache_ttl_from_env() -> float:
+    return read_env_float("DATAPULSE_CONSOLE_CACHE_TTL", DEFAULT_TTL_SECONDS, min_value=0.0)
+
+
+def _reader_stores(reader: Any) -> list[ReloadableStore]:
+    """Stores held by ``reader`` plus the stores nested one level inside them (e.g. run history)."""
+    stores: list[ReloadableStore] = []
+    seen: set[int] = set()
+    for value in list(vars(reader).values()) if hasattr(reader, "__dict__") else []:
+        if not isinstance(value, ReloadableStore) or id(value) in seen:
+            continue
+        seen.add(id(value))
+        stores.append(value)
+        for nested in vars(value).values():
+            if isinstance(nested, ReloadableStore) and id(nested) not in seen:
+                seen.add(id(nested))
+                stores.append(nested)
+    return sorted(stores, key=lambda store: str(store.path))
+
+
+def if_none_match(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {part.strip() for part in header.split(",")}
+    return "*" in candidates or etag in candidates or etag.removeprefix("W/") in candidates
+
+
+class ConsoleResponseCache:
+    """Small LRU of serialized console payloads keyed by route, query and store generations."""
+
+    def __init__(self, *, ttl_seconds: float | None = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl_seconds = cache_ttl_from_env() if ttl_seconds is None else max(0.0, float(ttl_seconds))
+        self.max_entries = max(1, int(max_entries))
+        self._paths: tuple[Path, ...] | None = None
+        self._entries: OrderedDict[CacheKey, tuple[Versions, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _bucket(self) -> int:
+        return int(time.time() // self.ttl_seconds) if self.ttl_seconds > 0 else 0
+
+    def learn(self, reader: Any) -> Versions | None:
+        """Record ``reader``'s store paths (first call only) and return the generations it loaded."""
+        if not self.enabled:
+            return None
+        stores = _reader_stores(reader)
+        if not stores:
+            return None
+        with self._lock:
+            if self._paths is None:
+                self._paths = tuple(store.path for store in stores)
+        if tuple(store.path for store in stores) != self._paths:
+            return None
+        return (*(store.generation for store in stores), self._bucket())
+
+    def versions(self) -> Versions | None:
+        """Current on-disk generations; ``None`` until a reader has been learned or when disabled."""
+        if not self.enabled or not self._paths:
+            return None
+        return (*(read_generation(path) for path in self._paths), self._bucket())
+
+    @staticmethod
+    def etag(key: CacheKey, versions: Versions) -> str:
+        digest = hashlib.blake2b(repr((key, versions)).encode("utf-8"), digest_size=12).hexdigest()
+        return f'W/"{digest}"'
+
+    def get(self, key: CacheKey, versions: Versions) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != versions:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: CacheKey, versions: Versions, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (versions, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def note_not_modified(self) -> None:
+        with self._lock:
+            self.not_modified += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "ttl_seconds": self.ttl_seconds,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "not_modified": self.not_modified,
+            }
@@ -0,0 +1,303 @@
+"""Server-sent event fan-out for the browser console.
+
+One :class:`ConsoleEventHub` per console app watches the shared store files
+through a single reader: each tick costs a ``.gen`` read per store, and only a
+store whose generation moved is reloaded and diffed. The resulting events
+(inbox additions, triage state changes, watch run completions, alert events
+and daemon heartbeats) are fanned out to every open ``/api/events`` stream, so
+N dashboards cost one diff instead of N full board refreshes. Changes made by
+the daemon, the CLI or another console process are picked up the same way as
+the console's own writes.
+
+A short backlog lets a reconnecting browser replay what it missed via
+``Last-Event-ID``; a subscriber that falls too far behind receives ``resync``
+and reloads the board instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Any, AsyncIterator, Callable
+
+from datapulse.core.triage import serialize_item_with_governance
+
+logger = logging.getLogger("datapulse.console_events")
+
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_KEEPALIVE_SECONDS = 15.0
+DEFAULT_BACKLOG = 256
+SUBSCRIBER_QUEUE_LIMIT = 512
+MAX_ITEMS_PER_EVENT = 25
+RETRY_MILLISECONDS = 3000
+
+
+def format_sse(event: str, data: Any, *, event_id: int | None = None) -> str:
+    """Encode one ``text/event-stream`` frame."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    lines.extend(f"data: {line}" for line in payload.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+class ConsoleEventHub:
+    """Detects store changes once per tick and broadcasts them to SSE subscribers."""
+
+    def __init__(
+        self,
+        reader_factory: Callable[[], Any],
+        *,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        keepalive_seconds: float = DEFAULT_KEEPALIVE_SECONDS,
+        backlog: int = DEFAULT_BACKLOG,
+    ):
+        self.reader_factory = reader_factory
+        self.interval = max(0.05, float(interval))
+        self.keepalive_seconds = max(0.05, float(keepalive_seconds))
+        self._reader: Any = None
+        self._primed = False
+        self._sequence = 0
+        self._backlog: deque[tuple[int, str, Any]] = deque(maxlen=max(1, backlog))
+        self._subscribers: set[asyncio.Queue[tuple[int, str, Any]]] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._review_states: dict[str, str] = {}
+        self._last_runs: dict[str, str] = {}
+        self._alert_ids: set[str] = set()
+        self._heartbeat: tuple[str, str] = ("", "")
+
+    # -- change detection ---------------------------------------------------
+
+    @property
+    def reader(self) -> Any:
+        if self._reader is None:
+            self._reader = self.reader_factory()
+        return self._reader
+
+    def poll(self) -> list[tuple[str, Any]]:
+        """Reload whatever changed on disk and return ``(event, data)`` pairs; the first call only primes."""
+        events: list[tuple[str, Any]] = []
+        for detect in (self._poll_inbox, self._poll_runs, self._poll_alerts, self._poll_heartbeat):
+            try:
+                events.extend(detect())
+            except Exception as exc:  # noqa: BLE001 - one bad store must not stall the stream
+                logger.warning("Console event detection failed in %s: %s", detect.__name__, exc)
+        self._primed = True
+        return events
+
+    def _poll_inbox(self) -> list[tuple[str, Any]]:
+        inbox = getattr(self.reader, "inbox", None)
+        if inbox is None:
+            return []
+        if not inbox.reload_if_changed() and self._primed:
+            return []
+        current = {item.id: str(item.review_state or "") for item in inbox.items}
+        previous, self._review_states = self._review_states, current
+        if not self._primed:
+            return []
+        by_id = {item.id: item for item in inbox.items}
+        added = [item_id for item_id in current if item_id not in previous]
+        changed = [
+            item_id for item_id, review_state in current.items()
+            if item_id in previous and previous[item_id] != review_state
+        ]
+        if not added and not changed:
+            return []
+        stats = self.reader.triage_stats()
+        events: list[tuple[str, Any]] = []
+        if added:
+            events.append(
+                (
+                    "inbox.added",
+                    {
+                        "count": len(added),
+                        "items": [serialize_item_with_governance(by_id[item_id]) for item_id in added[:MAX_ITEMS_PER_EVENT]],
+                        "triage_stats": stats,
+                    },
+                )
+            )
+        if changed:
+            events.append(
+                (
+                    "triage.updated",
+                    {
+                        "count": len(changed),
+                        "items": [
+                            {**serialize_item_with_governance(by_id[item_id]), "previous_state": previous[item_id]}
+                            for item_id in changed[:MAX_ITEMS_PER_EVENT]
+                        ],
+                        "triage_stats": stats,
+                    },
+                )
+            )
+        return events
+
+    def _poll_runs(self) -> list[tuple[str, Any]]:
+        watchlist = getattr(self.reader, "watchlist", None)
+        history = getattr(watchlist, "history", None)
+        if watchlist is None or history is None:
+            return []
+        if not watchlist.reload_if_changed() and self._primed:
+            return []
+        latest = {
+            mission_id: str((history.recent_runs(mission_id) or [{}])[0].get("id", ""))
+            for mission_id in history.mission_ids()
+        }
+        previous, self._last_runs = self._last_runs, latest
+        if not self._primed:
+            return []
+        events: list[tuple[str, Any]] = []
+        for mission_id, run_id in latest.items():
+            if not run_id or previous.get(mission_id) == run_id:
+                continue
+            watch = self.reader.show_watch(mission_id)
+            if watch is None:
+                continue
+            events.append(
+                (
+                    "watch.run",
+                    {"mission_id": mission_id, "run": history.recent_runs(mission_id)[0], "watch": watch},
+                )
+            )
+        return events
+
+    def _poll_alerts(self) -> list[tuple[str, Any]]:
+        alert_store = getattr(self.reader, "alert_store", None)
+        if alert_store is None:
+            return []
+        if not alert_store.reload_if_changed() and self._primed:
+            return []
+        previous, self._alert_ids = self._alert_ids, {event.id for event in alert_store.events}
+        if not self._primed:
+            return []
+        fresh = [event for event in alert_store.events if event.id not in previous]
+        return [("alert", event.to_dict()) for event in reversed(fresh[:MAX_ITEMS_PER_EVENT])]
+
+    def _poll_heartbeat(self) -> list[tuple[str, Any]]:
+        watch_status = getattr(self.reader, "watch_status", None)
+        if watch_status is None:
+            return []
+        if not watch_status.reload_if_changed() and self._primed:
+            return []
+        status = watch_status.status
+        current = (str(status.get("heartbeat_at", "") or ""), str(status.get("state", "") or ""))
+        previous, self._heartbeat = self._heartbeat, current
+        if not self._primed or current == previous:
+            return []
+        return [
+            (
+                "daemon.heartbeat",
+                {
+                    "state": current[1],
+                    "heartbeat_at": current[0],
+                    "last_cycle_finished_at": status.get("last_cycle_finished_at", ""),
+                    "last_error": status.get("last_error", ""),
+                    "metrics": status.get("metrics", {}),
+                },
+            )
+        ]
+
+    # -- fan-out --------------------------------------------------------------
+
+    @property
+    def last_event_id(self) -> int:
+        return self._sequence
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event: str, data: Any) -> int:
+        """Append to the backlog and hand the event to every subscriber; call on the event loop."""
+        self._sequence += 1
+        entry = (self._sequence, event, data)
+        self._backlog.append(entry)
+        for queue in list(self._subscribers):
+            self._offer(queue, entry)
+        return self._sequence
+
+    def _offer(self, queue: asyncio.Queue[tuple[int, str, Any]], entry: tuple[int, str, Any]) -> None:
+        try:
+            queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            # Too far behind to patch incrementally: drop the queue and ask for a full reload.
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait((self._sequence, "resync", {"reason": "subscriber_backlog_overflow"}))
+
+    def subscribe(self, last_event_id: int | None = None) -> asyncio.Queue[tuple[int, str, Any]]:
+        queue: asyncio.Queue[tuple[int, str, Any]] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_LIMIT)
+        if last_event_id is not None and last_event_id > self._sequence:
+            # The id came from an earlier hub (console restart); nothing here lines up with it.
+            queue.put_nowait((self._sequence, "resync", {"reason": "unknown_event_id"}))
+        elif last_event_id is not None and last_event_id < self._sequence:
+            oldest = self._backlog[0][0] if self._backlog else self._sequence + 1
+            if last_event_id + 1 < oldest:
+                queue.put_nowait((self._sequence, "resync", {"reason": "backlog_expired"}))
+            else:
+                for entry in self._backlog:
+                    if entry[0] > last_event_id:
+                        self._offer(queue, entry)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[tuple[int, str, Any]]) -> None:
+        """Drop ``queue``; the last one out also parks the poller until the next :meth:`stream`."""
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            task, self._task = self._task, None
+            task.cancel()
+
+    # -- lifecycle ------------------------------------------------------------
+
+    async def tick(self) -> int:
+        """Run one detection pass off the loop and publish its events; returns how many were sent."""
+        events = await asyncio.to_thread(self.poll)
+        for event, data in events:
+            self.publish(event, data)
+        return len(events)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as exc:  # noqa: BLE001 - keep the stream alive across transient errors
+                logger.warning("Console event tick failed: %s", exc)
+            await asyncio.sleep(self.interval)
+
+    def ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="datapulse-console-events")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def stream(self, last_event_id: int | None = None, *, is_disconnected: Callable[[], Any] | None = None) -> AsyncIterator[str]:
+        """Yield SSE frames for one subscriber until the client goes away."""
+        self.ensure_started()
+        queue = self.subscribe(last_event_id)
+        try:
+            yield f"retry: {RETRY_MILLISECONDS}\n\n"
+            yield format_sse("hello", {"last_event_id": self._sequence}, event_id=self._sequence)
+            while True:
+                try:
+                    event_id, event, data = await asyncio.wait_for(queue.get(), timeout=self.keepalive_seconds)
+                except asyncio.TimeoutError:
+                    if is_disconnected is not None and await is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event, data, event_id=event_id)
+        finally:
+            self.unsubscribe(queue)
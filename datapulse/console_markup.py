@@ -2564,6 +2564,25 @@ def render_console_html(title: str) -> str:
     .timeline-event.hot {{
       border-color: rgba(255, 106, 130, 0.28);
     }}
+    .run-buckets {{
+      display: flex;
+      align-items: flex-end;
+      gap: 3px;
+      height: 42px;
+      margin-bottom: 6px;
+    }}
+    .run-bucket {{
+      flex: 1;
+      min-width: 4px;
+      border-radius: 3px;
+      background: rgba(248, 239, 230, 0.12);
+    }}
+    .run-bucket.ok {{
+      background: rgba(145, 161, 125, 0.7);
+    }}
+    .run-bucket.hot {{
+      background: rgba(255, 106, 130, 0.7);
+    }}
     .graph-shell {{
       display: grid;
       gap: 12px;
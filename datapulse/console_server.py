@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import argparse
 import json
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from html import escape
 from pathlib import Path
@@ -11,12 +12,17 @@ from typing import Any, Callable
 from urllib.parse import urlencode
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import FileResponse, HTMLResponse, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, ConfigDict, Field
 
+from datapulse.console_cache import CacheKey, ConsoleResponseCache, Versions, if_none_match
 from datapulse.console_deck import build_mission_deck_suggestions
+from datapulse.console_events import ConsoleEventHub
 from datapulse.console_markup import render_console_html
+from datapulse.core.health import HEALTH_PROBES, default_health_ttl
+from datapulse.core.telemetry import TELEMETRY
 from datapulse.reader import DataPulseReader
 from datapulse.surface_capabilities import build_runtime_surface_introspection, build_surface_capability_projection
 
@@ -59,6 +65,24 @@ def _console_bundle_text() -> str:
     return _CONSOLE_BUNDLE_CACHE
 
 
+def _health_parsers_factory(reader_factory: Callable[[], DataPulseReader]) -> Callable[[], list[Any]]:
+    """Resolve the collector list once so the background health refresher stays cheap."""
+    parsers: list[Any] = []
+
+    def _factory() -> list[Any]:
+        if not parsers:
+            router = getattr(reader_factory(), "router", None)
+            parsers.extend(getattr(router, "parsers", None) or [])
+        return parsers
+
+    return _factory
+
+
+def _feed_source_ids(value: str | None) -> list[str] | None:
+    rows = _unique_text(str(value or "").split(","))
+    return rows or None
+
+
 def _unique_text(values: list[str]) -> list[str]:
     seen: set[str] = set()
     rows: list[str] = []
@@ -303,6 +327,7 @@ def _triage_fragment_response(
     rendered_item_ids: list[str],
     exact_replay_requested: bool,
     html: str,
+    etag: str = "",
 ) -> HTMLResponse:
     replay_claim, audit_path, audit_error = _write_triage_fragment_audit(
         surface=surface,
@@ -313,9 +338,11 @@ def _triage_fragment_response(
     )
     body = html.replace("__REPLAY_CLAIM__", replay_claim) + _triage_fragment_state_blob(state)
     headers = {
-        "Cache-Control": "no-store",
+        "Cache-Control": "no-cache" if etag else "no-store",
         "X-DataPulse-Triage-Replay-Claim": replay_claim,
     }
+    if etag:
+        headers["ETag"] = etag
     if audit_path is not None:
         headers["X-DataPulse-Triage-Audit-Path"] = str(audit_path)
     if audit_error:
@@ -504,8 +531,94 @@ class DigestDispatchRequest(BaseModel):
     route_name: str | None = None
 
 
+def _last_event_id(request: Request) -> int | None:
+    raw = request.headers.get("last-event-id") or request.query_params.get("last_event_id") or ""
+    try:
+        return int(raw) if raw.strip() else None
+    except ValueError:
+        return None
+
+
 def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader) -> FastAPI:
-    app = FastAPI(title=CONSOLE_TITLE, version="0.8.0")
+    event_hub = ConsoleEventHub(reader_factory)
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI):
+        started = HEALTH_PROBES.start_refresher(
+            _health_parsers_factory(reader_factory),
+            interval=max(30.0, default_health_ttl() / 2),
+        )
+        try:
+            yield
+        finally:
+            await event_hub.stop()
+            if started:
+                HEALTH_PROBES.stop_refresher()
+
+    app = FastAPI(title=CONSOLE_TITLE, version="0.8.0", lifespan=lifespan)
+    app.state.event_hub = event_hub
+    response_cache = ConsoleResponseCache()
+    app.state.response_cache = response_cache
+
+    def not_modified(request: Request) -> tuple[Versions | None, Response | None]:
+        """Current store versions, plus a 304 when the client already holds this exact payload."""
+        versions = response_cache.versions()
+        if versions is None:
+            return None, None
+        etag = response_cache.etag((request.url.path, request.url.query), versions)
+        if not if_none_match(request.headers.get("if-none-match"), etag):
+            return versions, None
+        response_cache.note_not_modified()
+        return versions, Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+    def cached_value(key: CacheKey, versions: Versions | None, build: Callable[[DataPulseReader], Any]) -> tuple[Any, Versions | None]:
+        if versions is not None:
+            value = response_cache.get(key, versions)
+            if value is not None:
+                return value, versions
+        reader = reader_factory()
+        versions = versions or response_cache.learn(reader)
+        value = build(reader)
+        if versions is not None:
+            response_cache.put(key, versions, value)
+        return value, versions
+
+    def cached_json(request: Request, build: Callable[[DataPulseReader], Any]) -> Response:
+        versions, response = not_modified(request)
+        if response is not None:
+            return response
+        key = (request.url.path, request.url.query)
+        body, versions = cached_value(key, versions, lambda reader: JSONResponse(jsonable_encoder(build(reader))).body)
+        headers = {"ETag": response_cache.etag(key, versions), "Cache-Control": "no-cache"} if versions is not None else {}
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def cached_triage_items(request: Request, versions: Versions | None) -> tuple[list[dict[str, Any]], str]:
+        """The triage rows every fragment filters, shared across fragment requests, plus this request's ETag."""
+        items, versions = cached_value(
+            ("triage_fragment_items", ""),
+            versions,
+            lambda reader: reader.triage_list(limit=5000, include_closed=True),
+        )
+        etag = response_cache.etag((request.url.path, request.url.query), versions) if versions is not None else ""
+        return items, etag
+
+    @app.middleware("http")
+    async def request_timing(request: Request, call_next: Callable[[Request], Any]) -> Response:
+        with TELEMETRY.span("http.request", method=request.method) as request_span:
+            response = await call_next(request)
+            route = request.scope.get("route")
+            request_span.labels["route"] = getattr(route, "path", "") or "unmatched"
+            if response.status_code >= 500:
+                request_span.status = "error"
+            return response
+
+    @app.middleware("http")
+    async def invalidate_response_cache(request: Request, call_next: Callable[[Request], Any]) -> Response:
+        """Drop cached read payloads after this console's own write requests."""
+        response = await call_next(request)
+        if request.method not in {"GET", "HEAD"}:
+            response_cache.clear()
+        return response
 
     @app.get("/static/console.js", include_in_schema=False)
     def console_bundle() -> Response:
@@ -557,9 +670,23 @@ def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader)
     def readyz() -> dict[str, str]:
         return {"status": "ready"}
 
+    @app.get("/metrics", include_in_schema=False)
+    def metrics() -> Response:
+        return Response(content=TELEMETRY.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+    @app.get("/api/events", include_in_schema=False)
+    async def console_events(request: Request) -> StreamingResponse:
+        return StreamingResponse(
+            event_hub.stream(_last_event_id(request), is_disconnected=request.is_disconnected),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     @app.get("/api/overview")
-    def overview() -> dict[str, Any]:
-        reader = reader_factory()
+    def overview(request: Request) -> Response:
+        return cached_json(request, _overview_payload)
+
+    def _overview_payload(reader: DataPulseReader) -> dict[str, Any]:
         watches = reader.list_watches(include_disabled=True)
         alerts = reader.list_alerts(limit=20)
         routes = reader.list_alert_routes()
@@ -587,8 +714,8 @@ def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader)
         }
 
     @app.get("/api/watches")
-    def list_watches(include_disabled: bool = False) -> list[dict[str, Any]]:
-        return reader_factory().list_watches(include_disabled=include_disabled)
+    def list_watches(request: Request, include_disabled: bool = False) -> Response:
+        return cached_json(request, lambda reader: reader.list_watches(include_disabled=include_disabled))
 
     @app.get("/api/watches/{identifier}")
     def show_watch(identifier: str) -> dict[str, Any]:
@@ -669,8 +796,8 @@ def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader)
         return payload
 
     @app.get("/api/alerts")
-    def list_alerts(limit: int = 20, mission_id: str = "") -> list[dict[str, Any]]:
-        return reader_factory().list_alerts(limit=limit, mission_id=mission_id or None)
+    def list_alerts(request: Request, limit: int = 20, mission_id: str = "") -> Response:
+        return cached_json(request, lambda reader: reader.list_alerts(limit=limit, mission_id=mission_id or None))
 
     @app.get("/api/alert-routes")
     def list_alert_routes() -> list[dict[str, Any]]:
@@ -701,8 +828,8 @@ def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader)
         return route
 
     @app.get("/api/alert-routes/health")
-    def alert_route_health(limit: int = 100) -> list[dict[str, Any]]:
-        return reader_factory().alert_route_health(limit=limit)
+    def alert_route_health(request: Request, limit: int = 100) -> Response:
+        return cached_json(request, lambda reader: reader.alert_route_health(limit=limit))
 
     @app.get("/api/watch-status")
     def watch_status() -> dict[str, Any]:
@@ -713,8 +840,8 @@ def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader)
         return reader_factory().ops_snapshot()
 
     @app.get("/api/ops/scorecard")
-    def ops_scorecard() -> dict[str, Any]:
-        return reader_factory().governance_scorecard_snapshot()
+    def ops_scorecard(request: Request) -> Response:
+        return cached_json(request, lambda reader: reader.governance_scorecard_snapshot())
 
     @app.get("/api/runtime/introspection")
     def runtime_introspection() -> dict[str, Any]:
@@ -769,8 +896,8 @@ def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader)
         return payload
 
     @app.get("/api/stories")
-    def list_stories(limit: int = 8, min_items: int = 0) -> list[dict[str, Any]]:
-        return reader_factory().list_stories(limit=limit, min_items=min_items)
+    def list_stories(request: Request, limit: int = 8, min_items: int = 0) -> Response:
+        return cached_json(request, lambda reader: reader.list_stories(limit=limit, min_items=min_items))
 
     @app.post("/api/stories")
     def create_story(payload: StoryCreateRequest) -> dict[str, Any]:
@@ -1152,6 +1279,86 @@ def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader)
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    @app.get("/api/feeds/bundle")
+    def stream_feed_bundle(
+        profile: str = "default",
+        source_ids: str | None = None,
+        limit: int = 500,
+        min_confidence: float = 0.0,
+        since: str | None = None,
+        format: str = "json",
+    ) -> StreamingResponse:
+        try:
+            chunks = reader_factory().iter_feed_bundle(
+                profile=profile,
+                source_ids=_feed_source_ids(source_ids),
+                limit=limit,
+                min_confidence=min_confidence,
+                since=since,
+                output_format=format,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        media_type = "application/json" if format.strip().lower() == "json" else "application/x-ndjson"
+        return StreamingResponse(chunks, media_type=media_type)
+
+    @app.get("/api/feeds/json")
+    def stream_json_feed(
+        profile: str = "default",
+        source_ids: str | None = None,
+        limit: int = 20,
+        min_confidence: float = 0.0,
+        since: str | None = None,
+        format: str = "json",
+    ) -> StreamingResponse:
+        try:
+            chunks = reader_factory().iter_json_feed(
+                profile=profile,
+                source_ids=_feed_source_ids(source_ids),
+                limit=limit,
+                min_confidence=min_confidence,
+                since=since,
+                output_format=format,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        media_type = "application/feed+json" if format.strip().lower() == "json" else "application/x-ndjson"
+        return StreamingResponse(chunks, media_type=media_type)
+
+    @app.get("/api/feeds/rss")
+    def stream_rss_feed(
+        profile: str = "default",
+        source_ids: str | None = None,
+        limit: int = 20,
+        min_confidence: float = 0.0,
+        since: str | None = None,
+    ) -> StreamingResponse:
+        chunks = reader_factory().iter_rss_feed(
+            profile=profile,
+            source_ids=_feed_source_ids(source_ids),
+            limit=limit,
+            min_confidence=min_confidence,
+            since=since,
+        )
+        return StreamingResponse(chunks, media_type="application/rss+xml; charset=utf-8")
+
+    @app.get("/api/feeds/atom")
+    def stream_atom_feed(
+        profile: str = "default",
+        source_ids: str | None = None,
+        limit: int = 20,
+        min_confidence: float = 0.0,
+        since: str | None = None,
+    ) -> StreamingResponse:
+        chunks = reader_factory().iter_atom_feed(
+            profile=profile,
+            source_ids=_feed_source_ids(source_ids),
+            limit=limit,
+            min_confidence=min_confidence,
+            since=since,
+        )
+        return StreamingResponse(chunks, media_type="application/atom+xml; charset=utf-8")
+
     @app.get("/api/export-profiles")
     def list_export_profiles(limit: int = 20, status: str | None = None) -> list[dict[str, Any]]:
         return reader_factory().list_export_profiles(limit=limit, status=status)
@@ -1279,13 +1486,21 @@ def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader)
         )
 
     @app.get("/api/triage")
-    def triage_list(limit: int = 20, state: list[str] | None = None, include_closed: bool = False) -> list[dict[str, Any]]:
-        return reader_factory().triage_list(limit=limit, states=state, include_closed=include_closed)
+    def triage_list(
+        request: Request,
+        limit: int = 20,
+        state: list[str] | None = None,
+        include_closed: bool = False,
+    ) -> Response:
+        return cached_json(request, lambda reader: reader.triage_list(limit=limit, states=state, include_closed=include_closed))
 
     @app.get("/api/fragments/triage/banner", response_class=HTMLResponse)
-    def triage_fragment_banner(request: Request) -> HTMLResponse:
+    def triage_fragment_banner(request: Request) -> Response:
+        versions, response = not_modified(request)
+        if response is not None:
+            return response
         state, exact_replay_requested = _triage_fragment_state(request)
-        items = reader_factory().triage_list(limit=5000, include_closed=True)
+        items, etag = cached_triage_items(request, versions)
         filtered_items = _filter_triage_items(items, state)
         html = _render_triage_fragment_banner(items, filtered_items, state)
         return _triage_fragment_response(
@@ -1295,12 +1510,16 @@ def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader)
             rendered_item_ids=[str(item.get("id") or "").strip() for item in filtered_items],
             exact_replay_requested=exact_replay_requested,
             html=html,
+            etag=etag,
         )
 
     @app.get("/api/fragments/triage/list", response_class=HTMLResponse)
-    def triage_fragment_list(request: Request) -> HTMLResponse:
+    def triage_fragment_list(request: Request) -> Response:
+        versions, response = not_modified(request)
+        if response is not None:
+            return response
         state, exact_replay_requested = _triage_fragment_state(request)
-        items = reader_factory().triage_list(limit=5000, include_closed=True)
+        items, etag = cached_triage_items(request, versions)
         filtered_items = _filter_triage_items(items, state)
         html = _render_triage_fragment_list(filtered_items, state)
         return _triage_fragment_response(
@@ -1310,13 +1529,17 @@ def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader)
             rendered_item_ids=[str(item.get("id") or "").strip() for item in filtered_items],
             exact_replay_requested=exact_replay_requested,
             html=html,
+            etag=etag,
         )
 
     @app.get("/api/fragments/triage/card/{item_id}", response_class=HTMLResponse)
-    def triage_fragment_card(item_id: str, request: Request) -> HTMLResponse:
+    def triage_fragment_card(item_id: str, request: Request) -> Response:
+        versions, response = not_modified(request)
+        if response is not None:
+            return response
         state, exact_replay_requested = _triage_fragment_state(request)
         state["selected_item_id"] = item_id
-        items = reader_factory().triage_list(limit=5000, include_closed=True)
+        items, etag = cached_triage_items(request, versions)
         item = next((row for row in items if str(row.get("id") or "").strip() == item_id), None)
         if item is None:
             raise HTTPException(status_code=404, detail=f"Triage item not found: {item_id}")
@@ -1328,11 +1551,12 @@ def create_app(reader_factory: Callable[[], DataPulseReader] = DataPulseReader)
             rendered_item_ids=[item_id],
             exact_replay_requested=exact_replay_requested,
             html=html,
+            etag=etag,
         )
 
     @app.get("/api/triage/stats")
-    def triage_stats() -> dict[str, Any]:
-        return reader_factory().triage_stats()
+    def triage_stats(request: Request) -> Response:
+        return cached_json(request, lambda reader: reader.triage_stats())
 
     @app.get("/api/triage/{item_id}/explain")
     def triage_explain(item_id: str, limit: int = 5) -> dict[str, Any]:
@@ -1,50 +1,112 @@
-from .alerts import AlertEvent, AlertRouteStore, AlertStore
-from .entities import Entity, EntityType, Relation
-from .entity_store import EntityStore
-from .models import DataPulseItem, MediaType, SourceType
-from .ops import WatchStatusStore
-from .report import (
-    CitationBundle,
-    ClaimCard,
-    ExportProfile,
-    Report,
-    ReportBrief,
-    ReportSection,
-    ReportStore,
-)
-from .router import ParsePipeline
-from .scheduler import (
-    WatchDaemon,
-    WatchDaemonLock,
-    WatchScheduler,
-    describe_schedule,
-    is_watch_due,
-    next_run_at,
-    schedule_to_seconds,
-)
-from .storage import UnifiedInbox
-from .story import (
-    Story,
-    StoryConflict,
-    StoryEvidence,
-    StoryStore,
-    StoryTimelineEvent,
-    build_story_clusters,
-    build_story_graph,
-    render_story_markdown,
-)
-from .triage import (
-    OPEN_REVIEW_STATES,
-    REVIEW_STATES,
-    TERMINAL_REVIEW_STATES,
-    TriageQueue,
-    build_review_action,
-    build_review_note,
-    is_digest_candidate,
-    normalize_review_state,
-    review_state_score,
-)
-from .watchlist import MissionRun, WatchlistStore, WatchMission
+"""Core domain layer for DataPulse.
+
+Exports resolve lazily (PEP 562) so importing one submodule does not pull in
+every store, the collector router, and their third-party dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .alerts import AlertEvent, AlertRouteStore, AlertStore
+    from .entities import Entity, EntityType, Relation
+    from .entity_store import EntityStore
+    from .models import DataPulseItem, MediaType, SourceType
+    from .ops import WatchStatusStore
+    from .report import (
+        CitationBundle,
+        ClaimCard,
+        ExportProfile,
+        Report,
+        ReportBrief,
+        ReportSection,
+        ReportStore,
+    )
+    from .router import ParsePipeline
+    from .scheduler import (
+        WatchDaemon,
+        WatchDaemonLock,
+        WatchScheduler,
+        describe_schedule,
+        is_watch_due,
+        next_run_at,
+        schedule_to_seconds,
+    )
+    from .storage import UnifiedInbox
+    from .story import (
+        Story,
+        StoryConflict,
+        StoryEvidence,
+        StoryStore,
+        StoryTimelineEvent,
+        build_story_clusters,
+        build_story_graph,
+        render_story_markdown,
+    )
+    from .triage import (
+        OPEN_REVIEW_STATES,
+        REVIEW_STATES,
+        TERMINAL_REVIEW_STATES,
+        TriageQueue,
+        build_review_action,
+        build_review_note,
+        is_digest_candidate,
+        normalize_review_state,
+        review_state_score,
+    )
+    from .watchlist import MissionRun, WatchlistStore, WatchMission
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "AlertEvent": ".alerts",
+    "AlertRouteStore": ".alerts",
+    "AlertStore": ".alerts",
+    "Entity": ".entities",
+    "EntityType": ".entities",
+    "Relation": ".entities",
+    "EntityStore": ".entity_store",
+    "DataPulseItem": ".models",
+    "MediaType": ".models",
+    "SourceType": ".models",
+    "WatchStatusStore": ".ops",
+    "CitationBundle": ".report",
+    "ClaimCard": ".report",
+    "ExportProfile": ".report",
+    "Report": ".report",
+    "ReportBrief": ".report",
+    "ReportSection": ".report",
+    "ReportStore": ".report",
+    "ParsePipeline": ".router",
+    "WatchDaemon": ".scheduler",
+    "WatchDaemonLock": ".scheduler",
+    "WatchScheduler": ".scheduler",
+    "describe_schedule": ".scheduler",
+    "is_watch_due": ".scheduler",
+    "next_run_at": ".scheduler",
+    "schedule_to_seconds": ".scheduler",
+    "UnifiedInbox": ".storage",
+    "Story": ".story",
+    "StoryConflict": ".story",
+    "StoryEvidence": ".story",
+    "StoryStore": ".story",
+    "StoryTimelineEvent": ".story",
+    "build_story_clusters": ".story",
+    "build_story_graph": ".story",
+    "render_story_markdown": ".story",
+    "OPEN_REVIEW_STATES": ".triage",
+    "REVIEW_STATES": ".triage",
+    "TERMINAL_REVIEW_STATES": ".triage",
+    "TriageQueue": ".triage",
+    "build_review_action": ".triage",
+    "build_review_note": ".triage",
+    "is_digest_candidate": ".triage",
+    "normalize_review_state": ".triage",
+    "review_state_score": ".triage",
+    "MissionRun": ".watchlist",
+    "WatchlistStore": ".watchlist",
+    "WatchMission": ".watchlist",
+}
 
 __all__ = [
     "DataPulseItem",
@@ -95,3 +157,16 @@ __all__ = [
     "MissionRun",
     "WatchlistStore",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,18 +5,26 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import re
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import Any
-from urllib.parse import urlparse
-
-import requests
+from typing import Any, Iterable
 
+from .cache import TTLCache
+from .filestore import ReloadableStore, atomic_write_json, file_lock, locked_append_text
 from .models import DataPulseItem
 from .story import build_factuality_gate, resolve_factuality_gate_status
+from .telemetry import TELEMETRY, traced
 from .triage import build_item_governance, evidence_grade_priority, serialize_item_with_governance
-from .utils import alert_routing_path_from_env, alerts_markdown_path_from_env, alerts_path_from_env
+from .utils import (
+    alert_routing_path_from_env,
+    alerts_markdown_path_from_env,
+    alerts_path_from_env,
+    analyze_url,
+    url_analysis_cache_stats,
+)
 from .watchlist import WatchMission
 
 
@@ -85,25 +93,30 @@ class AlertEvent:
         return cls(**{k: v for k, v in data.items() if k in valid})
 
 
-class AlertStore:
-    """File-backed store for watch alert events."""
+class AlertStore(ReloadableStore):
+    """File-backed store for watch alert events.
+
+    ``path`` holds a compacted JSON snapshot; new and updated events are appended
+    to a JSONL journal next to it (``<path>.jsonl``) and folded back into the
+    snapshot once the journal outgrows the retention window. Cooldown checks and
+    per-mission listing are served from in-memory indexes.
+    """
 
     def __init__(self, path: str | None = None):
         self.path = Path(path or alerts_path_from_env()).expanduser()
+        self.journal_path = (
+            self.path.with_suffix(".jsonl") if self.path.suffix == ".json" else Path(f"{self.path}.jsonl")
+        )
         self.events: list[AlertEvent] = []
         self.max_items = int(os.getenv("DATAPULSE_MAX_ALERTS", "500"))
+        self._by_id: dict[str, AlertEvent] = {}
+        self._by_mission: dict[str, list[AlertEvent]] = {}
+        self._last_emitted: dict[tuple[str, str], datetime] = {}
+        self._journal_lines = 0
         self._load()
 
-    def _load(self) -> None:
-        if not self.path.exists():
-            self.events = []
-            return
-        try:
-            raw = json.loads(self.path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            self.events = []
-            return
-        rows = raw if isinstance(raw, list) else raw.get("events", []) if isinstance(raw, dict) else []
+    @staticmethod
+    def _rows_to_events(rows: Any) -> list[AlertEvent]:
         loaded: list[AlertEvent] = []
         for row in rows if isinstance(rows, list) else []:
             if not isinstance(row, dict):
@@ -112,17 +125,103 @@ class AlertStore:
                 loaded.append(AlertEvent.from_dict(row))
             except (TypeError, ValueError):
                 continue
-        self.events = sorted(loaded, key=lambda event: event.created_at, reverse=True)[: self.max_items]
+        return loaded
+
+    def _read_snapshot(self) -> list[AlertEvent]:
+        if not self.path.exists():
+            return []
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return []
+        rows = raw if isinstance(raw, list) else raw.get("events", []) if isinstance(raw, dict) else []
+        return self._rows_to_events(rows)
+
+    def _read_journal(self) -> list[AlertEvent]:
+        if not self.journal_path.exists():
+            return []
+        rows: list[Any] = []
+        try:
+            with self.journal_path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        rows.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A torn trailing line from an interrupted append is skipped.
+                        continue
+        except OSError:
+            return []
+        self._journal_lines = len(rows)
+        return self._rows_to_events(rows)
+
+    def _read_merged(self) -> dict[str, AlertEvent]:
+        merged: dict[str, AlertEvent] = {}
+        self._journal_lines = 0
+        for event in [*self._read_snapshot(), *self._read_journal()]:
+            merged[event.id] = event
+        return merged
+
+    def _load(self) -> None:
+        self._mark_loaded()
+        merged = self._read_merged()
+        self.events = sorted(merged.values(), key=lambda event: event.created_at, reverse=True)[: self.max_items]
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._by_id = {}
+        self._by_mission = {}
+        self._last_emitted = {}
+        for event in self.events:
+            self._by_id[event.id] = event
+            self._by_mission.setdefault(event.mission_id, []).append(event)
+            self._note_emitted(event)
+
+    def _note_emitted(self, event: AlertEvent) -> None:
+        seen_at = _parse_dt(event.created_at)
+        if seen_at is None:
+            return
+        key = (event.mission_id, event.rule_name)
+        previous = self._last_emitted.get(key)
+        if previous is None or seen_at > previous:
+            self._last_emitted[key] = seen_at
+
+    def _append_journal(self, event: AlertEvent) -> None:
+        self._generation = locked_append_text(
+            self.journal_path,
+            json.dumps(event.to_dict(), ensure_ascii=False) + "\n",
+            generation_of=self.path,
+        )
+        self._journal_lines += 1
+        if self._journal_lines > self.max_items:
+            self.save()
 
     def save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        payload = [event.to_dict() for event in self.events[: self.max_items]]
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        """Compact: rewrite the snapshot with the retained events and truncate the journal.
+
+        Events journaled by other processes since our last load are folded in first
+        so compaction never drops them.
+        """
+        with file_lock(self.path):
+            if self.has_changed():
+                merged = self._read_merged()
+                merged.update(self._by_id)
+                self.events = sorted(merged.values(), key=lambda event: event.created_at, reverse=True)[
+                    : self.max_items
+                ]
+                self._reindex()
+            payload = [event.to_dict() for event in self.events[: self.max_items]]
+            self._generation = atomic_write_json(self.path, payload)
+            self.journal_path.unlink(missing_ok=True)
+        self._journal_lines = 0
+
+    def get(self, event_id: str) -> AlertEvent | None:
+        return self._by_id.get(str(event_id or "").strip())
 
     def list_events(self, *, limit: int = 20, mission_id: str | None = None) -> list[AlertEvent]:
-        events = self.events
-        if mission_id:
-            events = [event for event in events if event.mission_id == mission_id]
+        events = self._by_mission.get(mission_id, []) if mission_id else self.events
         return events[: max(0, limit)]
 
     def should_emit(self, event: AlertEvent, *, cooldown_seconds: int = 0) -> bool:
@@ -131,28 +230,67 @@ class AlertStore:
         current = _parse_dt(event.created_at)
         if current is None:
             return True
-        for existing in self.events:
-            if existing.mission_id != event.mission_id:
-                continue
-            if existing.rule_name != event.rule_name:
-                continue
-            seen_at = _parse_dt(existing.created_at)
-            if seen_at is None:
-                continue
-            if current - seen_at < timedelta(seconds=cooldown_seconds):
-                return False
-        return True
+        seen_at = self._last_emitted.get((event.mission_id, event.rule_name))
+        if seen_at is None:
+            return True
+        return current - seen_at >= timedelta(seconds=cooldown_seconds)
 
     def add(self, event: AlertEvent, *, cooldown_seconds: int = 0) -> bool:
-        if not self.should_emit(event, cooldown_seconds=cooldown_seconds):
-            return False
-        self.events.insert(0, event)
-        self.events = sorted(self.events, key=lambda row: row.created_at, reverse=True)[: self.max_items]
-        self.save()
-        return True
-
+        """Store ``event`` unless its rule is cooling down; other processes' alerts count too."""
+        with self._transaction():
+            if not self.should_emit(event, cooldown_seconds=cooldown_seconds):
+                return False
+            if self.events and event.created_at < self.events[0].created_at:
+                self.events.append(event)
+                self.events.sort(key=lambda row: row.created_at, reverse=True)
+                mission_events = self._by_mission.setdefault(event.mission_id, [])
+                mission_events.append(event)
+                mission_events.sort(key=lambda row: row.created_at, reverse=True)
+            else:
+                self.events.insert(0, event)
+                self._by_mission.setdefault(event.mission_id, []).insert(0, event)
+            self._by_id[event.id] = event
+            self._note_emitted(event)
+            self._apply_retention()
+            self._append_journal(event)
+            return True
 
-class AlertRouteStore:
+    def update(self, event: AlertEvent) -> None:
+        """Persist changes to an already stored event (e.g. delivery results) by appending it."""
+        with self._transaction():
+            stored = self._by_id.get(event.id)
+            if stored is None:
+                return
+            if stored is not event:
+                # A reload replaced our copy; keep the caller's version for the next compaction.
+                self._by_id[event.id] = event
+                self.events = [event if row.id == event.id else row for row in self.events]
+                mission_events = self._by_mission.get(event.mission_id, [])
+                mission_events[:] = [event if row.id == event.id else row for row in mission_events]
+            self._append_journal(event)
+
+    def _apply_retention(self) -> None:
+        if len(self.events) <= self.max_items:
+            return
+        dropped = self.events[self.max_items:]
+        self.events = self.events[: self.max_items]
+        for event in dropped:
+            self._by_id.pop(event.id, None)
+            mission_events = self._by_mission.get(event.mission_id)
+            if mission_events is None:
+                continue
+            mission_events[:] = [row for row in mission_events if row.id != event.id]
+            if not mission_events:
+                del self._by_mission[event.mission_id]
+        # Dropped events are the oldest, so a key still held by a retained event keeps its
+        # newest timestamp; keys with no retained event are forgotten like the events were.
+        for mission_id, rule_name in {(event.mission_id, event.rule_name) for event in dropped}:
+            retained = self._by_mission.get(mission_id, [])
+            if not any(row.rule_name == rule_name for row in retained):
+                self._last_emitted.pop((mission_id, rule_name), None)
+
+
+class AlertRouteStore(ReloadableStore):
     """File-backed named delivery routes for alert sinks."""
 
     SUPPORTED_CHANNELS = {"webhook", "feishu", "telegram", "markdown"}
@@ -163,6 +301,7 @@ class AlertRouteStore:
         self._load()
 
     def _load(self) -> None:
+        self._mark_loaded()
         if not self.path.exists():
             self.routes = {}
             return
@@ -189,9 +328,7 @@ class AlertRouteStore:
         self.routes = normalized
 
     def save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        payload = {"routes": self.routes}
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._write_json({"routes": self.routes})
 
     @staticmethod
     def _normalize_name(name: str) -> str:
@@ -318,36 +455,39 @@ class AlertRouteStore:
         route_name = self._normalize_name(name)
         if not route_name:
             raise ValueError("route name is required")
-        if route_name in self.routes:
-            raise ValueError(f"alert route already exists: {route_name}")
-        self.routes[route_name] = self._normalize_route_payload(payload)
-        self.save()
-        created = self.show(route_name)
-        if created is None:
-            raise ValueError(f"failed to create alert route: {route_name}")
-        return created
+        with self._transaction():
+            if route_name in self.routes:
+                raise ValueError(f"alert route already exists: {route_name}")
+            self.routes[route_name] = self._normalize_route_payload(payload)
+            self.save()
+            created = self.show(route_name)
+            if created is None:
+                raise ValueError(f"failed to create alert route: {route_name}")
+            return created
 
     def update(self, name: str, payload: dict[str, Any]) -> dict[str, Any] | None:
         route_name = self._normalize_name(name)
         if not route_name:
             return None
-        existing = self.routes.get(route_name)
-        if existing is None:
-            return None
-        self.routes[route_name] = self._normalize_route_payload(payload, existing=existing)
-        self.save()
-        return self.show(route_name)
+        with self._transaction():
+            existing = self.routes.get(route_name)
+            if existing is None:
+                return None
+            self.routes[route_name] = self._normalize_route_payload(payload, existing=existing)
+            self.save()
+            return self.show(route_name)
 
     def delete(self, name: str) -> dict[str, Any] | None:
         route_name = self._normalize_name(name)
         if not route_name:
             return None
-        existing = self.show(route_name)
-        if existing is None:
-            return None
-        del self.routes[route_name]
-        self.save()
-        return existing
+        with self._transaction():
+            existing = self.show(route_name)
+            if existing is None:
+                return None
+            del self.routes[route_name]
+            self.save()
+            return existing
 
 
 def validate_delivery_summary_payload(payload: Any) -> list[str]:
@@ -555,6 +695,8 @@ def _alert_text(event: AlertEvent, items: list[DataPulseItem]) -> str:
 
 
 def _post_json(url: str, payload: dict[str, Any], *, timeout: float = 10.0, headers: dict[str, str] | None = None) -> None:
+    import requests
+
     response = requests.post(url, json=payload, headers=headers or {}, timeout=timeout)
     response.raise_for_status()
 
@@ -734,6 +876,41 @@ def _normalize_route_names(rule: dict[str, Any]) -> list[str]:
     return _normalize_string_list(rule.get("route"))
 
 
+def route_delivery_outcomes(event: AlertEvent, alert_routes: AlertRouteStore) -> list[dict[str, Any]]:
+    """Per named route of ``event``'s rule: channel, whether it was delivered, and any delivery error."""
+    rule = event.extra.get("rule", {}) if isinstance(event.extra, dict) else {}
+    if not isinstance(rule, dict):
+        return []
+    delivery_errors = event.extra.get("delivery_errors", {})
+    if not isinstance(delivery_errors, dict):
+        delivery_errors = {}
+    delivered_channels = {
+        str(label or "").strip().lower()
+        for label in event.delivered_channels
+        if str(label or "").strip()
+    }
+    outcomes: list[dict[str, Any]] = []
+    for route_name in _normalize_route_names(rule):
+        route = alert_routes.get(route_name)
+        channel = str(route.get("channel", "")).strip().lower() if isinstance(route, dict) else ""
+        route_label = f"{channel}:{route_name}" if channel else route_name
+        outcomes.append(
+            {
+                "route": route_name,
+                "channel": channel,
+                "configured": isinstance(route, dict),
+                "delivered": route_label in delivered_channels,
+                "error": str(
+                    delivery_errors.get(route_label)
+                    or delivery_errors.get(f"route:{route_name}")
+                    or ""
+                ).strip(),
+                "delivered_channels": sorted(delivered_channels),
+            }
+        )
+    return outcomes
+
+
 def resolve_delivery_targets(
     rule: dict[str, Any],
 ) -> tuple[list[dict[str, Any]], dict[str, str]]:
@@ -830,6 +1007,7 @@ def _build_route_observations(
     return observations
 
 
+@traced("governance.alert")
 def _build_alert_governance(
     event: AlertEvent,
     items: list[DataPulseItem],
@@ -1005,6 +1183,7 @@ def _resolve_delivery_targets(rule: dict[str, Any]) -> tuple[list[dict[str, Any]
     return targets, errors
 
 
+@traced("alert.dispatch")
 def dispatch_alert_event(
     event: AlertEvent,
     items: list[DataPulseItem],
@@ -1110,8 +1289,7 @@ def _normalize_rule_required_tags(rule: dict[str, Any]) -> list[str]:
 
 
 def _item_domain(item: DataPulseItem) -> str:
-    parsed = urlparse(item.url or "")
-    return str(parsed.netloc or "").strip().lower()
+    return analyze_url(item.url or "").netloc
 
 
 def _item_search_text(item: DataPulseItem) -> str:
@@ -1128,58 +1306,178 @@ def _item_search_text(item: DataPulseItem) -> str:
     ).lower()
 
 
-def _item_age_minutes(item: DataPulseItem) -> float | None:
+def _item_age_minutes(item: DataPulseItem, *, now: datetime | None = None) -> float | None:
     fetched_at = _parse_dt(item.fetched_at)
     if fetched_at is None:
         return None
-    return max(0.0, (datetime.now(timezone.utc) - fetched_at).total_seconds() / 60.0)
+    reference = now or datetime.now(timezone.utc)
+    return max(0.0, (reference - fetched_at).total_seconds() / 60.0)
 
 
-def _matches_alert_rule(item: DataPulseItem, rule: dict[str, Any]) -> bool:
-    if item.score < int(rule.get("min_score", 0) or 0):
-        return False
-    if item.confidence < float(rule.get("min_confidence", 0.0) or 0.0):
-        return False
+class _KeywordMatcher:
+    """Find which of many lowercase keywords occur in a text with one regex scan.
 
-    item_tags = {str(tag).strip().lower() for tag in item.tags if str(tag).strip()}
-    required_tags = _normalize_rule_required_tags(rule)
-    if required_tags and not set(required_tags).issubset(item_tags):
-        return False
+    A lookahead alternation ordered longest-first reports the longest keyword
+    starting at every offset; shorter keywords contained in a hit come from a
+    precomputed substring closure. ``find(text)`` therefore equals
+    ``{kw for kw in keywords if kw in text}``.
+    """
 
-    excluded_tags = set(_normalize_string_list(rule.get("excluded_tags")))
-    if excluded_tags and item_tags.intersection(excluded_tags):
-        return False
+    def __init__(self, keywords: Iterable[str]):
+        ordered = sorted({keyword for keyword in keywords if keyword}, key=lambda keyword: (-len(keyword), keyword))
+        self._closure = {
+            keyword: frozenset(other for other in ordered if other in keyword)
+            for keyword in ordered
+        }
+        self._pattern = (
+            re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in ordered) + "))")
+            if ordered
+            else None
+        )
 
-    source_types = set(_normalize_rule_source_types(rule))
-    if source_types and item.source_type.value not in source_types:
-        return False
+    def find(self, text: str) -> frozenset[str]:
+        if self._pattern is None:
+            return frozenset()
+        found: set[str] = set()
+        for hit in set(self._pattern.findall(text)):
+            found.update(self._closure[hit])
+        return frozenset(found)
 
-    domains = _normalize_string_list(rule.get("domains"))
-    if domains:
-        domain = _item_domain(item)
-        if not any(domain == candidate or domain.endswith(f".{candidate}") for candidate in domains):
-            return False
 
-    search_text = _item_search_text(item)
-    keyword_any = _normalize_string_list(rule.get("keyword_any"))
-    if keyword_any and not any(token in search_text for token in keyword_any):
-        return False
+class _AlertItemFacts:
+    """Per-item values computed lazily once and shared by every rule in a pass."""
 
-    keyword_all = _normalize_string_list(rule.get("keyword_all"))
-    if keyword_all and not all(token in search_text for token in keyword_all):
-        return False
+    def __init__(self, item: DataPulseItem, matcher: _KeywordMatcher, now: datetime):
+        self.item = item
+        self._matcher = matcher
+        self._now = now
 
-    exclude_keywords = _normalize_string_list(rule.get("exclude_keywords"))
-    if exclude_keywords and any(token in search_text for token in exclude_keywords):
-        return False
+    @cached_property
+    def tags(self) -> frozenset[str]:
+        return frozenset(str(tag).strip().lower() for tag in self.item.tags if str(tag).strip())
 
-    max_age_minutes = int(rule.get("max_age_minutes", 0) or 0)
-    if max_age_minutes > 0:
-        age_minutes = _item_age_minutes(item)
-        if age_minutes is None or age_minutes > max_age_minutes:
+    @cached_property
+    def domain(self) -> str:
+        return _item_domain(self.item)
+
+    @cached_property
+    def keywords(self) -> frozenset[str]:
+        return self._matcher.find(_item_search_text(self.item))
+
+    @cached_property
+    def age_minutes(self) -> float | None:
+        return _item_age_minutes(self.item, now=self._now)
+
+
+@dataclass
+class CompiledAlertRule:
+    """One alert rule with its filters normalized once at compile time."""
+
+    index: int
+    name: str
+    raw: dict[str, Any]
+    min_results: int = 1
+    min_score: int = 0
+    min_confidence: float = 0.0
+    required_tags: frozenset[str] = frozenset()
+    excluded_tags: frozenset[str] = frozenset()
+    source_types: frozenset[str] = frozenset()
+    domains: tuple[str, ...] = ()
+    keyword_any: frozenset[str] = frozenset()
+    keyword_all: frozenset[str] = frozenset()
+    exclude_keywords: frozenset[str] = frozenset()
+    max_age_minutes: int = 0
+    channels: list[str] = field(default_factory=lambda: ["json"])
+    cooldown_seconds: int = 0
+
+    @classmethod
+    def compile(cls, raw_rule: dict[str, Any], index: int) -> "CompiledAlertRule":
+        return cls(
+            index=index,
+            name=str(raw_rule.get("name", "")).strip() or f"rule-{index}",
+            raw=raw_rule,
+            min_results=max(1, int(raw_rule.get("min_results", 1) or 1)),
+            min_score=int(raw_rule.get("min_score", 0) or 0),
+            min_confidence=float(raw_rule.get("min_confidence", 0.0) or 0.0),
+            required_tags=frozenset(_normalize_rule_required_tags(raw_rule)),
+            excluded_tags=frozenset(_normalize_string_list(raw_rule.get("excluded_tags"))),
+            source_types=frozenset(_normalize_rule_source_types(raw_rule)),
+            domains=tuple(_normalize_string_list(raw_rule.get("domains"))),
+            keyword_any=frozenset(_normalize_string_list(raw_rule.get("keyword_any"))),
+            keyword_all=frozenset(_normalize_string_list(raw_rule.get("keyword_all"))),
+            exclude_keywords=frozenset(_normalize_string_list(raw_rule.get("exclude_keywords"))),
+            max_age_minutes=int(raw_rule.get("max_age_minutes", 0) or 0),
+            channels=_normalize_rule_channels(raw_rule),
+            cooldown_seconds=int(raw_rule.get("cooldown_seconds", 0) or 0),
+        )
+
+    @property
+    def keywords(self) -> frozenset[str]:
+        return self.keyword_any | self.keyword_all | self.exclude_keywords
+
+    def matches(self, facts: _AlertItemFacts) -> bool:
+        item = facts.item
+        if item.score < self.min_score:
+            return False
+        if item.confidence < self.min_confidence:
             return False
+        if self.required_tags and not self.required_tags.issubset(facts.tags):
+            return False
+        if self.excluded_tags and facts.tags.intersection(self.excluded_tags):
+            return False
+        if self.source_types and item.source_type.value not in self.source_types:
+            return False
+        if self.domains:
+            domain = facts.domain
+            if not any(domain == candidate or domain.endswith(f".{candidate}") for candidate in self.domains):
+                return False
+        if self.keyword_any and self.keyword_any.isdisjoint(facts.keywords):
+            return False
+        if self.keyword_all and not self.keyword_all.issubset(facts.keywords):
+            return False
+        if self.exclude_keywords and not self.exclude_keywords.isdisjoint(facts.keywords):
+            return False
+        if self.max_age_minutes > 0:
+            age_minutes = facts.age_minutes
+            if age_minutes is None or age_minutes > self.max_age_minutes:
+                return False
+        return True
+
+
+class CompiledAlertRules:
+    """Every enabled alert rule of one mission, evaluated in a single pass over items."""
+
+    def __init__(self, raw_rules: list[Any]):
+        self.rules = [
+            CompiledAlertRule.compile(raw_rule, index)
+            for index, raw_rule in enumerate(raw_rules, start=1)
+            if isinstance(raw_rule, dict) and raw_rule.get("enabled", True) is not False
+        ]
+        self._matcher = _KeywordMatcher(keyword for rule in self.rules for keyword in rule.keywords)
+
+    def evaluate(self, items: list[DataPulseItem]) -> list[tuple[CompiledAlertRule, list[DataPulseItem]]]:
+        now = datetime.now(timezone.utc)
+        buckets: list[list[DataPulseItem]] = [[] for _ in self.rules]
+        for item in items:
+            facts = _AlertItemFacts(item, self._matcher, now)
+            for rule, bucket in zip(self.rules, buckets):
+                if rule.matches(facts):
+                    bucket.append(item)
+        return list(zip(self.rules, buckets))
+
 
-    return True
+_COMPILED_ALERT_RULES = TTLCache(maxsize=256, ttl=3600.0)
+
+
+def compile_alert_rules(mission: WatchMission) -> CompiledAlertRules:
+    """Return the mission's compiled rules, reusing them while the rule payload is unchanged."""
+    signature = json.dumps(mission.alert_rules, ensure_ascii=False, sort_keys=True, default=str)
+    cached = _COMPILED_ALERT_RULES.get(mission.id)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    compiled = CompiledAlertRules(mission.alert_rules)
+    _COMPILED_ALERT_RULES.set(mission.id, (signature, compiled))
+    return compiled
 
 
 def _rule_summary(mission: WatchMission, rule_name: str, rule: dict[str, Any], match_count: int) -> str:
@@ -1216,34 +1514,25 @@ def evaluate_watch_alerts(
 ) -> list[tuple[AlertEvent, list[DataPulseItem], int]]:
     """Evaluate alert rules for one mission run."""
     events: list[tuple[AlertEvent, list[DataPulseItem], int]] = []
-    for index, raw_rule in enumerate(mission.alert_rules, start=1):
-        if not isinstance(raw_rule, dict) or raw_rule.get("enabled", True) is False:
-            continue
-        min_results = max(1, int(raw_rule.get("min_results", 1) or 1))
-        matches: list[DataPulseItem] = []
-        for item in items:
-            if _matches_alert_rule(item, raw_rule):
-                matches.append(item)
-        if len(matches) < min_results:
+    for rule, matches in compile_alert_rules(mission).evaluate(items):
+        if len(matches) < rule.min_results:
             continue
-        rule_name = str(raw_rule.get("name", "")).strip() or f"rule-{index}"
-        summary = _rule_summary(mission, rule_name, raw_rule, len(matches))
+        summary = _rule_summary(mission, rule.name, rule.raw, len(matches))
         event = AlertEvent(
             mission_id=mission.id,
             mission_name=mission.name,
-            rule_name=rule_name,
-            channels=_normalize_rule_channels(raw_rule),
+            rule_name=rule.name,
+            channels=list(rule.channels),
             item_ids=[item.id for item in matches],
             summary=summary,
             extra={
-                "rule": raw_rule,
+                "rule": rule.raw,
                 "match_count": len(matches),
                 "top_item_title": matches[0].title if matches else "",
             },
         )
         event.governance = _build_alert_governance(event, matches)
-        cooldown_seconds = int(raw_rule.get("cooldown_seconds", 0) or 0)
-        events.append((event, matches, cooldown_seconds))
+        events.append((event, matches, rule.cooldown_seconds))
     return events
 
 
@@ -1297,31 +1586,16 @@ class AlertService:
             }
 
         for event in self.alert_store.list_events(limit=max(0, int(limit))):
-            rule = event.extra.get("rule", {}) if isinstance(event.extra, dict) else {}
-            if not isinstance(rule, dict):
-                continue
-            route_names = _normalize_route_names(rule)
-            if not route_names:
-                continue
-            delivered_channels = {
-                str(label or "").strip().lower()
-                for label in event.delivered_channels
-                if str(label or "").strip()
-            }
-            delivery_errors = event.extra.get("delivery_errors", {}) if isinstance(event.extra, dict) else {}
-            if not isinstance(delivery_errors, dict):
-                delivery_errors = {}
-            for route_name in route_names:
-                route_payload = self.alert_routes.get(route_name)
-                route_dict: dict[str, Any] | None = route_payload if isinstance(route_payload, dict) else None
-                channel = str(route_dict.get("channel", "")).strip().lower() if route_dict is not None else ""
+            for outcome in route_delivery_outcomes(event, self.alert_routes):
+                route_name = outcome["route"]
+                channel = outcome["channel"]
                 route_row = route_rows.setdefault(
                     route_name,
                     {
                         "name": route_name,
                         "channel": channel or "unknown",
-                        "configured": route_dict is not None,
-                        "status": "missing" if route_dict is None else "idle",
+                        "configured": outcome["configured"],
+                        "status": "idle" if outcome["configured"] else "missing",
                         "event_count": 0,
                         "delivered_count": 0,
                         "failure_count": 0,
@@ -1337,7 +1611,6 @@ class AlertService:
                 )
                 if channel and route_row["channel"] == "unknown":
                     route_row["channel"] = channel
-                route_row["configured"] = route_row["configured"] or isinstance(route, dict)
                 route_row["event_count"] += 1
                 route_row["mission_ids"].add(event.mission_id)
                 route_row["rule_names"].add(event.rule_name)
@@ -1345,17 +1618,12 @@ class AlertService:
                     route_row["last_event_at"] = event.created_at
                     route_row["last_summary"] = event.summary
 
-                route_label = f"{channel}:{route_name}" if channel else route_name
-                if route_label in delivered_channels:
+                if outcome["delivered"]:
                     route_row["delivered_count"] += 1
                     if not route_row["last_delivered_at"]:
                         route_row["last_delivered_at"] = event.created_at
 
-                error_message = str(
-                    delivery_errors.get(route_label)
-                    or delivery_errors.get(f"route:{route_name}")
-                    or ""
-                ).strip()
+                error_message = outcome["error"]
                 if error_message:
                     route_row["failure_count"] += 1
                     if not route_row["last_failed_at"]:
@@ -1363,9 +1631,13 @@ class AlertService:
                     if not route_row["last_error"]:
                         route_row["last_error"] = error_message
 
+        return self._finalize_route_rows(route_rows.values())
+
+    @staticmethod
+    def _finalize_route_rows(route_rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
         severity = {"missing": 0, "degraded": 1, "healthy": 2, "idle": 3}
         payloads: list[dict[str, Any]] = []
-        for route_row in route_rows.values():
+        for route_row in route_rows:
             attempts = route_row["delivered_count"] + route_row["failure_count"]
             if not route_row["configured"]:
                 route_row["status"] = "missing"
@@ -1390,6 +1662,39 @@ class AlertService:
             ),
         )
 
+    def materialized_route_health(self, route_counters: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        """Route health rows from the materialized per-route delivery counters (see ``OpsMetrics``)."""
+        route_rows: dict[str, dict[str, Any]] = {}
+        for route in self.list_alert_routes():
+            name = str(route.get("name", "")).strip().lower()
+            if name:
+                route_rows[name] = {"name": name, "channel": str(route.get("channel", "")).strip().lower(), "configured": True}
+        for name, counters in route_counters.items():
+            route_rows.setdefault(name, {"name": name, "channel": "", "configured": False})
+        payloads: list[dict[str, Any]] = []
+        for name, row in route_rows.items():
+            counters = route_counters.get(name, {})
+            payloads.append(
+                {
+                    "name": name,
+                    "channel": row["channel"] or str(counters.get("channel", "") or "") or "unknown",
+                    "configured": row["configured"],
+                    "status": "idle",
+                    "event_count": int(counters.get("event_count", 0) or 0),
+                    "delivered_count": int(counters.get("delivered_count", 0) or 0),
+                    "failure_count": int(counters.get("failure_count", 0) or 0),
+                    "success_rate": None,
+                    "last_event_at": str(counters.get("last_event_at", "") or ""),
+                    "last_delivered_at": str(counters.get("last_delivered_at", "") or ""),
+                    "last_failed_at": str(counters.get("last_failed_at", "") or ""),
+                    "last_error": str(counters.get("last_error", "") or ""),
+                    "last_summary": str(counters.get("last_summary", "") or ""),
+                    "mission_ids": list(counters.get("mission_ids", []) or []),
+                    "rule_names": list(counters.get("rule_names", []) or []),
+                }
+            )
+        return self._finalize_route_rows(payloads)
+
     def route_status_by_name(self) -> dict[str, str]:
         lookup: dict[str, str] = {}
         for route in self.alert_route_health(limit=100):
@@ -1405,10 +1710,7 @@ class AlertService:
         target = str(identifier or "").strip()
         if not target:
             return None
-        for event in self.alert_store.list_events(limit=self.alert_store.max_items):
-            if event.id == target:
-                return event
-        return None
+        return self.alert_store.get(target)
 
     def watch_status_snapshot(self) -> dict[str, Any]:
         return self.watch_status.snapshot()
@@ -1422,7 +1724,11 @@ class AlertService:
     ) -> dict[str, Any]:
         doctor_report = self.owner.doctor()
         status = self.watch_status_snapshot()
-        route_health = self.alert_route_health(limit=route_limit)
+        ops_metrics = getattr(self.owner, "ops_metrics", None)
+        if ops_metrics is not None:
+            route_health = self.materialized_route_health(ops_metrics.snapshot()["alerts"].get("routes", {}))
+        else:
+            route_health = self.alert_route_health(limit=route_limit)
         recent_alerts = self.list_alerts(limit=alert_limit)
         watch_summary, watch_health = self.owner._watch_health_snapshot()
         governance_scorecard = self.owner.governance_scorecard_snapshot()
@@ -1485,6 +1791,7 @@ class AlertService:
                     "available": bool(entry.get("available", True)),
                     "message": str(entry.get("message", "") or "").strip(),
                     "setup_hint": str(entry.get("setup_hint", "") or "").strip(),
+                    "checked_at": str(entry.get("checked_at", "") or "").strip(),
                 }
                 for tier_name, entries in doctor_report.items()
                 for entry in entries
@@ -1543,42 +1850,20 @@ class AlertService:
         ]
         route_timeline: list[dict[str, Any]] = []
         for event in self.alert_store.list_events(limit=max(0, int(route_limit))):
-            rule = event.extra.get("rule", {}) if isinstance(event.extra, dict) else {}
-            if not isinstance(rule, dict):
-                continue
-            route_names = _normalize_route_names(rule)
-            if not route_names:
-                continue
-            delivery_errors = event.extra.get("delivery_errors", {}) if isinstance(event.extra, dict) else {}
-            if not isinstance(delivery_errors, dict):
-                delivery_errors = {}
-            delivered_channels = {
-                str(label or "").strip().lower()
-                for label in event.delivered_channels
-                if str(label or "").strip()
-            }
-            for route_name in route_names:
-                route = self.alert_routes.get(route_name)
-                channel = str(route.get("channel", "")).strip().lower() if isinstance(route, dict) else ""
-                route_label = f"{channel}:{route_name}" if channel else route_name
-                error_message = str(
-                    delivery_errors.get(route_label)
-                    or delivery_errors.get(f"route:{route_name}")
-                    or ""
-                ).strip()
-                delivered = route_label in delivered_channels
+            for outcome in route_delivery_outcomes(event, self.alert_routes):
+                error_message = outcome["error"]
                 route_timeline.append(
                     {
-                        "route": route_name,
-                        "channel": channel or "unknown",
+                        "route": outcome["route"],
+                        "channel": outcome["channel"] or "unknown",
                         "mission_id": event.mission_id,
                         "mission_name": event.mission_name,
                         "rule_name": event.rule_name,
                         "created_at": event.created_at,
-                        "status": "failed" if error_message else "delivered" if delivered else "pending",
+                        "status": "failed" if error_message else "delivered" if outcome["delivered"] else "pending",
                         "summary": str(event.summary or "").strip(),
                         "error": error_message,
-                        "delivered_channels": sorted(delivered_channels),
+                        "delivered_channels": outcome["delivered_channels"],
                     }
                 )
         route_timeline = sorted(
@@ -1632,15 +1917,20 @@ class AlertService:
             "recent_failures": recent_failures,
             "recent_alerts": recent_alerts,
             "governance_scorecard": governance_scorecard,
+            "url_cache": url_analysis_cache_stats(),
+            "slowest_spans": TELEMETRY.snapshot()[:10],
             "daemon": status,
         }
 
+    @traced("alert.evaluate")
     def evaluate_and_dispatch_watch_alerts(
         self,
         mission: WatchMission,
         items: list[DataPulseItem],
     ) -> list[dict[str, Any]]:
         outputs: list[dict[str, Any]] = []
+        recorded: list[AlertEvent] = []
+        base_generation = self.alert_store.generation
         for event, matches, cooldown_seconds in evaluate_watch_alerts(mission, items):
             if not self.alert_store.add(event, cooldown_seconds=cooldown_seconds):
                 continue
@@ -1648,6 +1938,10 @@ class AlertService:
             event.delivered_channels = delivered
             if errors:
                 event.extra["delivery_errors"] = errors
-            self.alert_store.save()
+            self.alert_store.update(event)
+            recorded.append(event)
             outputs.append(event.to_dict())
+        metrics = getattr(self.owner, "ops_metrics", None)
+        if recorded and metrics is not None:
+            metrics.record_alerts(recorded, base_generation=base_generation)
         return outputs
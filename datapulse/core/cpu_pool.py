@@ -0,0 +1,138 @@
+"""Optional process pool for CPU-bound extraction work.
+
+Readers fetch pages on threads, but HTML parsing and text extraction then run
+under the GIL and pin a single core. When ``DATAPULSE_CPU_WORKERS`` is set,
+large documents are shipped to a shared pool of worker processes and only the
+compact parse result comes back. With the setting at ``0`` (the default), for
+small inputs, inside a worker, or if the pool breaks, work simply runs inline.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, TypeVar
+
+from datapulse.core.config import read_env_int, read_env_str
+
+logger = logging.getLogger("datapulse.core.cpu_pool")
+
+T = TypeVar("T")
+
+_MAX_WORKERS = 64
+_POOL_LOCK = threading.Lock()
+_pool: ProcessPoolExecutor | None = None
+_pool_size = 0
+_in_worker = False
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects affinity masks where supported)."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return max(1, os.cpu_count() or 1)
+
+
+def cpu_workers_from_env() -> int:
+    """Configured pool size: ``DATAPULSE_CPU_WORKERS`` as a number, ``auto`` for one per CPU, 0 for inline."""
+    if _in_worker:
+        return 0
+    raw = read_env_str("DATAPULSE_CPU_WORKERS", "0").lower()
+    if raw == "auto":
+        return min(available_cpus(), _MAX_WORKERS)
+    return read_env_int("DATAPULSE_CPU_WORKERS", 0, min_value=0, max_value=_MAX_WORKERS)
+
+
+def should_offload(size: int) -> bool:
+    """Whether an input of ``size`` characters is worth the round trip to a worker process."""
+    if cpu_workers_from_env() <= 0:
+        return False
+    return size >= read_env_int("DATAPULSE_CPU_POOL_MIN_CHARS", 32_000, min_value=0)
+
+
+def _mark_worker() -> None:
+    global _in_worker
+    _in_worker = True
+
+
+def _shared_pool() -> ProcessPoolExecutor | None:
+    global _pool, _pool_size
+    size = cpu_workers_from_env()
+    with _POOL_LOCK:
+        if _pool is not None and _pool_size != size:
+            # Other threads may still be waiting on the old pool: let their work finish.
+            _pool.shutdown(wait=False)
+            _pool = None
+        if _pool is None and size > 0:
+            # Never fork a threaded reader process; workers start from a clean interpreter.
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _pool = ProcessPoolExecutor(max_workers=size, mp_context=context, initializer=_mark_worker)
+            _pool_size = size
+        return _pool
+
+
+def _discard_pool(broken: ProcessPoolExecutor) -> None:
+    global _pool
+    with _POOL_LOCK:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def run_cpu_bound(fn: Callable[..., T], *args: Any) -> T:
+    """Run ``fn(*args)`` in the shared worker pool, or inline when no pool is configured.
+
+    ``fn`` must be a module-level function and its arguments and result
+    picklable. Exceptions raised by ``fn`` propagate as if it ran inline; a
+    broken or shut-down pool (work cancelled under us) or an unpicklable
+    payload falls back to running inline.
+    """
+    pool = _shared_pool()
+    if pool is None:
+        return fn(*args)
+    try:
+        future = pool.submit(fn, *args)
+    except RuntimeError as exc:  # pool shut down between lookup and submit
+        logger.info("CPU pool unavailable, running %s inline: %s", getattr(fn, "__name__", fn), exc)
+        return fn(*args)
+    try:
+        return future.result()
+    except BrokenProcessPool as exc:
+        logger.warning("CPU pool broke, running %s inline: %s", getattr(fn, "__name__", fn), exc)
+        _discard_pool(pool)
+        return fn(*args)
+    except CancelledError:
+        logger.info("CPU pool cancelled %s, running inline", getattr(fn, "__name__", fn))
+        return fn(*args)
+    except (pickle.PicklingError, TypeError, AttributeError) as exc:
+        if not _is_pickling_failure(exc):
+            raise
+        logger.warning("CPU pool could not ship %s, running inline: %s", getattr(fn, "__name__", fn), exc)
+        return fn(*args)
+
+
+def _is_pickling_failure(exc: BaseException) -> bool:
+    if isinstance(exc, pickle.PicklingError):
+        return True
+    message = str(exc).lower()
+    return "pickle" in message
+
+
+def shutdown_cpu_pool() -> None:
+    """Stop the shared worker pool; the next offload starts a fresh one."""
+    global _pool
+    with _POOL_LOCK:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+atexit.register(shutdown_cpu_pool)
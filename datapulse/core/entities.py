@@ -13,8 +13,6 @@ from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import Any
 
-import requests
-
 from datapulse.core.retry import CircuitBreaker, CircuitBreakerOpen, RateLimitError, retry
 from datapulse.core.security import get_secret
 
@@ -372,6 +370,8 @@ def _call_llm_api(prompt: str, api_key: str, model: str, api_base: str) -> str:
         "temperature": 0.1,
         "max_tokens": 2048,
     }
+    import requests
+
     response = requests.post(
         endpoint,
         json=body,
@@ -394,7 +394,9 @@ def _call_llm_api(prompt: str, api_key: str, model: str, api_base: str) -> str:
     return str(message.get("content", "")).strip()
 
 
-@retry(max_attempts=2, base_delay=1.0, retryable=(RateLimitError, requests.RequestException, RuntimeError))
+# requests.RequestException subclasses OSError, so listing OSError keeps network errors
+# retryable without importing requests at module import time.
+@retry(max_attempts=2, base_delay=1.0, retryable=(RateLimitError, OSError, RuntimeError))
 def _llm_text(prompt: str, *, api_key: str, model: str, api_base: str) -> str:
     return _call_llm_api(prompt, api_key=api_key, model=model, api_base=api_base)
 
@@ -8,9 +8,10 @@ from pathlib import Path
 from typing import Any
 
 from datapulse.core.entities import Entity, EntityType, Relation, normalize_entity_name
+from datapulse.core.filestore import ReloadableStore
 
 
-class EntityStore:
+class EntityStore(ReloadableStore):
     """JSON-backed entity storage with in-memory index."""
 
     def __init__(self, path: str | None = None):
@@ -20,6 +21,7 @@ class EntityStore:
         self._load()
 
     def _load(self) -> None:
+        self._mark_loaded()
         if not self.path.exists():
             self.entities = {}
             self.relations = []
@@ -62,34 +64,34 @@ class EntityStore:
             "entities": {key: value.to_dict() for key, value in self.entities.items()},
             "relations": [relation.to_dict() for relation in self.relations],
         }
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._write_json(payload)
 
     def add_entity(self, entity: Entity) -> bool:
         """Add or merge entity. Returns True when added or merged."""
         if not isinstance(entity, Entity):
             return False
-        existing = self.entities.get(entity.id)
-        if existing is None:
-            self.entities[entity.id] = entity
+        with self._transaction():
+            existing = self.entities.get(entity.id)
+            if existing is None:
+                self.entities[entity.id] = entity
+                self._save()
+                return True
+
+            merged_source_ids = sorted(set(existing.source_item_ids + entity.source_item_ids))
+            merged = Entity(
+                name=existing.name,
+                entity_type=existing.entity_type,
+                display_name=existing.display_name or entity.display_name,
+                source_item_ids=merged_source_ids,
+                mention_count=existing.mention_count + max(1, entity.mention_count),
+                extra={**existing.extra, **entity.extra},
+            )
+            if merged == existing:
+                return False
+            self.entities[entity.id] = merged
             self._save()
             return True
 
-        merged_source_ids = sorted(set(existing.source_item_ids + entity.source_item_ids))
-        merged = Entity(
-            name=existing.name,
-            entity_type=existing.entity_type,
-            display_name=existing.display_name or entity.display_name,
-            source_item_ids=merged_source_ids,
-            mention_count=existing.mention_count + max(1, entity.mention_count),
-            extra={**existing.extra, **entity.extra},
-        )
-        if merged == existing:
-            return False
-        self.entities[entity.id] = merged
-        self._save()
-        return True
-
     def add_entities(self, entities: list[Entity]) -> int:
         if not entities:
             return 0
@@ -104,27 +106,28 @@ class EntityStore:
             return False
         norm_source = relation.source_entity
         norm_target = relation.target_entity
-        for idx, existing in enumerate(self.relations):
-            if (
-                existing.source_entity == norm_source
-                and existing.target_entity == norm_target
-                and existing.relation_type == relation.relation_type
-            ):
-                merged = Relation(
-                    source_entity=existing.source_entity,
-                    target_entity=existing.target_entity,
-                    relation_type=existing.relation_type,
-                    keywords=sorted(set(existing.keywords + relation.keywords)),
-                    weight=max(existing.weight, relation.weight),
-                    source_item_ids=sorted(set(existing.source_item_ids + relation.source_item_ids)),
-                )
-                if merged != existing:
-                    self.relations[idx] = merged
-                    self._save()
-                return merged != existing
-        self.relations.append(relation)
-        self._save()
-        return True
+        with self._transaction():
+            for idx, existing in enumerate(self.relations):
+                if (
+                    existing.source_entity == norm_source
+                    and existing.target_entity == norm_target
+                    and existing.relation_type == relation.relation_type
+                ):
+                    merged = Relation(
+                        source_entity=existing.source_entity,
+                        target_entity=existing.target_entity,
+                        relation_type=existing.relation_type,
+                        keywords=sorted(set(existing.keywords + relation.keywords)),
+                        weight=max(existing.weight, relation.weight),
+                        source_item_ids=sorted(set(existing.source_item_ids + relation.source_item_ids)),
+                    )
+                    if merged != existing:
+                        self.relations[idx] = merged
+                        self._save()
+                    return merged != existing
+            self.relations.append(relation)
+            self._save()
+            return True
 
     def add_relations(self, relations: list[Relation]) -> int:
         if not relations:
@@ -0,0 +1,164 @@
+"""Multi-process safe persistence for the file-backed JSON stores — stdlib only.
+
+The watch daemon, console, CLI and MCP server share the same store files.
+Writers take an advisory ``fcntl`` lock on ``<path>.lock``, write a temp file
+in the same directory and ``os.replace`` it over the target, so readers never
+observe a half-written file. Every write bumps a monotonically increasing
+generation kept in ``<path>.gen``; long-lived processes poll it (one tiny read)
+and reload a store only when another process has changed it.
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms fall back to atomic rename only
+    fcntl = None  # type: ignore[assignment]
+
+_HELD = threading.local()
+
+
+def lock_path_for(path: Path | str) -> Path:
+    return Path(f"{path}.lock")
+
+
+def generation_path_for(path: Path | str) -> Path:
+    return Path(f"{path}.gen")
+
+
+@contextmanager
+def file_lock(path: Path | str, *, shared: bool = False) -> Iterator[None]:
+    """Advisory lock on ``<path>.lock``; re-entrant within a thread."""
+    key = str(Path(path).expanduser())
+    held: dict[str, int] = getattr(_HELD, "depth", None) or {}
+    _HELD.depth = held
+    if fcntl is None or held.get(key):
+        held[key] = held.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            held[key] -= 1
+        return
+
+    lock_file = lock_path_for(key)
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        held[key] = 1
+        try:
+            yield
+        finally:
+            held[key] = 0
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def read_generation(path: Path | str) -> int:
+    """Current write generation of ``path`` (0 when it has never been written through this module)."""
+    try:
+        return int(generation_path_for(path).read_text(encoding="utf-8").strip() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def atomic_replace_text(path: Path | str, text: str) -> None:
+    """Write-then-rename without taking the store lock or bumping the generation."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _bump_generation(path: Path) -> int:
+    generation = read_generation(path) + 1
+    atomic_replace_text(generation_path_for(path), f"{generation}\n")
+    return generation
+
+
+def atomic_write_text(path: Path | str, text: str) -> int:
+    """Atomically replace ``path`` with ``text`` under the store lock; returns the new generation."""
+    target = Path(path)
+    with file_lock(target):
+        atomic_replace_text(target, text)
+        return _bump_generation(target)
+
+
+def atomic_write_json(path: Path | str, payload: Any, *, indent: int | None = 2) -> int:
+    return atomic_write_text(path, json.dumps(payload, ensure_ascii=False, indent=indent))
+
+
+def locked_append_text(path: Path | str, text: str, *, generation_of: Path | str | None = None) -> int:
+    """Append ``text`` under the lock of ``generation_of`` (defaults to ``path``) and bump its generation."""
+    owner = Path(generation_of or path)
+    target = Path(path)
+    with file_lock(owner):
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("a", encoding="utf-8") as handle:
+            handle.write(text)
+            handle.flush()
+        return _bump_generation(owner)
+
+
+class ReloadableStore(abc.ABC):
+    """Base for stores with a ``path`` and a ``_load()`` that rebuilds state from disk.
+
+    Call :meth:`_mark_loaded` *before* reading the file so a concurrent write is
+    never mistaken for already-seen data; :meth:`reload_if_changed` then costs a
+    single small read when nothing changed. Mutators run inside
+    :meth:`_transaction` so reload, change and write happen under one lock.
+    """
+
+    path: Path
+    _generation: int = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def _mark_loaded(self) -> None:
+        self._generation = read_generation(self.path)
+
+    def _write_json(self, payload: Any) -> None:
+        self._generation = atomic_write_json(self.path, payload)
+
+    def has_changed(self) -> bool:
+        return read_generation(self.path) != self._generation
+
+    def reload_if_changed(self) -> bool:
+        if not self.has_changed():
+            return False
+        self._load()
+        return True
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Pick up other writers' changes and keep them locked out until this write lands."""
+        with file_lock(self.path):
+            self.reload_if_changed()
+            yield
+
+    @abc.abstractmethod
+    def _load(self) -> Any:
+        """Rebuild in-memory state from ``path``."""
@@ -0,0 +1,245 @@
+"""Cached, background-refreshed collector health probes — stdlib only.
+
+``doctor()`` used to run every collector ``check()`` inline, including live
+network probes. Probes are now cached per collector with a TTL
+(``health_ttl_seconds`` on the collector class), stale entries are served
+immediately while a background thread refreshes them, and cold probes run in
+parallel. A cold ``doctor()`` waits at most ``DATAPULSE_HEALTH_COLD_WAIT_SECONDS``
+for them; probes still running after that are reported as ``pending``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable
+
+logger = logging.getLogger("datapulse.health")
+
+DEFAULT_HEALTH_TTL_SECONDS = 300.0
+DEFAULT_HEALTH_COLD_WAIT_SECONDS = 2.0
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+@dataclass
+class HealthProbe:
+    check: dict[str, Any]
+    checked_at: str
+    checked_monotonic: float
+
+    def age_seconds(self, now: float | None = None) -> float:
+        return round(max(0.0, (now if now is not None else time.monotonic()) - self.checked_monotonic), 3)
+
+
+def probe_key(parser: Any) -> str:
+    parser_type = type(parser)
+    return f"{parser_type.__module__}.{parser_type.__qualname__}:{getattr(parser, 'name', '')}"
+
+
+def default_health_ttl() -> float:
+    raw = os.getenv("DATAPULSE_HEALTH_TTL_SECONDS", "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else DEFAULT_HEALTH_TTL_SECONDS
+    except ValueError:
+        return DEFAULT_HEALTH_TTL_SECONDS
+
+
+def cold_wait_seconds() -> float:
+    raw = os.getenv("DATAPULSE_HEALTH_COLD_WAIT_SECONDS", "").strip()
+    try:
+        return max(0.0, float(raw)) if raw else DEFAULT_HEALTH_COLD_WAIT_SECONDS
+    except ValueError:
+        return DEFAULT_HEALTH_COLD_WAIT_SECONDS
+
+
+def _pending_check() -> dict[str, Any]:
+    return {"status": "pending", "message": "health probe still running; retry shortly", "available": True, "ok": False}
+
+
+def probe_ttl(parser: Any) -> float:
+    """Collector-specific TTL (``health_ttl_seconds``) or the env-wide default."""
+    ttl = getattr(parser, "health_ttl_seconds", None)
+    if ttl is None:
+        return default_health_ttl()
+    try:
+        return max(0.0, float(ttl))
+    except (TypeError, ValueError):
+        return default_health_ttl()
+
+
+def run_check(parser: Any) -> dict[str, Any]:
+    try:
+        check = parser.check()
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("health check raised for %s: %s", getattr(parser, "name", parser), exc)
+        return {"status": "error", "message": f"health check raised: {exc}", "available": False}
+    return dict(check) if isinstance(check, dict) else {"status": "error", "message": "invalid check payload", "available": False}
+
+
+class HealthProbeCache:
+    """Process-wide cache of collector ``check()`` results keyed by collector class and name."""
+
+    def __init__(self, *, max_workers: int = 8):
+        self._max_workers = max(1, int(max_workers))
+        self._entries: dict[str, HealthProbe] = {}
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+        self._stored = threading.Condition(self._lock)
+        self._refresher: threading.Thread | None = None
+        self._refresher_stop = threading.Event()
+
+    def get(self, parser: Any) -> HealthProbe | None:
+        with self._lock:
+            return self._entries.get(probe_key(parser))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, parser: Any, check: dict[str, Any]) -> HealthProbe:
+        entry = HealthProbe(check=check, checked_at=_utcnow(), checked_monotonic=time.monotonic())
+        with self._lock:
+            self._entries[probe_key(parser)] = entry
+            self._stored.notify_all()
+        return entry
+
+    def _partition(self, parsers: list[Any], *, fresh: bool) -> tuple[list[Any], list[Any]]:
+        """Split parsers into (must probe now, stale but servable)."""
+        now = time.monotonic()
+        cold: list[Any] = []
+        stale: list[Any] = []
+        with self._lock:
+            for parser in parsers:
+                entry = self._entries.get(probe_key(parser))
+                if fresh or entry is None:
+                    cold.append(parser)
+                elif now - entry.checked_monotonic > probe_ttl(parser):
+                    stale.append(parser)
+        return cold, stale
+
+    def _snapshot(self, parsers: list[Any]) -> dict[str, HealthProbe]:
+        """Current entry per parser; parsers whose first probe has not finished get a ``pending`` entry."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                probe_key(parser): self._entries.get(probe_key(parser))
+                or HealthProbe(check=_pending_check(), checked_at="", checked_monotonic=now)
+                for parser in parsers
+            }
+
+    def _wait_for(self, parsers: list[Any], timeout: float) -> None:
+        """Block until every parser has a cached entry or ``timeout`` elapses."""
+        keys = [probe_key(parser) for parser in parsers]
+        deadline = time.monotonic() + timeout
+        with self._stored:
+            while any(key not in self._entries for key in keys):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                self._stored.wait(remaining)
+
+    def _probe_parallel(self, parsers: list[Any]) -> None:
+        if not parsers:
+            return
+        if len(parsers) == 1:
+            self._store(parsers[0], run_check(parsers[0]))
+            return
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(parsers)), thread_name_prefix="datapulse-health") as pool:
+            for parser, check in zip(parsers, pool.map(run_check, parsers)):
+                self._store(parser, check)
+
+    def _refresh_in_background(self, parsers: list[Any]) -> None:
+        pending: list[Any] = []
+        with self._lock:
+            for parser in parsers:
+                key = probe_key(parser)
+                if key in self._refreshing:
+                    continue
+                self._refreshing.add(key)
+                pending.append(parser)
+        if not pending:
+            return
+
+        def _runner() -> None:
+            try:
+                self._probe_parallel(pending)
+            finally:
+                with self._lock:
+                    for parser in pending:
+                        self._refreshing.discard(probe_key(parser))
+
+        threading.Thread(target=_runner, name="datapulse-health-refresh", daemon=True).start()
+
+    def probe(self, parsers: Iterable[Any], *, fresh: bool = False) -> dict[str, HealthProbe]:
+        """Return one probe per parser; stale entries refresh in background.
+
+        ``fresh=True`` re-probes everything synchronously (in parallel). Otherwise
+        never-probed parsers start in the background and are waited on for at most
+        :func:`cold_wait_seconds`; any still running are reported as ``pending``.
+        """
+        parser_list = list(parsers)
+        cold, stale = self._partition(parser_list, fresh=fresh)
+        if fresh:
+            self._probe_parallel(cold)
+        elif cold:
+            self._refresh_in_background(cold)
+            self._wait_for(cold, cold_wait_seconds())
+        snapshot = self._snapshot(parser_list)
+        self._refresh_in_background(stale)
+        return snapshot
+
+    async def probe_async(self, parsers: Iterable[Any], *, fresh: bool = False) -> dict[str, HealthProbe]:
+        """Async variant of :meth:`probe`; fresh probes run concurrently via ``asyncio.to_thread``."""
+        parser_list = list(parsers)
+        cold, stale = self._partition(parser_list, fresh=fresh)
+        if fresh:
+            checks = await asyncio.gather(*(asyncio.to_thread(run_check, parser) for parser in cold))
+            for parser, check in zip(cold, checks):
+                self._store(parser, check)
+        elif cold:
+            self._refresh_in_background(cold)
+            await asyncio.to_thread(self._wait_for, cold, cold_wait_seconds())
+        snapshot = self._snapshot(parser_list)
+        self._refresh_in_background(stale)
+        return snapshot
+
+    def start_refresher(self, parsers_factory: Callable[[], Iterable[Any]], *, interval: float = 60.0) -> bool:
+        """Keep probes warm from a daemon thread; returns False if one is already running."""
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return False
+            # Each refresher owns its stop event: a stopped loop that is still
+            # finishing a cycle must not be revived by the next start.
+            stop = threading.Event()
+            self._refresher_stop = stop
+
+            def _loop() -> None:
+                while not stop.is_set():
+                    try:
+                        parsers = list(parsers_factory())
+                        cold, stale = self._partition(parsers, fresh=False)
+                        self._probe_parallel(cold + stale)
+                    except Exception as exc:  # noqa: BLE001
+                        logger.warning("health refresher cycle failed: %s", exc)
+                    stop.wait(max(1.0, float(interval)))
+
+            self._refresher = threading.Thread(target=_loop, name="datapulse-health-refresher", daemon=True)
+            self._refresher.start()
+            return True
+
+    def stop_refresher(self) -> None:
+        with self._lock:
+            self._refresher_stop.set()
+            self._refresher = None
+
+
+HEALTH_PROBES = HealthProbeCache()
@@ -1,11 +1,47 @@
-"""XHS media helpers — Referer injection and guarded download."""
+"""Media helpers — Referer injection, streamed downloads and a content-hash cache.
+
+Downloads stream straight to a ``.part`` file in the media cache directory,
+so memory stays flat however large or numerous the files are. An interrupted
+transfer resumes from the bytes already on disk with an HTTP ``Range``
+request guarded by ``If-Range`` (the ETag or Last-Modified of the first
+response), so a body that changed in between is fetched again from the
+start. Finished bodies are stored once per SHA-256 and indexed by URL: a
+repeated URL is not downloaded again while its entry is younger than
+``DATAPULSE_MEDIA_CACHE_TTL_SECONDS``, and another URL serving identical bytes
+is downloaded but not stored twice. An older entry is revalidated with its
+ETag or Last-Modified (a ``304`` keeps the blob) or downloaded again.
+:func:`download_media` streams through a temporary file and keeps nothing
+unless given a cache. :func:`multipart_file_body` uploads a file without
+reading it into memory.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator
 from urllib.parse import urlparse
 
 import requests
 
+from datapulse.core.config import read_env_float, read_env_int
+from datapulse.core.filestore import (
+    ReloadableStore,
+    atomic_replace_text,
+    file_lock,
+    lock_path_for,
+    locked_append_text,
+)
+from datapulse.core.utils import media_cache_dir_from_env
+
 _REFERER_REQUIRED_DOMAINS = frozenset({
     "xhscdn.com",
     "ci.xiaohongshu.com",
@@ -21,6 +57,11 @@ _DEFAULT_UA = (
 )
 
 _MAX_BYTES_DEFAULT = 10 * 1024 * 1024  # 10 MB
+_CHUNK_SIZE = 64 * 1024
+_JOURNAL_COMPACT_MIN_LINES = 256
+_SWEEP_INTERVAL_SECONDS = 3600.0
+PARTIAL_MAX_AGE_SECONDS = 24 * 3600.0
+DEFAULT_ENTRY_TTL_SECONDS = 24 * 3600.0
 
 
 def needs_referer(url: str) -> bool:
@@ -43,24 +84,532 @@ def build_media_headers(url: str) -> dict[str, str]:
     return headers
 
 
+@dataclass(frozen=True)
+class MediaFile:
+    """A downloaded media body on disk; open it instead of loading it."""
+
+    url: str
+    path: Path
+    size: int
+    sha256: str
+    content_type: str = ""
+    cached: bool = False
+
+    def open(self) -> BinaryIO:
+        return self.path.open("rb")
+
+    def read_bytes(self) -> bytes:
+        return self.path.read_bytes()
+
+
+class MediaCache(ReloadableStore):
+    """Content-addressed blob directory plus a JSON index of URL -> blob.
+
+    ``blobs/<sha256>`` holds each distinct body once; ``partial/`` holds
+    in-flight downloads that a later call can resume. New index entries are
+    appended to ``index.jsonl`` and folded into ``index.json`` only when the
+    journal grows past the index or trimming drops entries. Entries older than
+    ``ttl_seconds`` are stale: :meth:`lookup` skips them so the caller
+    revalidates. The blob directory is trimmed oldest-first past
+    ``max_bytes``. Partial downloads (and their lock files) untouched for
+    ``PARTIAL_MAX_AGE_SECONDS`` are swept away.
+    """
+
+    def __init__(self, root: str | None = None, *, max_bytes: int | None = None, ttl_seconds: float | None = None):
+        self.root = Path(root or media_cache_dir_from_env()).expanduser()
+        self.path = self.root / "index.json"
+        self.journal_path = self.root / "index.jsonl"
+        self.blob_dir = self.root / "blobs"
+        self.partial_dir = self.root / "partial"
+        if max_bytes is None:
+            max_bytes = read_env_int("DATAPULSE_MEDIA_CACHE_MAX_MB", 512, min_value=1, max_value=1 << 20) * 1024 * 1024
+        self.max_bytes = max_bytes
+        if ttl_seconds is None:
+            ttl_seconds = read_env_float("DATAPULSE_MEDIA_CACHE_TTL_SECONDS", DEFAULT_ENTRY_TTL_SECONDS, min_value=0.0)
+        self.ttl_seconds = ttl_seconds
+        self.urls: dict[str, dict[str, Any]] = {}
+        self._journal_lines = 0
+        self._swept_at = 0.0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        self._mark_loaded()
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8")) if self.path.exists() else {}
+        except (OSError, json.JSONDecodeError):
+            raw = {}
+        urls = raw.get("urls", {}) if isinstance(raw, dict) else {}
+        self.urls = {str(key): dict(value) for key, value in urls.items() if isinstance(value, dict)}
+        self._journal_lines = 0
+        for row in self._read_journal():
+            url = str(row.pop("url", "") or "")
+            if url:
+                self.urls[url] = row
+            self._journal_lines += 1
+
+    def _read_journal(self) -> list[dict[str, Any]]:
+        if not self.journal_path.exists():
+            return []
+        rows: list[dict[str, Any]] = []
+        try:
+            with self.journal_path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn trailing line from an interrupted append is skipped.
+                        continue
+                    if isinstance(row, dict):
+                        rows.append(row)
+        except OSError:
+            return []
+        return rows
+
+    def _compact(self, *, dropped: set[str] | frozenset[str] = frozenset()) -> None:
+        """Rewrite ``index.json`` without entries for ``dropped`` blobs and truncate the journal; hold the lock."""
+        self.urls = {url: entry for url, entry in self.urls.items() if str(entry.get("sha256", "")) not in dropped}
+        self._write_json({"urls": self.urls})
+        self.journal_path.unlink(missing_ok=True)
+        self._journal_lines = 0
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blob_dir / sha256
+
+    def partial_path(self, url: str) -> Path:
+        return self.partial_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.part"
+
+    def lookup(self, url: str, *, stale_ok: bool = False) -> MediaFile | None:
+        """The cached file for ``url``; entries past ``ttl_seconds`` only with ``stale_ok``."""
+        with self._lock:
+            self.reload_if_changed()
+            entry = self.urls.get(url)
+        if not entry:
+            return None
+        if not stale_ok and time.time() - float(entry.get("stored_at", 0) or 0) >= self.ttl_seconds:
+            return None
+        blob = self.blob_path(str(entry.get("sha256", "")))
+        if not entry.get("sha256") or not blob.exists():
+            return None
+        try:
+            os.utime(blob)  # keeps recently used blobs out of the eviction tail
+        except OSError:
+            pass
+        return MediaFile(
+            url=url,
+            path=blob,
+            size=int(entry.get("size", 0) or blob.stat().st_size),
+            sha256=str(entry["sha256"]),
+            content_type=str(entry.get("content_type", "")),
+            cached=True,
+        )
+
+    def revalidation_headers(self, url: str) -> dict[str, str]:
+        """Conditional-request headers from the validators stored with ``url``'s entry."""
+        with self._lock:
+            entry = self.urls.get(url) or {}
+        headers: dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = str(entry["etag"])
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = str(entry["last_modified"])
+        return headers
+
+    def refresh(self, url: str) -> None:
+        """Restart ``url``'s TTL after the server confirmed the cached body (``304``)."""
+        with self._lock, self._transaction():
+            entry = self.urls.get(url)
+            if entry is not None:
+                self._append_entry(url, {**entry, "stored_at": time.time()})
+
+    def _append_entry(self, url: str, entry: dict[str, Any]) -> None:
+        """Index ``entry`` under ``url`` through the journal; hold ``_lock`` and the transaction."""
+        self.urls[url] = entry
+        self._generation = locked_append_text(
+            self.journal_path,
+            json.dumps({"url": url, **entry}, ensure_ascii=False) + "\n",
+            generation_of=self.path,
+        )
+        self._journal_lines += 1
+        if self._journal_lines > max(_JOURNAL_COMPACT_MIN_LINES, len(self.urls)):
+            self._compact()
+
+    def commit(
+        self,
+        url: str,
+        part: Path,
+        *,
+        sha256: str,
+        size: int,
+        content_type: str,
+        validators: dict[str, str] | None = None,
+    ) -> MediaFile:
+        """Move a finished ``.part`` file into the blob store and index it under ``url``."""
+        blob = self.blob_path(sha256)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        if blob.exists():
+            part.unlink(missing_ok=True)
+        else:
+            os.replace(part, blob)
+        entry = {
+            "sha256": sha256,
+            "size": size,
+            "content_type": content_type,
+            "stored_at": time.time(),
+            **{key: value for key, value in (validators or {}).items() if value},
+        }
+        with self._lock, self._transaction():
+            self._append_entry(url, entry)
+        self._trim(keep=blob)
+        if time.time() - self._swept_at >= _SWEEP_INTERVAL_SECONDS:
+            self.sweep_partials()
+        return MediaFile(url=url, path=blob, size=size, sha256=sha256, content_type=content_type)
+
+    def _trim(self, *, keep: Path) -> None:
+        try:
+            blobs = [(entry.stat().st_mtime, entry.stat().st_size, entry) for entry in self.blob_dir.iterdir() if entry.is_file()]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in blobs)
+        dropped: set[str] = set()
+        for _, size, blob in sorted(blobs, key=lambda row: row[0]):
+            if total <= self.max_bytes:
+                break
+            if blob == keep:
+                continue
+            blob.unlink(missing_ok=True)
+            dropped.add(blob.name)
+            total -= size
+        if dropped:
+            with self._lock, self._transaction():
+                self._compact(dropped=dropped)
+
+    def sweep_partials(self, *, max_age_seconds: float = PARTIAL_MAX_AGE_SECONDS, now: float | None = None) -> int:
+        """Delete abandoned ``.part`` files and lock files idle past ``max_age_seconds``; returns files removed.
+
+        A download in progress keeps touching its part file, and
+        :func:`fetch_media` touches the lock file when it takes it, so only
+        leftovers from crashed or given-up downloads are old enough to go.
+        """
+        now = time.time() if now is None else now
+        self._swept_at = now
+        removed = 0
+        try:
+            entries = list(self.partial_dir.iterdir())
+        except OSError:
+            return 0
+        for entry in entries:
+            try:
+                stale = entry.is_file() and now - entry.stat().st_mtime >= max_age_seconds
+            except OSError:
+                continue
+            if not stale:
+                continue
+            if entry.suffix == ".lock" and Path(str(entry)[: -len(".lock")]).exists():
+                continue  # its part file decides; the lock goes with it
+            if entry.suffix == ".part":
+                for sidecar in (_part_meta_path(entry), lock_path_for(entry)):
+                    if sidecar.exists():
+                        sidecar.unlink(missing_ok=True)
+                        removed += 1
+            entry.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+_SHARED_CACHES: dict[str, MediaCache] = {}
+_SHARED_CACHES_LOCK = threading.Lock()
+
+
+def shared_media_cache() -> MediaCache:
+    """Process-wide cache for the current ``DATAPULSE_MEDIA_CACHE_DIR``."""
+    root = media_cache_dir_from_env()
+    with _SHARED_CACHES_LOCK:
+        cache = _SHARED_CACHES.get(root)
+        if cache is None:
+            cache = _SHARED_CACHES[root] = MediaCache(root)
+        return cache
+
+
+class _TooLarge(Exception):
+    pass
+
+
+class _NotModified(Exception):
+    pass
+
+
+def _hash_existing(part: Path) -> tuple[Any, int]:
+    digest = hashlib.sha256()
+    size = 0
+    with part.open("rb") as handle:
+        for block in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(block)
+            size += len(block)
+    return digest, size
+
+
+def _part_meta_path(part: Path) -> Path:
+    return part.with_suffix(".meta")
+
+
+def _read_part_meta(part: Path) -> dict[str, Any]:
+    try:
+        meta = json.loads(_part_meta_path(part).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def _discard_part(part: Path) -> None:
+    part.unlink(missing_ok=True)
+    _part_meta_path(part).unlink(missing_ok=True)
+
+
+def _resume_validator(meta: dict[str, Any]) -> str:
+    """Strong ETag, else Last-Modified; ``If-Range`` cannot use a weak ETag."""
+    etag = str(meta.get("etag", "") or "")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return str(meta.get("last_modified", "") or "")
+
+
+def _content_range_total(value: str) -> int | None:
+    """The complete length from a ``Content-Range`` header (``bytes */123``), if stated."""
+    total = value.rpartition("/")[2].strip()
+    return int(total) if total.isdigit() else None
+
+
+def _validators(meta: dict[str, Any]) -> dict[str, str]:
+    return {"etag": str(meta.get("etag", "") or ""), "last_modified": str(meta.get("last_modified", "") or "")}
+
+
+def _stream_to_part(
+    url: str,
+    part: Path,
+    *,
+    headers: dict[str, str],
+    timeout: int,
+    max_bytes: int,
+    conditional: dict[str, str] | None = None,
+) -> tuple[str, int, str, dict[str, str]]:
+    """Append the rest of ``url`` to ``part`` (resuming with Range).
+
+    Returns (sha256, size, content type, validators). A fresh request carries
+    the ``conditional`` headers and raises :class:`_NotModified` on a ``304``.
+    """
+    offset = part.stat().st_size if part.exists() else 0
+    meta = _read_part_meta(part) if offset else {}
+    validator = _resume_validator(meta)
+    request_headers = dict(headers)
+    if offset and validator:
+        request_headers["Range"] = f"bytes={offset}-"
+        request_headers["If-Range"] = validator
+    else:
+        offset = 0  # nothing proves the server still has the same body, so start over
+        request_headers.update(conditional or {})
+    resp = requests.get(url, headers=request_headers, timeout=timeout, stream=True)
+    try:
+        if offset and resp.status_code == 416:
+            if _content_range_total(str(resp.headers.get("Content-Range", "") or "")) == offset:
+                # The part file already holds the whole body.
+                digest, size = _hash_existing(part)
+                return digest.hexdigest(), size, str(meta.get("content_type", "")), _validators(meta)
+            resp.close()
+            _discard_part(part)
+            return _stream_to_part(
+                url, part, headers=headers, timeout=timeout, max_bytes=max_bytes, conditional=conditional
+            )
+        if not offset and resp.status_code == 304:
+            raise _NotModified(url)
+        resp.raise_for_status()
+        resumed = bool(offset) and resp.status_code == 206
+        content_type = str(resp.headers.get("Content-Type", "") or "").split(";")[0].strip()
+        if resumed:
+            digest, size = _hash_existing(part)
+            content_type = str(meta.get("content_type", "")) or content_type
+        else:
+            # A 200 (new download, or If-Range saw a changed body) starts the part over.
+            digest, size = hashlib.sha256(), 0
+            meta = {
+                "etag": str(resp.headers.get("ETag", "") or ""),
+                "last_modified": str(resp.headers.get("Last-Modified", "") or ""),
+                "content_type": content_type,
+            }
+            atomic_replace_text(_part_meta_path(part), json.dumps(meta))
+        with part.open("ab" if resumed else "wb") as handle:
+            for chunk in resp.iter_content(chunk_size=_CHUNK_SIZE):
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if size > max_bytes:
+                    raise _TooLarge(url)
+                digest.update(chunk)
+                handle.write(chunk)
+        return digest.hexdigest(), size, content_type, _validators(meta)
+    finally:
+        resp.close()
+
+
+def fetch_media(
+    url: str,
+    *,
+    timeout: int = 30,
+    max_bytes: int = _MAX_BYTES_DEFAULT,
+    attempts: int = 3,
+    cache: MediaCache | None = None,
+) -> MediaFile | None:
+    """Download ``url`` into the media cache and return the file; ``None`` on failure or past ``max_bytes``.
+
+    A URL cached within the TTL is returned without a request; a stale one is
+    revalidated and kept on ``304``. Network errors mid-transfer are retried
+    up to ``attempts`` times, resuming from the bytes already written.
+    """
+    cache = cache or shared_media_cache()
+    hit = cache.lookup(url)
+    if hit is not None:
+        return hit if hit.size <= max_bytes else None
+
+    part = cache.partial_path(url)
+    part.parent.mkdir(parents=True, exist_ok=True)
+    headers = build_media_headers(url)
+    with file_lock(part):
+        try:
+            os.utime(lock_path_for(part))  # marks the lock as in use for sweep_partials
+        except OSError:
+            pass
+        hit = cache.lookup(url)
+        if hit is not None:
+            return hit if hit.size <= max_bytes else None
+        stale = cache.lookup(url, stale_ok=True)
+        conditional = cache.revalidation_headers(url) if stale is not None else {}
+        for attempt in range(1, max(1, attempts) + 1):
+            try:
+                sha256, size, content_type, validators = _stream_to_part(
+                    url, part, headers=headers, timeout=timeout, max_bytes=max_bytes, conditional=conditional
+                )
+                media = cache.commit(url, part, sha256=sha256, size=size, content_type=content_type, validators=validators)
+                _part_meta_path(part).unlink(missing_ok=True)
+                return media
+            except _NotModified:
+                assert stale is not None
+                cache.refresh(url)
+                return stale if stale.size <= max_bytes else None
+            except _TooLarge:
+                _discard_part(part)
+                return None
+            except requests.HTTPError:
+                _discard_part(part)
+                return None
+            except (requests.RequestException, OSError):
+                if attempt >= attempts:
+                    # Keep the partial body; the next call resumes from it.
+                    return None
+    return None
+
+
 def download_media(
     url: str,
     *,
     timeout: int = 30,
     max_bytes: int = _MAX_BYTES_DEFAULT,
+    cache: MediaCache | None = None,
 ) -> bytes | None:
-    """Download media with appropriate headers. Returns None on failure."""
-    headers = build_media_headers(url)
+    """Download media with appropriate headers. Returns None on failure.
+
+    The body streams through a temporary file that is removed afterwards;
+    pass ``cache`` to keep it (see :func:`fetch_media`). Prefer
+    :func:`fetch_media` for large bodies; this loads the result into memory.
+    """
     try:
-        resp = requests.get(url, headers=headers, timeout=timeout, stream=True)
-        resp.raise_for_status()
-        chunks: list[bytes] = []
-        total = 0
-        for chunk in resp.iter_content(chunk_size=8192):
-            total += len(chunk)
-            if total > max_bytes:
-                return None
-            chunks.append(chunk)
-        return b"".join(chunks)
-    except (requests.RequestException, OSError):
+        if cache is not None:
+            media = fetch_media(url, timeout=timeout, max_bytes=max_bytes, cache=cache)
+            return media.read_bytes() if media is not None else None
+        with tempfile.TemporaryDirectory(prefix="datapulse-media-") as tmp:
+            part = Path(tmp) / "body.part"
+            _stream_to_part(url, part, headers=build_media_headers(url), timeout=timeout, max_bytes=max_bytes)
+            return part.read_bytes()
+    except (_TooLarge, requests.RequestException, OSError):
         return None
+
+
+class MultipartFileBody:
+    """A ``multipart/form-data`` body that streams one file from disk.
+
+    ``requests`` sends file-like bodies in blocks and takes Content-Length from
+    ``len()``, so uploading a large file costs one block of memory. There is
+    deliberately no ``tell()``: ``requests`` would subtract it from the length.
+    """
+
+    def __init__(
+        self,
+        field: str,
+        path: Path | str,
+        *,
+        filename: str = "",
+        content_type: str = "application/octet-stream",
+        fields: dict[str, str] | None = None,
+    ):
+        self.path = Path(path)
+        self.boundary = uuid.uuid4().hex
+        head = io.BytesIO()
+        for name, value in (fields or {}).items():
+            head.write(
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode("utf-8")
+            )
+        head.write(
+            (
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{field}"; '
+                f'filename="{filename or self.path.name}"\r\nContent-Type: {content_type}\r\n\r\n'
+            ).encode("utf-8")
+        )
+        self._head = head.getvalue()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self._file_size = self.path.stat().st_size
+        self._parts: list[BinaryIO] = [io.BytesIO(self._head), self.path.open("rb"), io.BytesIO(self._tail)]
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._head) + self._file_size + len(self._tail)
+
+    def read(self, size: int = -1) -> bytes:
+        out = bytearray()
+        while self._parts and (size < 0 or len(out) < size):
+            block = self._parts[0].read(-1 if size < 0 else size - len(out))
+            if block:
+                out.extend(block)
+            else:
+                self._parts.pop(0).close()
+        return bytes(out)
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(lambda: self.read(_CHUNK_SIZE), b"")
+
+    def close(self) -> None:
+        for part in self._parts:
+            part.close()
+        self._parts = []
+
+    def __enter__(self) -> MultipartFileBody:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def multipart_file_body(
+    field: str,
+    path: Path | str,
+    *,
+    filename: str = "",
+    content_type: str = "application/octet-stream",
+    fields: dict[str, str] | None = None,
+) -> MultipartFileBody:
+    """Build a streaming multipart body; send it as ``data=`` with ``Content-Type: body.content_type``."""
+    return MultipartFileBody(field, path, filename=filename, content_type=content_type, fields=fields)
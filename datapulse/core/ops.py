@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import json
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+from .filestore import ReloadableStore, atomic_replace_text, read_generation
 from .utils import watch_status_html_path_from_env, watch_status_path_from_env
 
 
@@ -14,8 +16,13 @@ def _utcnow() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
-class WatchStatusStore:
-    """JSON + HTML status output for the watch daemon."""
+class WatchStatusStore(ReloadableStore):
+    """JSON + HTML status output for the watch daemon.
+
+    The file also carries the materialized ops ``aggregates`` (see
+    :mod:`datapulse.core.ops_metrics`), written by any process, so every update
+    is a read-modify-write under the store lock.
+    """
 
     def __init__(self, path: str | None = None, html_path: str | None = None):
         self.path = Path(path or watch_status_path_from_env()).expanduser()
@@ -40,9 +47,11 @@ class WatchStatusStore:
                 "alerts_total": 0,
             },
             "last_result": {},
+            "aggregates": {},
         }
 
     def _load(self) -> dict[str, Any]:
+        self._generation = read_generation(self.path)
         if not self.path.exists():
             return self._default_payload()
         try:
@@ -55,15 +64,29 @@ class WatchStatusStore:
         base.update(payload)
         if not isinstance(base.get("metrics"), dict):
             base["metrics"] = self._default_payload()["metrics"]
+        if not isinstance(base.get("aggregates"), dict):
+            base["aggregates"] = {}
         return base
 
-    def _persist(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(self.status, ensure_ascii=False, indent=2), encoding="utf-8")
-        self._write_html()
+    def _persist(self, *, html: bool = True) -> None:
+        self._write_json(self.status)
+        if html:
+            self._write_html()
+
+    @contextmanager
+    def transaction(self, *, html: bool = True) -> Iterator[dict[str, Any]]:
+        """Yield ``status`` merged with other writers' changes and persist it on exit, all under the lock."""
+        with self._transaction():
+            yield self.status
+            self._persist(html=html)
+
+    def reload_if_changed(self) -> bool:
+        if not self.has_changed():
+            return False
+        self.status = self._load()
+        return True
 
     def _write_html(self) -> None:
-        self.html_path.parent.mkdir(parents=True, exist_ok=True)
         metrics = self.status.get("metrics", {})
         html = f"""<!doctype html>
 <html lang="en">
@@ -111,29 +134,28 @@ class WatchStatusStore:
 </body>
 </html>
 """
-        self.html_path.write_text(html, encoding="utf-8")
+        atomic_replace_text(self.html_path, html)
 
     def mark_started(self) -> dict[str, Any]:
         now = _utcnow()
-        self.status["started_at"] = self.status.get("started_at") or now
-        self.status["heartbeat_at"] = now
-        self.status["updated_at"] = now
-        self.status["state"] = "running"
-        self._persist()
-        return self.status
+        with self.transaction() as status:
+            status["started_at"] = status.get("started_at") or now
+            status["heartbeat_at"] = now
+            status["updated_at"] = now
+            status["state"] = "running"
+        return self.snapshot()
 
     def mark_cycle_started(self) -> dict[str, Any]:
         now = _utcnow()
-        self.status["heartbeat_at"] = now
-        self.status["updated_at"] = now
-        self.status["last_cycle_started_at"] = now
-        self.status["state"] = "running"
-        self._persist()
-        return self.status
+        with self.transaction() as status:
+            status["heartbeat_at"] = now
+            status["updated_at"] = now
+            status["last_cycle_started_at"] = now
+            status["state"] = "running"
+        return self.snapshot()
 
     def record_cycle(self, payload: dict[str, Any]) -> dict[str, Any]:
         now = _utcnow()
-        metrics = self.status.setdefault("metrics", {})
         results = payload.get("results", [])
         success_count = 0
         error_count = 0
@@ -145,41 +167,43 @@ class WatchStatusStore:
                 error_count += 1
             alert_count += int(row.get("alert_count", 0) or 0)
 
-        metrics["cycles_total"] = int(metrics.get("cycles_total", 0) or 0) + 1
-        metrics["due_total"] = int(metrics.get("due_total", 0) or 0) + int(payload.get("due_count", 0) or 0)
-        metrics["runs_total"] = int(metrics.get("runs_total", 0) or 0) + int(payload.get("run_count", 0) or 0)
-        metrics["success_total"] = int(metrics.get("success_total", 0) or 0) + success_count
-        metrics["error_total"] = int(metrics.get("error_total", 0) or 0) + error_count
-        metrics["alerts_total"] = int(metrics.get("alerts_total", 0) or 0) + alert_count
-
-        self.status["heartbeat_at"] = now
-        self.status["updated_at"] = now
-        self.status["last_cycle_finished_at"] = now
-        self.status["last_result"] = payload
-        self.status["last_error"] = ""
-        self.status["state"] = "running"
-        self._persist()
-        return self.status
+        with self.transaction() as status:
+            metrics = status.setdefault("metrics", {})
+            metrics["cycles_total"] = int(metrics.get("cycles_total", 0) or 0) + 1
+            metrics["due_total"] = int(metrics.get("due_total", 0) or 0) + int(payload.get("due_count", 0) or 0)
+            metrics["runs_total"] = int(metrics.get("runs_total", 0) or 0) + int(payload.get("run_count", 0) or 0)
+            metrics["success_total"] = int(metrics.get("success_total", 0) or 0) + success_count
+            metrics["error_total"] = int(metrics.get("error_total", 0) or 0) + error_count
+            metrics["alerts_total"] = int(metrics.get("alerts_total", 0) or 0) + alert_count
+
+            status["heartbeat_at"] = now
+            status["updated_at"] = now
+            status["last_cycle_finished_at"] = now
+            status["last_result"] = payload
+            status["last_error"] = ""
+            status["state"] = "running"
+        return self.snapshot()
 
     def record_error(self, error: str) -> dict[str, Any]:
         now = _utcnow()
-        metrics = self.status.setdefault("metrics", {})
-        metrics["error_total"] = int(metrics.get("error_total", 0) or 0) + 1
-        self.status["heartbeat_at"] = now
-        self.status["updated_at"] = now
-        self.status["last_cycle_finished_at"] = now
-        self.status["last_error"] = str(error or "").strip()
-        self.status["state"] = "error"
-        self._persist()
-        return self.status
+        with self.transaction() as status:
+            metrics = status.setdefault("metrics", {})
+            metrics["error_total"] = int(metrics.get("error_total", 0) or 0) + 1
+            status["heartbeat_at"] = now
+            status["updated_at"] = now
+            status["last_cycle_finished_at"] = now
+            status["last_error"] = str(error or "").strip()
+            status["state"] = "error"
+        return self.snapshot()
 
     def mark_stopped(self) -> dict[str, Any]:
         now = _utcnow()
-        self.status["heartbeat_at"] = now
-        self.status["updated_at"] = now
-        self.status["state"] = "idle"
-        self._persist()
-        return self.status
+        with self.transaction() as status:
+            status["heartbeat_at"] = now
+            status["updated_at"] = now
+            status["state"] = "idle"
+        return self.snapshot()
 
     def snapshot(self) -> dict[str, Any]:
-        return self.status
+        """Daemon status without the materialized aggregates (served by ``ops_snapshot``)."""
+        return {key: value for key, value in self.status.items() if key != "aggregates"}
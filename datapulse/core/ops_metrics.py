@@ -0,0 +1,451 @@
+"""Materialized ops and governance-scorecard aggregates.
+
+``ops_snapshot`` and the governance scorecard used to rescan the inbox, the
+story store and the alert log on every request. :class:`OpsMetrics` keeps the
+counters those views need — triage state counts, per-mission coverage labels
+and latest result, successful runs, alert yield, route delivery outcomes and
+story conversion — in the ``aggregates`` section of the watch status file and
+updates them as events happen. Only counters are persisted; the story → item
+references behind the conversion count stay in memory.
+
+Each section is stamped with the write generations (see
+:mod:`datapulse.core.filestore`) of the stores it summarizes. An update is only
+applied incrementally when the section still matches the generation the caller
+started from; otherwise the writer rebuilds the section from its stores. Reads
+never write: a section whose stores moved on without it is rebuilt in memory
+and served from there until the next writer persists it.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from .alerts import _normalize_string_list, route_delivery_outcomes
+from .filestore import read_generation
+from .triage import normalize_review_state
+from .utils import analyze_url
+
+if TYPE_CHECKING:
+    from .alerts import AlertEvent, AlertRouteStore, AlertStore
+    from .models import DataPulseItem
+    from .ops import WatchStatusStore
+    from .storage import UnifiedInbox
+    from .story import Story, StoryStore
+    from .watchlist import WatchlistStore, WatchMission
+
+SECTIONS = ("inbox", "runs", "alerts", "stories")
+STORY_ELIGIBLE_STATES = frozenset({"triaged", "verified", "escalated"})
+# Same window the scorecard has always used for persisted stories.
+STORY_SCAN_LIMIT = 5000
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    text = str(value or "").strip()
+    if not text:
+        return None
+    if text.endswith("Z"):
+        text = f"{text[:-1]}+00:00"
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _epoch(value: Any) -> float:
+    parsed = _parse_timestamp(value)
+    return parsed.timestamp() if parsed is not None else 0.0
+
+
+def normalize_scorecard_label(value: Any) -> str:
+    text = str(value or "").strip().casefold()
+    if text.startswith("www."):
+        text = text[4:]
+    return text
+
+
+def coverage_observation_labels(item: DataPulseItem) -> set[str]:
+    """Platform, source, tag and domain labels a watch result contributes to mission coverage."""
+    labels: set[str] = set()
+    for raw in [item.source_name, item.source_type.value, item.parser, *item.tags]:
+        key = normalize_scorecard_label(raw)
+        if key:
+            labels.add(key)
+    domain = analyze_url(str(item.url or "")).netloc
+    if domain.startswith("www."):
+        domain = domain[4:]
+    if domain:
+        labels.add(domain)
+    for raw in _normalize_string_list(item.extra.get("search_sources")):
+        key = normalize_scorecard_label(raw)
+        if key:
+            labels.add(key)
+        source_domain = analyze_url(raw).netloc
+        if source_domain.startswith("www."):
+            source_domain = source_domain[4:]
+        if source_domain:
+            labels.add(source_domain)
+    return labels
+
+
+def summarize_mission_results(items: Iterable[DataPulseItem]) -> dict[str, Any]:
+    labels: set[str] = set()
+    latest_result_at = ""
+    result_count = 0
+    for item in items:
+        result_count += 1
+        labels.update(coverage_observation_labels(item))
+        if _parse_timestamp(item.fetched_at) is not None and (
+            not latest_result_at or _epoch(item.fetched_at) > _epoch(latest_result_at)
+        ):
+            latest_result_at = item.fetched_at
+    return {"result_count": result_count, "latest_result_at": latest_result_at, "labels": sorted(labels)}
+
+
+def _item_state(item: DataPulseItem) -> str:
+    return normalize_review_state(item.review_state, processed=item.processed)
+
+
+def story_item_ids(story: Story) -> set[str]:
+    return {
+        str(evidence.item_id or "").strip()
+        for evidence in [*story.primary_evidence, *story.secondary_evidence]
+        if str(evidence.item_id or "").strip()
+    }
+
+
+def story_is_delivery_ready(story: Story) -> bool:
+    governance = story.governance if isinstance(story.governance, dict) else {}
+    delivery_risk = governance.get("delivery_risk", {}) if isinstance(governance.get("delivery_risk"), dict) else {}
+    return str(delivery_risk.get("status", "") or "").strip().lower() == "ready"
+
+
+def _empty_route_counters() -> dict[str, Any]:
+    return {
+        "channel": "",
+        "event_count": 0,
+        "delivered_count": 0,
+        "failure_count": 0,
+        "last_event_at": "",
+        "last_delivered_at": "",
+        "last_failed_at": "",
+        "last_error": "",
+        "last_summary": "",
+        "mission_ids": [],
+        "rule_names": [],
+    }
+
+
+def _count_alert_event(section: dict[str, Any], event: AlertEvent, alert_routes: AlertRouteStore) -> None:
+    section["event_count"] = int(section.get("event_count", 0) or 0) + 1
+    missions = section.setdefault("missions", {})
+    missions[event.mission_id] = int(missions.get(event.mission_id, 0) or 0) + 1
+    routes = section.setdefault("routes", {})
+    for outcome in route_delivery_outcomes(event, alert_routes):
+        row = routes.setdefault(outcome["route"], _empty_route_counters())
+        row["channel"] = outcome["channel"] or row["channel"]
+        row["event_count"] += 1
+        if event.mission_id not in row["mission_ids"]:
+            row["mission_ids"] = sorted([*row["mission_ids"], event.mission_id])
+        if event.rule_name not in row["rule_names"]:
+            row["rule_names"] = sorted([*row["rule_names"], event.rule_name])
+        newest = _epoch(event.created_at) >= _epoch(row["last_event_at"])
+        if newest:
+            row["last_event_at"] = event.created_at
+            row["last_summary"] = event.summary
+        if outcome["delivered"]:
+            row["delivered_count"] += 1
+            if _epoch(event.created_at) >= _epoch(row["last_delivered_at"]):
+                row["last_delivered_at"] = event.created_at
+        if outcome["error"]:
+            row["failure_count"] += 1
+            if _epoch(event.created_at) >= _epoch(row["last_failed_at"]):
+                row["last_failed_at"] = event.created_at
+                row["last_error"] = outcome["error"]
+
+
+class OpsMetrics:
+    """Generation-stamped aggregates behind ``ops_snapshot`` and the governance scorecard."""
+
+    def __init__(
+        self,
+        status_store: WatchStatusStore,
+        *,
+        inbox: UnifiedInbox,
+        watchlist: WatchlistStore,
+        alert_store: AlertStore,
+        alert_routes: AlertRouteStore,
+        story_store: StoryStore,
+    ):
+        self.status_store = status_store
+        self.inbox = inbox
+        self.watchlist = watchlist
+        self.alert_store = alert_store
+        self.alert_routes = alert_routes
+        self.story_store = story_store
+        # Sections rebuilt on the read path, served from memory until a writer persists them.
+        self._built: dict[str, dict[str, Any]] = {}
+        # Item ids cited by persisted stories, valid for ``_story_refs_generation`` of the story store.
+        self._story_refs: set[str] = set()
+        self._story_refs_generation = -1
+
+    def _sources(self) -> dict[str, tuple[Any, ...]]:
+        return {
+            "inbox": (self.inbox,),
+            "runs": (self.watchlist.history,),
+            "alerts": (self.alert_store,),
+            # Conversion counts depend on inbox review states as well as on the stories.
+            "stories": (self.story_store, self.inbox),
+        }
+
+    def _generations(self, name: str, *, on_disk: bool = False) -> dict[str, int]:
+        return {
+            str(store.path): read_generation(store.path) if on_disk else store.generation
+            for store in self._sources()[name]
+        }
+
+    # -- builders (full scans, only on a stale or missing section) ---------
+
+    def _build_inbox(self) -> dict[str, Any]:
+        states: dict[str, int] = {}
+        note_count = 0
+        eligible_count = 0
+        for item in self.inbox.items:
+            state = _item_state(item)
+            states[state] = states.get(state, 0) + 1
+            note_count += len(item.review_notes)
+            if state in STORY_ELIGIBLE_STATES:
+                eligible_count += 1
+        return {
+            "total": len(self.inbox.items),
+            "states": states,
+            "note_count": note_count,
+            "story_eligible_count": eligible_count,
+            "missions": {
+                mission_id: summarize_mission_results(self.inbox.mission_items(mission_id))
+                for mission_id in self.inbox.mission_ids()
+            },
+        }
+
+    def _build_runs(self) -> dict[str, Any]:
+        return {
+            "successful_runs": {
+                mission_id: self._successful_runs(mission_id)
+                for mission_id in self.watchlist.history.mission_ids()
+            }
+        }
+
+    def _build_alerts(self) -> dict[str, Any]:
+        section: dict[str, Any] = {"event_count": 0, "missions": {}, "routes": {}}
+        for event in self.alert_store.events:
+            _count_alert_event(section, event, self.alert_routes)
+        return section
+
+    def _build_stories(self) -> dict[str, Any]:
+        section: dict[str, Any] = {"story_count": 0, "ready_story_count": 0}
+        refs: set[str] = set()
+        for story in self.story_store.list_stories(limit=STORY_SCAN_LIMIT, min_items=1):
+            section["story_count"] += 1
+            if story_is_delivery_ready(story):
+                section["ready_story_count"] += 1
+            refs |= story_item_ids(story)
+        self._story_refs = refs
+        self._story_refs_generation = self.story_store.generation
+        section["converted_item_count"] = self._converted_count()
+        return section
+
+    def _build_section(self, name: str) -> dict[str, Any]:
+        builders: dict[str, Callable[[], dict[str, Any]]] = {
+            "inbox": self._build_inbox,
+            "runs": self._build_runs,
+            "alerts": self._build_alerts,
+            "stories": self._build_stories,
+        }
+        for store in self._sources()[name]:
+            store.reload_if_changed()
+        section = builders[name]()
+        section["generations"] = self._generations(name)
+        return section
+
+    def _converted_count(self) -> int:
+        """Story-eligible inbox items cited by at least one story (one lookup per cited id)."""
+        if self._story_refs_generation != self.story_store.generation:
+            return int(self._build_stories()["converted_item_count"])
+        count = 0
+        for item_id in self._story_refs:
+            item = self.inbox.get(item_id)
+            if item is not None and _item_state(item) in STORY_ELIGIBLE_STATES:
+                count += 1
+        return count
+
+    @staticmethod
+    def _is_current(section: Any, generations: dict[str, int]) -> bool:
+        return isinstance(section, dict) and section.get("generations") == generations
+
+    def _successful_runs(self, mission_id: str) -> int:
+        return sum(
+            1
+            for run in self.watchlist.history.recent_runs(mission_id)
+            if str(run.get("status", "") or "").strip().lower() == "success"
+        )
+
+    # -- reads --------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Current aggregates; stale sections are rebuilt in memory, never written from here."""
+        self.status_store.reload_if_changed()
+        aggregates = self.status_store.status.get("aggregates", {})
+        sections: dict[str, dict[str, Any]] = {}
+        for name in SECTIONS:
+            generations = self._generations(name, on_disk=True)
+            current = next(
+                (
+                    candidate
+                    for candidate in (aggregates.get(name), self._built.get(name))
+                    if self._is_current(candidate, generations)
+                ),
+                None,
+            )
+            if current is None:
+                current = self._built[name] = self._build_section(name)
+            sections[name] = current
+        return sections
+
+    def rebuild(self, sections: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Recompute ``sections`` (default: all) from their stores and persist them."""
+        names = [name for name in (sections or SECTIONS) if name in SECTIONS]
+        with self.status_store.transaction(html=False) as status:
+            aggregates = status.setdefault("aggregates", {})
+            for name in names:
+                aggregates[name] = self._build_section(name)
+                self._built.pop(name, None)
+            return {name: aggregates.get(name, {}) for name in SECTIONS}
+
+    # -- event updates ------------------------------------------------------
+
+    def _apply(self, store: Any, base_generation: int, updates: dict[str, Callable[[dict[str, Any]], bool]]) -> None:
+        """Apply each update to its section if the section reflects ``base_generation`` of ``store``.
+
+        A section that is stale, or whose ``update`` returns False because the
+        event cannot be expressed as a counter change, is rebuilt from its
+        stores instead. Either way the writer persists the result.
+        """
+        with self.status_store.transaction(html=False) as status:
+            aggregates = status.setdefault("aggregates", {})
+            for name, update in updates.items():
+                expected = {**self._generations(name), str(store.path): base_generation}
+                section = next(
+                    (
+                        candidate
+                        for candidate in (aggregates.get(name), self._built.get(name))
+                        if self._is_current(candidate, expected)
+                    ),
+                    None,
+                )
+                if section is not None and update(section):
+                    section["generations"] = self._generations(name)
+                else:
+                    section = self._build_section(name)
+                aggregates[name] = section
+                self._built.pop(name, None)
+
+    def _recount_converted(self, section: dict[str, Any]) -> bool:
+        section["converted_item_count"] = self._converted_count()
+        return True
+
+    def _refresh_missions(self, section: dict[str, Any], mission_ids: Iterable[str]) -> None:
+        missions = section.setdefault("missions", {})
+        for mission_id in {str(mission_id or "").strip() for mission_id in mission_ids} - {""}:
+            results = self.inbox.mission_items(mission_id)
+            if results:
+                missions[mission_id] = summarize_mission_results(results)
+            else:
+                missions.pop(mission_id, None)
+
+    def record_items_added(self, items: list[DataPulseItem], *, base_generation: int) -> None:
+        def update(section: dict[str, Any]) -> bool:
+            if int(section.get("total", 0) or 0) + len(items) != len(self.inbox.items):
+                return False  # capacity eviction dropped items the counters cannot see
+            states = section.setdefault("states", {})
+            for item in items:
+                state = _item_state(item)
+                states[state] = int(states.get(state, 0) or 0) + 1
+                section["note_count"] = int(section.get("note_count", 0) or 0) + len(item.review_notes)
+                if state in STORY_ELIGIBLE_STATES:
+                    section["story_eligible_count"] = int(section.get("story_eligible_count", 0) or 0) + 1
+            section["total"] = len(self.inbox.items)
+            self._refresh_missions(section, (item.extra.get("watch_mission_id", "") for item in items))
+            return True
+
+        if items:
+            self._apply(self.inbox, base_generation, {"inbox": update, "stories": self._recount_converted})
+
+    def record_review_change(
+        self,
+        item: DataPulseItem,
+        previous_state: str,
+        *,
+        base_generation: int,
+        notes_added: int = 0,
+    ) -> None:
+        def update(section: dict[str, Any]) -> bool:
+            states = section.setdefault("states", {})
+            state = _item_state(item)
+            if int(states.get(previous_state, 0) or 0) <= 0:
+                return False
+            states[previous_state] = int(states[previous_state]) - 1
+            states[state] = int(states.get(state, 0) or 0) + 1
+            section["note_count"] = int(section.get("note_count", 0) or 0) + notes_added
+            eligible_delta = int(state in STORY_ELIGIBLE_STATES) - int(previous_state in STORY_ELIGIBLE_STATES)
+            section["story_eligible_count"] = int(section.get("story_eligible_count", 0) or 0) + eligible_delta
+            return True
+
+        self._apply(self.inbox, base_generation, {"inbox": update, "stories": self._recount_converted})
+
+    def record_mission_results(self, mission_ids: Iterable[str], *, base_generation: int) -> None:
+        touched = list(mission_ids)
+
+        def update(section: dict[str, Any]) -> bool:
+            self._refresh_missions(section, touched)
+            return True
+
+        self._apply(self.inbox, base_generation, {"inbox": update, "stories": self._recount_converted})
+
+    def record_run(self, mission: WatchMission, *, base_generation: int) -> None:
+        def update(section: dict[str, Any]) -> bool:
+            section.setdefault("successful_runs", {})[mission.id] = self._successful_runs(mission.id)
+            return True
+
+        self._apply(self.watchlist.history, base_generation, {"runs": update})
+
+    def record_alerts(self, events: list[AlertEvent], *, base_generation: int) -> None:
+        def update(section: dict[str, Any]) -> bool:
+            if int(section.get("event_count", 0) or 0) + len(events) != len(self.alert_store.events):
+                return False  # retention trimmed events the counters cannot see
+            for event in events:
+                _count_alert_event(section, event, self.alert_routes)
+            return True
+
+        if events:
+            self._apply(self.alert_store, base_generation, {"alerts": update})
+
+    def record_story_created(self, story: Story, *, base_generation: int) -> None:
+        def update(section: dict[str, Any]) -> bool:
+            if story.item_count < 1:
+                return True
+            if int(section.get("story_count", 0) or 0) >= STORY_SCAN_LIMIT:
+                return False
+            if self._story_refs_generation != base_generation:
+                return False
+            section["story_count"] = int(section.get("story_count", 0) or 0) + 1
+            if story_is_delivery_ready(story):
+                section["ready_story_count"] = int(section.get("ready_story_count", 0) or 0) + 1
+            self._story_refs |= story_item_ids(story)
+            self._story_refs_generation = self.story_store.generation
+            section["converted_item_count"] = self._converted_count()
+            return True
+
+        self._apply(self.story_store, base_generation, {"stories": update})
@@ -7,11 +7,12 @@ from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, TypeAlias, TypeVar
-from urllib.parse import urlparse
 
 from .alerts import DeliveryDispatchError, resolve_delivery_targets
+from .config import read_env_int
+from .filestore import ReloadableStore, atomic_write_json, file_lock
 from .story import build_story_evidence_intake
-from .utils import generate_slug, reports_path_from_env
+from .utils import analyze_url, generate_slug, reports_path_from_env
 
 
 def _utcnow() -> str:
@@ -350,7 +351,7 @@ def build_story_research_projection(story_payload: dict[str, Any]) -> dict[str,
     )
     sites = _normalize_string_list(
         [
-            urlparse(str(url or "").strip()).netloc.lower()
+            analyze_url(str(url or "").strip()).netloc
             for url in intake.get("source_urls", [])
             if str(url or "").strip()
         ]
@@ -1166,12 +1167,39 @@ ReportRecordT = TypeVar(
 )
 
 
-class ReportStore:
-    """File-backed storage for report-production objects."""
+_REPORT_COLLECTIONS: tuple[tuple[str, Callable[[dict[str, Any]], Any]], ...] = (
+    ("report_briefs", ReportBrief.from_dict),
+    ("claim_cards", ClaimCard.from_dict),
+    ("report_sections", ReportSection.from_dict),
+    ("citation_bundles", CitationBundle.from_dict),
+    ("reports", Report.from_dict),
+    ("export_profiles", ExportProfile.from_dict),
+    ("delivery_subscriptions", DeliverySubscription.from_dict),
+    ("delivery_dispatch_records", DeliveryDispatchRecord.from_dict),
+)
+# collection -> (index attribute, foreign-key field) for the collections looked up by parent id.
+_REPORT_INDEXES: dict[str, tuple[str, str]] = {
+    "report_sections": ("_sections_by_report", "report_id"),
+    "export_profiles": ("_profiles_by_report", "report_id"),
+    "delivery_dispatch_records": ("_dispatch_by_subscription", "subscription_id"),
+}
+
+
+class ReportStore(ReloadableStore):
+    """File-backed storage for report-production objects.
+
+    Each collection lives in its own JSON file under ``<stem>_collections/``
+    with its own lock and generation; the store path holds a small manifest of
+    collection generations, so an update rewrites one collection and a reload
+    re-reads only the collections another process changed. A legacy
+    single-file store is read as-is and split on its first save.
+    """
 
     def __init__(self, path: str | None = None):
         self.path = Path(path or reports_path_from_env()).expanduser()
+        self.collection_dir = self.path.with_name(f"{self.path.stem}_collections")
         self.version = 1
+        self.max_dispatch_records = read_env_int("DATAPULSE_MAX_DISPATCH_RECORDS", 2000, min_value=0)
         self.report_briefs: dict[str, ReportBrief] = {}
         self.claim_cards: dict[str, ClaimCard] = {}
         self.report_sections: dict[str, ReportSection] = {}
@@ -1180,32 +1208,89 @@ class ReportStore:
         self.export_profiles: dict[str, ExportProfile] = {}
         self.delivery_subscriptions: dict[str, DeliverySubscription] = {}
         self.delivery_dispatch_records: dict[str, DeliveryDispatchRecord] = {}
+        self._collection_generations: dict[str, int] = {}
+        self._legacy_layout = False
+        self._sections_by_report: dict[str, set[str]] = {}
+        self._profiles_by_report: dict[str, set[str]] = {}
+        self._dispatch_by_subscription: dict[str, set[str]] = {}
+        # collection -> record id -> key the record is currently filed under in its index.
+        self._index_keys: dict[str, dict[str, str]] = {}
         self._load()
 
+    def _collection(self, name: str) -> dict[str, Any]:
+        return getattr(self, name)
+
+    def _collection_name(self, container: dict[str, Any]) -> str:
+        for name, _factory in _REPORT_COLLECTIONS:
+            if self._collection(name) is container:
+                return name
+        raise ValueError("Unknown report collection")
+
+    def collection_path(self, name: str) -> Path:
+        return self.collection_dir / f"{name}.json"
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        """The on-disk manifest, or None when the store is missing or still in the legacy single-file layout."""
+        if not self.path.exists():
+            return None
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return None
+        if isinstance(raw, dict) and raw.get("layout") == "collections":
+            return raw
+        return None
+
     def _load(self) -> None:
+        self._mark_loaded()
+        manifest = self._read_manifest()
+        if manifest is not None:
+            self._legacy_layout = False
+            self.version = int(manifest.get("version", self.version) or self.version)
+            self._sync_collections(manifest)
+            return
+
+        self._collection_generations = {}
+        for name, _factory in _REPORT_COLLECTIONS:
+            self._collection(name).clear()
+        self._legacy_layout = self.path.exists()
         if not self.path.exists():
+            self._reindex()
             return
         try:
             raw = json.loads(self.path.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError):
+            self._reindex()
             return
 
         if isinstance(raw, dict):
             self.version = int(raw.get("version", self.version) or self.version)
-            self._load_collection(raw.get("report_briefs"), ReportBrief.from_dict, self.report_briefs)
-            self._load_collection(raw.get("claim_cards"), ClaimCard.from_dict, self.claim_cards)
-            self._load_collection(raw.get("report_sections"), ReportSection.from_dict, self.report_sections)
-            self._load_collection(raw.get("citation_bundles"), CitationBundle.from_dict, self.citation_bundles)
-            self._load_collection(raw.get("reports"), Report.from_dict, self.reports)
-            self._load_collection(raw.get("export_profiles"), ExportProfile.from_dict, self.export_profiles)
-            self._load_collection(raw.get("delivery_subscriptions"), DeliverySubscription.from_dict, self.delivery_subscriptions)
-            self._load_collection(
-                raw.get("delivery_dispatch_records"),
-                DeliveryDispatchRecord.from_dict,
-                self.delivery_dispatch_records,
-            )
+            for name, factory in _REPORT_COLLECTIONS:
+                self._load_collection(raw.get(name), factory, self._collection(name))
         elif isinstance(raw, list):
             self._load_collection(raw, Report.from_dict, self.reports)
+        self._reindex()
+
+    def _sync_collections(self, manifest: dict[str, Any], *, skip: set[str] | None = None) -> None:
+        """Reload the collections whose manifest generation differs from the one last read."""
+        entries = manifest.get("collections", {})
+        entries = entries if isinstance(entries, dict) else {}
+        for name, factory in _REPORT_COLLECTIONS:
+            if skip and name in skip:
+                continue
+            entry = entries.get(name, {})
+            generation = int(entry.get("generation", 0) or 0) if isinstance(entry, dict) else 0
+            if name in self._collection_generations and self._collection_generations[name] == generation:
+                continue
+            target = self._collection(name)
+            target.clear()
+            try:
+                rows = json.loads(self.collection_path(name).read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError):
+                rows = []
+            self._load_collection(rows, factory, target)
+            self._collection_generations[name] = generation
+            self._reindex(name)
 
     def _load_collection(
         self,
@@ -1223,27 +1308,92 @@ class ReportStore:
                 continue
             target[model_obj.id] = model_obj
 
-    def _persistable_payload(self) -> dict[str, Any]:
-        return {
-            "version": self.version,
-            "report_briefs": [brief.to_dict() for brief in self._list_records(self.report_briefs)],
-            "claim_cards": [claim.to_dict() for claim in self._list_records(self.claim_cards)],
-            "report_sections": [section.to_dict() for section in self._list_records(self.report_sections)],
-            "citation_bundles": [bundle.to_dict() for bundle in self._list_records(self.citation_bundles)],
-            "reports": [report.to_dict() for report in self._list_records(self.reports)],
-            "export_profiles": [profile.to_dict() for profile in self._list_records(self.export_profiles)],
-            "delivery_subscriptions": [
-                subscription.to_dict() for subscription in self._list_records(self.delivery_subscriptions)
-            ],
-            "delivery_dispatch_records": [
-                dispatch_record.to_dict()
-                for dispatch_record in self._list_records(self.delivery_dispatch_records)
-            ],
-        }
+    def _reindex(self, name: str | None = None) -> None:
+        """Rebuild the foreign-key indexes for ``name`` (default: all indexed collections) after a load."""
+        for collection_name, (index_attr, key_field) in _REPORT_INDEXES.items():
+            if name is not None and name != collection_name:
+                continue
+            index: dict[str, set[str]] = {}
+            keys: dict[str, str] = {}
+            for record in self._collection(collection_name).values():
+                key = str(getattr(record, key_field, "") or "")
+                if key:
+                    index.setdefault(key, set()).add(record.id)
+                    keys[record.id] = key
+            setattr(self, index_attr, index)
+            self._index_keys[collection_name] = keys
+
+    def _index_record(self, name: str, record: ReportRecord) -> None:
+        """Re-file one created or updated record under its current foreign key."""
+        if name not in _REPORT_INDEXES:
+            return
+        index_attr, key_field = _REPORT_INDEXES[name]
+        key = str(getattr(record, key_field, "") or "")
+        keys = self._index_keys.setdefault(name, {})
+        if keys.get(record.id, "") == key:
+            return
+        self._unindex_record(name, record.id)
+        if key:
+            getattr(self, index_attr).setdefault(key, set()).add(record.id)
+            keys[record.id] = key
+
+    def _unindex_record(self, name: str, record_id: str) -> None:
+        if name not in _REPORT_INDEXES:
+            return
+        index: dict[str, set[str]] = getattr(self, _REPORT_INDEXES[name][0])
+        key = self._index_keys.get(name, {}).pop(record_id, "")
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.discard(record_id)
+        if not bucket:
+            del index[key]
 
-    def save(self) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(self._persistable_payload(), ensure_ascii=False, indent=2), encoding="utf-8")
+    def _indexed(self, container: dict[str, ReportRecordT], index: dict[str, set[str]], key: str) -> list[ReportRecordT]:
+        return [container[record_id] for record_id in index.get(key, ()) if record_id in container]
+
+    def _prune_dispatch_records(self) -> None:
+        """Keep at most ``max_dispatch_records``, dropping the oldest settled records first."""
+        overflow = len(self.delivery_dispatch_records) - max(0, self.max_dispatch_records)
+        if overflow <= 0:
+            return
+        settled = sorted(
+            (record for record in self.delivery_dispatch_records.values() if record.status != "pending"),
+            key=lambda record: (str(record.updated_at), str(record.id)),
+        )
+        for record in settled[:overflow]:
+            del self.delivery_dispatch_records[record.id]
+            self._unindex_record("delivery_dispatch_records", record.id)
+
+    def _collection_rows(self, name: str) -> list[dict[str, Any]]:
+        container = self._collection(name)
+        return [record.to_dict() for record in self._list_records(container, limit=len(container))]
+
+    def save(self, *collections: str) -> None:
+        """Persist ``collections`` (default: all) and publish their generations in the manifest."""
+        names = [name for name, _factory in _REPORT_COLLECTIONS]
+        if collections and not self._legacy_layout:
+            unknown = set(collections) - set(names)
+            if unknown:
+                raise ValueError(f"Unknown report collection: {sorted(unknown)[0]}")
+            names = [name for name in names if name in collections]
+        with file_lock(self.path):
+            manifest = self._read_manifest() or {}
+            self._sync_collections(manifest, skip=set(names))
+            entries = dict(manifest.get("collections", {}) or {})
+            for name in names:
+                if name == "delivery_dispatch_records":
+                    self._prune_dispatch_records()
+                rows = self._collection_rows(name)
+                generation = atomic_write_json(self.collection_path(name), rows)
+                self._collection_generations[name] = generation
+                entries[name] = {
+                    "file": str(self.collection_path(name).relative_to(self.path.parent)),
+                    "generation": generation,
+                    "count": len(rows),
+                }
+            self._write_json({"version": self.version, "layout": "collections", "collections": entries})
+            self._legacy_layout = False
 
     def _touch(self, obj: ReportRecord) -> None:
         obj.updated_at = _utcnow()
@@ -1305,13 +1455,16 @@ class ReportStore:
             if not isinstance(payload, dict):
                 raise TypeError(f"Unsupported payload type for {model_type.__name__}: {type(payload)!r}")
             candidate = factory(payload)
-        candidate.id = _unique_id(candidate.id, set(container), prefix=id_prefix)
-        if not candidate.created_at:
-            candidate.created_at = _utcnow()
-        candidate.updated_at = candidate.created_at
-        container[candidate.id] = candidate
-        self.save()
-        return candidate
+        with self._transaction():
+            candidate.id = _unique_id(candidate.id, set(container), prefix=id_prefix)
+            if not candidate.created_at:
+                candidate.created_at = _utcnow()
+            candidate.updated_at = candidate.created_at
+            container[candidate.id] = candidate
+            name = self._collection_name(container)
+            self._index_record(name, candidate)
+            self.save(name)
+            return candidate
 
     def _update_timestamp(self) -> None:
         self.version += 1
@@ -1323,25 +1476,28 @@ class ReportStore:
         *,
         updates: dict[str, Any],
     ) -> ReportRecordT | None:
-        current = self._lookup(container, identifier)
-        if current is None:
-            return None
-        for field_name, field_value in updates.items():
-            if field_value is None:
-                continue
-            if isinstance(field_value, list):
-                setattr(current, field_name, self._normalize_ids(field_value))
-            elif isinstance(field_value, bool):
-                setattr(current, field_name, bool(field_value))
-            elif hasattr(current, field_name) and isinstance(getattr(current, field_name), float):
-                setattr(current, field_name, _coerce_float(field_value, default=getattr(current, field_name)))
-            elif isinstance(field_value, int) and hasattr(current, field_name) and isinstance(getattr(current, field_name), int):
-                setattr(current, field_name, _coerce_int(field_value, default=getattr(current, field_name)))
-            else:
-                setattr(current, field_name, _normalize_optional_string(field_value))
-        self._touch(current)
-        self.save()
-        return current
+        with self._transaction():
+            current = self._lookup(container, identifier)
+            if current is None:
+                return None
+            for field_name, field_value in updates.items():
+                if field_value is None:
+                    continue
+                if isinstance(field_value, list):
+                    setattr(current, field_name, self._normalize_ids(field_value))
+                elif isinstance(field_value, bool):
+                    setattr(current, field_name, bool(field_value))
+                elif hasattr(current, field_name) and isinstance(getattr(current, field_name), float):
+                    setattr(current, field_name, _coerce_float(field_value, default=getattr(current, field_name)))
+                elif isinstance(field_value, int) and hasattr(current, field_name) and isinstance(getattr(current, field_name), int):
+                    setattr(current, field_name, _coerce_int(field_value, default=getattr(current, field_name)))
+                else:
+                    setattr(current, field_name, _normalize_optional_string(field_value))
+            self._touch(current)
+            name = self._collection_name(container)
+            self._index_record(name, current)
+            self.save(name)
+            return current
 
     # ReportBrief CRUD
     def create_report_brief(self, payload: ReportBrief | dict[str, Any]) -> ReportBrief:
@@ -1387,18 +1543,19 @@ class ReportStore:
             "tags": prepared_payload.get("tags"),
             "brief_id": prepared_payload.get("brief_id"),
         }
-        claim = self._update_generic(identifier, self.claim_cards, updates=updates)
-        if claim is None:
-            return None
-        if "governance" in prepared_payload:
-            claim.governance = dict(prepared_payload.get("governance") or {})
-            self._touch(claim)
-            self.save()
-        if "confidence" in prepared_payload:
-            claim.confidence = round(max(0.0, min(1.0, _coerce_float(prepared_payload.get("confidence"), default=claim.confidence))), 4)
-            self._touch(claim)
-            self.save()
-        return claim
+        with self._transaction():
+            claim = self._update_generic(identifier, self.claim_cards, updates=updates)
+            if claim is None:
+                return None
+            if "governance" in prepared_payload:
+                claim.governance = dict(prepared_payload.get("governance") or {})
+                self._touch(claim)
+                self.save("claim_cards")
+            if "confidence" in prepared_payload:
+                claim.confidence = round(max(0.0, min(1.0, _coerce_float(prepared_payload.get("confidence"), default=claim.confidence))), 4)
+                self._touch(claim)
+                self.save("claim_cards")
+            return claim
 
     # ReportSection CRUD
     def create_report_section(self, payload: ReportSection | dict[str, Any]) -> ReportSection:
@@ -1418,12 +1575,13 @@ class ReportStore:
             "claim_card_ids": payload.get("claim_card_ids"),
             "report_id": payload.get("report_id"),
         }
-        current = self._update_generic(identifier, self.report_sections, updates=updates)
-        if current is not None and "position" in payload:
-            current.position = _coerce_int(payload.get("position"), default=current.position)
-            self._touch(current)
-            self.save()
-        return current
+        with self._transaction():
+            current = self._update_generic(identifier, self.report_sections, updates=updates)
+            if current is not None and "position" in payload:
+                current.position = _coerce_int(payload.get("position"), default=current.position)
+                self._touch(current)
+                self.save("report_sections")
+            return current
 
     # CitationBundle CRUD
     def create_citation_bundle(self, payload: CitationBundle | dict[str, Any]) -> CitationBundle:
@@ -1446,12 +1604,13 @@ class ReportStore:
             "source_item_ids": prepared_payload.get("source_item_ids"),
             "source_urls": prepared_payload.get("source_urls"),
         }
-        bundle = self._update_generic(identifier, self.citation_bundles, updates=updates)
-        if bundle is not None and "governance" in prepared_payload:
-            bundle.governance = dict(prepared_payload.get("governance") or {})
-            self._touch(bundle)
-            self.save()
-        return bundle
+        with self._transaction():
+            bundle = self._update_generic(identifier, self.citation_bundles, updates=updates)
+            if bundle is not None and "governance" in prepared_payload:
+                bundle.governance = dict(prepared_payload.get("governance") or {})
+                self._touch(bundle)
+                self.save("citation_bundles")
+            return bundle
 
     # Report CRUD
     def _normalize_report_identifier(self, identifier: str) -> str:
@@ -1470,32 +1629,32 @@ class ReportStore:
         return payload
 
     def ensure_default_export_profiles(self, report: Report) -> list[str]:
-        existing_profiles = {
-            self._normalize_profile_name(profile.name): profile
-            for profile in self.export_profiles.values()
-            if profile.report_id == report.id
-        }
-        ordered_profile_ids: list[str] = []
-        for template in _DEFAULT_EXPORT_PROFILES:
-            normalized_name = self._normalize_profile_name(template.get("name"))
-            profile = existing_profiles.get(normalized_name)
-            if profile is None:
-                profile = self._create(
-                    self._default_export_profile_payload(report.id, template),
-                    ExportProfile.from_dict,
-                    ExportProfile,
-                    self.export_profiles,
-                    id_prefix="export-profile",
-                )
-            if profile.id:
-                ordered_profile_ids.append(profile.id)
-        existing_profile_ids = list(_normalize_id_sequence(report.export_profile_ids))
-        merged_profile_ids = _normalize_id_sequence([*ordered_profile_ids, *existing_profile_ids])
-        if merged_profile_ids != existing_profile_ids:
-            report.export_profile_ids = merged_profile_ids
-            self._touch(report)
-            self.save()
-        return merged_profile_ids
+        with self._transaction():
+            existing_profiles = {
+                self._normalize_profile_name(profile.name): profile
+                for profile in self._indexed(self.export_profiles, self._profiles_by_report, report.id)
+            }
+            ordered_profile_ids: list[str] = []
+            for template in _DEFAULT_EXPORT_PROFILES:
+                normalized_name = self._normalize_profile_name(template.get("name"))
+                profile = existing_profiles.get(normalized_name)
+                if profile is None:
+                    profile = self._create(
+                        self._default_export_profile_payload(report.id, template),
+                        ExportProfile.from_dict,
+                        ExportProfile,
+                        self.export_profiles,
+                        id_prefix="export-profile",
+                    )
+                if profile.id:
+                    ordered_profile_ids.append(profile.id)
+            existing_profile_ids = list(_normalize_id_sequence(report.export_profile_ids))
+            merged_profile_ids = _normalize_id_sequence([*ordered_profile_ids, *existing_profile_ids])
+            if merged_profile_ids != existing_profile_ids:
+                report.export_profile_ids = merged_profile_ids
+                self._touch(report)
+                self.save("reports")
+            return merged_profile_ids
 
     def _resolve_default_profile(self, report: Report, *, profile_id: str | None = None, default_name: str | None = None) -> str | None:
         if profile_id:
@@ -1509,16 +1668,15 @@ class ReportStore:
         return None
 
     def _lookup_reports_with_name(self, report_id: str) -> list[ExportProfile]:
-        return [
-            profile
-            for profile in self._list_records(self.export_profiles, limit=max(0, len(self.export_profiles)))
-            if profile.report_id == report_id
-        ]
+        profiles = self._indexed(self.export_profiles, self._profiles_by_report, report_id)
+        profiles.sort(key=lambda item: (str(item.updated_at), str(item.id)), reverse=True)
+        return profiles
 
     def create_report(self, payload: Report | dict[str, Any]) -> Report:
-        report = self._create(payload, Report.from_dict, Report, self.reports, id_prefix="report")
-        report.export_profile_ids = self.ensure_default_export_profiles(report)
-        return report
+        with self._transaction():
+            report = self._create(payload, Report.from_dict, Report, self.reports, id_prefix="report")
+            report.export_profile_ids = self.ensure_default_export_profiles(report)
+            return report
 
     def list_reports(self, *, limit: int = 20, status: str | None = None) -> list[Report]:
         return self._list_records(self.reports, limit=limit, status=status)
@@ -1558,10 +1716,11 @@ class ReportStore:
         status: str | None = None,
         report_id: str | None = None,
     ) -> list[ExportProfile]:
-        rows = list(self.export_profiles.values())
         if report_id:
             normalized_report_id = self._normalize_report_identifier(report_id)
-            rows = [row for row in rows if row.report_id == normalized_report_id]
+            rows = self._indexed(self.export_profiles, self._profiles_by_report, normalized_report_id)
+        else:
+            rows = list(self.export_profiles.values())
         if status is not None:
             normalized = {s.strip().lower() for s in _normalize_string_list([status])}
             rows = [row for row in rows if str(getattr(row, "status", "")).strip().lower() in normalized]
@@ -1578,19 +1737,20 @@ class ReportStore:
             "output_format": payload.get("output_format"),
             "profile_version": payload.get("profile_version"),
         }
-        current = self._update_generic(identifier, self.export_profiles, updates=updates)
-        if current is not None and ("include_sections" in payload or "include_claim_cards" in payload or "include_bundles" in payload or "include_metadata" in payload):
-            if "include_sections" in payload:
-                current.include_sections = bool(payload.get("include_sections", current.include_sections))
-            if "include_claim_cards" in payload:
-                current.include_claim_cards = bool(payload.get("include_claim_cards", current.include_claim_cards))
-            if "include_bundles" in payload:
-                current.include_bundles = bool(payload.get("include_bundles", current.include_bundles))
-            if "include_metadata" in payload:
-                current.include_metadata = bool(payload.get("include_metadata", current.include_metadata))
-            self._touch(current)
-            self.save()
-        return current
+        with self._transaction():
+            current = self._update_generic(identifier, self.export_profiles, updates=updates)
+            if current is not None and ("include_sections" in payload or "include_claim_cards" in payload or "include_bundles" in payload or "include_metadata" in payload):
+                if "include_sections" in payload:
+                    current.include_sections = bool(payload.get("include_sections", current.include_sections))
+                if "include_claim_cards" in payload:
+                    current.include_claim_cards = bool(payload.get("include_claim_cards", current.include_claim_cards))
+                if "include_bundles" in payload:
+                    current.include_bundles = bool(payload.get("include_bundles", current.include_bundles))
+                if "include_metadata" in payload:
+                    current.include_metadata = bool(payload.get("include_metadata", current.include_metadata))
+                self._touch(current)
+                self.save("export_profiles")
+            return current
 
     @staticmethod
     def _normalize_dict_list(values: Any) -> list[dict[str, Any]]:
@@ -1771,12 +1931,13 @@ class ReportStore:
         return current
 
     def delete_delivery_subscription(self, identifier: str) -> DeliverySubscription | None:
-        current = self._lookup(self.delivery_subscriptions, identifier)
-        if current is None:
-            return None
-        del self.delivery_subscriptions[current.id]
-        self.save()
-        return current
+        with self._transaction():
+            current = self._lookup(self.delivery_subscriptions, identifier)
+            if current is None:
+                return None
+            del self.delivery_subscriptions[current.id]
+            self.save("delivery_subscriptions")
+            return current
 
     # Delivery dispatch record CRUD
     def create_delivery_dispatch_record(self, payload: DeliveryDispatchRecord | dict[str, Any]) -> DeliveryDispatchRecord:
@@ -1799,9 +1960,14 @@ class ReportStore:
         output_kind: str | None = None,
         route_name: str | None = None,
     ) -> list[DeliveryDispatchRecord]:
-        rows = list(self.delivery_dispatch_records.values())
         if subscription_id is not None:
-            rows = [row for row in rows if row.subscription_id == _normalize_optional_string(subscription_id)]
+            rows = self._indexed(
+                self.delivery_dispatch_records,
+                self._dispatch_by_subscription,
+                _normalize_optional_string(subscription_id),
+            )
+        else:
+            rows = list(self.delivery_dispatch_records.values())
         if subject_kind is not None:
             rows = [row for row in rows if row.subject_kind == _normalize_optional_string(subject_kind).strip().lower()]
         if subject_ref is not None:
@@ -1846,17 +2012,18 @@ class ReportStore:
             updates["status"] = self._normalize_optional_dispatch_status(payload.get("status"))
         if "error" in payload:
             updates["error"] = _normalize_optional_string(payload.get("error"))
-        current = self._update_generic(identifier, self.delivery_dispatch_records, updates=updates)
-        if current is None:
-            return None
-        if "attempts" in payload:
-            try:
-                current.attempts = _coerce_int(payload.get("attempts"), default=current.attempts)
-            except Exception:
-                current.attempts = _coerce_int(current.attempts, default=0)
-            self._touch(current)
-            self.save()
-        return current
+        with self._transaction():
+            current = self._update_generic(identifier, self.delivery_dispatch_records, updates=updates)
+            if current is None:
+                return None
+            if "attempts" in payload:
+                try:
+                    current.attempts = _coerce_int(payload.get("attempts"), default=current.attempts)
+                except Exception:
+                    current.attempts = _coerce_int(current.attempts, default=0)
+                self._touch(current)
+                self.save("delivery_dispatch_records")
+            return current
 
     def assemble_report(
         self,
@@ -1871,10 +2038,12 @@ class ReportStore:
         if report is None:
             return None
 
-        section_map = {row.id: row for row in self.report_sections.values() if row.report_id == report.id}
-        claim_map = {row.id: row for row in self.claim_cards.values()}
-        bundle_map = {row.id: row for row in self.citation_bundles.values()}
-        profile_map = {row.id: row for row in self.export_profiles.values()}
+        section_map = {
+            row.id: row for row in self._indexed(self.report_sections, self._sections_by_report, report.id)
+        }
+        claim_map = self.claim_cards
+        bundle_map = self.citation_bundles
+        profile_map = self.export_profiles
 
         ordered_sections = [section_map[section_id] for section_id in report.section_ids if section_id in section_map]
 
@@ -2,32 +2,37 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
 
-from datapulse.collectors import (
-    ArxivCollector,
-    BaseCollector,
-    BilibiliCollector,
-    GenericCollector,
-    GitHubCollector,
-    HackerNewsCollector,
-    JinaCollector,
-    NativeBridgeCollector,
-    ParseResult,
-    RedditCollector,
-    RssCollector,
-    TelegramCollector,
-    TrendingCollector,
-    TwitterCollector,
-    WeChatCollector,
-    WeiboCollector,
-    XiaohongshuCollector,
-    YouTubeCollector,
-)
+from datapulse.collectors.base import BaseCollector, ParseResult
+from datapulse.core.health import HEALTH_PROBES, HealthProbe, probe_key
+from datapulse.core.telemetry import span, traced
 from datapulse.core.utils import resolve_platform_hint
 
 logger = logging.getLogger("datapulse.router")
 
+# Default collector chain in routing order, as (module, class) pairs. Modules are
+# imported the first time the pipeline's parsers are needed, not at import time.
+DEFAULT_COLLECTORS: tuple[tuple[str, str], ...] = (
+    ("datapulse.collectors.twitter", "TwitterCollector"),
+    ("datapulse.collectors.youtube", "YouTubeCollector"),
+    ("datapulse.collectors.reddit", "RedditCollector"),
+    ("datapulse.collectors.bilibili", "BilibiliCollector"),
+    ("datapulse.collectors.telegram", "TelegramCollector"),
+    ("datapulse.collectors.native_bridge", "NativeBridgeCollector"),
+    ("datapulse.collectors.wechat", "WeChatCollector"),
+    ("datapulse.collectors.weibo", "WeiboCollector"),
+    ("datapulse.collectors.xhs", "XiaohongshuCollector"),
+    ("datapulse.collectors.arxiv", "ArxivCollector"),
+    ("datapulse.collectors.hackernews", "HackerNewsCollector"),
+    ("datapulse.collectors.github", "GitHubCollector"),
+    ("datapulse.collectors.trending", "TrendingCollector"),
+    ("datapulse.collectors.rss", "RssCollector"),
+    ("datapulse.collectors.generic", "GenericCollector"),
+    ("datapulse.collectors.jina", "JinaCollector"),
+)
+
 
 def _is_policy_block(error: str) -> bool:
     text = (error or "").lower()
@@ -40,27 +45,22 @@ def _is_policy_block(error: str) -> bool:
 
 class ParsePipeline:
     def __init__(self, extra_parsers: list[BaseCollector] | None = None):
-        configured = extra_parsers or []
-        self.parsers: list[BaseCollector] = []
-        self.parsers.extend(configured)
-        self.parsers.extend([
-            TwitterCollector(),
-            YouTubeCollector(),
-            RedditCollector(),
-            BilibiliCollector(),
-            TelegramCollector(),
-            NativeBridgeCollector(),
-            WeChatCollector(),
-            WeiboCollector(),
-            XiaohongshuCollector(),
-            ArxivCollector(),
-            HackerNewsCollector(),
-            GitHubCollector(),
-            TrendingCollector(),
-            RssCollector(),
-            GenericCollector(),
-            JinaCollector(),
-        ])
+        self._configured: list[BaseCollector] = list(extra_parsers or [])
+        self._parsers: list[BaseCollector] | None = None
+
+    @property
+    def parsers(self) -> list[BaseCollector]:
+        """Collector chain; default collectors are imported and built on first access."""
+        if self._parsers is None:
+            self._parsers = [*self._configured, *(
+                getattr(importlib.import_module(module_name), class_name)()
+                for module_name, class_name in DEFAULT_COLLECTORS
+            )]
+        return self._parsers
+
+    @parsers.setter
+    def parsers(self, value: list[BaseCollector]) -> None:
+        self._parsers = list(value)
 
     def register_parser(self, parser: BaseCollector, priority: bool = False) -> None:
         if priority:
@@ -72,6 +72,7 @@ class ParsePipeline:
     def available_parsers(self) -> list[str]:
         return [p.name for p in self.parsers]
 
+    @traced("pipeline.route")
     def route(self, url: str) -> tuple[ParseResult, BaseCollector]:
         hint = resolve_platform_hint(url)
         prioritized: list[BaseCollector] = []
@@ -92,7 +93,10 @@ class ParsePipeline:
                 if best_match is None:
                     best_match = parser
                 logger.info("Routing with %s for %s", parser.name, url)
-                result = parser.parse(url)
+                with span("collector.parse", collector=parser.name) as collector_span:
+                    result = parser.parse(url)
+                    if not result.success:
+                        collector_span.status = "failed"
                 if result.success:
                     return result, parser
 
@@ -115,15 +119,27 @@ class ParsePipeline:
             error_msg += f"\nHint ({chosen.name}): {chosen.setup_hint}"
         return ParseResult.failure(url, error_msg), chosen
 
-    def doctor(self) -> dict[str, list[dict[str, str | bool]]]:
-        """Run health checks on all registered parsers, grouped by tier."""
-        report: dict[str, list[dict[str, str | bool]]] = {
+    def doctor(self, *, fresh: bool = False) -> dict[str, list[dict[str, str | bool | float]]]:
+        """Run health checks on all registered parsers, grouped by tier.
+
+        Checks are served from the shared probe cache; stale entries refresh in the
+        background and ``fresh=True`` forces a synchronous (parallel) re-probe.
+        """
+        return self._doctor_report(HEALTH_PROBES.probe(self.parsers, fresh=fresh))
+
+    async def doctor_async(self, *, fresh: bool = False) -> dict[str, list[dict[str, str | bool | float]]]:
+        """Async variant of :meth:`doctor`; cold probes run concurrently."""
+        return self._doctor_report(await HEALTH_PROBES.probe_async(self.parsers, fresh=fresh))
+
+    def _doctor_report(self, probes: dict[str, HealthProbe]) -> dict[str, list[dict[str, str | bool | float]]]:
+        report: dict[str, list[dict[str, str | bool | float]]] = {
             "tier_0": [],
             "tier_1": [],
             "tier_2": [],
         }
         for parser in self.parsers:
-            check = parser.check()
+            probe = probes[probe_key(parser)]
+            check = probe.check
             status = str(check.get("status", "ok"))
             available = bool(check.get("available", True))
             raw_ok = check.get("ok")
@@ -131,13 +147,15 @@ class ParsePipeline:
                 ok = raw_ok
             else:
                 ok = available and status in {"ok", "warn"}
-            entry: dict[str, str | bool] = {
+            entry: dict[str, str | bool | float] = {
                 "name": parser.name,
                 "status": status,
                 "message": check.get("message", ""),
                 "available": available,
                 "ok": ok,
                 "setup_hint": parser.setup_hint,
+                "checked_at": probe.checked_at,
+                "age_seconds": probe.age_seconds(),
             }
             tier_key = f"tier_{parser.tier}"
             if tier_key not in report:
@@ -0,0 +1,308 @@
+"""Append-only watch run history with per-mission hourly/daily rollups — stdlib only.
+
+Every finished mission run is appended as one JSON line to a monthly segment
+(``runs-YYYY-MM.jsonl``) in the history directory; segments are never
+rewritten. ``rollups.json`` next to them keeps, per mission, the most recent
+runs plus hourly and daily buckets (runs, success, error, item_count,
+duration_seconds) and lifetime totals, so health views never replay the
+segments. It is written atomically under the store lock and carries the usual
+``.gen`` generation; when it is missing it is rebuilt from the segments.
+Forgetting a mission appends a tombstone line to the current segment, so a
+rebuild skips every run of that mission recorded up to then.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from .filestore import ReloadableStore, file_lock
+from .utils import run_history_dir_from_env
+
+RECENT_RUN_LIMIT = 10
+HOURLY_RETENTION = timedelta(days=14)
+DAILY_RETENTION = timedelta(days=400)
+GRANULARITIES = {"hourly": ("%Y-%m-%dT%H", timedelta(hours=1)), "daily": ("%Y-%m-%d", timedelta(days=1))}
+TOMBSTONE_EVENT = "mission_forgotten"
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    text = str(value or "").strip()
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _empty_counters() -> dict[str, Any]:
+    return {"runs": 0, "success": 0, "error": 0, "item_count": 0, "duration_seconds": 0.0}
+
+
+def _add_counters(target: dict[str, Any], source: dict[str, Any]) -> None:
+    for key in ("runs", "success", "error", "item_count"):
+        target[key] = int(target.get(key, 0) or 0) + int(source.get(key, 0) or 0)
+    target["duration_seconds"] = round(
+        float(target.get("duration_seconds", 0.0) or 0.0) + float(source.get("duration_seconds", 0.0) or 0.0),
+        3,
+    )
+
+
+def _with_rates(counters: dict[str, Any]) -> dict[str, Any]:
+    row = dict(counters)
+    runs = int(row.get("runs", 0) or 0)
+    row["success_rate"] = round(row["success"] / runs, 3) if runs > 0 else None
+    row["average_items"] = round(row["item_count"] / runs, 2) if runs > 0 else 0.0
+    row["average_duration_seconds"] = round(row["duration_seconds"] / runs, 3) if runs > 0 else 0.0
+    return row
+
+
+def run_counters(run: dict[str, Any]) -> dict[str, Any]:
+    """Single-run contribution to a bucket."""
+    started = _parse_timestamp(run.get("started_at"))
+    finished = _parse_timestamp(run.get("finished_at")) or started
+    duration = max(0.0, (finished - started).total_seconds()) if started and finished else 0.0
+    success = str(run.get("status", "") or "").strip().lower() == "success"
+    try:
+        item_count = max(0, int(run.get("item_count", 0) or 0))
+    except (TypeError, ValueError):
+        item_count = 0
+    return {
+        "runs": 1,
+        "success": 1 if success else 0,
+        "error": 0 if success else 1,
+        "item_count": item_count,
+        "duration_seconds": round(duration, 3),
+    }
+
+
+def run_timestamp(run: dict[str, Any]) -> datetime:
+    return (
+        _parse_timestamp(run.get("finished_at"))
+        or _parse_timestamp(run.get("started_at"))
+        or datetime.now(timezone.utc)
+    )
+
+
+class RunHistoryStore(ReloadableStore):
+    """Run segments plus the rollup file that backs watch health and the timeline strip."""
+
+    def __init__(self, directory: str | None = None, *, watchlist_path: str | None = None):
+        self.directory = Path(directory or run_history_dir_from_env(watchlist_path)).expanduser()
+        self.path = self.directory / "rollups.json"
+        self.version = 1
+        self.missions: dict[str, dict[str, Any]] = {}
+        self._load()
+
+    # -- persistence --------------------------------------------------------
+
+    def _load(self) -> None:
+        self._mark_loaded()
+        if not self.path.exists():
+            self.missions = {}
+            if any(self.segment_paths()):
+                self.rebuild()
+            return
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            self.missions = {}
+            return
+        missions = raw.get("missions", {}) if isinstance(raw, dict) else {}
+        self.missions = {
+            str(mission_id): entry
+            for mission_id, entry in (missions.items() if isinstance(missions, dict) else [])
+            if isinstance(entry, dict)
+        }
+
+    def save(self) -> None:
+        self._write_json({"version": self.version, "missions": self.missions})
+
+    def segment_paths(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob("runs-*.jsonl"))
+
+    def _segment_for(self, when: datetime) -> Path:
+        return self.directory / f"runs-{when:%Y-%m}.jsonl"
+
+    def _iter_rows(self) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        for segment in self.segment_paths():
+            try:
+                lines = segment.read_text(encoding="utf-8").splitlines()
+            except OSError:
+                continue
+            for line in lines:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(row, dict):
+                    rows.append(row)
+        return rows
+
+    def iter_runs(self, mission_id: str | None = None) -> list[dict[str, Any]]:
+        """Replay the segments (oldest first); used for rebuilds and exports, never on hot paths.
+
+        Runs of a forgotten mission up to its latest tombstone are left out.
+        """
+        rows = self._iter_rows()
+        forgotten: dict[str, datetime] = {}
+        for row in rows:
+            if row.get("event") == TOMBSTONE_EVENT:
+                when = _parse_timestamp(row.get("forgotten_at"))
+                row_mission = str(row.get("mission_id", ""))
+                if when is not None and (row_mission not in forgotten or when > forgotten[row_mission]):
+                    forgotten[row_mission] = when
+        runs: list[dict[str, Any]] = []
+        for row in rows:
+            row_mission = str(row.get("mission_id", ""))
+            if row.get("event") == TOMBSTONE_EVENT:
+                continue
+            if mission_id is not None and row_mission != mission_id:
+                continue
+            if row_mission in forgotten and run_timestamp(row) <= forgotten[row_mission]:
+                continue
+            runs.append(row)
+        return runs
+
+    def rebuild(self) -> None:
+        """Recompute every rollup from the segments."""
+        with file_lock(self.path):
+            self.missions = {}
+            now = datetime.now(timezone.utc)
+            for run in sorted(self.iter_runs(), key=run_timestamp):
+                self._fold(run, now=now)
+            self.save()
+
+    # -- writes -------------------------------------------------------------
+
+    def append(self, run: dict[str, Any]) -> dict[str, Any]:
+        """Append one run to its segment and fold it into the rollups; returns the mission entry."""
+        row = dict(run)
+        mission_id = str(row.get("mission_id", "") or "").strip()
+        if not mission_id:
+            raise ValueError("run is missing mission_id")
+        with file_lock(self.path):
+            self.reload_if_changed()
+            self._append_line(self._segment_for(run_timestamp(row)), row)
+            self._fold(row, now=datetime.now(timezone.utc))
+            self.save()
+            return self.missions[mission_id]
+
+    def import_runs(self, mission_id: str, runs: list[dict[str, Any]]) -> bool:
+        """Seed history for a mission from legacy inline runs; a no-op once the mission has history."""
+        if not runs:
+            return False
+        with file_lock(self.path):
+            self.reload_if_changed()
+            if mission_id in self.missions:
+                return False
+            for run in sorted(runs, key=run_timestamp):
+                self.append({**run, "mission_id": mission_id})
+            return True
+
+    @staticmethod
+    def _append_line(segment: Path, row: dict[str, Any]) -> None:
+        segment.parent.mkdir(parents=True, exist_ok=True)
+        with segment.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+            handle.flush()
+
+    def forget(self, mission_id: str) -> bool:
+        """Drop a mission's rollups; its segment lines stay as an audit trail behind a tombstone."""
+        with file_lock(self.path):
+            self.reload_if_changed()
+            if self.missions.pop(mission_id, None) is None:
+                return False
+            now = datetime.now(timezone.utc)
+            self._append_line(
+                self._segment_for(now),
+                {"event": TOMBSTONE_EVENT, "mission_id": mission_id, "forgotten_at": now.isoformat()},
+            )
+            self.save()
+            return True
+
+    def _fold(self, run: dict[str, Any], *, now: datetime) -> None:
+        mission_id = str(run.get("mission_id", "") or "").strip()
+        if not mission_id:
+            return
+        entry = self.missions.setdefault(
+            mission_id,
+            {"recent": [], "totals": _empty_counters(), "hourly": {}, "daily": {}},
+        )
+        counters = run_counters(run)
+        when = run_timestamp(run)
+        _add_counters(entry.setdefault("totals", _empty_counters()), counters)
+        for granularity, (key_format, _step) in GRANULARITIES.items():
+            buckets = entry.setdefault(granularity, {})
+            _add_counters(buckets.setdefault(when.strftime(key_format), _empty_counters()), counters)
+
+        recent = [row for row in entry.get("recent", []) if row.get("id") != run.get("id")]
+        recent.append(dict(run))
+        recent.sort(key=run_timestamp, reverse=True)
+        entry["recent"] = recent[:RECENT_RUN_LIMIT]
+        self._prune(entry, now=now)
+
+    @staticmethod
+    def _prune(entry: dict[str, Any], *, now: datetime) -> None:
+        for granularity, retention in (("hourly", HOURLY_RETENTION), ("daily", DAILY_RETENTION)):
+            key_format = GRANULARITIES[granularity][0]
+            cutoff = (now - retention).strftime(key_format)
+            entry[granularity] = {
+                key: counters for key, counters in entry.get(granularity, {}).items() if key >= cutoff
+            }
+
+    # -- reads --------------------------------------------------------------
+
+    def mission_ids(self) -> list[str]:
+        return sorted(self.missions)
+
+    def recent_runs(self, mission_id: str) -> list[dict[str, Any]]:
+        """Most recent runs for ``mission_id``, newest first."""
+        entry = self.missions.get(mission_id) or {}
+        return [dict(row) for row in entry.get("recent", [])]
+
+    def rollups(
+        self,
+        mission_id: str,
+        *,
+        granularity: str = "hourly",
+        limit: int = 24,
+        now: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """The last ``limit`` buckets ending at the current one, oldest first, with empty buckets filled."""
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unsupported rollup granularity: {granularity}")
+        key_format, step = GRANULARITIES[granularity]
+        buckets = (self.missions.get(mission_id) or {}).get(granularity, {})
+        current = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        if granularity == "hourly":
+            current = current.replace(minute=0, second=0, microsecond=0)
+        else:
+            current = current.replace(hour=0, minute=0, second=0, microsecond=0)
+        rows: list[dict[str, Any]] = []
+        for offset in range(max(0, int(limit)) - 1, -1, -1):
+            start = current - step * offset
+            key = start.strftime(key_format)
+            rows.append({"bucket": key, "start": start.isoformat(), **_with_rates(buckets.get(key, _empty_counters()))})
+        return rows
+
+    def summary(self, mission_id: str, *, now: datetime | None = None) -> dict[str, Any]:
+        """Rolling 24h / 7d windows and lifetime totals for one mission."""
+        entry = self.missions.get(mission_id) or {}
+        windows: dict[str, dict[str, Any]] = {}
+        for name, granularity, limit in (("last_24h", "hourly", 24), ("last_7d", "daily", 7)):
+            counters = _empty_counters()
+            for row in self.rollups(mission_id, granularity=granularity, limit=limit, now=now):
+                _add_counters(counters, row)
+            windows[name] = _with_rates(counters)
+        windows["lifetime"] = _with_rates({**_empty_counters(), **entry.get("totals", {})})
+        return windows
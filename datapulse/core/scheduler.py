@@ -230,6 +230,10 @@ class WatchDaemon:
             try:
                 while True:
                     cycles += 1
+                    # Pick up missions, routes and inbox edits made by the console/CLI/MCP.
+                    refresh_stores = getattr(self.reader, "refresh_stores", None)
+                    if callable(refresh_stores):
+                        refresh_stores()
                     self.status_store.mark_cycle_started()
                     try:
                         last_payload = await self.reader.run_due_watches(
@@ -7,6 +7,7 @@ from collections import Counter
 from datetime import datetime, timezone
 
 from .models import DataPulseItem
+from .telemetry import traced
 from .triage import normalize_review_state, review_state_score
 from .utils import content_fingerprint, get_domain
 
@@ -415,6 +416,7 @@ def compute_composite_score(
     return score, breakdown
 
 
+@traced("scoring.rank")
 def rank_items(
     items: list[DataPulseItem],
     *,
@@ -22,6 +22,7 @@ from datapulse.core.config import SearchGatewayConfig
 from datapulse.core.jina_client import JinaAPIClient, JinaSearchOptions
 from datapulse.core.retry import CircuitBreaker, CircuitBreakerOpen, RateLimitError, retry
 from datapulse.core.security import get_secret
+from datapulse.core.telemetry import span
 from datapulse.core.utils import get_domain
 
 logger = logging.getLogger("datapulse.search_gateway")
@@ -415,20 +416,21 @@ class SearchGateway:
         news: bool = False,
         time_range: str | None = None,
     ) -> list[SearchHit]:
-        if provider_name == "tavily":
-            return self._search_tavily(
-                query=query,
-                sites=sites,
-                limit=limit,
-                deep=deep,
-                news=news,
-                time_range=time_range,
-            )
-        if provider_name == "jina":
-            return self._search_jina(query=query, sites=sites, limit=limit)
-        if provider_name == "qnaigc":
-            return self._search_qnaigc(query=query, sites=sites, limit=limit)
-        raise SearchProviderUnavailable(f"Unsupported search provider: {provider_name}")
+        with span("search.provider", provider=provider_name):
+            if provider_name == "tavily":
+                return self._search_tavily(
+                    query=query,
+                    sites=sites,
+                    limit=limit,
+                    deep=deep,
+                    news=news,
+                    time_range=time_range,
+                )
+            if provider_name == "jina":
+                return self._search_jina(query=query, sites=sites, limit=limit)
+            if provider_name == "qnaigc":
+                return self._search_qnaigc(query=query, sites=sites, limit=limit)
+            raise SearchProviderUnavailable(f"Unsupported search provider: {provider_name}")
 
     @staticmethod
     def _coalesce_key(item: dict[str, Any], keys: tuple[str, ...], default: Any = None) -> Any:
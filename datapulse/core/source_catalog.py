@@ -10,9 +10,10 @@ import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 from urllib.parse import urlparse
 
+from .filestore import ReloadableStore
 from .models import (
     DataPulseItem,
     SourceAuthorityLevel,
@@ -22,7 +23,7 @@ from .models import (
     SourceSensitivity,
     SourceType,
 )
-from .utils import generate_slug, resolve_platform_hint
+from .utils import analyze_url, generate_slug
 
 JSONSource = dict[str, Any]
 
@@ -297,8 +298,7 @@ class SourceRecord:
         if item.source_type.value != self.source_type and item.source_type.value not in self.source_type.split("|"):
             return False
 
-        parsed = urlparse(item.url)
-        host = (parsed.hostname or "").lower()
+        host = analyze_url(item.url).host
 
         # explicit domain filter
         domain = self.match.get("domain", "").lower()
@@ -319,8 +319,8 @@ class SourceRecord:
         source_url = str(self.config.get("url", "")).lower()
         if source_url and item.url.startswith(source_url):
             return True
-        source_host = urlparse(source_url).hostname or ""
-        if source_host and self._matches_host(source_host.lower(), host):
+        source_host = analyze_url(source_url).host
+        if source_host and self._matches_host(source_host, host):
             return True
 
         return False
@@ -491,7 +491,7 @@ _BUILTIN_SOURCE_SEEDS: tuple[JSONSource, ...] = (
 )
 
 
-class SourceCatalog:
+class SourceCatalog(ReloadableStore):
     def __init__(self, catalog_path: str | None = None):
         default_path = os.getenv("DATAPULSE_SOURCE_CATALOG", "").strip() or "datapulse_source_catalog.json"
         self._explicit_catalog_path = catalog_path is not None
@@ -518,6 +518,7 @@ class SourceCatalog:
             self._bootstrapped_defaults = True
 
     def _load(self) -> None:
+        self._mark_loaded()
         if not self.path.exists():
             if not self._explicit_catalog_path:
                 self._bootstrap_builtin_sources()
@@ -591,7 +592,7 @@ class SourceCatalog:
             "subscriptions": self.subscriptions,
             "packs": [pack.to_dict() for pack in self.packs.values()],
         }
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._write_json(payload)
 
     def list_sources(self, *, include_inactive: bool = False, public_only: bool = False) -> list[SourceRecord]:
         items = list(self.sources.values())
@@ -619,7 +620,7 @@ class SourceCatalog:
                 authority[domain] = weight
             source_url = str(source.config.get("url", "")).strip()
             if source_url:
-                source_host = (urlparse(source_url).hostname or "").lower()
+                source_host = analyze_url(source_url).host
                 if source_host and source_host not in authority:
                     authority[source_host] = weight
         return authority
@@ -657,8 +658,9 @@ class SourceCatalog:
 
     def resolve_source(self, url: str) -> dict[str, Any]:
         parsed = urlparse(url)
-        source_type = resolve_platform_hint(url)
-        host = (parsed.hostname or "").lower()
+        analysis = analyze_url(url)
+        source_type = analysis.platform_hint
+        host = analysis.host
         seed = parsed.geturl() or url
 
         normalized_source_type = _normalize_source_type(source_type)
@@ -686,7 +688,7 @@ class SourceCatalog:
             if source_url and seed.startswith(source_url):
                 score = max(score, 70)
 
-            source_host = (urlparse(source_url).hostname or "").lower()
+            source_host = analyze_url(source_url).host
             if source_host and source._matches_host(source_host, host):
                 score = max(score, 50)
 
@@ -730,72 +732,77 @@ class SourceCatalog:
         return self.get_subscription(profile)
 
     def set_subscription(self, profile: str, source_ids: list[str]) -> list[str]:
-        key = str(profile or self._default_profile())
-        existing: list[str] = []
-        for source_id in source_ids:
-            sid = str(source_id).strip()
-            if sid in self.sources:
-                existing.append(sid)
-        self.subscriptions[key] = existing
-        self._save()
-        return existing
+        with self._transaction():
+            key = str(profile or self._default_profile())
+            existing: list[str] = []
+            for source_id in source_ids:
+                sid = str(source_id).strip()
+                if sid in self.sources:
+                    existing.append(sid)
+            self.subscriptions[key] = existing
+            self._save()
+            return existing
 
     def subscribe(self, profile: str, source_id: str) -> bool:
-        key = str(profile or self._default_profile())
-        if source_id not in self.sources:
-            return False
-        items = self.subscriptions.setdefault(key, [])
-        if source_id in items:
-            return False
-        items.append(source_id)
-        self._save()
-        return True
+        with self._transaction():
+            key = str(profile or self._default_profile())
+            if source_id not in self.sources:
+                return False
+            items = self.subscriptions.setdefault(key, [])
+            if source_id in items:
+                return False
+            items.append(source_id)
+            self._save()
+            return True
 
     def unsubscribe(self, profile: str, source_id: str) -> bool:
-        key = str(profile or self._default_profile())
-        items = self.subscriptions.get(key, [])
-        if source_id not in items:
-            return False
-        self.subscriptions[key] = [x for x in items if x != source_id]
-        self._save()
-        return True
+        with self._transaction():
+            key = str(profile or self._default_profile())
+            items = self.subscriptions.get(key, [])
+            if source_id not in items:
+                return False
+            self.subscriptions[key] = [x for x in items if x != source_id]
+            self._save()
+            return True
 
     def install_pack(self, profile: str, slug: str) -> int:
-        pack = self.get_pack(slug)
-        if not pack:
-            return 0
-        profile_key = str(profile or self._default_profile())
-        ids = set(self.subscriptions.get(profile_key, []))
-        added = 0
-        for sid in pack.source_ids:
-            if sid in self.sources and sid not in ids:
-                ids.add(sid)
-                added += 1
-        self.subscriptions[profile_key] = sorted(ids)
-        self._save()
-        return added
+        with self._transaction():
+            pack = self.get_pack(slug)
+            if not pack:
+                return 0
+            profile_key = str(profile or self._default_profile())
+            ids = set(self.subscriptions.get(profile_key, []))
+            added = 0
+            for sid in pack.source_ids:
+                if sid in self.sources and sid not in ids:
+                    ids.add(sid)
+                    added += 1
+            self.subscriptions[profile_key] = sorted(ids)
+            self._save()
+            return added
 
     def register_auto_source(self, name: str, source_type: str, source_url: str) -> SourceRecord:
-        sid = _item_id(f"{name}:{source_type}:{source_url}")
-        if sid in self.sources:
-            return self.sources[sid]
-
-        source_type = _normalize_source_type(source_type)
-        record = SourceRecord(
-            id=sid,
-            name=name,
-            source_type=source_type,
-            config={"url": source_url},
-            governance=_governance_from_raw({}, source_type, {"url": source_url}),
-            is_active=True,
-            is_public=True,
-            match={"url_prefix": source_url},
-            tags=[source_type],
-        )
-        self._touch_timestamps(record, create=True)
-        self.sources[sid] = record
-        self._save()
-        return record
+        with self._transaction():
+            sid = _item_id(f"{name}:{source_type}:{source_url}")
+            if sid in self.sources:
+                return self.sources[sid]
+
+            source_type = _normalize_source_type(source_type)
+            record = SourceRecord(
+                id=sid,
+                name=name,
+                source_type=source_type,
+                config={"url": source_url},
+                governance=_governance_from_raw({}, source_type, {"url": source_url}),
+                is_active=True,
+                is_public=True,
+                match={"url_prefix": source_url},
+                tags=[source_type],
+            )
+            self._touch_timestamps(record, create=True)
+            self.sources[sid] = record
+            self._save()
+            return record
 
     def filter_by_subscription(
         self,
@@ -806,28 +813,30 @@ class SourceCatalog:
     ) -> list[DataPulseItem]:
         if not items:
             return []
+        return list(self.iter_subscribed(items, profile=profile, source_ids=source_ids))
 
+    def iter_subscribed(
+        self,
+        items: Iterable[DataPulseItem],
+        *,
+        profile: str = "default",
+        source_ids: list[str] | None = None,
+    ) -> Iterator[DataPulseItem]:
+        """Lazily yield the items matched by the profile's subscription (or ``source_ids``)."""
         if source_ids is None:
             source_ids = self.get_subscription(profile)
             if not source_ids:
                 if self._bootstrapped_defaults and not self.subscriptions:
-                    return items
+                    yield from items
+                    return
                 # fallback: all public active sources
                 source_ids = [s.id for s in self.list_sources(include_inactive=False, public_only=True)]
             if not source_ids:
-                return items
+                yield from items
+                return
 
         target = set(source_ids)
-        selected: list[DataPulseItem] = []
+        sources = [source for source in self.sources.values() if source.id in target and source.is_active]
         for item in items:
-            matched = False
-            for source in self.sources.values():
-                if source.id not in target or not source.is_active:
-                    continue
-                if source.matches(item):
-                    matched = True
-                    break
-            if matched:
-                selected.append(item)
-
-        return selected
+            if any(source.matches(item) for source in sources):
+                yield item
@@ -7,44 +7,64 @@ import os
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+from .filestore import ReloadableStore, file_lock
 from .models import DataPulseItem
+from .telemetry import traced
 from .triage import normalize_review_state
 from .utils import content_fingerprint, content_hash, get_domain_tag
 
 
-class UnifiedInbox:
-    """Append-only JSON memory with bounded size and deduplication."""
+def _row_digest(row: dict[str, Any]) -> int:
+    return hash(json.dumps(row, ensure_ascii=False, sort_keys=True))
+
+
+def _watch_mission_id(item: DataPulseItem) -> str:
+    return str(item.extra.get("watch_mission_id", "") or "").strip()
+
+
+class UnifiedInbox(ReloadableStore):
+    """Append-only JSON memory with bounded size and deduplication.
+
+    Keeps an id → item map and a watch mission → item-id index so per-mission
+    views cost O(results) rather than a scan of the whole inbox.
+    """
 
     def __init__(self, path: str):
         self.path: Path = Path(path)
         self.items: list[DataPulseItem] = []
         self._fingerprints: set[str] = set()
+        self._by_id: dict[str, DataPulseItem] = {}
+        self._mission_index: dict[str, dict[str, None]] = {}
+        # id -> digest of each row as last read from or written to disk; save() uses it to
+        # tell our own edits apart from rows another process changed underneath us.
+        self._synced: dict[str, int] = {}
         self.max_items = int(os.getenv("DATAPULSE_MAX_INBOX", "500"))
         self.max_days = int(os.getenv("DATAPULSE_KEEP_DAYS", "30"))
         self._load()
 
+    @traced("store.load", store="inbox")
     def _load(self) -> None:
-        if not self.path.exists():
-            self.items = []
-            return
+        self._mark_loaded()
+        self.items = self._read_items()
+        self._synced = {item.id: _row_digest(item.to_dict()) for item in self.items}
+        self._prune()
 
+    def _read_items(self) -> list[DataPulseItem]:
+        if not self.path.exists():
+            return []
         try:
             data = json.loads(self.path.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError):
-            self.items = []
-            return
-
+            return []
         loaded = []
         for row in data if isinstance(data, list) else []:
             try:
                 loaded.append(DataPulseItem.from_dict(row))
             except (KeyError, TypeError, ValueError):
                 continue
-        self.items = loaded
-        self._prune()
-        self._rebuild_fingerprints()
+        return loaded
 
     def _prune(self) -> None:
         cutoff = datetime.now(timezone.utc) - timedelta(days=max(0, self.max_days))
@@ -70,6 +90,7 @@ class UnifiedInbox:
         ordered = sorted(dedup.values(), key=lambda i: i.fetched_at, reverse=True)
         self.items = ordered[: self.max_items]
         self._rebuild_fingerprints()
+        self._rebuild_indexes()
 
     def _rebuild_fingerprints(self) -> None:
         """Rebuild fingerprint set from current items."""
@@ -78,9 +99,33 @@ class UnifiedInbox:
             if len(item.content) >= 50:
                 self._fingerprints.add(content_fingerprint(item.content))
 
+    def _rebuild_indexes(self) -> None:
+        self._by_id = {}
+        self._mission_index = {}
+        for item in self.items:
+            self._index_item(item)
+
+    def _index_item(self, item: DataPulseItem) -> None:
+        self._by_id[item.id] = item
+        mission_id = _watch_mission_id(item)
+        if mission_id:
+            self._mission_index.setdefault(mission_id, {})[item.id] = None
+
+    def _drop_from_missions(self, item_id: str, *, keep: str = "") -> None:
+        for mission_id, item_ids in list(self._mission_index.items()):
+            if mission_id == keep or item_id not in item_ids:
+                continue
+            del item_ids[item_id]
+            if not item_ids:
+                del self._mission_index[mission_id]
+
+    def _unindex_item(self, item: DataPulseItem) -> None:
+        self._by_id.pop(item.id, None)
+        self._drop_from_missions(item.id)
+
     def add(self, item: DataPulseItem, *, fingerprint_dedup: bool = True) -> bool:
         # ID dedup (existing behaviour)
-        if any(existing.id == item.id for existing in self.items):
+        if item.id in self._by_id:
             return False
         # Fingerprint dedup for content >= 50 chars
         if fingerprint_dedup and len(item.content) >= 50:
@@ -90,37 +135,91 @@ class UnifiedInbox:
             self._fingerprints.add(fp)
         self.items.append(item)
         self.items.sort(key=lambda i: i.fetched_at, reverse=True)
+        self._index_item(item)
+        for dropped in self.items[self.max_items:]:
+            self._unindex_item(dropped)
         self.items = self.items[: self.max_items]
         return True
 
+    @traced("store.save", store="inbox")
     def save(self) -> None:
-        self._prune()
-        payload = [item.to_dict() for item in self.items]
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        """Prune and persist, first merging in whatever other processes wrote since our last sync.
+
+        Items added, edited or deleted here win; everything else takes the on-disk version,
+        so concurrent triage or ingest in another process is never rolled back.
+        """
+        with file_lock(self.path):
+            if self.has_changed():
+                self._merge_from_disk()
+            self._prune()
+            rows = [item.to_dict() for item in self.items]
+            self._write_json(rows)
+        self._synced = {row["id"]: _row_digest(row) for row in rows}
+
+    def _merge_from_disk(self) -> None:
+        ours = {item.id: item for item in self.items}
+        merged: dict[str, DataPulseItem] = {}
+        for theirs in self._read_items():
+            mine = ours.pop(theirs.id, None)
+            if mine is None:
+                # Absent here: either new from another writer, or synced before and dropped by us.
+                if theirs.id not in self._synced:
+                    merged[theirs.id] = theirs
+            elif _row_digest(mine.to_dict()) == self._synced.get(theirs.id):
+                merged[theirs.id] = theirs
+            else:
+                merged[theirs.id] = mine
+        for item_id, mine in ours.items():
+            # Absent on disk: keep it only if it is new here or edited since the last sync.
+            if _row_digest(mine.to_dict()) != self._synced.get(item_id):
+                merged[item_id] = mine
+        self.items = list(merged.values())
 
     def query(self, limit: int = 20, min_confidence: float = 0.0) -> list[DataPulseItem]:
         filtered = [item for item in self.items if item.confidence >= min_confidence]
         return sorted(filtered, key=lambda i: i.confidence, reverse=True)[:limit]
 
     def all_items(self, min_confidence: float = 0.0) -> list[DataPulseItem]:
-        return [item for item in self.items if item.confidence >= min_confidence]
+        return list(self.iter_items(min_confidence))
+
+    def iter_items(self, min_confidence: float = 0.0) -> Iterator[DataPulseItem]:
+        return (item for item in self.items if item.confidence >= min_confidence)
 
     def get(self, item_id: str) -> DataPulseItem | None:
-        for item in self.items:
-            if item.id == item_id:
-                return item
-        return None
+        return self._by_id.get(item_id)
 
     def delete(self, item_id: str) -> DataPulseItem | None:
+        if item_id not in self._by_id:
+            return None
         for index, item in enumerate(self.items):
             if item.id != item_id:
                 continue
             removed = self.items.pop(index)
+            self._unindex_item(removed)
             self._rebuild_fingerprints()
             return removed
         return None
 
+    def mission_ids(self) -> list[str]:
+        return list(self._mission_index)
+
+    def mission_items(self, mission_id: str, *, min_confidence: float = 0.0) -> list[DataPulseItem]:
+        """Items tagged with ``watch_mission_id == mission_id``, in insertion order."""
+        rows: list[DataPulseItem] = []
+        for item_id in self._mission_index.get(str(mission_id or "").strip(), {}):
+            item = self._by_id.get(item_id)
+            if item is not None and item.confidence >= min_confidence:
+                rows.append(item)
+        return rows
+
+    def assign_mission(self, item: DataPulseItem, mission_id: str) -> None:
+        """Re-index ``item`` after its ``watch_mission_id`` was (re)assigned."""
+        if item.id not in self._by_id:
+            return
+        self._drop_from_missions(item.id, keep=mission_id)
+        if mission_id:
+            self._mission_index.setdefault(mission_id, {})[item.id] = None
+
     def mark_processed(self, item_id: str, processed: bool = True) -> bool:
         for item in self.items:
             if item.id == item_id:
@@ -17,9 +17,11 @@ from typing import Any
 
 from .entities import normalize_entity_name
 from .entity_store import EntityStore
+from .filestore import ReloadableStore
 from .models import DataPulseItem
 from .scoring import rank_items
 from .semantic import build_semantic_review
+from .telemetry import traced
 from .triage import GROUNDING_BACKEND_KIND, build_item_governance, evidence_grade_priority, is_digest_candidate
 from .utils import content_fingerprint, generate_slug, get_domain, stories_path_from_env
 
@@ -321,7 +323,7 @@ class Story:
         return cls(**payload)
 
 
-class StoryStore:
+class StoryStore(ReloadableStore):
     """File-backed storage for persisted story aggregation snapshots."""
 
     def __init__(self, path: str | None = None):
@@ -331,6 +333,7 @@ class StoryStore:
         self._load()
 
     def _load(self) -> None:
+        self._mark_loaded()
         if not self.path.exists():
             self.stories = {}
             return
@@ -362,8 +365,7 @@ class StoryStore:
             "version": self.version,
             "stories": [story.to_dict() for story in self.list_stories(limit=5000)],
         }
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._write_json(payload)
 
     @staticmethod
     def _unique_id(base_id: str, existing: set[str]) -> str:
@@ -388,9 +390,10 @@ class StoryStore:
             if isinstance(provenance, dict):
                 provenance["story_id"] = candidate.id
             normalized[candidate.id] = candidate
-        self.stories = normalized
-        self.save()
-        return self.list_stories(limit=len(normalized) or 20)
+        with self._transaction():
+            self.stories = normalized
+            self.save()
+            return self.list_stories(limit=len(normalized) or 20)
 
     def list_stories(self, *, limit: int = 20, min_items: int = 1) -> list[Story]:
         rows = [
@@ -423,18 +426,19 @@ class StoryStore:
         return None
 
     def create_story(self, payload: Story | dict[str, Any]) -> Story:
-        candidate = payload if isinstance(payload, Story) else Story.from_dict(payload)
-        candidate.id = self._unique_id(candidate.id, set(self.stories))
-        provenance = (
-            candidate.governance.get("provenance", {})
-            if isinstance(candidate.governance, dict)
-            else {}
-        )
-        if isinstance(provenance, dict):
-            provenance["story_id"] = candidate.id
-        self.stories[candidate.id] = candidate
-        self.save()
-        return candidate
+        with self._transaction():
+            candidate = payload if isinstance(payload, Story) else Story.from_dict(payload)
+            candidate.id = self._unique_id(candidate.id, set(self.stories))
+            provenance = (
+                candidate.governance.get("provenance", {})
+                if isinstance(candidate.governance, dict)
+                else {}
+            )
+            if isinstance(provenance, dict):
+                provenance["story_id"] = candidate.id
+            self.stories[candidate.id] = candidate
+            self.save()
+            return candidate
 
     def update_story(
         self,
@@ -444,32 +448,34 @@ class StoryStore:
         summary: str | None = None,
         status: str | None = None,
     ) -> Story | None:
-        story = self.get_story(identifier)
-        if story is None:
-            return None
-        if title is not None:
-            next_title = str(title or "").strip()
-            if not next_title:
-                raise ValueError("Story title cannot be empty")
-            story.title = next_title
-        if summary is not None:
-            story.summary = str(summary or "").strip()
-        if status is not None:
-            next_status = str(status or "").strip().lower()
-            if not next_status:
-                raise ValueError("Story status cannot be empty")
-            story.status = next_status
-        story.updated_at = _utcnow()
-        self.save()
-        return story
+        with self._transaction():
+            story = self.get_story(identifier)
+            if story is None:
+                return None
+            if title is not None:
+                next_title = str(title or "").strip()
+                if not next_title:
+                    raise ValueError("Story title cannot be empty")
+                story.title = next_title
+            if summary is not None:
+                story.summary = str(summary or "").strip()
+            if status is not None:
+                next_status = str(status or "").strip().lower()
+                if not next_status:
+                    raise ValueError("Story status cannot be empty")
+                story.status = next_status
+            story.updated_at = _utcnow()
+            self.save()
+            return story
 
     def delete_story(self, identifier: str) -> Story | None:
-        story = self.get_story(identifier)
-        if story is None:
-            return None
-        del self.stories[story.id]
-        self.save()
-        return story
+        with self._transaction():
+            story = self.get_story(identifier)
+            if story is None:
+                return None
+            del self.stories[story.id]
+            self.save()
+            return story
 
 
 def _descriptor_for_item(item: DataPulseItem, *, entity_store: EntityStore | None = None) -> dict[str, Any]:
@@ -2272,6 +2278,7 @@ def build_story_from_items(
     )
 
 
+@traced("story.cluster")
 def build_story_clusters(
     items: list[DataPulseItem],
     *,
@@ -2660,8 +2667,16 @@ class StoryService:
     def list_stories(self, *, limit: int = 20, min_items: int = 1) -> list[dict[str, Any]]:
         return [story.to_dict() for story in self.story_store.list_stories(limit=limit, min_items=min_items)]
 
+    def _create_story(self, payload: Story | dict[str, Any]) -> Story:
+        base_generation = self.story_store.generation
+        story = self.story_store.create_story(payload)
+        metrics = getattr(self.owner, "ops_metrics", None)
+        if metrics is not None:
+            metrics.record_story_created(story, base_generation=base_generation)
+        return story
+
     def create_story(self, **payload: Any) -> dict[str, Any]:
-        return self.story_store.create_story(payload).to_dict()
+        return self._create_story(payload).to_dict()
 
     def create_story_from_triage(
         self,
@@ -2695,7 +2710,7 @@ class StoryService:
             status=status,
             entity_store=self.owner.entity_store,
         )
-        return self.story_store.create_story(story).to_dict()
+        return self._create_story(story).to_dict()
 
     def show_story(self, identifier: str) -> dict[str, Any] | None:
         story = self.story_store.get_story(identifier)
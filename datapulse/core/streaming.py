@@ -0,0 +1,95 @@
+"""Chunked serializers for large feed exports — stdlib only.
+
+Every helper yields ``str`` chunks so callers can hand them to a file, stdout,
+or an HTTP streaming response without building the whole document first.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Iterator
+
+DEFAULT_STREAM_CHUNK_SIZE = 50
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def xml_escape(value: str) -> str:
+    return (value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("\"", "&quot;"))
+
+
+def iter_json_object(
+    head: dict[str, Any],
+    stream_key: str,
+    rows: Iterable[Any],
+    tail: dict[str, Any] | None = None,
+    *,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    indent: int | None = None,
+) -> Iterator[str]:
+    """Serialize ``{**head, stream_key: [*rows], **tail}`` as a chunked JSON object.
+
+    The joined output is byte-identical to ``json.dumps(..., ensure_ascii=False,
+    indent=indent)`` of the equivalent dict; ``rows`` is consumed lazily,
+    ``chunk_size`` rows per chunk.
+    """
+    if indent is None:
+        field_sep, open_brace, close_brace, row_pad = ", ", "{", "}", ""
+    else:
+        field_sep, open_brace, close_brace, row_pad = ",\n", "{\n", "\n}", " " * (2 * indent)
+    pad = "" if indent is None else " " * indent
+
+    def _field(key: str, value: Any) -> str:
+        return f"{pad}{_dumps(key)}: {_dumps_indented(value, indent, pad)}"
+
+    fields = [_field(key, value) for key, value in head.items()]
+    fields.append(f"{pad}{_dumps(stream_key)}: [")
+    yield open_brace + field_sep.join(fields)
+
+    row_sep = ", " if indent is None else ",\n"
+    first_sep = "" if indent is None else "\n"
+    chunk_size = max(1, int(chunk_size))
+    buffer: list[str] = []
+    first = True
+    for row in rows:
+        buffer.append(row_pad + _dumps_indented(row, indent, row_pad))
+        if len(buffer) >= chunk_size:
+            yield (first_sep if first else row_sep) + row_sep.join(buffer)
+            first = False
+            buffer = []
+    if buffer:
+        yield (first_sep if first else row_sep) + row_sep.join(buffer)
+        first = False
+
+    closing = "]" if first or indent is None else f"\n{pad}]"
+    for key, value in (tail or {}).items():
+        closing += field_sep + _field(key, value)
+    yield closing + close_brace
+
+
+def _dumps_indented(value: Any, indent: int | None, pad: str) -> str:
+    if indent is None:
+        return _dumps(value)
+    return json.dumps(value, ensure_ascii=False, indent=indent).replace("\n", "\n" + pad)
+
+
+def iter_json_lines(
+    rows: Iterable[Any],
+    *,
+    header: dict[str, Any] | None = None,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Serialize rows as JSON Lines, optionally preceded by one header record."""
+    if header is not None:
+        yield _dumps(header) + "\n"
+    chunk_size = max(1, int(chunk_size))
+    buffer: list[str] = []
+    for row in rows:
+        buffer.append(_dumps(row) + "\n")
+        if len(buffer) >= chunk_size:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
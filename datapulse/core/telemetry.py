@@ -0,0 +1,289 @@
+"""Dependency-free spans, latency histograms and JSONL traces — stdlib only.
+
+Hot paths wrap their work in :func:`span`. Every finished span feeds a
+process-wide latency histogram keyed by span name and its (low-cardinality)
+labels, plus an outcome counter; :func:`render_prometheus` exports both in the
+Prometheus text format for the console ``/metrics`` endpoint. A bounded window
+of recent durations per series backs the p50/p95/p99 figures in
+:meth:`Telemetry.snapshot`.
+
+When ``DATAPULSE_TRACE_PATH`` is set, finished spans are also appended to that
+file as JSON lines carrying ``trace_id`` / ``span_id`` / ``parent_id``, so a
+slow read can be followed from the reader down to the collector that stalled.
+``DATAPULSE_TRACE_MIN_MS`` drops spans faster than the given threshold. Both
+are read once, on the first finished span; :meth:`Telemetry.configure_tracing`
+re-reads them.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import json
+import math
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypedDict, TypeVar
+
+from .config import read_env_float, read_env_str
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+RECENT_WINDOW = 1024
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+_CURRENT: contextvars.ContextVar[Span | None] = contextvars.ContextVar("datapulse_span", default=None)
+
+SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _label_items(labels: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((str(key), str(value)) for key, value in labels.items() if value is not None and value != ""))
+
+
+def _percentile(ordered: list[float], quantile: float) -> float:
+    if not ordered:
+        return 0.0
+    index = max(0, min(len(ordered) - 1, math.ceil(quantile * len(ordered)) - 1))
+    return ordered[index]
+
+
+class SpanStats(TypedDict):
+    span: str
+    labels: dict[str, str]
+    count: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    outcomes: dict[str, int]
+
+
+class Span:
+    """One timed unit of work; set ``status`` to something other than ``"ok"`` to flag a soft failure."""
+
+    __slots__ = ("name", "labels", "status", "trace_id", "span_id", "parent_id", "started_at", "_start")
+
+    name: str
+    labels: dict[str, Any]
+    status: str
+    trace_id: str
+    span_id: str
+    parent_id: str
+    started_at: str
+    _start: float
+
+    def __init__(self, name: str, labels: dict[str, Any], parent: Span | None):
+        self.name = name
+        self.labels = dict(labels)
+        self.status = "ok"
+        self.trace_id = parent.trace_id if parent is not None else uuid.uuid4().hex
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent.span_id if parent is not None else ""
+        self.started_at = _utcnow()
+        self._start = time.perf_counter()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start
+
+
+class _Series:
+    __slots__ = ("buckets", "count", "total", "recent")
+
+    def __init__(self, bucket_count: int):
+        self.buckets = [0] * bucket_count
+        self.count = 0
+        self.total = 0.0
+        self.recent: deque[float] = deque(maxlen=RECENT_WINDOW)
+
+
+class Telemetry:
+    """Process-wide span registry; safe to use from threads and event loops."""
+
+    def __init__(self, *, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series: dict[SeriesKey, _Series] = {}
+        self._outcomes: dict[tuple[str, tuple[tuple[str, str], ...], str], int] = {}
+        self._trace_lock = threading.Lock()
+        self._trace_path: Path | None = None
+        self._trace_min_ms = 0.0
+        self._trace_configured = False
+
+    def configure_tracing(self, path: str | None = None, *, min_ms: float | None = None) -> None:
+        """Set the JSONL trace sink; arguments left as None are read from ``DATAPULSE_TRACE_*``."""
+        raw_path = read_env_str("DATAPULSE_TRACE_PATH") if path is None else path.strip()
+        with self._trace_lock:
+            self._trace_path = Path(raw_path).expanduser() if raw_path else None
+            self._trace_min_ms = read_env_float("DATAPULSE_TRACE_MIN_MS", 0.0) if min_ms is None else float(min_ms)
+            self._trace_configured = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._outcomes.clear()
+
+    @contextmanager
+    def span(self, name: str, **labels: Any) -> Iterator[Span]:
+        active = Span(name, labels, _CURRENT.get())
+        token = _CURRENT.set(active)
+        try:
+            yield active
+        except BaseException:
+            active.status = "error"
+            raise
+        finally:
+            _CURRENT.reset(token)
+            self.observe(active, active.elapsed())
+
+    def observe(self, active: Span, seconds: float) -> None:
+        label_items = _label_items(active.labels)
+        with self._lock:
+            series = self._series.get((active.name, label_items))
+            if series is None:
+                series = self._series[(active.name, label_items)] = _Series(len(self.buckets))
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series.buckets[index] += 1
+            series.count += 1
+            series.total += seconds
+            series.recent.append(seconds)
+            outcome_key = (active.name, label_items, active.status)
+            self._outcomes[outcome_key] = self._outcomes.get(outcome_key, 0) + 1
+        self._trace(active, seconds)
+
+    def _trace(self, active: Span, seconds: float) -> None:
+        if not self._trace_configured:
+            self.configure_tracing()
+        path = self._trace_path
+        if path is None:
+            return
+        duration_ms = round(seconds * 1000.0, 3)
+        if duration_ms < self._trace_min_ms:
+            return
+        line = json.dumps(
+            {
+                "ts": active.started_at,
+                "trace_id": active.trace_id,
+                "span_id": active.span_id,
+                "parent_id": active.parent_id,
+                "span": active.name,
+                "labels": active.labels,
+                "status": active.status,
+                "duration_ms": duration_ms,
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+        with self._trace_lock:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("a", encoding="utf-8") as handle:
+                    handle.write(line + "\n")
+            except OSError:
+                return
+
+    def snapshot(self) -> list[SpanStats]:
+        """Per-series count, mean and recent-window p50/p95/p99 in milliseconds, slowest p95 first."""
+        with self._lock:
+            rows: list[SpanStats] = []
+            for (name, label_items), series in self._series.items():
+                ordered = sorted(series.recent)
+                outcomes = {
+                    status: count
+                    for (outcome_name, outcome_labels, status), count in self._outcomes.items()
+                    if outcome_name == name and outcome_labels == label_items
+                }
+                rows.append(
+                    {
+                        "span": name,
+                        "labels": dict(label_items),
+                        "count": series.count,
+                        "mean_ms": round(series.total / series.count * 1000.0, 3) if series.count else 0.0,
+                        "p50_ms": round(_percentile(ordered, 0.50) * 1000.0, 3),
+                        "p95_ms": round(_percentile(ordered, 0.95) * 1000.0, 3),
+                        "p99_ms": round(_percentile(ordered, 0.99) * 1000.0, 3),
+                        "outcomes": outcomes,
+                    }
+                )
+        rows.sort(key=lambda row: (-row["p95_ms"], row["span"]))
+        return rows
+
+    def render_prometheus(self) -> str:
+        lines = [
+            "# HELP datapulse_span_duration_seconds Duration of instrumented DataPulse operations.",
+            "# TYPE datapulse_span_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (name, label_items), series in sorted(self._series.items()):
+                base = [("span", name), *label_items]
+                for bound, count in zip(self.buckets, series.buckets):
+                    lines.append(f"datapulse_span_duration_seconds_bucket{_render_labels([*base, ('le', _fmt(bound))])} {count}")
+                lines.append(f"datapulse_span_duration_seconds_bucket{_render_labels([*base, ('le', '+Inf')])} {series.count}")
+                lines.append(f"datapulse_span_duration_seconds_sum{_render_labels(base)} {_fmt(series.total)}")
+                lines.append(f"datapulse_span_duration_seconds_count{_render_labels(base)} {series.count}")
+            lines.append("# HELP datapulse_span_total Finished DataPulse operations by outcome status.")
+            lines.append("# TYPE datapulse_span_total counter")
+            for (name, label_items, status), count in sorted(self._outcomes.items()):
+                lines.append(f"datapulse_span_total{_render_labels([('span', name), *label_items, ('status', status)])} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _fmt(value: float) -> str:
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _render_labels(items: list[tuple[str, str]]) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in items) + "}"
+
+
+TELEMETRY = Telemetry()
+
+
+def span(name: str, **labels: Any):
+    """``with span("inbox.save"):`` — time a block on the shared registry."""
+    return TELEMETRY.span(name, **labels)
+
+
+def current_span() -> Span | None:
+    return _CURRENT.get()
+
+
+def traced(name: str, **labels: Any) -> Callable[[_F], _F]:
+    """Decorator form of :func:`span` for plain and ``async`` functions."""
+
+    def decorator(func: _F) -> _F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with TELEMETRY.span(name, **labels):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with TELEMETRY.span(name, **labels):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def render_prometheus() -> str:
+    return TELEMETRY.render_prometheus()
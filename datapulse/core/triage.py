@@ -1296,8 +1296,9 @@ def _jaccard(left: set[str], right: set[str]) -> float:
 class TriageQueue:
     """Reader-facing triage service backed by UnifiedInbox."""
 
-    def __init__(self, inbox: Any):
+    def __init__(self, inbox: Any, *, metrics: Any = None):
         self.inbox = inbox
+        self.metrics = metrics
 
     def _find_item(self, item_id: str) -> "DataPulseItem | None":
         for item in self.inbox.items:
@@ -1305,6 +1306,22 @@ class TriageQueue:
                 return item
         return None
 
+    def _record_review_change(
+        self,
+        item: "DataPulseItem",
+        previous_state: str,
+        *,
+        base_generation: int,
+        notes_added: int = 0,
+    ) -> None:
+        if self.metrics is not None:
+            self.metrics.record_review_change(
+                item,
+                previous_state,
+                base_generation=base_generation,
+                notes_added=notes_added,
+            )
+
     def list_items(
         self,
         *,
@@ -1352,6 +1369,7 @@ class TriageQueue:
         if next_state == "duplicate" and duplicate_of == item.id:
             raise ValueError("duplicate_of cannot equal item id")
         previous_state = normalize_review_state(item.review_state, processed=item.processed)
+        base_generation = self.inbox.generation
         item.review_state = next_state
         item.processed = next_state in TERMINAL_REVIEW_STATES
         if next_state == "duplicate":
@@ -1370,6 +1388,12 @@ class TriageQueue:
         if note.strip():
             item.review_notes.append(build_review_note(note, author=actor))
         self.inbox.save()
+        self._record_review_change(
+            item,
+            previous_state,
+            base_generation=base_generation,
+            notes_added=1 if note.strip() else 0,
+        )
         return item
 
     def add_note(
@@ -1382,7 +1406,9 @@ class TriageQueue:
         item = self._find_item(item_id)
         if item is None:
             return None
-        if normalize_review_state(item.review_state, processed=item.processed) == "new":
+        previous_state = normalize_review_state(item.review_state, processed=item.processed)
+        base_generation = self.inbox.generation
+        if previous_state == "new":
             item.review_state = "triaged"
         item.review_notes.append(build_review_note(note, author=author))
         item.review_actions.append(
@@ -1393,6 +1419,7 @@ class TriageQueue:
             }
         )
         self.inbox.save()
+        self._record_review_change(item, previous_state, base_generation=base_generation, notes_added=1)
         return item
 
     def delete_item(self, item_id: str) -> "DataPulseItem | None":
@@ -11,22 +11,27 @@ import re
 import socket
 import threading
 import unicodedata
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Awaitable, TypeVar
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, Iterator, TypeVar
 from urllib.parse import urlparse, urlunparse
 
-import tldextract
-
 from datapulse.core.cache import TTLCache
+from datapulse.core.config import read_env_int
+
+if TYPE_CHECKING:
+    import tldextract
 
 _URL_PATTERN = re.compile(r"https?://(?:[a-zA-Z0-9\-._~:/?#\[\]@!$&'()*+,;=%])+", re.IGNORECASE)
 _ALLOWED_SCHEMES = {"http", "https"}
 _T = TypeVar("_T")
 _CONFIG_CACHE: dict[str, dict[str, str]] = {}
-# Use the bundled PSL snapshot with no disk cache so domain parsing stays
-# deterministic in sandboxes and CI without touching user cache directories.
-_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+_URL_ANALYSIS_CACHE_SIZE = read_env_int("DATAPULSE_URL_CACHE_SIZE", 4096, min_value=16)
 
 
 def _default_datapulse_storage_dir() -> Path:
@@ -87,7 +92,7 @@ def validate_external_url(url: str) -> tuple[bool, str]:
     try:
         addrs = {a[4][0] for a in socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP) if a[4]}
     except socket.gaierror as exc:
-        ext = _TLD_EXTRACT(host)
+        ext = _tld_extractor()(host)
         if ext.domain and ext.suffix:
             return True, ""
         return False, f"DNS resolution failed: {exc}"
@@ -144,31 +149,29 @@ def _is_tag_character(char: str) -> bool:
 
 
 def _is_grapheme_extend(char: str) -> bool:
-    return any([
-        unicodedata.combining(char) != 0,
-        unicodedata.category(char) in {"Mn", "Mc", "Me"},
-        _is_variation_selector(char),
-        _is_emoji_modifier(char),
-        _is_tag_character(char),
-        char == "\u200d",
-    ])
-
-
-def split_graphemes(text: str) -> list[str]:
-    """Split text into deterministic grapheme-like clusters for truncation."""
-    if not text:
-        return []
-
-    clusters: list[str] = []
+    if ord(char) < 0x300:  # nothing below the combining diacritics block extends a cluster
+        return False
+    return (
+        unicodedata.combining(char) != 0
+        or unicodedata.category(char) in {"Mn", "Mc", "Me"}
+        or _is_variation_selector(char)
+        or _is_emoji_modifier(char)
+        or _is_tag_character(char)
+        or char == "\u200d"
+    )
+
+
+def iter_graphemes(text: str) -> Iterator[str]:
+    """Yield deterministic grapheme-like clusters lazily, so callers can stop early."""
     index = 0
-    length = len(text)
+    length = len(text or "")
 
     while index < length:
         cluster = text[index]
         index += 1
 
         if cluster == "\r" and index < length and text[index] == "\n":
-            clusters.append("\r\n")
+            yield "\r\n"
             index += 1
             continue
 
@@ -188,9 +191,12 @@ def split_graphemes(text: str) -> list[str]:
                 continue
             break
 
-        clusters.append(cluster)
+        yield cluster
 
-    return clusters
+
+def split_graphemes(text: str) -> list[str]:
+    """Split text into deterministic grapheme-like clusters for truncation."""
+    return list(iter_graphemes(text))
 
 
 def truncate_graphemes(
@@ -204,7 +210,8 @@ def truncate_graphemes(
     if max_length <= 0:
         return ellipsis if text else ""
 
-    clusters = split_graphemes(text)
+    # Only the first max_length + 1 clusters matter; never walk the rest of a long text.
+    clusters = list(islice(iter_graphemes(text), max_length + 1))
     if len(clusters) <= max_length:
         return text
 
@@ -247,23 +254,89 @@ def build_filename(text: str, url: str) -> str:
     return f"{date_prefix}_{generate_slug(text)[:40]}.{hashlib.sha1(url.encode()).hexdigest()[:10]}.md"
 
 
-def get_domain(url: str) -> str:
-    parsed = urlparse(url)
-    host = (parsed.hostname or "").lower()
+@dataclass(frozen=True)
+class UrlAnalysis:
+    """Host-level facts derived from one URL, resolved together and cached."""
+
+    netloc: str
+    host: str
+    domain: str
+    domain_tag: str
+    platform_hint: str
+
+
+def analyze_url(url: str) -> UrlAnalysis:
+    """Parse a URL once and return host, registered domain, domain tag and platform hint.
+
+    The per-URL parse is cheap and stays uncached; public-suffix resolution is
+    memoized per host in a bounded LRU, so every URL on a known host reuses it.
+    See ``url_analysis_cache_stats`` for hit-rate tuning.
+    """
+    try:
+        parsed = urlparse(url)
+        netloc = str(parsed.netloc or "").strip().lower()
+        host = (parsed.hostname or "").lower()
+        platform_hint = _platform_hint(url)
+    except ValueError:
+        return UrlAnalysis(netloc="", host="", domain="unknown", domain_tag="unknown", platform_hint="generic")
+    domain = _host_domain(host)
+    return UrlAnalysis(
+        netloc=netloc,
+        host=host,
+        domain=domain,
+        domain_tag=domain.replace(".", "_"),
+        platform_hint=platform_hint,
+    )
+
+
+def url_analysis_cache_stats() -> dict[str, float | int | None]:
+    """Return hit/miss counters for the per-host domain LRU behind ``analyze_url``."""
+    info = _host_domain.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxsize": info.maxsize,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else None,
+    }
+
+
+def clear_url_analysis_cache() -> None:
+    _host_domain.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _tld_extractor() -> tldextract.TLDExtract:
+    # Use the bundled PSL snapshot with no disk cache so domain parsing stays
+    # deterministic in sandboxes and CI without touching user cache directories.
+    # Built on first use: loading tldextract and its PSL snapshot is a large share
+    # of cold-start time for commands that never look at a domain.
+    import tldextract
+
+    return tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+
+@lru_cache(maxsize=_URL_ANALYSIS_CACHE_SIZE)
+def _host_domain(host: str) -> str:
     if not host:
         return "unknown"
     try:
         _ = ipaddress.ip_address(host)
         return host
     except ValueError:
-        ext = _TLD_EXTRACT(url)
+        ext = _tld_extractor()(host)
         if ext.domain and ext.suffix:
             return f"{ext.domain}.{ext.suffix}".lower()
         return host
 
 
+def get_domain(url: str) -> str:
+    return analyze_url(url).domain
+
+
 def get_domain_tag(url: str) -> str:
-    return get_domain(url).replace(".", "_")
+    return analyze_url(url).domain_tag
 
 
 def content_hash(content: str) -> str:
@@ -362,6 +435,10 @@ def is_trending_url(url: str) -> bool:
 
 
 def resolve_platform_hint(url: str) -> str:
+    return analyze_url(url).platform_hint
+
+
+def _platform_hint(url: str) -> str:
     if is_twitter_url(url):
         return "twitter"
     if is_reddit_url(url):
@@ -419,6 +496,15 @@ def watchlist_path_from_env() -> str:
     return _default_datapulse_storage_path("datapulse_watchlist.json")
 
 
+def run_history_dir_from_env(watchlist_path: str | None = None) -> str:
+    explicit_dir = os.getenv("DATAPULSE_RUN_HISTORY_DIR", "").strip()
+    if explicit_dir:
+        return explicit_dir
+
+    watchlist = Path(watchlist_path or watchlist_path_from_env()).expanduser()
+    return str(watchlist.with_name(f"{watchlist.stem}_runs"))
+
+
 def alerts_path_from_env() -> str:
     explicit_file = os.getenv("DATAPULSE_ALERTS_PATH", "").strip()
     if explicit_file:
@@ -539,6 +625,66 @@ def reports_path_from_env() -> str:
     return _default_datapulse_storage_path("datapulse_reports.json")
 
 
+def telegram_cursors_path_from_env() -> str:
+    explicit_file = os.getenv("DATAPULSE_TG_CURSOR_PATH", "").strip()
+    if explicit_file:
+        return explicit_file
+
+    memory_path = os.getenv("DATAPULSE_MEMORY_DIR", "").strip()
+    if memory_path:
+        candidate = Path(memory_path)
+        if candidate.suffix == ".json":
+            return str(candidate.with_name("datapulse_telegram_cursors.json"))
+        return str(candidate / "datapulse_telegram_cursors.json")
+
+    return _default_datapulse_storage_path("datapulse_telegram_cursors.json")
+
+
+def github_repo_cache_path_from_env() -> str:
+    explicit_file = os.getenv("DATAPULSE_GITHUB_CACHE_PATH", "").strip()
+    if explicit_file:
+        return explicit_file
+
+    memory_path = os.getenv("DATAPULSE_MEMORY_DIR", "").strip()
+    if memory_path:
+        candidate = Path(memory_path)
+        if candidate.suffix == ".json":
+            return str(candidate.with_name("datapulse_github_repos.json"))
+        return str(candidate / "datapulse_github_repos.json")
+
+    return _default_datapulse_storage_path("datapulse_github_repos.json")
+
+
+def media_cache_dir_from_env() -> str:
+    explicit_dir = os.getenv("DATAPULSE_MEDIA_CACHE_DIR", "").strip()
+    if explicit_dir:
+        return explicit_dir
+
+    memory_path = os.getenv("DATAPULSE_MEMORY_DIR", "").strip()
+    if memory_path:
+        candidate = Path(memory_path)
+        if candidate.suffix == ".json":
+            return str(candidate.with_name("datapulse_media_cache"))
+        return str(candidate / "datapulse_media_cache")
+
+    return _default_datapulse_storage_path("datapulse_media_cache")
+
+
+def youtube_cache_dir_from_env() -> str:
+    explicit_dir = os.getenv("DATAPULSE_YOUTUBE_CACHE_DIR", "").strip()
+    if explicit_dir:
+        return explicit_dir
+
+    memory_path = os.getenv("DATAPULSE_MEMORY_DIR", "").strip()
+    if memory_path:
+        candidate = Path(memory_path)
+        if candidate.suffix == ".json":
+            return str(candidate.with_name("datapulse_youtube_cache"))
+        return str(candidate / "datapulse_youtube_cache")
+
+    return _default_datapulse_storage_path("datapulse_youtube_cache")
+
+
 def output_path_from_env():
     vault = os.getenv("OBSIDIAN_VAULT", "").strip()
     if vault:
@@ -578,6 +724,67 @@ def run_sync(coro: Awaitable[_T]) -> _T:
     return result_holder[0]
 
 
+class BackgroundLoop:
+    """One event loop on a daemon thread, for async clients that must outlive a single ``run_sync`` call.
+
+    Connections (browsers, Telethon clients) are bound to the loop that created
+    them; ``run_sync`` spins up a fresh loop per call, so anything pooled across
+    calls lives here instead and sync callers on any thread block on ``call``.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self.running:
+                return self._loop
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _serve() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=_serve, name=self.name, daemon=True)
+            thread.start()
+            ready.wait()
+            self._loop, self._thread = loop, thread
+            return loop
+
+    def call(self, coro_factory: Callable[[], Coroutine[Any, Any, _T]], *, timeout: float | None = None) -> _T:
+        """Run ``coro_factory()`` on the loop and block the calling thread for its result."""
+        future: Future[_T] = asyncio.run_coroutine_threadsafe(coro_factory(), self.loop())
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError(f"{self.name} call exceeded {timeout:.0f}s") from None
+
+    def stop(self, shutdown: Callable[[], Coroutine[Any, Any, object]] | None = None, *, timeout: float = 10.0) -> None:
+        """Optionally run ``shutdown()`` on the loop, then stop and join the thread; no-op when never started."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        if shutdown is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout=timeout)
+            except Exception:  # noqa: BLE001 - best effort at shutdown
+                pass
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=timeout)
+
+
 def load_local_context_map(context_env_key: str) -> dict[str, str]:
     """Load a local JSON context map and cache it per env key.
 
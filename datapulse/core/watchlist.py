@@ -9,6 +9,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from datapulse.collectors.base import read_scope
+
+from .filestore import ReloadableStore
+from .run_history import RECENT_RUN_LIMIT, RunHistoryStore
+from .telemetry import traced
 from .utils import content_fingerprint, generate_slug, watchlist_path_from_env
 
 
@@ -511,7 +516,7 @@ class WatchMission:
                     normalized_runs.append(MissionRun.from_dict(run_raw))
                 except (TypeError, ValueError):
                     continue
-        self.runs = normalized_runs[:10]
+        self.runs = normalized_runs[:RECENT_RUN_LIMIT]
         try:
             self.last_run_count = max(0, int(self.last_run_count))
         except Exception:
@@ -556,16 +561,52 @@ class WatchMission:
         return cls(**payload)
 
 
-class WatchlistStore:
-    """File-backed storage for recurring watch missions."""
+_RUN_STATE_FIELDS = ("runs", "last_run_at", "last_run_count", "last_run_status", "last_run_error")
+
+
+class WatchlistStore(ReloadableStore):
+    """File-backed storage for recurring watch missions.
+
+    The watchlist file holds mission configuration only; runs are appended to a
+    :class:`RunHistoryStore` and ``runs`` / ``last_run_*`` are hydrated from it.
+    """
 
-    def __init__(self, path: str | None = None):
+    def __init__(self, path: str | None = None, *, history: RunHistoryStore | None = None):
         self.path = Path(path or watchlist_path_from_env()).expanduser()
+        self.history = history or RunHistoryStore(watchlist_path=str(self.path))
         self.version = 1
         self.missions: dict[str, WatchMission] = {}
         self._load()
 
+    def has_changed(self) -> bool:
+        return super().has_changed() or self.history.has_changed()
+
+    def reload_if_changed(self) -> bool:
+        if super().has_changed():
+            self._load()
+            return True
+        if self.history.reload_if_changed():
+            self._hydrate_runs()
+            return True
+        return False
+
+    def _hydrate_runs(self) -> None:
+        for mission in self.missions.values():
+            recent = self.history.recent_runs(mission.id)
+            if not recent:
+                continue
+            mission.runs = [MissionRun.from_dict(row) for row in recent]
+            latest = mission.runs[0]
+            mission.last_run_at = latest.finished_at or latest.started_at
+            mission.last_run_count = latest.item_count
+            mission.last_run_status = latest.status
+            mission.last_run_error = latest.error
+            if mission.last_run_at > mission.updated_at:
+                mission.updated_at = mission.last_run_at
+
     def _load(self) -> None:
+        self._mark_loaded()
+        self.history.reload_if_changed()
         if not self.path.exists():
             self.missions = {}
             return
@@ -594,15 +635,25 @@ class WatchlistStore:
             except (TypeError, ValueError):
                 continue
             loaded[mission.id] = mission
+            if mission.runs:
+                self.history.import_runs(mission.id, [run.to_dict() for run in mission.runs])
         self.missions = loaded
+        self._hydrate_runs()
+
+    def _config_row(self, mission: WatchMission) -> dict[str, Any]:
+        row = mission.to_dict()
+        row.pop("runs", None)
+        if mission.id in self.history.missions:
+            for key in _RUN_STATE_FIELDS:
+                row.pop(key, None)
+        return row
 
     def save(self) -> None:
         payload = {
             "version": self.version,
-            "missions": [mission.to_dict() for mission in self.list_missions(include_disabled=True)],
+            "missions": [self._config_row(mission) for mission in self.list_missions(include_disabled=True)],
         }
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._write_json(payload)
 
     def list_missions(self, *, include_disabled: bool = False) -> list[WatchMission]:
         missions = list(self.missions.values())
@@ -688,11 +739,12 @@ class WatchlistStore:
             alert_rules=list(alert_rules or []),
             enabled=enabled,
         )
-        mission.id = self._next_id(mission.id)
-        mission.updated_at = mission.created_at
-        self.missions[mission.id] = mission
-        self.save()
-        return mission
+        with self._transaction():
+            mission.id = self._next_id(mission.id)
+            mission.updated_at = mission.created_at
+            self.missions[mission.id] = mission
+            self.save()
+            return mission
 
     def update_mission(
         self,
@@ -712,74 +764,75 @@ class WatchlistStore:
         alert_rules: list[dict[str, Any]] | None = None,
         enabled: bool | None = None,
     ) -> WatchMission | None:
-        mission = self.get(identifier)
-        if mission is None:
-            return None
-        normalized_mission_intent = (
-            mission.mission_intent
-            if mission_intent is None
-            else mission_intent
-            if isinstance(mission_intent, MissionIntent)
-            else MissionIntent.from_dict(mission_intent)
-            if isinstance(mission_intent, dict)
-            else MissionIntent()
-        )
-        normalized_trend_inputs = list(mission.trend_inputs)
-        if trend_inputs is not None:
-            normalized_trend_inputs = []
-            for trend_raw in trend_inputs:
-                if isinstance(trend_raw, TrendFeedInput):
-                    trend_input = trend_raw
-                elif isinstance(trend_raw, dict):
-                    try:
-                        trend_input = TrendFeedInput.from_dict(trend_raw)
-                    except (TypeError, ValueError):
+        with self._transaction():
+            mission = self.get(identifier)
+            if mission is None:
+                return None
+            normalized_mission_intent = (
+                mission.mission_intent
+                if mission_intent is None
+                else mission_intent
+                if isinstance(mission_intent, MissionIntent)
+                else MissionIntent.from_dict(mission_intent)
+                if isinstance(mission_intent, dict)
+                else MissionIntent()
+            )
+            normalized_trend_inputs = list(mission.trend_inputs)
+            if trend_inputs is not None:
+                normalized_trend_inputs = []
+                for trend_raw in trend_inputs:
+                    if isinstance(trend_raw, TrendFeedInput):
+                        trend_input = trend_raw
+                    elif isinstance(trend_raw, dict):
+                        try:
+                            trend_input = TrendFeedInput.from_dict(trend_raw)
+                        except (TypeError, ValueError):
+                            continue
+                    else:
                         continue
-                else:
-                    continue
-                if trend_input.has_content():
-                    normalized_trend_inputs.append(trend_input)
-        normalized_market_context_sidecars = list(mission.market_context_sidecars)
-        if market_context_sidecars is not None:
-            normalized_market_context_sidecars = []
-            for sidecar_raw in market_context_sidecars:
-                if isinstance(sidecar_raw, MarketContextSidecar):
-                    sidecar = sidecar_raw
-                elif isinstance(sidecar_raw, dict):
-                    try:
-                        sidecar = MarketContextSidecar.from_dict(sidecar_raw)
-                    except (TypeError, ValueError):
+                    if trend_input.has_content():
+                        normalized_trend_inputs.append(trend_input)
+            normalized_market_context_sidecars = list(mission.market_context_sidecars)
+            if market_context_sidecars is not None:
+                normalized_market_context_sidecars = []
+                for sidecar_raw in market_context_sidecars:
+                    if isinstance(sidecar_raw, MarketContextSidecar):
+                        sidecar = sidecar_raw
+                    elif isinstance(sidecar_raw, dict):
+                        try:
+                            sidecar = MarketContextSidecar.from_dict(sidecar_raw)
+                        except (TypeError, ValueError):
+                            continue
+                    else:
                         continue
-                else:
-                    continue
-                if sidecar.has_content():
-                    normalized_market_context_sidecars.append(sidecar)
-        updated = WatchMission(
-            id=mission.id,
-            name=mission.name if name is None else name,
-            query=mission.query if query is None else query,
-            mission_intent=normalized_mission_intent,
-            trend_inputs=normalized_trend_inputs,
-            market_context_sidecars=normalized_market_context_sidecars,
-            platforms=mission.platforms if platforms is None else list(platforms),
-            sites=mission.sites if sites is None else list(sites),
-            provider=mission.provider if provider is None else provider,
-            schedule=mission.schedule if schedule is None else schedule,
-            min_confidence=mission.min_confidence if min_confidence is None else min_confidence,
-            top_n=mission.top_n if top_n is None else top_n,
-            alert_rules=mission.alert_rules if alert_rules is None else list(alert_rules),
-            enabled=mission.enabled if enabled is None else enabled,
-            created_at=mission.created_at,
-            updated_at=_utcnow(),
-            last_run_at=mission.last_run_at,
-            last_run_count=mission.last_run_count,
-            last_run_status=mission.last_run_status,
-            last_run_error=mission.last_run_error,
-            runs=list(mission.runs),
-        )
-        self.missions[mission.id] = updated
-        self.save()
-        return updated
+                    if sidecar.has_content():
+                        normalized_market_context_sidecars.append(sidecar)
+            updated = WatchMission(
+                id=mission.id,
+                name=mission.name if name is None else name,
+                query=mission.query if query is None else query,
+                mission_intent=normalized_mission_intent,
+                trend_inputs=normalized_trend_inputs,
+                market_context_sidecars=normalized_market_context_sidecars,
+                platforms=mission.platforms if platforms is None else list(platforms),
+                sites=mission.sites if sites is None else list(sites),
+                provider=mission.provider if provider is None else provider,
+                schedule=mission.schedule if schedule is None else schedule,
+                min_confidence=mission.min_confidence if min_confidence is None else min_confidence,
+                top_n=mission.top_n if top_n is None else top_n,
+                alert_rules=mission.alert_rules if alert_rules is None else list(alert_rules),
+                enabled=mission.enabled if enabled is None else enabled,
+                created_at=mission.created_at,
+                updated_at=_utcnow(),
+                last_run_at=mission.last_run_at,
+                last_run_count=mission.last_run_count,
+                last_run_status=mission.last_run_status,
+                last_run_error=mission.last_run_error,
+                runs=list(mission.runs),
+            )
+            self.missions[mission.id] = updated
+            self.save()
+            return updated
 
     def get(self, identifier: str) -> WatchMission | None:
         key = str(identifier or "").strip()
@@ -794,58 +847,57 @@ class WatchlistStore:
         return None
 
     def disable(self, identifier: str) -> WatchMission | None:
-        mission = self.get(identifier)
-        if mission is None:
-            return None
-        mission.enabled = False
-        mission.updated_at = _utcnow()
-        self.save()
-        return mission
+        with self._transaction():
+            mission = self.get(identifier)
+            if mission is None:
+                return None
+            mission.enabled = False
+            mission.updated_at = _utcnow()
+            self.save()
+            return mission
 
     def enable(self, identifier: str) -> WatchMission | None:
-        mission = self.get(identifier)
-        if mission is None:
-            return None
-        mission.enabled = True
-        mission.updated_at = _utcnow()
-        self.save()
-        return mission
+        with self._transaction():
+            mission = self.get(identifier)
+            if mission is None:
+                return None
+            mission.enabled = True
+            mission.updated_at = _utcnow()
+            self.save()
+            return mission
 
     def delete(self, identifier: str) -> WatchMission | None:
-        mission = self.get(identifier)
-        if mission is None:
-            return None
-        removed = self.missions.pop(mission.id, None)
-        if removed is None:
-            return None
-        self.save()
-        return removed
+        with self._transaction():
+            mission = self.get(identifier)
+            if mission is None:
+                return None
+            removed = self.missions.pop(mission.id, None)
+            if removed is None:
+                return None
+            self.save()
+            self.history.forget(removed.id)
+            return removed
 
     def replace_alert_rules(self, identifier: str, alert_rules: list[dict[str, Any]] | None) -> WatchMission | None:
-        mission = self.get(identifier)
-        if mission is None:
-            return None
-        mission.alert_rules = [
-            dict(rule)
-            for rule in list(alert_rules or [])
-            if isinstance(rule, dict)
-        ]
-        mission.updated_at = _utcnow()
-        self.save()
-        return mission
+        with self._transaction():
+            mission = self.get(identifier)
+            if mission is None:
+                return None
+            mission.alert_rules = [
+                dict(rule)
+                for rule in list(alert_rules or [])
+                if isinstance(rule, dict)
+            ]
+            mission.updated_at = _utcnow()
+            self.save()
+            return mission
 
     def record_run(self, identifier: str, run: MissionRun) -> WatchMission | None:
         mission = self.get(identifier)
         if mission is None:
             return None
-        mission.last_run_at = run.finished_at or run.started_at
-        mission.last_run_count = run.item_count
-        mission.last_run_status = run.status
-        mission.last_run_error = run.error
-        mission.updated_at = mission.last_run_at or _utcnow()
-        mission.runs.insert(0, run)
-        mission.runs = mission.runs[:10]
-        self.save()
+        self.history.append({**run.to_dict(), "mission_id": mission.id})
+        self._hydrate_runs()
         return mission
 
 
@@ -857,6 +909,14 @@ class WatchService:
         self.watchlist = watchlist
         self.scheduler = scheduler
 
+    def _record_run(self, mission: WatchMission, run: MissionRun) -> WatchMission:
+        base_generation = self.watchlist.history.generation
+        updated = self.watchlist.record_run(mission.id, run)
+        metrics = getattr(self.owner, "ops_metrics", None)
+        if updated is not None and metrics is not None:
+            metrics.record_run(updated, base_generation=base_generation)
+        return updated or mission
+
     def create_watch(
         self,
         *,
@@ -1001,6 +1061,10 @@ class WatchService:
             "last_alert_at": recent_alerts[0].get("created_at", "") if recent_alerts else "",
         }
         payload["timeline_strip"] = self.owner._build_watch_timeline_strip(mission, payload["recent_results"], recent_alerts)
+        payload["run_timeline"] = {
+            "hourly": self.watchlist.history.rollups(mission.id, granularity="hourly", limit=24),
+            "daily": self.watchlist.history.rollups(mission.id, granularity="daily", limit=14),
+        }
         return payload
 
     def disable_watch(self, identifier: str) -> dict[str, Any] | None:
@@ -1015,6 +1079,7 @@ class WatchService:
         mission = self.watchlist.delete(identifier)
         return mission.to_dict() if mission is not None else None
 
+    @traced("watch.run")
     async def run_watch(self, identifier: str, *, trigger: str = "manual") -> dict[str, Any]:
         mission = self.watchlist.get(identifier)
         if mission is None:
@@ -1025,56 +1090,57 @@ class WatchService:
         started_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
         effective_provider = mission.provider if mission.provider in {"auto", "jina", "multi"} else "auto"
         try:
-            if mission.platforms:
-                batches = await asyncio.gather(
-                    *[
-                        self.owner.search(
-                            mission.query,
-                            sites=mission.sites or None,
-                            platform=platform,
-                            limit=mission.top_n,
-                            min_confidence=mission.min_confidence,
-                            provider=effective_provider,
-                        )
-                        for platform in mission.platforms
-                    ]
-                )
-                merged: dict[str, Any] = {}
-                platform_hits: dict[str, set[str]] = {}
-                fp_platform_hits: dict[str, set[str]] = {}
-                item_fp: dict[str, str] = {}
-                for platform, batch in zip(mission.platforms, batches):
-                    for item in batch:
-                        merged.setdefault(item.id, item)
-                        platform_hits.setdefault(item.id, set()).add(platform)
-                        fp = content_fingerprint(getattr(item, "content", "") or "")
-                        item_fp[item.id] = fp
-                        fp_platform_hits.setdefault(fp, set()).add(platform)
-                for item_id, item in merged.items():
-                    platforms_for_item = platform_hits.get(item_id, set())
-                    fp_platforms = fp_platform_hits.get(item_fp.get(item_id, ""), set())
-                    corroborated = max(len(platforms_for_item), len(fp_platforms))
-                    if corroborated >= 2 and isinstance(getattr(item, "extra", None), dict):
-                        item.extra["corroboration_platforms"] = sorted(fp_platforms or platforms_for_item)
-                        item.extra["corroboration_count"] = corroborated
-                items = sorted(
-                    merged.values(),
-                    key=lambda item: (
-                        int((item.extra or {}).get("corroboration_count", 1)) if isinstance(getattr(item, "extra", None), dict) else 1,
-                        item.score,
-                        item.confidence,
-                        item.fetched_at,
-                    ),
-                    reverse=True,
-                )[: mission.top_n]
-            else:
-                items = await self.owner.search(
-                    mission.query,
-                    sites=mission.sites or None,
-                    limit=mission.top_n,
-                    min_confidence=mission.min_confidence,
-                    provider=effective_provider,
-                )
+            with read_scope(f"watch:{mission.id}"):
+                if mission.platforms:
+                    batches = await asyncio.gather(
+                        *[
+                            self.owner.search(
+                                mission.query,
+                                sites=mission.sites or None,
+                                platform=platform,
+                                limit=mission.top_n,
+                                min_confidence=mission.min_confidence,
+                                provider=effective_provider,
+                            )
+                            for platform in mission.platforms
+                        ]
+                    )
+                    merged: dict[str, Any] = {}
+                    platform_hits: dict[str, set[str]] = {}
+                    fp_platform_hits: dict[str, set[str]] = {}
+                    item_fp: dict[str, str] = {}
+                    for platform, batch in zip(mission.platforms, batches):
+                        for item in batch:
+                            merged.setdefault(item.id, item)
+                            platform_hits.setdefault(item.id, set()).add(platform)
+                            fp = content_fingerprint(getattr(item, "content", "") or "")
+                            item_fp[item.id] = fp
+                            fp_platform_hits.setdefault(fp, set()).add(platform)
+                    for item_id, item in merged.items():
+                        platforms_for_item = platform_hits.get(item_id, set())
+                        fp_platforms = fp_platform_hits.get(item_fp.get(item_id, ""), set())
+                        corroborated = max(len(platforms_for_item), len(fp_platforms))
+                        if corroborated >= 2 and isinstance(getattr(item, "extra", None), dict):
+                            item.extra["corroboration_platforms"] = sorted(fp_platforms or platforms_for_item)
+                            item.extra["corroboration_count"] = corroborated
+                    items = sorted(
+                        merged.values(),
+                        key=lambda item: (
+                            int((item.extra or {}).get("corroboration_count", 1)) if isinstance(getattr(item, "extra", None), dict) else 1,
+                            item.score,
+                            item.confidence,
+                            item.fetched_at,
+                        ),
+                        reverse=True,
+                    )[: mission.top_n]
+                else:
+                    items = await self.owner.search(
+                        mission.query,
+                        sites=mission.sites or None,
+                        limit=mission.top_n,
+                        min_confidence=mission.min_confidence,
+                        provider=effective_provider,
+                    )
 
             items = self.owner._filter_watch_results_by_query(mission, items)
             self.owner._tag_items_with_watch(mission, items)
@@ -1087,7 +1153,7 @@ class WatchService:
                 started_at=started_at,
                 finished_at=datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
             )
-            updated = self.watchlist.record_run(mission.id, run) or mission
+            updated = self._record_run(mission, run)
             return {
                 "mission": self.owner._serialize_watch_mission(updated),
                 "run": run.to_dict(),
@@ -1104,7 +1170,7 @@ class WatchService:
                 started_at=started_at,
                 finished_at=datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
             )
-            self.watchlist.record_run(mission.id, run)
+            self._record_run(mission, run)
             raise
 
     async def run_due_watches(
@@ -810,7 +810,7 @@ async def _run_entity_stats() -> str:
 
 async def _run_doctor() -> str:
     reader = DataPulseReader()
-    report = reader.doctor()
+    report = await reader.doctor_async()
     return json.dumps(report, ensure_ascii=False, indent=2)
 
 
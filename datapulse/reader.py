@@ -4,16 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import heapq
 import json
 import logging
 import os
 import re
 from datetime import datetime, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import Any, cast
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Iterator, cast
 
-from datapulse.collectors.trending import TrendingCollector, build_trending_url
 from datapulse.core.alerts import (
     AlertEvent,
     AlertRouteStore,
@@ -30,12 +30,14 @@ from datapulse.core.alerts import (
     validate_delivery_summary_payload,
 )
 from datapulse.core.confidence import compute_confidence
+from datapulse.core.cpu_pool import cpu_workers_from_env
 from datapulse.core.entities import Entity, Relation
 from datapulse.core.entities import extract_entities as extract_entities_text
 from datapulse.core.entity_store import EntityStore
-from datapulse.core.jina_client import JinaSearchOptions
+from datapulse.core.filestore import atomic_write_text
 from datapulse.core.models import DataPulseItem, SourceType
 from datapulse.core.ops import WatchStatusStore
+from datapulse.core.ops_metrics import OpsMetrics, coverage_observation_labels, normalize_scorecard_label
 from datapulse.core.report import (
     ReportService,
     ReportStore,
@@ -47,7 +49,6 @@ from datapulse.core.report import (
 from datapulse.core.router import ParsePipeline
 from datapulse.core.scheduler import WatchDaemon, WatchScheduler, describe_schedule, is_watch_due, next_run_at
 from datapulse.core.scoring import rank_items
-from datapulse.core.search_gateway import SearchGateway, SearchHit
 from datapulse.core.source_catalog import SourceCatalog
 from datapulse.core.storage import UnifiedInbox, output_record_md, project_markdown
 from datapulse.core.story import (
@@ -57,7 +58,11 @@ from datapulse.core.story import (
     build_story_evidence_intake,
     resolve_factuality_gate_status,
 )
+from datapulse.core.streaming import DEFAULT_STREAM_CHUNK_SIZE, iter_json_lines, iter_json_object, xml_escape
+from datapulse.core.telemetry import traced
 from datapulse.core.triage import (
+    OPEN_REVIEW_STATES,
+    TERMINAL_REVIEW_STATES,
     TriageQueue,
     TriageService,
     build_triage_assist_payload,
@@ -66,7 +71,7 @@ from datapulse.core.triage import (
     serialize_item_with_governance,
     validate_triage_assist_payload,
 )
-from datapulse.core.utils import content_fingerprint, inbox_path_from_env, normalize_language
+from datapulse.core.utils import analyze_url, content_fingerprint, inbox_path_from_env, normalize_language
 from datapulse.core.watchlist import (
     MarketContextSidecar,
     MissionIntent,
@@ -95,6 +100,10 @@ from datapulse.governance_paths import (
     root_candidate_entries as resolve_root_candidate_entries,
 )
 
+if TYPE_CHECKING:
+    from datapulse.core.jina_client import JinaAPIClient
+    from datapulse.core.search_gateway import SearchGateway, SearchHit
+
 logger = logging.getLogger("datapulse.reader")
 
 
@@ -102,10 +111,31 @@ def _utcnow_z() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+def _normalize_stream_format(value: str) -> str:
+    normalized = str(value or "json").strip().lower() or "json"
+    if normalized in {"ndjson", "jsonlines"}:
+        normalized = "jsonl"
+    if normalized not in {"json", "jsonl"}:
+        raise ValueError(f"Unsupported stream format: {value}")
+    return normalized
+
+
 def _utc_today() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
 
+def _fetched_since(items: Iterator[DataPulseItem], since_dt: datetime) -> Iterator[DataPulseItem]:
+    """Drop items fetched before ``since_dt``; items with unparseable timestamps are kept."""
+    for item in items:
+        try:
+            ts = datetime.fromisoformat(item.fetched_at)
+        except Exception:
+            yield item
+            continue
+        if ts >= since_dt:
+            yield item
+
+
 def _parse_timestamp(value: Any) -> datetime | None:
     text = str(value or "").strip()
     if not text:
@@ -232,7 +262,7 @@ class ReaderAIService:
         explain_payload = self.owner.triage.explain_duplicate(item_id, limit=limit)
         if explain_payload is None:
             return None
-        item = next((candidate for candidate in self.owner.inbox.items if candidate.id == item_id), None)
+        item = self.owner.inbox.get(item_id)
         if item is None:
             return None
         precheck = self.ai_surface_precheck("triage_assist", mode=mode)
@@ -619,14 +649,20 @@ class DataPulseReader:
         self.catalog = SourceCatalog()
         self.watchlist = WatchlistStore()
         self.watch_scheduler = WatchScheduler(self.watchlist)
-        self.triage = TriageQueue(self.inbox)
         self.story_store = StoryStore()
         self.report_store = ReportStore()
         self.alert_store = AlertStore()
         self.alert_routes = AlertRouteStore()
         self.watch_status = WatchStatusStore()
-        self._search_gateway = SearchGateway()
-        self._jina_client = self._search_gateway._jina_client
+        self.ops_metrics = OpsMetrics(
+            self.watch_status,
+            inbox=self.inbox,
+            watchlist=self.watchlist,
+            alert_store=self.alert_store,
+            alert_routes=self.alert_routes,
+            story_store=self.story_store,
+        )
+        self.triage = TriageQueue(self.inbox, metrics=self.ops_metrics)
         self._entity_store: EntityStore | None = None
         self.watch_service = WatchService(self, watchlist=self.watchlist, scheduler=self.watch_scheduler)
         self.triage_service = TriageService(triage=self.triage)
@@ -640,12 +676,39 @@ class DataPulseReader:
         )
         self.ai_service = ReaderAIService(self)
 
+    @cached_property
+    def _search_gateway(self) -> SearchGateway:
+        # Built on first search so requests and the provider stack stay off the cold-start path.
+        from datapulse.core.search_gateway import SearchGateway
+
+        return SearchGateway()
+
+    @cached_property
+    def _jina_client(self) -> JinaAPIClient:
+        return self._search_gateway._jina_client
+
     @property
     def entity_store(self) -> EntityStore:
         if self._entity_store is None:
             self._entity_store = EntityStore()
         return self._entity_store
 
+    def refresh_stores(self) -> list[str]:
+        """Reload stores another process has written since they were loaded; returns their names."""
+        stores: dict[str, Any] = {
+            "inbox": self.inbox,
+            "catalog": self.catalog,
+            "watchlist": self.watchlist,
+            "stories": self.story_store,
+            "reports": self.report_store,
+            "alerts": self.alert_store,
+            "alert_routes": self.alert_routes,
+            "watch_status": self.watch_status,
+        }
+        if self._entity_store is not None:
+            stores["entities"] = self._entity_store
+        return [name for name, store in stores.items() if store.reload_if_changed()]
+
     @staticmethod
     def _normalize_ai_mode(mode: str | None) -> str:
         normalized = str(mode or "assist").strip().lower() or "assist"
@@ -791,9 +854,7 @@ class DataPulseReader:
             delivery_target_kind=default_delivery_target_kind,
             delivery_target_ref=default_delivery_target_ref,
         )
-        path = self._digest_profile_path()
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(profile, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        atomic_write_text(self._digest_profile_path(), json.dumps(profile, ensure_ascii=False, indent=2) + "\n")
         return self.get_digest_profile()
 
     def _resolve_digest_profile(
@@ -1843,6 +1904,7 @@ class DataPulseReader:
             "last_status": mission.last_run_status or "",
             "last_error": mission.last_run_error or "",
         }
+        payload["run_rollups"] = self.watchlist.history.summary(mission.id)
         return payload
 
     @staticmethod
@@ -2090,6 +2152,8 @@ class DataPulseReader:
         freshness: str | None = None,
         mission_intent: MissionIntent | dict[str, Any] | None = None,
     ) -> dict[str, Any]:
+        from datapulse.core.search_gateway import SearchGateway
+
         if isinstance(mission_intent, MissionIntent):
             normalized_intent = mission_intent
         elif isinstance(mission_intent, dict):
@@ -2108,7 +2172,7 @@ class DataPulseReader:
         cjk_terms = self._watch_query_cjk_terms(query)
         ascii_terms = self._watch_query_ascii_terms(query)
         core_terms = self._merge_unique_text(cjk_terms, ascii_terms)
-        has_cjk = SearchGateway._is_chinese_query(query)
+        has_cjk = SearchGateway._is_chinese_query(str(query or ""))
         has_ascii = bool(re.search(r"[a-z]", str(query or "").casefold()))
         locale = "mixed" if has_cjk and has_ascii else "zh" if has_cjk else "latin"
         intent_kind = self._classify_search_intent(query, normalized_intent)
@@ -2724,6 +2788,7 @@ class DataPulseReader:
                     "error_total": error_total,
                     "success_rate": success_rate,
                     "average_items": run_stats.get("average_items", 0.0),
+                    "run_rollups": payload.get("run_rollups", {}),
                 }
             )
 
@@ -2766,10 +2831,7 @@ class DataPulseReader:
 
     @staticmethod
     def _normalize_scorecard_label(value: Any) -> str:
-        text = str(value or "").strip().casefold()
-        if text.startswith("www."):
-            text = text[4:]
-        return text
+        return normalize_scorecard_label(value)
 
     @classmethod
     def _coverage_expectations(cls, mission: WatchMission) -> list[dict[str, str]]:
@@ -2797,32 +2859,7 @@ class DataPulseReader:
 
     @classmethod
     def _coverage_observation_labels(cls, item: DataPulseItem) -> set[str]:
-        labels: set[str] = set()
-        for raw in [item.source_name, item.source_type.value, item.parser, *item.tags]:
-            key = cls._normalize_scorecard_label(raw)
-            if key:
-                labels.add(key)
-        try:
-            domain = str(urlparse(str(item.url or "")).netloc or "").strip().lower()
-        except ValueError:
-            domain = ""
-        if domain.startswith("www."):
-            domain = domain[4:]
-        if domain:
-            labels.add(domain)
-        for raw in _normalize_string_list(item.extra.get("search_sources")):
-            key = cls._normalize_scorecard_label(raw)
-            if key:
-                labels.add(key)
-            try:
-                source_domain = str(urlparse(raw).netloc or "").strip().lower()
-            except ValueError:
-                source_domain = ""
-            if source_domain.startswith("www."):
-                source_domain = source_domain[4:]
-            if source_domain:
-                labels.add(source_domain)
-        return labels
+        return coverage_observation_labels(item)
 
     @classmethod
     def _coverage_target_hit(cls, target: str, observed_labels: set[str]) -> bool:
@@ -2834,22 +2871,16 @@ class DataPulseReader:
             return False
         return any(target in candidate or candidate in target for candidate in observed_labels)
 
+    @traced("governance.scorecard")
     def governance_scorecard_snapshot(self) -> dict[str, Any]:
+        """Scorecard signals computed from the materialized ops aggregates (no inbox/story/alert scans)."""
+        aggregates = self.ops_metrics.snapshot()
+        inbox_metrics = aggregates["inbox"]
+        mission_results = inbox_metrics.get("missions", {})
         enabled_missions = self.watchlist.list_missions(include_disabled=False)
         all_missions = self.watchlist.list_missions(include_disabled=True)
-        all_items = list(self.inbox.items)
-        all_stories = self.story_store.list_stories(limit=5000, min_items=1)
-        triage_stats = self.triage.stats()
-        enabled_mission_ids = {mission.id for mission in enabled_missions}
         now = datetime.now(timezone.utc)
 
-        mission_items: dict[str, list[DataPulseItem]] = {}
-        for item in all_items:
-            mission_id = str(item.extra.get("watch_mission_id", "") or "").strip()
-            if not mission_id:
-                continue
-            mission_items.setdefault(mission_id, []).append(item)
-
         coverage_expected_total = 0
         coverage_hit_total = 0
         missions_with_targets = 0
@@ -2861,9 +2892,7 @@ class DataPulseReader:
                 missions_without_targets += 1
                 continue
             missions_with_targets += 1
-            observed_labels: set[str] = set()
-            for item in mission_items.get(mission.id, []):
-                observed_labels.update(self._coverage_observation_labels(item))
+            observed_labels = set(mission_results.get(mission.id, {}).get("labels", []))
             for row in expected:
                 coverage_expected_total += 1
                 if self._coverage_target_hit(row["key"], observed_labels):
@@ -2919,12 +2948,8 @@ class DataPulseReader:
                     freshness_text_only_missions += 1
                 continue
             freshness_sla_missions += 1
-            latest_result = max(
-                mission_items.get(mission.id, []),
-                key=lambda item: (_parse_timestamp(item.fetched_at) or datetime.fromtimestamp(0, tz=timezone.utc)).timestamp(),
-                default=None,
-            )
-            latest_ts = _parse_timestamp(getattr(latest_result, "fetched_at", "")) if latest_result is not None else None
+            latest_result_at = str(mission_results.get(mission.id, {}).get("latest_result_at", "") or "")
+            latest_ts = _parse_timestamp(latest_result_at)
             if latest_ts is None:
                 missing_freshness_results += 1
                 stale_missions.append(
@@ -2937,7 +2962,6 @@ class DataPulseReader:
                     }
                 )
                 continue
-            assert latest_result is not None
             age_hours = round(max(0.0, (now - latest_ts).total_seconds() / 3600), 2)
             if age_hours <= max_age_hours:
                 fresh_missions += 1
@@ -2947,7 +2971,7 @@ class DataPulseReader:
                     "mission_id": mission.id,
                     "mission_name": mission.name,
                     "freshness_max_age_hours": max_age_hours,
-                    "latest_result_at": latest_result.fetched_at,
+                    "latest_result_at": latest_result_at,
                     "age_hours": age_hours,
                 }
             )
@@ -2982,19 +3006,13 @@ class DataPulseReader:
             stale_mission_detail=stale_missions[:8],
         )
 
-        successful_runs = sum(
-            1
-            for mission in enabled_missions
-            for run in mission.runs
-            if str(run.status or "").strip().lower() == "success"
+        run_counts = aggregates["runs"].get("successful_runs", {})
+        alert_counts = aggregates["alerts"].get("missions", {})
+        successful_runs = sum(int(run_counts.get(mission.id, 0) or 0) for mission in enabled_missions)
+        alert_count = sum(int(alert_counts.get(mission.id, 0) or 0) for mission in enabled_missions)
+        alerting_missions = sum(
+            1 for mission in enabled_missions if str(mission.id or "").strip() and alert_counts.get(mission.id)
         )
-        alert_events = [
-            event
-            for event in self.alert_store.events
-            if event.mission_id in enabled_mission_ids
-        ]
-        alert_count = len(alert_events)
-        alerting_missions = len({event.mission_id for event in alert_events if str(event.mission_id or "").strip()})
         alert_yield_rate = round(alert_count / successful_runs, 4) if successful_runs > 0 else None
         alert_yield_signal = self._scorecard_signal(
             signal_id="alert_yield",
@@ -3019,11 +3037,12 @@ class DataPulseReader:
             alerting_missions=alerting_missions,
         )
 
-        triage_total = int(triage_stats.get("total", 0) or 0)
-        triage_states = triage_stats.get("states", {}) if isinstance(triage_stats.get("states"), dict) else {}
+        triage_total = int(inbox_metrics.get("total", 0) or 0)
+        triage_states = inbox_metrics.get("states", {}) if isinstance(inbox_metrics.get("states"), dict) else {}
         new_items = int(triage_states.get("new", 0) or 0)
         triage_acted_on = max(0, triage_total - new_items)
-        triage_closed = int(triage_stats.get("closed_count", 0) or 0)
+        triage_closed = sum(int(count or 0) for state, count in triage_states.items() if state in TERMINAL_REVIEW_STATES)
+        triage_open = sum(int(count or 0) for state, count in triage_states.items() if state in OPEN_REVIEW_STATES)
         triage_rate = round(triage_acted_on / triage_total, 4) if triage_total > 0 else None
         closed_rate = round(triage_closed / triage_total, 4) if triage_total > 0 else None
         triage_signal = self._scorecard_signal(
@@ -3047,37 +3066,17 @@ class DataPulseReader:
             total_items=triage_total,
             acted_on_items=triage_acted_on,
             closed_items=triage_closed,
-            open_items=int(triage_stats.get("open_count", 0) or 0),
-            note_count=int(triage_stats.get("note_count", 0) or 0),
+            open_items=triage_open,
+            note_count=int(inbox_metrics.get("note_count", 0) or 0),
             closed_rate=closed_rate,
         )
 
-        story_item_ids = {
-            str(evidence.item_id or "").strip()
-            for story in all_stories
-            for evidence in [*story.primary_evidence, *story.secondary_evidence]
-            if str(evidence.item_id or "").strip()
-        }
-        delivery_ready_stories = 0
-        for story in all_stories:
-            governance = story.governance if isinstance(story.governance, dict) else {}
-            delivery_risk = governance.get("delivery_risk", {}) if isinstance(governance.get("delivery_risk"), dict) else {}
-            if str(delivery_risk.get("status", "") or "").strip().lower() == "ready":
-                delivery_ready_stories += 1
-        eligible_story_items = [
-            item
-            for item in all_items
-            if normalize_review_state(item.review_state, processed=item.processed) in {"triaged", "verified", "escalated"}
-        ]
-        eligible_story_item_ids = {
-            str(item.id or "").strip()
-            for item in eligible_story_items
-            if str(item.id or "").strip()
-        }
-        converted_story_items = len(eligible_story_item_ids & story_item_ids)
+        story_metrics = aggregates["stories"]
+        eligible_story_items = int(inbox_metrics.get("story_eligible_count", 0) or 0)
+        converted_story_items = int(story_metrics.get("converted_item_count", 0) or 0)
         story_conversion_rate = (
-            round(converted_story_items / len(eligible_story_item_ids), 4)
-            if eligible_story_item_ids
+            round(converted_story_items / eligible_story_items, 4)
+            if eligible_story_items
             else None
         )
         story_signal = self._scorecard_signal(
@@ -3085,7 +3084,7 @@ class DataPulseReader:
             label="Story Conversion",
             status=(
                 "missing"
-                if not eligible_story_item_ids
+                if not eligible_story_items
                 else "ok"
                 if (story_conversion_rate or 0.0) >= 0.4
                 else "watch"
@@ -3094,13 +3093,13 @@ class DataPulseReader:
             unit="conversion_ratio",
             display=(
                 "No triaged item is ready for story conversion yet."
-                if not eligible_story_item_ids
-                else f"{converted_story_items}/{len(eligible_story_item_ids)} triaged items referenced by stories"
+                if not eligible_story_items
+                else f"{converted_story_items}/{eligible_story_items} triaged items referenced by stories"
             ),
             detail="Tracks how much reviewed evidence is already represented in persisted story objects.",
-            story_count=len(all_stories),
-            ready_story_count=delivery_ready_stories,
-            eligible_item_count=len(eligible_story_item_ids),
+            story_count=int(story_metrics.get("story_count", 0) or 0),
+            ready_story_count=int(story_metrics.get("ready_story_count", 0) or 0),
+            eligible_item_count=eligible_story_items,
             converted_item_count=converted_story_items,
         )
 
@@ -3125,8 +3124,8 @@ class DataPulseReader:
                 "total": len(all_missions),
                 "enabled": len(enabled_missions),
                 "disabled": max(0, len(all_missions) - len(enabled_missions)),
-                "items": len(all_items),
-                "stories": len(all_stories),
+                "items": triage_total,
+                "stories": int(story_metrics.get("story_count", 0) or 0),
             },
             "signals": signals,
             "summary": {
@@ -3145,6 +3144,9 @@ class DataPulseReader:
         limit: int = 5,
     ) -> tuple[list[SearchHit], dict[str, Any]]:
         """Run Jina search through the reader's injected client for testable behavior."""
+        from datapulse.core.jina_client import JinaSearchOptions
+        from datapulse.core.search_gateway import SearchHit
+
         opts = JinaSearchOptions(sites=sites or [], limit=max(1, int(limit)))
         raw_hits = self._jina_client.search(query, options=opts)
 
@@ -3204,6 +3206,7 @@ class DataPulseReader:
             or "authentication" in message
         )
 
+    @traced("reader.read")
     async def read(
         self,
         url: str,
@@ -3313,10 +3316,12 @@ class DataPulseReader:
                 )
             )
 
+        base_generation = self.inbox.generation
         if self.inbox.add(item):
             projection = project_markdown(item)
             item.extra["markdown_projection"] = projection.to_dict()
             self.inbox.save()
+            self.ops_metrics.record_items_added([item], base_generation=base_generation)
             if projection.primary_path:
                 logger.info("Projected markdown: %s", projection.primary_path)
             if projection.status == "degraded":
@@ -3329,6 +3334,7 @@ class DataPulseReader:
             logger.info("Item already exists in inbox: %s", item.id)
         return item
 
+    @traced("reader.read_batch")
     async def read_batch(
         self,
         urls: list[str],
@@ -3351,7 +3357,9 @@ class DataPulseReader:
             if normalized and normalized not in seen:
                 seen.add(normalized)
                 unique_urls.append(url.strip())
-        max_concurrency = int(os.getenv("DATAPULSE_BATCH_CONCURRENCY", "5"))
+        # With an extraction pool, keep enough fetches in flight to feed every worker process.
+        default_concurrency = max(5, cpu_workers_from_env() * 2)
+        max_concurrency = int(os.getenv("DATAPULSE_BATCH_CONCURRENCY", str(default_concurrency)))
         semaphore = asyncio.Semaphore(max_concurrency)
         if store is not None:
             logger.debug(
@@ -3457,6 +3465,7 @@ class DataPulseReader:
         elif "relations" in item.extra:
             item.extra.pop("relations")
 
+    @traced("reader.search")
     async def search(
         self,
         query: str,
@@ -3777,12 +3786,11 @@ class DataPulseReader:
             items.append(item)
 
         # Batch add to inbox + single save
-        added_any = False
-        for item in items:
-            if self.inbox.add(item):
-                added_any = True
-        if added_any:
+        base_generation = self.inbox.generation
+        added = [item for item in items if self.inbox.add(item)]
+        if added:
             self.inbox.save()
+            self.ops_metrics.record_items_added(added, base_generation=base_generation)
 
         # Score and rank
         authority_map = self.catalog.build_authority_map()
@@ -3803,6 +3811,12 @@ class DataPulseReader:
         Returns structured data with the latest snapshot.
         store=True saves the snapshot as a DataPulseItem to inbox (opt-in).
         """
+        from datapulse.collectors.trending import (
+            TrendingCollector,
+            build_trending_url,
+            trending_history_from_env,
+        )
+
         collector = TrendingCollector()
         requested_location = location.strip().lower() if location else "worldwide"
         resolved_location = requested_location
@@ -3875,6 +3889,9 @@ class DataPulseReader:
         }
         if fallback_reason:
             result["fallback_reason"] = fallback_reason
+        history = trending_history_from_env()
+        if history is not None:
+            result["deltas"] = history.deltas(loc_slug)
 
         if validate is None:
             validate = os.getenv("DATAPULSE_TRENDING_CROSS_VALIDATE", "0").strip().lower() in {
@@ -3895,8 +3912,10 @@ class DataPulseReader:
             parse_result = collector.parse(url)
             if parse_result.success:
                 item = self._to_item(parse_result, collector.name)
+                base_generation = self.inbox.generation
                 if self.inbox.add(item):
                     self.inbox.save()
+                    self.ops_metrics.record_items_added([item], base_generation=base_generation)
                 result["stored_item_id"] = item.id
 
         return result
@@ -3907,6 +3926,8 @@ class DataPulseReader:
         *,
         label: str = "",
     ) -> TrendFeedInput | None:
+        from datapulse.collectors.trending import build_trending_url
+
         if not isinstance(payload, dict):
             return None
         trends = payload.get("trends", [])
@@ -4878,6 +4899,7 @@ class DataPulseReader:
             },
         )
 
+    @traced("delivery.route_dispatch")
     def _dispatch_route_delivery_payload(
         self,
         route_target: dict[str, Any],
@@ -4968,12 +4990,13 @@ class DataPulseReader:
         raise ValueError(f"unsupported route delivery channel: {channel}")
 
     def _persist_delivery_dispatch_governance(self, record_id: str, governance: dict[str, Any]) -> None:
-        record = self.report_store.get_delivery_dispatch_record(record_id)
-        if record is None:
-            return
-        record.governance = dict(governance or {})
-        self.report_store._touch(record)
-        self.report_store.save()
+        with self.report_store._transaction():
+            record = self.report_store.get_delivery_dispatch_record(record_id)
+            if record is None:
+                return
+            record.governance = dict(governance or {})
+            self.report_store._touch(record)
+            self.report_store.save("delivery_dispatch_records")
 
     def build_report_delivery_package(
         self,
@@ -5285,18 +5308,23 @@ class DataPulseReader:
             score=0,
         )
 
-    def doctor(self) -> dict[str, list[dict[str, str | bool]]]:
-        """Run health checks on all collectors, grouped by tier."""
-        return self.router.doctor()
+    def doctor(self, *, fresh: bool = False) -> dict[str, list[dict[str, str | bool | float]]]:
+        """Run health checks on all collectors, grouped by tier (cached unless ``fresh``)."""
+        return self.router.doctor(fresh=fresh)
 
-    async def doctor_async(self) -> dict[str, list[dict[str, str | bool]]]:
-        """Async wrapper for doctor() in coroutine contexts."""
-        return await asyncio.to_thread(self.doctor)
+    async def doctor_async(self, *, fresh: bool = False) -> dict[str, list[dict[str, str | bool | float]]]:
+        """Async doctor(): cold collector probes run concurrently."""
+        return await self.router.doctor_async(fresh=fresh)
 
     def mark_processed(self, item_id: str, processed: bool = True) -> bool:
+        item = self.inbox.get(item_id)
+        previous_state = normalize_review_state(item.review_state, processed=item.processed) if item else ""
+        base_generation = self.inbox.generation
         ok = self.inbox.mark_processed(item_id, processed=processed)
         if ok:
             self.inbox.save()
+            if item is not None:
+                self.ops_metrics.record_review_change(item, previous_state, base_generation=base_generation)
         return ok
 
     def query_unprocessed(self, limit: int = 20, min_confidence: float = 0.0) -> list[DataPulseItem]:
@@ -5619,13 +5647,8 @@ class DataPulseReader:
         min_confidence: float = 0.0,
         apply_query_filter: bool = True,
     ) -> list[DataPulseItem]:
-        matched = [
-            item
-            for item in self.inbox.all_items(min_confidence=min_confidence)
-            if str(item.extra.get("watch_mission_id", "")).strip() == mission.id
-        ]
         ordered = sorted(
-            matched,
+            self.inbox.mission_items(mission.id, min_confidence=min_confidence),
             key=lambda item: (
                 (_parse_timestamp(item.fetched_at) or datetime.fromtimestamp(0, tz=timezone.utc)).timestamp(),
                 item.score,
@@ -5642,10 +5665,7 @@ class DataPulseReader:
         state = str(getattr(item, "review_state", "") or "new").strip().lower() or "new"
         source_label = str(item.source_name or getattr(item.source_type, "value", "") or "unknown").strip() or "unknown"
         source_key = source_label.casefold() or "unknown"
-        try:
-            domain = str(urlparse(str(item.url or "")).netloc or "").strip().lower()
-        except ValueError:
-            domain = ""
+        domain = analyze_url(str(item.url or "")).netloc
         if domain.startswith("www."):
             domain = domain[4:]
         return {
@@ -5811,7 +5831,12 @@ class DataPulseReader:
             for sidecar in mission.market_context_sidecars
         ]
         changed = False
+        base_generation = self.inbox.generation
+        touched_missions = {mission.id}
         for item in items:
+            stored = self.inbox.get(item.id)
+            if stored is not None:
+                touched_missions.add(str(stored.extra.get("watch_mission_id", "") or "").strip())
             item.extra["watch_mission_id"] = mission.id
             item.extra["watch_mission_name"] = mission.name
             item.extra["watch_query"] = mission.query
@@ -5826,9 +5851,7 @@ class DataPulseReader:
             if "watch" not in item.tags:
                 item.tags.append("watch")
 
-            for stored in self.inbox.items:
-                if stored.id != item.id:
-                    continue
+            if stored is not None:
                 stored.extra["watch_mission_id"] = mission.id
                 stored.extra["watch_mission_name"] = mission.name
                 stored.extra["watch_query"] = mission.query
@@ -5842,10 +5865,11 @@ class DataPulseReader:
                     stored.extra["watch_market_context_boundary"] = MARKET_CONTEXT_SIDECAR_BOUNDARY_TEXT
                 if "watch" not in stored.tags:
                     stored.tags.append("watch")
+                self.inbox.assign_mission(stored, mission.id)
                 changed = True
-                break
         if changed:
             self.inbox.save()
+            self.ops_metrics.record_mission_results(touched_missions, base_generation=base_generation)
 
     def _item_watch_context(self, item: DataPulseItem) -> dict[str, Any] | None:
         mission_id = str(item.extra.get("watch_mission_id", "") or "").strip()
@@ -6117,42 +6141,56 @@ class DataPulseReader:
         min_confidence: float = 0.0,
         since: str | None = None,
     ) -> list[DataPulseItem]:
-        all_items = self.inbox.all_items(min_confidence=min_confidence)
-        filtered = self.catalog.filter_by_subscription(
-            all_items,
+        return list(
+            self.iter_query_feed(
+                profile=profile,
+                source_ids=source_ids,
+                limit=limit,
+                min_confidence=min_confidence,
+                since=since,
+            )
+        )
+
+    def iter_query_feed(
+        self,
+        *,
+        profile: str = "default",
+        source_ids: list[str] | None = None,
+        limit: int = 20,
+        min_confidence: float = 0.0,
+        since: str | None = None,
+    ) -> Iterator[DataPulseItem]:
+        """Yield the newest ``limit`` subscribed items without copying or sorting the whole inbox.
+
+        Items stream through the confidence, subscription and ``since`` filters,
+        and only a bounded heap of ``limit`` candidates is ever held in memory.
+        """
+        filtered: Iterator[DataPulseItem] = self.catalog.iter_subscribed(
+            self.inbox.iter_items(min_confidence=min_confidence),
             profile=profile,
             source_ids=source_ids,
         )
+        since_dt = None
         if since:
-            since_dt = None
             try:
                 since_dt = datetime.fromisoformat(since)
             except Exception:
                 since_dt = None
-            if since_dt:
-                valid: list[DataPulseItem] = []
-                for item in filtered:
-                    try:
-                        ts = datetime.fromisoformat(item.fetched_at)
-                    except Exception:
-                        valid.append(item)
-                        continue
-                    if ts >= since_dt:
-                        valid.append(item)
-                filtered = valid
+        if since_dt:
+            filtered = _fetched_since(filtered, since_dt)
 
-        ordered = sorted(filtered, key=lambda it: it.fetched_at, reverse=True)
-        return ordered[: max(0, limit)]
+        # heapq.nlargest is equivalent to sorted(..., reverse=True)[:limit], including tie order.
+        yield from heapq.nlargest(max(0, limit), filtered, key=lambda it: it.fetched_at)
 
-    def build_feed_bundle(
+    def _feed_bundle_frame(
         self,
         *,
-        profile: str = "default",
-        source_ids: list[str] | None = None,
-        limit: int = 500,
-        min_confidence: float = 0.0,
-        since: str | None = None,
-    ) -> dict[str, Any]:
+        profile: str,
+        source_ids: list[str] | None,
+        limit: int,
+        min_confidence: float,
+        since: str | None,
+    ) -> tuple[dict[str, Any], list[DataPulseItem], dict[str, Any]]:
         errors: list[dict[str, Any]] = []
         if since and _parse_timestamp(since) is None:
             errors.append(
@@ -6180,7 +6218,7 @@ class DataPulseReader:
         if source_count == 0:
             source_count = len({str(item.source_name or "").strip() for item in items if str(item.source_name or "").strip()})
 
-        return {
+        head = {
             "schema_version": "feed_bundle.v1",
             "generated_at": _utcnow_z(),
             "selection": {
@@ -6193,23 +6231,73 @@ class DataPulseReader:
                 "min_confidence": float(min_confidence),
             },
             "window": self._bundle_window(items, since=since),
-            "items": [item.to_dict() for item in items],
+        }
+        tail = {
             "stats": {
                 "items_selected": len(items),
                 "sources_selected": source_count,
             },
             "errors": errors,
         }
+        return head, items, tail
 
-    def build_json_feed(
+    def build_feed_bundle(
         self,
         *,
         profile: str = "default",
         source_ids: list[str] | None = None,
-        limit: int = 20,
+        limit: int = 500,
         min_confidence: float = 0.0,
         since: str | None = None,
     ) -> dict[str, Any]:
+        head, items, tail = self._feed_bundle_frame(
+            profile=profile,
+            source_ids=source_ids,
+            limit=limit,
+            min_confidence=min_confidence,
+            since=since,
+        )
+        return {**head, "items": [item.to_dict() for item in items], **tail}
+
+    def iter_feed_bundle(
+        self,
+        *,
+        profile: str = "default",
+        source_ids: list[str] | None = None,
+        limit: int = 500,
+        min_confidence: float = 0.0,
+        since: str | None = None,
+        output_format: str = "json",
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        indent: int | None = None,
+    ) -> Iterator[str]:
+        """Stream the feed bundle as a chunked JSON document or JSON Lines.
+
+        ``jsonl`` emits one header record (the bundle without ``items``) followed
+        by one serialized item per line. ``indent`` pretty-prints the ``json`` form.
+        """
+        output_format = _normalize_stream_format(output_format)
+        head, items, tail = self._feed_bundle_frame(
+            profile=profile,
+            source_ids=source_ids,
+            limit=limit,
+            min_confidence=min_confidence,
+            since=since,
+        )
+        rows = (item.to_dict() for item in items)
+        if output_format == "jsonl":
+            return iter_json_lines(rows, header={**head, **tail}, chunk_size=chunk_size)
+        return iter_json_object(head, "items", rows, tail, chunk_size=chunk_size, indent=indent)
+
+    def _json_feed_frame(
+        self,
+        *,
+        profile: str,
+        source_ids: list[str] | None,
+        limit: int,
+        min_confidence: float,
+        since: str | None,
+    ) -> tuple[dict[str, Any], list[DataPulseItem], dict[str, Any]]:
         items = self.query_feed(
             profile=profile,
             source_ids=source_ids,
@@ -6218,34 +6306,77 @@ class DataPulseReader:
             since=since,
         )
         base = "https://datapulse.local"
-        now = _utcnow_z()
-        payload: dict[str, Any] = {
+        head: dict[str, Any] = {
             "version": "https://jsonfeed.org/version/1.1",
             "title": f"DataPulse Feed ({profile})",
             "home_page_url": base,
             "feed_url": f"{base}/feed/{profile}.json",
-            "items": [],
-            "generated_at": now,
         }
-        for item in items:
-            row: dict[str, Any] = {
-                "id": item.id,
-                "title": item.title,
-                "content_text": item.content,
-                "date_published": item.fetched_at,
-                "url": item.url,
-                "source_type": item.source_type.value,
-                "source_name": item.source_name,
-                "authors": [{"name": item.source_name}] if item.source_name else [],
-            }
-            watch_context = self._item_watch_context(item)
-            if watch_context is not None:
-                row["datapulse_context"] = watch_context
-            payload["items"].append(row)
+        tail: dict[str, Any] = {"generated_at": _utcnow_z()}
         feed_context = self._build_feed_context(items)
         if feed_context is not None:
-            payload["datapulse_context"] = feed_context
-        return payload
+            tail["datapulse_context"] = feed_context
+        return head, items, tail
+
+    def _json_feed_row(self, item: DataPulseItem) -> dict[str, Any]:
+        row: dict[str, Any] = {
+            "id": item.id,
+            "title": item.title,
+            "content_text": item.content,
+            "date_published": item.fetched_at,
+            "url": item.url,
+            "source_type": item.source_type.value,
+            "source_name": item.source_name,
+            "authors": [{"name": item.source_name}] if item.source_name else [],
+        }
+        watch_context = self._item_watch_context(item)
+        if watch_context is not None:
+            row["datapulse_context"] = watch_context
+        return row
+
+    def build_json_feed(
+        self,
+        *,
+        profile: str = "default",
+        source_ids: list[str] | None = None,
+        limit: int = 20,
+        min_confidence: float = 0.0,
+        since: str | None = None,
+    ) -> dict[str, Any]:
+        head, items, tail = self._json_feed_frame(
+            profile=profile,
+            source_ids=source_ids,
+            limit=limit,
+            min_confidence=min_confidence,
+            since=since,
+        )
+        return {**head, "items": [self._json_feed_row(item) for item in items], **tail}
+
+    def iter_json_feed(
+        self,
+        *,
+        profile: str = "default",
+        source_ids: list[str] | None = None,
+        limit: int = 20,
+        min_confidence: float = 0.0,
+        since: str | None = None,
+        output_format: str = "json",
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        indent: int | None = None,
+    ) -> Iterator[str]:
+        """Stream the JSON Feed document, or its header plus one entry per line for ``jsonl``."""
+        output_format = _normalize_stream_format(output_format)
+        head, items, tail = self._json_feed_frame(
+            profile=profile,
+            source_ids=source_ids,
+            limit=limit,
+            min_confidence=min_confidence,
+            since=since,
+        )
+        rows = (self._json_feed_row(item) for item in items)
+        if output_format == "jsonl":
+            return iter_json_lines(rows, header={**head, **tail}, chunk_size=chunk_size)
+        return iter_json_object(head, "items", rows, tail, chunk_size=chunk_size, indent=indent)
 
     def build_rss_feed(
         self,
@@ -6256,6 +6387,26 @@ class DataPulseReader:
         min_confidence: float = 0.0,
         since: str | None = None,
     ) -> str:
+        return "".join(
+            self.iter_rss_feed(
+                profile=profile,
+                source_ids=source_ids,
+                limit=limit,
+                min_confidence=min_confidence,
+                since=since,
+            )
+        )
+
+    def iter_rss_feed(
+        self,
+        *,
+        profile: str = "default",
+        source_ids: list[str] | None = None,
+        limit: int = 20,
+        min_confidence: float = 0.0,
+        since: str | None = None,
+    ) -> Iterator[str]:
+        """Yield the RSS 2.0 document incrementally: channel header, one ``<item>`` per chunk, footer."""
         items = self.query_feed(
             profile=profile,
             source_ids=source_ids,
@@ -6263,14 +6414,17 @@ class DataPulseReader:
             min_confidence=min_confidence,
             since=since,
         )
-        def _xml_escape(value: str) -> str:
-            return (value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("\"", "&quot;"))
-
         feed_context = self._build_feed_context(items)
         description = "Unified content feed"
         if feed_context is not None:
             description = f"{description}. {feed_context['seed_boundary']}"
-        rows = []
+        yield (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            "<rss version=\"2.0\"><channel>"
+            "<title>DataPulse Feed</title>"
+            f"<description>{xml_escape(description)}</description>"
+            "<link>https://datapulse.local</link>"
+        )
         for item in items:
             pub = item.fetched_at
             try:
@@ -6278,27 +6432,17 @@ class DataPulseReader:
             except Exception:
                 dt = pub
             category = "<category>trend-seeded-watch</category>" if self._item_trend_seed_context(item) is not None else ""
-            rows.append(
+            yield (
                 "<item>"
-                f"<title>{_xml_escape(item.title)}</title>"
-                f"<link>{_xml_escape(item.url)}</link>"
-                f"<guid>{_xml_escape(item.id)}</guid>"
-                f"<pubDate>{_xml_escape(dt)}</pubDate>"
-                f"<description>{_xml_escape(item.content[:1800])}</description>"
+                f"<title>{xml_escape(item.title)}</title>"
+                f"<link>{xml_escape(item.url)}</link>"
+                f"<guid>{xml_escape(item.id)}</guid>"
+                f"<pubDate>{xml_escape(dt)}</pubDate>"
+                f"<description>{xml_escape(item.content[:1800])}</description>"
                 f"{category}"
                 "</item>"
             )
-
-        payload = (
-            '<?xml version="1.0" encoding="UTF-8"?>'
-            "<rss version=\"2.0\"><channel>"
-            "<title>DataPulse Feed</title>"
-            f"<description>{_xml_escape(description)}</description>"
-            "<link>https://datapulse.local</link>"
-            + "".join(rows)
-            + "</channel></rss>"
-        )
-        return payload
+        yield "</channel></rss>"
 
 
     def build_digest(
@@ -6667,6 +6811,26 @@ class DataPulseReader:
         min_confidence: float = 0.0,
         since: str | None = None,
     ) -> str:
+        return "".join(
+            self.iter_atom_feed(
+                profile=profile,
+                source_ids=source_ids,
+                limit=limit,
+                min_confidence=min_confidence,
+                since=since,
+            )
+        )
+
+    def iter_atom_feed(
+        self,
+        *,
+        profile: str = "default",
+        source_ids: list[str] | None = None,
+        limit: int = 20,
+        min_confidence: float = 0.0,
+        since: str | None = None,
+    ) -> Iterator[str]:
+        """Yield the Atom 1.0 document incrementally: feed header, one ``<entry>`` per chunk, footer."""
         items = self.query_feed(
             profile=profile,
             source_ids=source_ids,
@@ -6675,48 +6839,40 @@ class DataPulseReader:
             since=since,
         )
 
-        def _xml_escape(value: str) -> str:
-            return (value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("\"", "&quot;"))
-
         now = _utcnow_z()
         base = "https://datapulse.local"
         feed_context = self._build_feed_context(items)
         subtitle = (
-            f"<subtitle>{_xml_escape(feed_context['seed_boundary'])}</subtitle>"
+            f"<subtitle>{xml_escape(feed_context['seed_boundary'])}</subtitle>"
             if feed_context is not None
             else ""
         )
-
-        entries = []
+        yield (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom">'
+            f"<title>DataPulse Feed ({xml_escape(profile)})</title>"
+            f"{subtitle}"
+            f'<link href="{base}/feed/{profile}.atom" rel="self"/>'
+            f"<id>urn:datapulse:feed:{xml_escape(profile)}</id>"
+            f"<updated>{now}</updated>"
+        )
         for item in items:
             updated = item.fetched_at
             if not updated.endswith("Z"):
                 updated += "Z"
             category = '<category term="trend-seeded-watch"/>' if self._item_trend_seed_context(item) is not None else ""
-            entries.append(
+            yield (
                 "<entry>"
-                f"<title>{_xml_escape(item.title)}</title>"
-                f'<link href="{_xml_escape(item.url)}" rel="alternate"/>'
-                f"<id>urn:datapulse:{_xml_escape(item.id)}</id>"
-                f"<updated>{_xml_escape(updated)}</updated>"
-                f"<summary>{_xml_escape(item.content[:1800])}</summary>"
-                f"<author><name>{_xml_escape(item.source_name)}</name></author>"
+                f"<title>{xml_escape(item.title)}</title>"
+                f'<link href="{xml_escape(item.url)}" rel="alternate"/>'
+                f"<id>urn:datapulse:{xml_escape(item.id)}</id>"
+                f"<updated>{xml_escape(updated)}</updated>"
+                f"<summary>{xml_escape(item.content[:1800])}</summary>"
+                f"<author><name>{xml_escape(item.source_name)}</name></author>"
                 f"{category}"
                 "</entry>"
             )
-
-        payload = (
-            '<?xml version="1.0" encoding="UTF-8"?>'
-            '<feed xmlns="http://www.w3.org/2005/Atom">'
-            f"<title>DataPulse Feed ({_xml_escape(profile)})</title>"
-            f"{subtitle}"
-            f'<link href="{base}/feed/{profile}.atom" rel="self"/>'
-            f"<id>urn:datapulse:feed:{_xml_escape(profile)}</id>"
-            f"<updated>{now}</updated>"
-            + "".join(entries)
-            + "</feed>"
-        )
-        return payload
+        yield "</feed>"
 
     async def extract_entities(
         self,
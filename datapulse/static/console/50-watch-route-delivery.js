@@ -999,6 +999,9 @@ function renderWatchDetail() {
   const deliveryStats = watch.delivery_stats || {};
   const resultFilters = watch.result_filters || {};
   const timelineEvents = Array.isArray(watch.timeline_strip) ? watch.timeline_strip : [];
+  const runTimeline = watch.run_timeline || {};
+  const runBuckets = Array.isArray(runTimeline.hourly) ? runTimeline.hourly : [];
+  const runRollups = watch.run_rollups || {};
   const stateOptions = Array.isArray(resultFilters.states) ? resultFilters.states : [];
   const sourceOptions = Array.isArray(resultFilters.sources) ? resultFilters.sources : [];
   const domainOptions = Array.isArray(resultFilters.domains) ? resultFilters.domains : [];
@@ -1154,6 +1157,17 @@ function renderWatchDetail() {
         </div>
       `).join("")}</div>`
     : `<div class="empty">${copy("No mission timeline event captured yet.", "当前还没有记录到任务时间线事件。")}</div>`;
+  const peakBucketRuns = Math.max(1, ...runBuckets.map((bucket) => Number(bucket.runs) || 0));
+  const runBucketBlock = runBuckets.some((bucket) => Number(bucket.runs) > 0)
+    ? `<div class="run-buckets">${runBuckets.map((bucket) => {
+        const runs = Number(bucket.runs) || 0;
+        const tone = Number(bucket.error) > 0 ? "hot" : (runs > 0 ? "ok" : "");
+        const height = runs > 0 ? Math.max(12, Math.round((runs / peakBucketRuns) * 100)) : 4;
+        const title = `${bucket.bucket || "-"} | runs=${runs} | ok=${Number(bucket.success) || 0} | err=${Number(bucket.error) || 0} | items=${Number(bucket.item_count) || 0}`;
+        return `<div class="run-bucket ${tone}" style="height:${height}%;" title="${title}"></div>`;
+      }).join("")}</div>
+      <div class="panel-sub">${copy("24h", "24 小时")}: ${Number(runRollups.last_24h?.runs) || 0} ${copy("runs", "次运行")} / ${Number(runRollups.last_24h?.error) || 0} ${copy("errors", "次失败")} · ${copy("7d", "7 天")}: ${Number(runRollups.last_7d?.runs) || 0} / ${Number(runRollups.last_7d?.error) || 0} · ${copy("lifetime", "累计")}: ${Number(runRollups.lifetime?.runs) || 0}</div>`
+    : "";
   const retryCollectors = retryAdvice && Array.isArray(retryAdvice.suspected_collectors)
     ? retryAdvice.suspected_collectors
     : [];
@@ -1318,6 +1332,7 @@ function renderWatchDetail() {
       <div class="mono">${copy("timeline strip", "时间线")}</div>
       <div class="panel-sub">${copy("Recent run, result, and alert events are merged into one server-backed mission timeline.", "最近的运行、结果和告警事件会合并成一条服务端驱动的任务时间线。")}</div>
       <div style="margin-top:12px;">
+        ${runBucketBlock}
         ${timelineBlock}
       </div>
     </div>
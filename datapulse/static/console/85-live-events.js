@@ -0,0 +1,136 @@
+// Split group 2i: live console event stream (SSE) and incremental view patches.
+// Depends on prior fragments and 00-common.js.
+
+const liveEventsPath = "/api/events";
+const liveTriageMinimum = 12;
+const liveAlertLimit = 8;
+const liveOverviewAlertCap = 20;
+let consoleEventSource = null;
+
+function upsertLiveRow(rows, row, { prepend = false } = {}) {
+  const list = Array.isArray(rows) ? rows : [];
+  const rowId = String(row?.id || "").trim();
+  if (!rowId) {
+    return list;
+  }
+  const index = list.findIndex((entry) => entry.id === rowId);
+  if (index >= 0) {
+    const next = list.slice();
+    next[index] = { ...list[index], ...row };
+    return next;
+  }
+  return prepend ? [row, ...list] : list;
+}
+
+function applyLiveTriageStats(stats) {
+  if (!stats || typeof stats !== "object") {
+    return;
+  }
+  state.triageStats = stats;
+  if (state.overview) {
+    state.overview.triage_open_count = Number(stats.open_count ?? state.overview.triage_open_count ?? 0);
+  }
+}
+
+function applyInboxAddedEvent(payload) {
+  const items = Array.isArray(payload?.items) ? payload.items : [];
+  const keep = Math.max(liveTriageMinimum, state.triage.length);
+  items.slice().reverse().forEach((item) => {
+    state.triage = upsertLiveRow(state.triage, item, { prepend: true });
+  });
+  state.triage = state.triage.slice(0, keep);
+  if (!state.selectedTriageId && state.triage.length) {
+    state.selectedTriageId = state.triage[0].id;
+  }
+  applyLiveTriageStats(payload?.triage_stats);
+  renderTriage();
+  renderOverview();
+}
+
+function applyTriageUpdatedEvent(payload) {
+  const items = Array.isArray(payload?.items) ? payload.items : [];
+  items.forEach((item) => {
+    const { previous_state: _previousState, ...row } = item || {};
+    state.triage = upsertLiveRow(state.triage, row);
+  });
+  applyLiveTriageStats(payload?.triage_stats);
+  renderTriage();
+  renderOverview();
+}
+
+function applyWatchRunEvent(payload) {
+  const watch = payload?.watch;
+  const watchId = String(watch?.id || payload?.mission_id || "").trim();
+  if (!watchId || !watch) {
+    return;
+  }
+  state.watches = upsertLiveRow(state.watches, watch);
+  state.watchDetails[watchId] = watch;
+  renderWatches();
+  if (state.selectedWatchId === watchId) {
+    renderWatchDetail();
+  }
+}
+
+function applyAlertEvent(payload) {
+  const alertId = String(payload?.id || "").trim();
+  if (!alertId) {
+    return;
+  }
+  const known = state.alerts.some((alert) => alert.id === alertId);
+  state.alerts = [payload, ...state.alerts.filter((alert) => alert.id !== alertId)].slice(0, liveAlertLimit);
+  if (state.overview && !known) {
+    state.overview.alert_count = Math.min(liveOverviewAlertCap, Number(state.overview.alert_count || 0) + 1);
+  }
+  renderAlerts();
+  renderOverview();
+}
+
+function applyDaemonHeartbeatEvent(payload) {
+  if (!payload || typeof payload !== "object") {
+    return;
+  }
+  state.status = { ...(state.status || {}), ...payload };
+  if (state.overview) {
+    state.overview.daemon_state = payload.state || state.overview.daemon_state;
+    state.overview.daemon_heartbeat_at = payload.heartbeat_at || state.overview.daemon_heartbeat_at;
+  }
+  renderStatus();
+  renderOverview();
+}
+
+function applyResyncEvent() {
+  refreshBoard().catch((error) => reportError(error, copy("Refresh console", "刷新控制台")));
+}
+
+const liveEventHandlers = {
+  "inbox.added": applyInboxAddedEvent,
+  "triage.updated": applyTriageUpdatedEvent,
+  "watch.run": applyWatchRunEvent,
+  alert: applyAlertEvent,
+  "daemon.heartbeat": applyDaemonHeartbeatEvent,
+  resync: applyResyncEvent,
+};
+
+function startConsoleEventStream() {
+  if (consoleEventSource || typeof window.EventSource !== "function") {
+    return;
+  }
+  // EventSource reconnects on its own and resends Last-Event-ID, so the server replays what was missed.
+  consoleEventSource = new window.EventSource(liveEventsPath);
+  Object.entries(liveEventHandlers).forEach(([eventName, handler]) => {
+    consoleEventSource.addEventListener(eventName, (message) => {
+      let payload = null;
+      try {
+        payload = JSON.parse(message.data || "null");
+      } catch (_error) {
+        return;
+      }
+      try {
+        handler(payload);
+      } catch (error) {
+        console.warn("live console event failed", eventName, error);
+      }
+    });
+  });
+}
@@ -273,6 +273,7 @@ window.getConsoleOverflowEvidence = getConsoleOverflowEvidence;
 hydrateBoardForSection(state.activeSectionId).catch((error) => {
   reportError(error, copy("Console boot failed", "控制台启动失败"));
 });
+startConsoleEventStream();
 
 document.addEventListener("keydown", (event) => {
   const target = event.target;
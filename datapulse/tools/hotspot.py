@@ -8,7 +8,9 @@ import json
 from typing import Any
 from urllib.parse import urlparse
 
+from datapulse.collectors.base import ParseResult
 from datapulse.collectors.github import GitHubCollector
+from datapulse.core.config import read_env_int
 from datapulse.core.models import DataPulseItem, SourceType
 from datapulse.core.utils import extract_urls
 from datapulse.reader import DataPulseReader
@@ -90,9 +92,10 @@ async def build_hotspot_evidence_pack(
         min_confidence=0.0,
     )
 
-    best_by_repo: dict[str, dict[str, Any]] = {}
+    concurrency = read_env_int("DATAPULSE_HOTSPOT_CONCURRENCY", 6, min_value=1, max_value=32)
+    semaphore = asyncio.Semaphore(concurrency)
 
-    for item in search_items:
+    async def _candidates(item: DataPulseItem) -> list[str]:
         repo_candidates = extract_repo_candidates(item)
         if (
             read_reddit_thread
@@ -100,13 +103,27 @@ async def build_hotspot_evidence_pack(
             and not repo_candidates
         ):
             try:
-                enriched = await reader.read(item.url, min_confidence=0.0)
+                async with semaphore:
+                    enriched = await reader.read(item.url, min_confidence=0.0)
                 repo_candidates.extend(extract_repo_candidates(enriched))
             except Exception:
                 pass
+        return repo_candidates
+
+    async def _repo_result(repo: str) -> ParseResult:
+        async with semaphore:
+            return await asyncio.to_thread(github.parse, f"https://github.com/{repo}")
+
+    # One round of thread reads, then one GitHub lookup per distinct repo.
+    candidates_by_item = await asyncio.gather(*(_candidates(item) for item in search_items))
+    unique_repos = list(dict.fromkeys(repo for repos in candidates_by_item for repo in repos))
+    repo_results = dict(zip(unique_repos, await asyncio.gather(*(_repo_result(repo) for repo in unique_repos))))
+
+    best_by_repo: dict[str, dict[str, Any]] = {}
 
+    for item, repo_candidates in zip(search_items, candidates_by_item):
         for repo in repo_candidates:
-            gh_result = await asyncio.to_thread(github.parse, f"https://github.com/{repo}")
+            gh_result = repo_results[repo]
             repo_meta = gh_result.extra if gh_result.success else {}
             repo_degraded = bool(repo_meta.get("api_degraded", not gh_result.success))
 
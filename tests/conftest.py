@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from datapulse.collectors.base import ParseResult
+from datapulse.core.health import HEALTH_PROBES
 from datapulse.core.models import DataPulseItem, SourceType
 
 
@@ -20,6 +21,37 @@ def _isolate_modelbus_validation_counter(tmp_path: Path, monkeypatch: pytest.Mon
     )
 
 
+@pytest.fixture(autouse=True)
+def _isolate_watch_status(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the watch status file (and its materialized ops aggregates) per test."""
+    monkeypatch.setenv("DATAPULSE_WATCH_STATUS_PATH", str(tmp_path / "watch-status.json"))
+    monkeypatch.setenv("DATAPULSE_WATCH_STATUS_HTML", str(tmp_path / "watch-status.html"))
+
+
+@pytest.fixture(autouse=True)
+def _isolate_github_repo_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own GitHub repo metadata cache file."""
+    monkeypatch.setenv("DATAPULSE_GITHUB_CACHE_PATH", str(tmp_path / "github-repos.json"))
+
+
+@pytest.fixture(autouse=True)
+def _isolate_media_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own downloaded-media cache directory."""
+    monkeypatch.setenv("DATAPULSE_MEDIA_CACHE_DIR", str(tmp_path / "media-cache"))
+
+
+@pytest.fixture(autouse=True)
+def _isolate_youtube_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test its own YouTube metadata/transcript cache directory."""
+    monkeypatch.setenv("DATAPULSE_YOUTUBE_CACHE_DIR", str(tmp_path / "youtube-cache"))
+
+
+@pytest.fixture(autouse=True)
+def _reset_health_probe_cache() -> None:
+    """Drop cached collector health probes so doctor() tests never share results."""
+    HEALTH_PROBES.clear()
+
+
 @pytest.fixture()
 def tmp_inbox(tmp_path: Path) -> Path:
     """Return a temporary inbox JSON path."""
@@ -159,7 +159,7 @@ async def test_watch_alert_external_channels_dispatch(tmp_path, monkeypatch):
         return _Resp()
 
     monkeypatch.setattr(reader, "search", fake_search)
-    monkeypatch.setattr("datapulse.core.alerts.requests.post", fake_post)
+    monkeypatch.setattr("requests.post", fake_post)
 
     payload = await reader.run_watch(mission["id"])
 
@@ -269,7 +269,7 @@ async def test_watch_alert_rich_filters_and_named_routes(tmp_path, monkeypatch):
         return _Resp()
 
     monkeypatch.setattr(reader, "search", fake_search)
-    monkeypatch.setattr("datapulse.core.alerts.requests.post", fake_post)
+    monkeypatch.setattr("requests.post", fake_post)
 
     payload = await reader.run_watch(mission["id"])
 
@@ -344,7 +344,7 @@ async def test_watch_alert_external_channels_dispatch_when_factuality_ready(tmp_
         return _Resp()
 
     monkeypatch.setattr(reader, "search", fake_search)
-    monkeypatch.setattr("datapulse.core.alerts.requests.post", fake_post)
+    monkeypatch.setattr("requests.post", fake_post)
 
     payload = await reader.run_watch(mission["id"])
 
@@ -463,7 +463,7 @@ async def test_watch_alert_backend_review_holds_external_delivery_and_is_visible
 
     monkeypatch.setattr(reader, "search", fake_search)
     monkeypatch.setattr("datapulse.core.story.subprocess.run", fake_backend)
-    monkeypatch.setattr("datapulse.core.alerts.requests.post", fake_post)
+    monkeypatch.setattr("requests.post", fake_post)
 
     payload = await reader.run_watch(mission["id"])
 
@@ -604,3 +604,187 @@ async def test_alert_route_health_reports_degraded_named_route(tmp_path, monkeyp
     assert health[0]["failure_count"] == 1
     assert "webhook_url is required" in health[0]["last_error"]
     assert alerts[0]["governance"]["delivery_risk"]["status"] == "degraded"
+
+
+def test_keyword_matcher_matches_substring_semantics():
+    from datapulse.core.alerts import _KeywordMatcher
+
+    keywords = ["open", "openai", "ai agent", "agents", "bc", "ab", "模型"]
+    matcher = _KeywordMatcher(keywords)
+    texts = [
+        "openai ships ai agents",
+        "abc",
+        "国产大模型发布",
+        "nothing relevant here",
+        "",
+    ]
+    for text in texts:
+        assert matcher.find(text) == frozenset(keyword for keyword in keywords if keyword in text)
+
+
+def test_compiled_alert_rules_evaluate_all_rules_in_one_pass(monkeypatch):
+    from datapulse.core import alerts as alerts_module
+    from datapulse.core.alerts import compile_alert_rules, evaluate_watch_alerts
+    from datapulse.core.watchlist import WatchMission
+
+    mission = WatchMission(
+        name="Compiled Radar",
+        query="agents",
+        alert_rules=[
+            {"name": "any", "keyword_any": ["OpenAI", "Anthropic"], "domains": ["example.com"]},
+            {"name": "all", "keyword_all": ["agents", "release"], "exclude_keywords": ["rumor"]},
+            {"name": "disabled", "enabled": False, "keyword_any": ["openai"]},
+            {"keyword_any": ["missing-term"]},
+            {"name": "fresh", "max_age_minutes": 30, "required_tags": ["ai"], "source_types": ["generic"]},
+        ],
+    )
+    now = datetime.now(timezone.utc)
+    items = [
+        DataPulseItem(
+            source_type=SourceType.GENERIC,
+            source_name="news",
+            title="OpenAI agents release",
+            content="Official notes",
+            url="https://news.example.com/a",
+            tags=["AI"],
+            fetched_at=now.isoformat(),
+        ),
+        DataPulseItem(
+            source_type=SourceType.GENERIC,
+            source_name="blog",
+            title="Agents release rumor",
+            content="Unconfirmed",
+            url="https://other.org/b",
+            tags=["ai"],
+            fetched_at=(now - timedelta(hours=2)).isoformat(),
+        ),
+    ]
+
+    search_text_calls: list[str] = []
+    original_search_text = alerts_module._item_search_text
+
+    def counting_search_text(item):
+        search_text_calls.append(item.id)
+        return original_search_text(item)
+
+    monkeypatch.setattr(alerts_module, "_item_search_text", counting_search_text)
+
+    results = evaluate_watch_alerts(mission, items)
+
+    assert [(event.rule_name, event.item_ids) for event, _, _ in results] == [
+        ("any", [items[0].id]),
+        ("all", [items[0].id]),
+        ("fresh", [items[0].id]),
+    ]
+    assert sorted(search_text_calls) == sorted(item.id for item in items)
+    assert compile_alert_rules(mission) is compile_alert_rules(mission)
+
+    mission.alert_rules = [{"name": "changed", "keyword_any": ["rumor"]}]
+    recompiled = compile_alert_rules(mission)
+    assert [rule.name for rule in recompiled.rules] == ["changed"]
+
+
+def test_alert_store_appends_journal_and_replays_updates(tmp_path):
+    from datapulse.core.alerts import AlertEvent, AlertStore
+
+    store = AlertStore(str(tmp_path / "alerts.json"))
+    first = AlertEvent(mission_id="m1", mission_name="M1", rule_name="r1", created_at="2026-03-01T00:00:00+00:00")
+    second = AlertEvent(mission_id="m2", mission_name="M2", rule_name="r1", created_at="2026-03-01T00:05:00+00:00")
+
+    assert store.add(first) is True
+    assert store.add(second) is True
+    assert not (tmp_path / "alerts.json").exists()
+    assert len((tmp_path / "alerts.jsonl").read_text(encoding="utf-8").splitlines()) == 2
+
+    second.delivered_channels = ["webhook:ops"]
+    store.update(second)
+
+    reloaded = AlertStore(str(tmp_path / "alerts.json"))
+    assert [event.id for event in reloaded.list_events()] == [second.id, first.id]
+    assert reloaded.get(second.id).delivered_channels == ["webhook:ops"]
+    assert [event.id for event in reloaded.list_events(mission_id="m1")] == [first.id]
+    assert reloaded.list_events(mission_id="missing") == []
+
+
+def test_alert_store_cooldown_uses_last_emitted_index(tmp_path):
+    from datapulse.core.alerts import AlertEvent, AlertStore
+
+    store = AlertStore(str(tmp_path / "alerts.json"))
+    base = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    def event(minutes: int, rule: str = "r1") -> AlertEvent:
+        return AlertEvent(
+            mission_id="m1",
+            mission_name="M1",
+            rule_name=rule,
+            created_at=(base + timedelta(minutes=minutes)).isoformat(),
+        )
+
+    assert store.add(event(0), cooldown_seconds=600) is True
+    assert store.add(event(5), cooldown_seconds=600) is False
+    assert store.add(event(5, rule="r2"), cooldown_seconds=600) is True
+    assert store.add(event(10), cooldown_seconds=600) is True
+    assert store.add(event(15), cooldown_seconds=600) is False
+
+
+def test_alert_store_compacts_journal_with_retention(tmp_path, monkeypatch):
+    from datapulse.core.alerts import AlertEvent, AlertStore
+
+    monkeypatch.setenv("DATAPULSE_MAX_ALERTS", "3")
+    store = AlertStore(str(tmp_path / "alerts.json"))
+    events = [
+        AlertEvent(mission_id=f"m{index % 2}", mission_name="M", rule_name="r", created_at=f"2026-03-01T00:0{index}:00+00:00")
+        for index in range(5)
+    ]
+    for row in events:
+        store.add(row)
+
+    snapshot = json.loads((tmp_path / "alerts.json").read_text(encoding="utf-8"))
+    assert [row["id"] for row in snapshot] == [events[3].id, events[2].id, events[1].id]
+    assert len((tmp_path / "alerts.jsonl").read_text(encoding="utf-8").splitlines()) == 1
+    assert [event.id for event in store.list_events()] == [events[4].id, events[3].id, events[2].id]
+    assert [event.id for event in store.list_events(mission_id="m1")] == [events[3].id]
+    assert store.get(events[0].id) is None
+
+    reloaded = AlertStore(str(tmp_path / "alerts.json"))
+    assert [event.id for event in reloaded.list_events()] == [events[4].id, events[3].id, events[2].id]
+
+
+def test_alert_store_prunes_cooldown_index_with_retention(tmp_path, monkeypatch):
+    from datapulse.core.alerts import AlertEvent, AlertStore
+
+    monkeypatch.setenv("DATAPULSE_MAX_ALERTS", "2")
+    store = AlertStore(str(tmp_path / "alerts.json"))
+    for index in range(6):
+        store.add(
+            AlertEvent(
+                mission_id=f"m{index}",
+                mission_name="M",
+                rule_name="r",
+                created_at=f"2026-03-01T00:0{index}:00+00:00",
+            )
+        )
+
+    assert set(store._last_emitted) == {("m4", "r"), ("m5", "r")}
+
+
+def test_alert_stores_sharing_a_path_keep_each_others_events(tmp_path):
+    from datapulse.core.alerts import AlertEvent, AlertStore
+
+    path = str(tmp_path / "alerts.json")
+    first, second = AlertStore(path), AlertStore(path)
+
+    def event(minutes: int, mission: str) -> AlertEvent:
+        return AlertEvent(
+            mission_id=mission, mission_name="M", rule_name="r", created_at=f"2026-03-01T00:{minutes:02d}:00+00:00"
+        )
+
+    e1, e2, e3 = event(0, "m1"), event(1, "m2"), event(2, "m3")
+    assert first.add(e1) is True
+    assert second.add(e2) is True
+    assert first.add(e3) is True
+    first.save()
+
+    assert [row.id for row in AlertStore(path).list_events()] == [e3.id, e2.id, e1.id]
+    # The cooldown sees the other process's alert for the same mission and rule.
+    assert second.add(event(5, "m3"), cooldown_seconds=600) is False
@@ -0,0 +1,67 @@
+"""Smoke tests for the offline benchmark suite so it does not rot between runs."""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture(scope="module")
+def bench_run():
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    return importlib.import_module("benchmarks.run")
+
+
+def test_corpus_is_seeded_and_carries_duplicates(bench_run) -> None:
+    corpus = importlib.import_module("benchmarks.corpus")
+    first = corpus.generate_corpus(200, seed=3)
+    second = corpus.generate_corpus(200, seed=3)
+
+    assert [item.content for item in first] == [item.content for item in second]
+    assert len({item.language for item in first}) == len(corpus.TEMPLATES)
+    assert len({item.content for item in first}) < len(first)
+    assert corpus.parse_size("10k") == 10_000
+
+
+def test_suite_runs_every_case_in_an_isolated_environment(bench_run, monkeypatch) -> None:
+    monkeypatch.delenv("DATAPULSE_MAX_INBOX", raising=False)
+    document = bench_run.run_suite(["40"], repeat=1, batch_urls=3)
+
+    timings = document["results"]["40"]
+    assert set(timings) == set(bench_run.CASES)
+    assert all(row["runs"] == 1 and row["min_ms"] <= row["median_ms"] <= row["max_ms"] for row in timings.values())
+    assert "DATAPULSE_MAX_INBOX" not in os.environ
+    json.dumps(document)
+
+
+def test_compare_flags_only_material_median_regressions(bench_run) -> None:
+    baseline = {"results": {"1k": {"inbox.load": {"median_ms": 100.0}, "scoring.rank": {"median_ms": 0.2}}}}
+    current = {"results": {"1k": {"inbox.load": {"median_ms": 130.0}, "scoring.rank": {"median_ms": 0.5}}}}
+
+    rows = {row["case"]: row for row in bench_run.compare_results(current, baseline, threshold=0.2)}
+
+    assert rows["inbox.load"]["regressed"] is True
+    assert rows["scoring.rank"]["regressed"] is False
+    assert rows["scoring.rank"]["ratio"] == 2.5
+
+
+def test_cli_exits_nonzero_on_regression(bench_run, tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": {"30": {"alerts.evaluate": {"median_ms": 0.0001}}}}), encoding="utf-8")
+    output = tmp_path / "current.json"
+
+    code = bench_run.main(
+        ["--sizes", "30", "--repeat", "1", "--only", "alerts", "--output", str(output), "--compare", str(baseline),
+         "--min-delta-ms", "0"]
+    )
+
+    assert code == 1
+    assert set(json.loads(output.read_text(encoding="utf-8"))["results"]["30"]) == {"alerts.evaluate"}
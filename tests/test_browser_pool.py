@@ -0,0 +1,197 @@
+"""Tests for the warm Playwright browser pool."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from datapulse.collectors.browser_pool import BrowserPool
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+        self.visits: list[str] = []
+
+    async def goto(self, url: str, **_kwargs) -> None:
+        self.visits.append(url)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeContext:
+    def __init__(self, options: dict) -> None:
+        self.options = options
+        self.init_scripts: list[str] = []
+        self.pages: list[_FakePage] = []
+        self.closed = False
+
+    async def add_init_script(self, script: str) -> None:
+        self.init_scripts.append(script)
+
+    async def new_page(self) -> _FakePage:
+        page = _FakePage()
+        self.pages.append(page)
+        return page
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.contexts: list[_FakeContext] = []
+        self.connected = True
+
+    async def new_context(self, **options) -> _FakeContext:
+        context = _FakeContext(options)
+        self.contexts.append(context)
+        return context
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+class _FakePlaywright:
+    def __init__(self) -> None:
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+class _Launcher:
+    def __init__(self) -> None:
+        self.browsers: list[_FakeBrowser] = []
+        self.threads: set[str] = set()
+
+    async def __call__(self) -> tuple[_FakePlaywright, _FakeBrowser]:
+        self.threads.add(threading.current_thread().name)
+        browser = _FakeBrowser()
+        self.browsers.append(browser)
+        return _FakePlaywright(), browser
+
+
+@pytest.fixture()
+def launcher() -> _Launcher:
+    return _Launcher()
+
+
+@pytest.fixture()
+def pool(launcher: _Launcher):
+    pool = BrowserPool(max_pages_per_context=3, idle_seconds=60, launcher=launcher)
+    yield pool
+    pool.close()
+
+
+async def _visit(page: _FakePage) -> _FakePage:
+    await page.goto("https://www.example.com/post")
+    return page
+
+
+def test_sync_callers_share_one_browser_and_reuse_pages(pool: BrowserPool, launcher: _Launcher) -> None:
+    key = ("xhs", "", True)
+    results: list[_FakePage] = []
+    workers = [
+        threading.Thread(target=lambda: results.append(pool.run_page(key, _visit, init_scripts=("window.chrome = {};",))))
+        for _ in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(launcher.browsers) == 1
+    assert launcher.threads == {"datapulse-browser-pool"}
+    assert len(launcher.browsers[0].contexts) == 1
+    context = launcher.browsers[0].contexts[0]
+    assert context.init_scripts == ["window.chrome = {};"]
+    assert all(page.visits[-1] == "about:blank" for page in results)
+    assert pool.stats()["pages_created"] + pool.stats()["pages_reused"] == 2
+
+
+def test_contexts_are_per_session_and_recycled_after_page_limit(
+    pool: BrowserPool, launcher: _Launcher, tmp_path: Path
+) -> None:
+    session = tmp_path / "xhs.json"
+    session.write_text("{}", encoding="utf-8")
+    xhs_key = ("xhs", str(session), True)
+
+    pages = [pool.run_page(xhs_key, _visit) for _ in range(3)]
+    pool.run_page(("wechat", "", False), _visit)
+    fourth = pool.run_page(xhs_key, _visit)
+
+    browser = launcher.browsers[0]
+    first_context, wechat_context, second_context = browser.contexts
+    assert first_context.options == {"storage_state": str(session)}
+    assert wechat_context.options == {}
+    assert pages[1] is pages[0]
+    assert first_context.closed and not second_context.closed
+    assert fourth in second_context.pages
+
+    stamp = time.time() + 5
+    os.utime(session, (stamp, stamp))
+    pool.run_page(xhs_key, _visit)
+    assert second_context.closed
+    assert len(browser.contexts) == 4
+
+
+def test_failed_pages_are_dropped_and_idle_pool_shuts_down(pool: BrowserPool, launcher: _Launcher) -> None:
+    key = ("generic", "", False)
+
+    async def _boom(page: _FakePage) -> None:
+        raise RuntimeError("navigation failed")
+
+    with pytest.raises(RuntimeError, match="navigation failed"):
+        pool.run_page(key, _boom)
+    context = launcher.browsers[0].contexts[0]
+    assert context.pages[0].closed
+
+    assert pool.call(lambda: pool.reap_idle(now=time.monotonic() + 3600)) == 1
+    assert context.closed
+    assert not pool.running
+    assert not launcher.browsers[0].connected
+
+    pool.run_page(key, _visit)
+    assert len(launcher.browsers) == 2
+
+
+def test_disconnected_browser_is_relaunched(pool: BrowserPool, launcher: _Launcher) -> None:
+    key = ("generic", "", False)
+    pool.run_page(key, _visit)
+    launcher.browsers[0].connected = False
+
+    pool.run_page(key, _visit)
+
+    assert len(launcher.browsers) == 2
+    assert len(launcher.browsers[1].contexts) == 1
+    assert pool.stats()["launches"] == 2
+
+
+def test_reaper_keeps_the_browser_while_a_retired_context_page_is_leased(pool: BrowserPool, launcher: _Launcher) -> None:
+    key = ("generic", "", False)
+    pool.run_page(key, _visit)
+    pool.run_page(key, _visit)
+
+    async def _reap_mid_read(page: _FakePage) -> bool:
+        await pool.reap_idle(now=time.monotonic() + 3600)
+        return launcher.browsers[0].connected
+
+    # The third page hits the limit, so its context is retired while the read is still running.
+    assert pool.run_page(key, _reap_mid_read)
+    assert pool.stats()["leased_pages"] == 0
+    assert launcher.browsers[0].contexts[0].closed
+
+    pool.call(lambda: pool.reap_idle(now=time.monotonic() + 3600))
+    assert not pool.running
@@ -1527,3 +1527,46 @@ def test_skill_contract_lists_watch_status_and_alert_envs(monkeypatch, capsys):
     assert "DATAPULSE_ALERT_WEBHOOK_URL" in out
     assert "DATAPULSE_FEISHU_WEBHOOK_URL" in out
     assert "DATAPULSE_TELEGRAM_BOT_TOKEN" in out
+
+
+class _FeedStreamReader:
+    def __init__(self):
+        self.calls = []
+
+    def iter_feed_bundle(self, **kwargs):
+        self.calls.append(("bundle", kwargs))
+        return iter(['{"schema_version": "feed_bundle.v1"}\n', '{"id": "item-1"}\n'])
+
+    def iter_rss_feed(self, **kwargs):
+        self.calls.append(("rss", kwargs))
+        return iter(["<rss>", "<item/>", "</rss>"])
+
+
+def test_feed_bundle_streams_jsonl_to_output_file(monkeypatch, capsys, tmp_path):
+    reader = _FeedStreamReader()
+    target = tmp_path / "exports" / "bundle.jsonl"
+    monkeypatch.setattr(cli, "DataPulseReader", lambda: reader)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["datapulse", "--feed-bundle", "--feed-format", "jsonl", "--feed-output", str(target), "--limit", "50"],
+    )
+
+    cli.main()
+    captured = capsys.readouterr()
+
+    assert target.read_text(encoding="utf-8").splitlines() == ['{"schema_version": "feed_bundle.v1"}', '{"id": "item-1"}']
+    assert captured.out == ""
+    assert f"wrote: {target}" in captured.err
+    assert reader.calls[0][1]["output_format"] == "jsonl"
+    assert reader.calls[0][1]["limit"] == 50
+    assert reader.calls[0][1]["indent"] == 2
+
+
+def test_query_rss_streams_to_stdout(monkeypatch, capsys):
+    monkeypatch.setattr(cli, "DataPulseReader", lambda: _FeedStreamReader())
+    monkeypatch.setattr(sys, "argv", ["datapulse", "--query-rss"])
+
+    cli.main()
+
+    assert capsys.readouterr().out == "<rss><item/></rss>\n"
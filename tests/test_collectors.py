@@ -619,7 +619,7 @@ class TestGenericCollectorParse:
             pytest.fail("BeautifulSoup fallback should not run after GeneralNewsExtractor success")
 
         monkeypatch.setattr(GenericCollector, "_fetch_html", fake_fetch)
-        monkeypatch.setattr(GenericCollector, "_extract_with_bs", fail_bs)
+        monkeypatch.setattr(GenericCollector, "_extract_with_lxml_walk", fail_bs)
         monkeypatch.setattr(
             GenericCollector,
             "_extract_with_firecrawl",
@@ -671,7 +671,7 @@ class TestGenericCollectorParse:
         )
         monkeypatch.setattr(
             GenericCollector,
-            "_extract_with_bs",
+            "_extract_with_lxml_walk",
             lambda self, html: pytest.fail("BeautifulSoup fallback should not run after trafilatura success"),
         )
         monkeypatch.setattr(
@@ -699,6 +699,59 @@ class TestGenericCollectorParse:
         assert result.extra["collector_provenance"]["bridge_profile"] == "trafilatura"
         assert result.extra["collector_provenance"]["transport"] == "in_process"
 
+    def test_parses_html_once_across_metadata_and_fallbacks(self, monkeypatch):
+        import lxml.html
+
+        html = (
+            "<html><head><title>Shared tree</title><meta name='author' content='Ann' /></head>"
+            "<body><nav>menu</nav><article><h1>Heading</h1><p>Body text that is long enough to keep.</p>"
+            "<aside>advert</aside>closing words</article><footer>footer</footer></body></html>"
+        )
+        parses: list[int] = []
+        original = lxml.html.document_fromstring
+
+        def counting_fromstring(*args, **kwargs):
+            parses.append(1)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(lxml.html, "document_fromstring", counting_fromstring)
+        monkeypatch.setattr(GenericCollector, "_fetch_html", lambda self, url: html)
+        fake_trafilatura = ModuleType("trafilatura")
+        fake_trafilatura.extract = lambda tree, **kwargs: "" if isinstance(tree, lxml.html.HtmlElement) else pytest.fail(
+            "trafilatura should receive the shared lxml tree"
+        )
+        monkeypatch.setitem(sys.modules, "trafilatura", fake_trafilatura)
+
+        result = GenericCollector().parse("https://example.com/english-post")
+
+        assert result.success is True
+        assert result.title == "Shared tree"
+        assert result.author == "Ann"
+        assert result.content == "Heading\nBody text that is long enough to keep.\nclosing words"
+        assert result.confidence_flags == ["fallback_bs4"]
+        assert len(parses) == 1
+
+    def test_skips_general_news_extractor_for_non_chinese_pages(self, monkeypatch):
+        html = "<html lang='en'><head><title>English</title></head><body><article>" + "word " * 40 + "</article></body></html>"
+        monkeypatch.setattr(GenericCollector, "_fetch_html", lambda self, url: html)
+
+        fake_gne = ModuleType("gne")
+
+        class FailingExtractor:
+            def extract(self, html):
+                pytest.fail("GeneralNewsExtractor should not run on pages without Chinese text")
+
+        fake_gne.GeneralNewsExtractor = FailingExtractor
+        monkeypatch.setitem(sys.modules, "gne", fake_gne)
+        fake_trafilatura = ModuleType("trafilatura")
+        fake_trafilatura.extract = lambda *args, **kwargs: "Trafilatura extracted body. " * 8
+        monkeypatch.setitem(sys.modules, "trafilatura", fake_trafilatura)
+
+        result = GenericCollector().parse("https://example.com/english-news")
+
+        assert result.success is True
+        assert result.confidence_flags == ["trafilatura"]
+
 
 def test_generic_check_reports_general_news_extractor_when_available(monkeypatch):
     fake_gne = ModuleType("gne")
@@ -0,0 +1,123 @@
+"""Tests for generation-keyed ETags and the console response cache."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from datapulse.console_cache import DEFAULT_TTL_SECONDS, cache_ttl_from_env
+from datapulse.console_server import create_app
+from datapulse.core.models import DataPulseItem, SourceType
+from datapulse.core.storage import UnifiedInbox
+from datapulse.reader import DataPulseReader
+
+
+@pytest.fixture()
+def inbox_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("DATAPULSE_WATCHLIST_PATH", str(tmp_path / "watchlist.json"))
+    monkeypatch.setenv("DATAPULSE_ALERTS_PATH", str(tmp_path / "alerts.json"))
+    monkeypatch.setenv("DATAPULSE_ALERT_ROUTING_PATH", str(tmp_path / "alert-routes.json"))
+    monkeypatch.setenv("DATAPULSE_STORIES_PATH", str(tmp_path / "stories.json"))
+    monkeypatch.setenv("DATAPULSE_REPORTS_PATH", str(tmp_path / "reports.json"))
+    monkeypatch.setenv("DATAPULSE_SOURCE_CATALOG", str(tmp_path / "catalog.json"))
+    monkeypatch.delenv("DATAPULSE_CONSOLE_CACHE_TTL", raising=False)
+    return tmp_path / "inbox.json"
+
+
+class _CountingFactory:
+    def __init__(self, inbox_path: Path):
+        self.inbox_path = inbox_path
+        self.calls = 0
+
+    def __call__(self) -> DataPulseReader:
+        self.calls += 1
+        return DataPulseReader(inbox_path=str(self.inbox_path))
+
+
+def _seed_item(inbox_path: Path, index: int) -> None:
+    inbox = UnifiedInbox(str(inbox_path))
+    inbox.add(
+        DataPulseItem(
+            source_type=SourceType.GENERIC,
+            source_name="Example News",
+            title=f"Launch update {index}",
+            content=f"Launch update body {index} " * 10,
+            url=f"https://www.example.com/launch/{index}",
+            parser="generic",
+            fetched_at=datetime.now(timezone.utc).isoformat(),
+        )
+    )
+    inbox.save()
+
+
+def test_unchanged_stores_serve_cached_payloads_and_304s(inbox_path: Path) -> None:
+    factory = _CountingFactory(inbox_path)
+    client = TestClient(create_app(reader_factory=factory))
+
+    first = client.get("/api/watches?include_disabled=true")
+    etag = first.headers["etag"]
+    calls = factory.calls
+    second = client.get("/api/watches?include_disabled=true")
+    revalidated = client.get("/api/watches?include_disabled=true", headers={"If-None-Match": etag})
+
+    assert second.json() == first.json()
+    assert second.headers["etag"] == etag
+    assert revalidated.status_code == 304
+    assert factory.calls == calls
+    assert client.app.state.response_cache.stats()["not_modified"] == 1
+
+
+def test_writes_from_any_process_change_the_etag(inbox_path: Path) -> None:
+    client = TestClient(create_app(reader_factory=_CountingFactory(inbox_path)))
+    before = client.get("/api/triage?limit=5")
+    assert before.json() == []
+
+    _seed_item(inbox_path, 1)
+    after = client.get("/api/triage?limit=5", headers={"If-None-Match": before.headers["etag"]})
+
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
+    assert [row["title"] for row in after.json()] == ["Launch update 1"]
+
+    client.post("/api/watches", json={"name": "Launch Watch", "query": "launch"})
+    assert client.app.state.response_cache.stats()["entries"] == 0
+    assert [row["name"] for row in client.get("/api/watches").json()] == ["Launch Watch"]
+
+
+def test_triage_fragments_revalidate_against_shared_rows(inbox_path: Path) -> None:
+    _seed_item(inbox_path, 1)
+    factory = _CountingFactory(inbox_path)
+    client = TestClient(create_app(reader_factory=factory))
+
+    banner = client.get("/api/fragments/triage/banner")
+    listing = client.get("/api/fragments/triage/list")
+    calls = factory.calls
+    repeat = client.get("/api/fragments/triage/list", headers={"If-None-Match": listing.headers["etag"]})
+
+    assert banner.headers["cache-control"] == "no-cache"
+    assert banner.headers["etag"] != listing.headers["etag"]
+    assert "Launch update 1" in listing.text
+    assert repeat.status_code == 304
+    assert factory.calls == calls
+
+
+def test_zero_ttl_disables_caching(inbox_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DATAPULSE_CONSOLE_CACHE_TTL", "0")
+    factory = _CountingFactory(inbox_path)
+    client = TestClient(create_app(reader_factory=factory))
+
+    client.get("/api/stories")
+    response = client.get("/api/stories")
+
+    assert "etag" not in response.headers
+    assert factory.calls == 2
+
+
+def test_cache_ttl_falls_back_on_bad_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DATAPULSE_CONSOLE_CACHE_TTL", "soon")
+    assert cache_ttl_from_env() == DEFAULT_TTL_SECONDS
+    monkeypatch.setenv("DATAPULSE_CONSOLE_CACHE_TTL", "-5")
+    assert cache_ttl_from_env() == 0.0
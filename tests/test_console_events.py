@@ -0,0 +1,161 @@
+"""Tests for the console server-sent event hub."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from starlette.requests import Request
+
+from datapulse.console_events import ConsoleEventHub, format_sse
+from datapulse.console_server import create_app
+from datapulse.core.alerts import AlertEvent
+from datapulse.core.models import DataPulseItem, SourceType
+from datapulse.core.storage import UnifiedInbox
+from datapulse.core.watchlist import MissionRun
+from datapulse.reader import DataPulseReader
+
+
+@pytest.fixture()
+def env_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("DATAPULSE_WATCHLIST_PATH", str(tmp_path / "watchlist.json"))
+    monkeypatch.setenv("DATAPULSE_ALERTS_PATH", str(tmp_path / "alerts.json"))
+    monkeypatch.setenv("DATAPULSE_ALERT_ROUTING_PATH", str(tmp_path / "alert-routes.json"))
+    monkeypatch.setenv("DATAPULSE_STORIES_PATH", str(tmp_path / "stories.json"))
+    return tmp_path
+
+
+def _item(index: int) -> DataPulseItem:
+    return DataPulseItem(
+        source_type=SourceType.GENERIC,
+        source_name="Example News",
+        title=f"Launch update {index}",
+        content=f"Launch update body {index} " * 10,
+        url=f"https://www.example.com/launch/{index}",
+        parser="generic",
+        fetched_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+def _hub(tmp_path: Path) -> ConsoleEventHub:
+    return ConsoleEventHub(lambda: DataPulseReader(inbox_path=str(tmp_path / "inbox.json")))
+
+
+def test_hub_reports_changes_written_by_other_processes(env_paths: Path) -> None:
+    hub = _hub(env_paths)
+    other = DataPulseReader(inbox_path=str(env_paths / "inbox.json"))
+    mission = other.watchlist.get(other.create_watch(name="Launch Watch", query="launch")["id"])
+    assert hub.poll() == []
+
+    inbox = UnifiedInbox(str(env_paths / "inbox.json"))
+    inbox.add(_item(1))
+    inbox.save()
+    added = dict(hub.poll())["inbox.added"]
+    assert added["count"] == 1
+    assert added["items"][0]["title"] == "Launch update 1"
+    assert added["triage_stats"]["open_count"] == 1
+
+    other.inbox.reload_if_changed()
+    other.triage_update(added["items"][0]["id"], state="verified")
+    other.watchlist.record_run(mission.id, MissionRun(mission_id=mission.id, item_count=3))
+    other.alert_store.add(AlertEvent(mission_id=mission.id, mission_name=mission.name, rule_name="launch", summary="hit"))
+    events = dict(hub.poll())
+
+    assert events["triage.updated"]["items"][0]["review_state"] == "verified"
+    assert events["triage.updated"]["items"][0]["previous_state"] == "new"
+    assert events["watch.run"]["watch"]["last_run_count"] == 3
+    assert events["alert"]["summary"] == "hit"
+    assert hub.poll() == []
+
+
+def test_daemon_heartbeat_is_published_once_per_beat(env_paths: Path) -> None:
+    hub = _hub(env_paths)
+    hub.poll()
+    daemon = DataPulseReader(inbox_path=str(env_paths / "inbox.json"))
+
+    daemon.watch_status.mark_started()
+    events = hub.poll()
+
+    assert [event for event, _ in events] == ["daemon.heartbeat"]
+    assert events[0][1]["state"] == "running"
+    assert hub.poll() == []
+
+
+async def test_subscribers_replay_from_last_event_id_and_resync_when_expired(env_paths: Path) -> None:
+    hub = ConsoleEventHub(lambda: None, backlog=2)
+    for index in range(3):
+        hub.publish("alert", {"id": str(index)})
+
+    replay = hub.subscribe(last_event_id=2)
+    assert replay.get_nowait()[:2] == (3, "alert")
+    assert replay.empty()
+
+    expired = hub.subscribe(last_event_id=0)
+    assert expired.get_nowait()[1] == "resync"
+
+    hub.publish("alert", {"id": "live"})
+    assert replay.get_nowait()[2] == {"id": "live"}
+    assert hub.subscriber_count == 2
+
+
+async def test_event_id_from_a_previous_hub_triggers_resync(env_paths: Path) -> None:
+    hub = ConsoleEventHub(lambda: None)
+    hub.publish("alert", {"id": "1"})
+
+    queue = hub.subscribe(last_event_id=40)
+
+    assert queue.get_nowait() == (1, "resync", {"reason": "unknown_event_id"})
+    assert queue.empty()
+
+
+async def test_poller_stops_when_the_last_subscriber_leaves(env_paths: Path) -> None:
+    hub = ConsoleEventHub(lambda: None, keepalive_seconds=0.05)
+    first, second = hub.stream(), hub.stream()
+    await first.__anext__()
+    await second.__anext__()
+    task = hub._task
+    assert task is not None
+
+    await first.aclose()
+    assert hub._task is task and not task.done()
+    await second.aclose()
+    await asyncio.sleep(0)
+
+    assert hub._task is None
+    assert task.cancelled()
+
+
+async def test_stream_frames_events_and_keepalives(env_paths: Path) -> None:
+    hub = ConsoleEventHub(lambda: None, keepalive_seconds=0.05)
+    stream = hub.stream()
+    assert (await stream.__anext__()).startswith("retry:")
+    assert "event: hello" in await stream.__anext__()
+    assert await stream.__anext__() == ": keepalive\n\n"
+
+    hub.publish("watch.run", {"mission_id": "m1"})
+    frame = await asyncio.wait_for(stream.__anext__(), timeout=1)
+    assert frame == format_sse("watch.run", {"mission_id": "m1"}, event_id=1)
+    assert json.loads(frame.splitlines()[2][len("data: "):]) == {"mission_id": "m1"}
+
+    await stream.aclose()
+    await hub.stop()
+    assert hub.subscriber_count == 0
+
+
+async def test_console_app_serves_the_hub_as_an_event_stream() -> None:
+    app = create_app(reader_factory=lambda: None)
+    route = next(route for route in app.routes if getattr(route, "path", "") == "/api/events")
+    request = Request(
+        {"type": "http", "method": "GET", "path": "/api/events", "headers": [(b"last-event-id", b"0")], "query_string": b""}
+    )
+
+    response = await route.endpoint(request)
+
+    assert response.media_type == "text/event-stream"
+    assert response.headers["cache-control"] == "no-cache"
+    assert (await response.body_iterator.__anext__()).startswith("retry:")
+    await response.body_iterator.aclose()
+    await app.state.event_hub.stop()
@@ -2985,3 +2985,41 @@ def test_console_ops_scorecard_with_real_reader(tmp_path, monkeypatch):
     assert scorecard_direct["summary"] == scorecard["summary"]
     assert scorecard_direct["mission_scope"] == scorecard["mission_scope"]
     assert scorecard_direct["signals"] == scorecard["signals"]
+
+
+def test_console_feed_routes_stream_bundle_and_xml(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATAPULSE_SOURCE_CATALOG", str(tmp_path / "catalog.json"))
+    reader = DataPulseReader(inbox_path=str(tmp_path / "inbox.json"))
+    reader.inbox.add(
+        DataPulseItem(
+            source_type=SourceType.GENERIC,
+            source_name="example",
+            title="Streamed item",
+            content="Streamed content",
+            url="https://example.com/streamed",
+            confidence=0.9,
+        )
+    )
+    client = TestClient(create_app(reader_factory=lambda: reader))
+
+    bundle = client.get("/api/feeds/bundle?limit=5")
+    lines = client.get("/api/feeds/bundle?format=jsonl&limit=5")
+    feed = client.get("/api/feeds/json")
+    rss = client.get("/api/feeds/rss")
+    atom = client.get("/api/feeds/atom")
+    invalid = client.get("/api/feeds/bundle?format=yaml")
+
+    assert bundle.status_code == 200
+    assert bundle.headers["content-type"].startswith("application/json")
+    assert [item["title"] for item in bundle.json()["items"]] == ["Streamed item"]
+    assert lines.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in lines.text.splitlines()]
+    assert rows[0]["stats"]["items_selected"] == 1
+    assert rows[1]["title"] == "Streamed item"
+    assert feed.headers["content-type"].startswith("application/feed+json")
+    assert feed.json()["items"][0]["title"] == "Streamed item"
+    assert rss.headers["content-type"].startswith("application/rss+xml")
+    assert "<title>Streamed item</title>" in rss.text
+    assert atom.headers["content-type"].startswith("application/atom+xml")
+    assert atom.text.endswith("</feed>")
+    assert invalid.status_code == 400
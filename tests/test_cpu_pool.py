@@ -0,0 +1,106 @@
+"""Tests for the optional CPU-bound extraction process pool."""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from datapulse.collectors.generic import GenericCollector
+from datapulse.core import cpu_pool
+from datapulse.core.cpu_pool import cpu_workers_from_env, run_cpu_bound, should_offload, shutdown_cpu_pool
+
+ARTICLE_HTML = (
+    "<html><head><title>Pooled page</title><meta name='author' content='Ann' /></head><body>"
+    "<nav>menu</nav><article>"
+    + "".join(
+        f"<p>Paragraph {index} carries enough ordinary prose for the extractor to keep it as body text.</p>"
+        for index in range(8)
+    )
+    + "</article></body></html>"
+)
+
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+
+@pytest.fixture(autouse=True)
+def _stop_pool():
+    yield
+    shutdown_cpu_pool()
+
+
+def test_runs_inline_by_default(monkeypatch):
+    monkeypatch.delenv("DATAPULSE_CPU_WORKERS", raising=False)
+
+    assert cpu_workers_from_env() == 0
+    assert should_offload(10_000_000) is False
+    assert run_cpu_bound(_worker_pid) == os.getpid()
+
+
+def test_worker_count_and_size_threshold(monkeypatch):
+    monkeypatch.setenv("DATAPULSE_CPU_WORKERS", "auto")
+    assert cpu_workers_from_env() == min(cpu_pool.available_cpus(), 64)
+
+    monkeypatch.setenv("DATAPULSE_CPU_WORKERS", "2")
+    monkeypatch.setenv("DATAPULSE_CPU_POOL_MIN_CHARS", "1000")
+    assert cpu_workers_from_env() == 2
+    assert should_offload(999) is False
+    assert should_offload(1000) is True
+
+
+def test_offloads_to_worker_process_and_falls_back_for_unpicklable_work(monkeypatch):
+    monkeypatch.setenv("DATAPULSE_CPU_WORKERS", "1")
+
+    assert run_cpu_bound(_worker_pid) != os.getpid()
+    assert run_cpu_bound(lambda: os.getpid()) == os.getpid()
+
+
+def _slow_worker_pid() -> int:
+    time.sleep(0.5)
+    return os.getpid()
+
+
+def test_resizing_the_pool_lets_in_flight_work_finish(monkeypatch):
+    monkeypatch.setenv("DATAPULSE_CPU_WORKERS", "1")
+    old_pool = cpu_pool._shared_pool()
+    in_flight = old_pool.submit(_slow_worker_pid)
+
+    monkeypatch.setenv("DATAPULSE_CPU_WORKERS", "2")
+    assert cpu_pool._shared_pool() is not old_pool
+
+    assert in_flight.result(timeout=30) != os.getpid()
+
+
+def test_cancelled_work_falls_back_to_inline(monkeypatch):
+    class _CancellingPool:
+        def submit(self, fn, *args):
+            future: Future[int] = Future()
+            future.cancel()
+            return future
+
+    monkeypatch.setattr(cpu_pool, "_shared_pool", lambda: _CancellingPool())
+
+    assert run_cpu_bound(_worker_pid) == os.getpid()
+
+
+def test_generic_extraction_in_worker_matches_inline(monkeypatch):
+    monkeypatch.setattr(GenericCollector, "_fetch_html", lambda self, url: ARTICLE_HTML)
+    inline = GenericCollector().parse("https://example.com/pooled")
+
+    monkeypatch.setenv("DATAPULSE_CPU_WORKERS", "1")
+    monkeypatch.setenv("DATAPULSE_CPU_POOL_MIN_CHARS", "0")
+    monkeypatch.setattr(
+        GenericCollector,
+        "_extract_document",
+        lambda self, document: pytest.fail("extraction should run in the worker process"),
+    )
+    pooled = GenericCollector().parse("https://example.com/pooled")
+
+    assert pooled.success is True
+    assert pooled == inline
+    assert pooled.title == "Pooled page"
+    assert "Paragraph 7" in pooled.content
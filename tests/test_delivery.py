@@ -207,10 +207,12 @@ def test_normalized_delivery_subscriptions_are_persisted_for_multiple_subjects(t
     assert reloaded_reader.show_delivery_subscription(watch_sub["id"]) is not None
     assert reloaded_reader.show_delivery_subscription(story_sub["id"]) is not None
 
-    payload = json.loads(Path(os.environ["DATAPULSE_REPORTS_PATH"]).read_text(encoding="utf-8"))
-    assert "delivery_subscriptions" in payload
-    assert len(payload["delivery_subscriptions"]) == 4
-    for row in payload["delivery_subscriptions"]:
+    reports_path = Path(os.environ["DATAPULSE_REPORTS_PATH"])
+    manifest = json.loads(reports_path.read_text(encoding="utf-8"))
+    subscription_file = reports_path.parent / manifest["collections"]["delivery_subscriptions"]["file"]
+    subscriptions = json.loads(subscription_file.read_text(encoding="utf-8"))
+    assert len(subscriptions) == 4
+    for row in subscriptions:
         assert isinstance(row["route_names"], list)
         assert "webhook_url" not in row
         assert "telegram_bot_token" not in row
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+
 import pytest
 
 from datapulse.collectors import (
@@ -185,7 +188,7 @@ def test_doctor_entry_shape():
 def test_doctor_tier0_all_ok():
     """Tier-0 collectors should always report ok (zero deps)."""
     pipeline = ParsePipeline()
-    report = pipeline.doctor()
+    report = pipeline.doctor(fresh=True)
     for entry in report["tier_0"]:
         assert entry["status"] == "ok", f"{entry['name']} tier-0 should be ok"
 
@@ -198,3 +201,129 @@ def test_doctor_names_unique():
         for entry in entries:
             names.append(entry["name"])
     assert len(names) == len(set(names)), "Doctor report has duplicate collector names"
+
+
+# ── Cached health probes ────────────────────────────────────────────────────
+
+class _CountingCollector(BaseCollector):
+    name = "counting"
+    tier = 0
+    health_ttl_seconds = 300.0
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def can_handle(self, url: str) -> bool:
+        return False
+
+    def parse(self, url: str):
+        pass
+
+    def check(self):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return {"status": "ok", "message": f"call {self.calls}", "available": True}
+
+
+def _pipeline_with(*parsers):
+    pipeline = ParsePipeline()
+    pipeline.parsers = list(parsers)
+    return pipeline
+
+
+def test_doctor_reuses_cached_probe_until_fresh():
+    collector = _CountingCollector()
+    pipeline = _pipeline_with(collector)
+    first = pipeline.doctor()
+    second = pipeline.doctor()
+    assert collector.calls == 1
+    assert first["tier_0"][0]["checked_at"] == second["tier_0"][0]["checked_at"]
+    assert second["tier_0"][0]["age_seconds"] >= 0
+
+    pipeline.doctor(fresh=True)
+    assert collector.calls == 2
+
+
+def test_doctor_serves_stale_probe_and_refreshes_in_background():
+    collector = _CountingCollector()
+    collector.health_ttl_seconds = 0.0
+    pipeline = _pipeline_with(collector)
+    pipeline.doctor()
+    time.sleep(0.01)
+
+    stale = pipeline.doctor()
+    assert stale["tier_0"][0]["message"] == "call 1"
+    deadline = time.monotonic() + 2
+    while collector.calls < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert collector.calls == 2
+
+
+def test_doctor_check_exception_is_reported_not_raised():
+    class Broken(_CountingCollector):
+        name = "broken"
+
+        def check(self):
+            raise RuntimeError("boom")
+
+    report = _pipeline_with(Broken()).doctor()
+    entry = report["tier_0"][0]
+    assert entry["status"] == "error"
+    assert entry["available"] is False
+    assert "boom" in entry["message"]
+
+
+def test_doctor_async_probes_in_parallel():
+    class Slow(_CountingCollector):
+        pass
+
+    parsers = []
+    for index in range(4):
+        slow = type(f"Slow{index}", (Slow,), {"name": f"slow-{index}"})(delay=0.2)
+        parsers.append(slow)
+    pipeline = _pipeline_with(*parsers)
+
+    started = time.monotonic()
+    report = asyncio.run(pipeline.doctor_async())
+    elapsed = time.monotonic() - started
+    assert len(report["tier_0"]) == 4
+    assert elapsed < 0.6
+    assert all(parser.calls == 1 for parser in parsers)
+
+
+def test_cold_doctor_reports_slow_probes_as_pending(monkeypatch):
+    monkeypatch.setenv("DATAPULSE_HEALTH_COLD_WAIT_SECONDS", "0.05")
+    slow = _CountingCollector(delay=0.5)
+    pipeline = _pipeline_with(slow)
+
+    started = time.monotonic()
+    report = pipeline.doctor()
+    assert time.monotonic() - started < 0.4
+    entry = report["tier_0"][0]
+    assert entry["status"] == "pending"
+    assert entry["ok"] is False
+
+    deadline = time.monotonic() + 3
+    while pipeline.doctor()["tier_0"][0]["status"] == "pending" and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert pipeline.doctor()["tier_0"][0]["message"] == "call 1"
+    assert slow.calls == 1
+
+
+def test_restarted_refresher_does_not_revive_the_stopped_loop():
+    from datapulse.core.health import HealthProbeCache
+
+    cache = HealthProbeCache()
+    slow = _CountingCollector(delay=0.2)
+    assert cache.start_refresher(lambda: [slow], interval=1.0) is True
+    old = cache._refresher
+    time.sleep(0.05)  # the first cycle is still probing
+
+    cache.stop_refresher()
+    assert cache.start_refresher(lambda: [], interval=1.0) is True
+    old.join(timeout=2)
+
+    assert not old.is_alive()
+    cache.stop_refresher()
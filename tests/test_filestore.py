@@ -0,0 +1,154 @@
+"""Tests for multi-process safe store persistence."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from datapulse.core.alerts import AlertEvent, AlertStore
+from datapulse.core.filestore import (
+    ReloadableStore,
+    atomic_write_json,
+    file_lock,
+    generation_path_for,
+    lock_path_for,
+    read_generation,
+)
+from datapulse.core.models import DataPulseItem, SourceType
+from datapulse.core.source_catalog import SourceCatalog
+from datapulse.core.storage import UnifiedInbox
+from datapulse.core.watchlist import WatchlistStore
+
+fcntl = pytest.importorskip("fcntl")
+
+
+def test_atomic_write_json_bumps_generation_and_leaves_no_temp_files(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    assert read_generation(path) == 0
+
+    assert atomic_write_json(path, {"a": 1}) == 1
+    assert atomic_write_json(path, {"a": 2}) == 2
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 2}
+    assert read_generation(path) == 2
+    assert generation_path_for(path).exists()
+    assert not [entry for entry in os.listdir(tmp_path) if entry.endswith(".tmp")]
+
+
+def test_failed_write_keeps_previous_file_intact(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "store.json"
+    atomic_write_json(path, {"ok": True})
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("datapulse.core.filestore.os.replace", broken_replace)
+    with pytest.raises(OSError):
+        atomic_write_json(path, {"ok": False})
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"ok": True}
+    assert read_generation(path) == 1
+    assert not [entry for entry in os.listdir(tmp_path) if entry.endswith(".tmp")]
+
+
+def test_file_lock_excludes_other_holders_and_is_reentrant(tmp_path: Path) -> None:
+    path = tmp_path / "store.json"
+    with file_lock(path):
+        with file_lock(path):
+            pass
+        fd = os.open(lock_path_for(path), os.O_RDWR)
+        try:
+            with pytest.raises(BlockingIOError):
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        finally:
+            os.close(fd)
+
+    fd = os.open(lock_path_for(path), os.O_RDWR)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def test_store_reloads_only_when_another_writer_changed_it(tmp_path: Path) -> None:
+    path = str(tmp_path / "watchlist.json")
+    daemon_view = WatchlistStore(path)
+    console_view = WatchlistStore(path)
+    assert daemon_view.reload_if_changed() is False
+
+    mission = console_view.create_mission(name="Launch Watch", query="launch")
+    console_view.save()
+    assert console_view.has_changed() is False
+
+    assert daemon_view.has_changed() is True
+    assert daemon_view.reload_if_changed() is True
+    assert mission.id in daemon_view.missions
+    assert daemon_view.reload_if_changed() is False
+
+
+def test_alert_compaction_keeps_events_journaled_by_other_process(tmp_path: Path) -> None:
+    path = str(tmp_path / "alerts.json")
+    first = AlertStore(path)
+    second = AlertStore(path)
+    ours = AlertEvent(mission_id="m1", mission_name="M1", rule_name="r", created_at="2026-03-01T00:00:00+00:00")
+    theirs = AlertEvent(mission_id="m2", mission_name="M2", rule_name="r", created_at="2026-03-01T00:05:00+00:00")
+
+    first.add(ours)
+    second.add(theirs)
+    first.save()
+
+    reloaded = AlertStore(path)
+    assert {event.id for event in reloaded.events} == {ours.id, theirs.id}
+    assert not Path(first.journal_path).exists()
+
+
+def _inbox_item(url: str) -> DataPulseItem:
+    return DataPulseItem(source_type=SourceType.GENERIC, source_name="test", title=url, content=url, url=url)
+
+
+def test_reloadable_store_requires_a_loader() -> None:
+    with pytest.raises(TypeError):
+        ReloadableStore()  # type: ignore[abstract]
+
+
+def test_store_mutation_applies_on_top_of_other_writers_changes(tmp_path: Path) -> None:
+    path = str(tmp_path / "catalog.json")
+    first = SourceCatalog(path)
+    second = SourceCatalog(path)
+    a = first.register_auto_source("A", "rss", "https://a.example/feed")
+    b = second.register_auto_source("B", "rss", "https://b.example/feed")
+
+    assert first.subscribe("default", a.id) is True
+    assert second.subscribe("default", b.id) is True
+
+    assert SourceCatalog(path).get_subscription("default") == [a.id, b.id]
+
+
+def test_inbox_save_merges_items_and_edits_from_other_process(tmp_path: Path) -> None:
+    path = str(tmp_path / "inbox.json")
+    seed = UnifiedInbox(path)
+    shared, doomed = _inbox_item("https://shared.example"), _inbox_item("https://doomed.example")
+    seed.add(shared)
+    seed.add(doomed)
+    seed.save()
+
+    daemon, console = UnifiedInbox(path), UnifiedInbox(path)
+    daemon.add(_inbox_item("https://fresh.example"))
+    daemon.save()
+    console.mark_processed(shared.id)
+    console.delete(doomed.id)
+    console.save()
+    daemon.add(_inbox_item("https://later.example"))
+    daemon.save()
+
+    merged = {item.id: item for item in UnifiedInbox(path).items}
+    assert set(merged) == {
+        shared.id,
+        _inbox_item("https://fresh.example").id,
+        _inbox_item("https://later.example").id,
+    }
+    assert merged[shared.id].processed is True
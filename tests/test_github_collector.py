@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import time
 from unittest.mock import patch
 
+import pytest
+
+from datapulse.collectors import github as github_module
 from datapulse.collectors.github import GitHubCollector
 
 
 class _Resp:
-    def __init__(self, status_code: int, payload: dict | None = None):
+    def __init__(self, status_code: int, payload: dict | None = None, headers: dict | None = None):
         self.status_code = status_code
         self._payload = payload or {}
+        self.headers = headers or {}
 
     def json(self):
         return self._payload
@@ -92,3 +97,68 @@ def test_parse_repo_404_returns_failure():
         result = collector.parse("https://github.com/acme/missing")
 
     assert result.success is False
+
+
+@pytest.fixture()
+def _no_rate_limit(monkeypatch):
+    monkeypatch.setattr(github_module, "_rate_limit_reset_at", 0.0)
+
+
+def _repo_api(calls: list[tuple[str, dict]], *, repo_status: int = 200, etag: str = '"v1"', remaining: str = "59"):
+    def _fake_get(url: str, headers: dict | None = None, **kwargs):  # noqa: ARG001
+        calls.append((url, dict(headers or {})))
+        if url.endswith("/releases/latest"):
+            return _Resp(200, {"tag_name": "v2.0.0"}, headers={"X-RateLimit-Remaining": remaining})
+        return _Resp(
+            repo_status,
+            {"full_name": "acme/project", "stargazers_count": 321, "forks_count": 4} if repo_status == 200 else {},
+            headers={"ETag": etag, "X-RateLimit-Remaining": remaining, "X-RateLimit-Reset": str(int(time.time()) + 600)},
+        )
+
+    return _fake_get
+
+
+def test_repo_metadata_is_served_from_cache_within_ttl(_no_rate_limit):
+    calls: list[tuple[str, dict]] = []
+    with patch("requests.get", side_effect=_repo_api(calls)):
+        first = GitHubCollector().parse("https://github.com/acme/project")
+        second = GitHubCollector().parse("https://github.com/ACME/project")
+
+    assert len(calls) == 2
+    assert first.extra["cache"] == "miss"
+    assert second.extra["cache"] == "hit"
+    assert second.extra["stars"] == 321
+    assert second.extra["release"]["tag_name"] == "v2.0.0"
+
+
+def test_expired_entry_revalidates_with_etag(_no_rate_limit, monkeypatch):
+    monkeypatch.setenv("DATAPULSE_GITHUB_CACHE_TTL", "0")
+    calls: list[tuple[str, dict]] = []
+    with patch("requests.get", side_effect=_repo_api(calls)):
+        GitHubCollector().parse("https://github.com/acme/project")
+    calls.clear()
+    with patch("requests.get", side_effect=_repo_api(calls, repo_status=304)):
+        result = GitHubCollector().parse("https://github.com/acme/project")
+
+    assert [url for url, _ in calls] == ["https://api.github.com/repos/acme/project"]
+    assert calls[0][1]["If-None-Match"] == '"v1"'
+    assert result.extra["cache"] == "revalidated"
+    assert result.extra["stars"] == 321
+    assert result.extra["api_degraded"] is False
+
+
+def test_exhausted_rate_limit_stops_requests_and_serves_stale(_no_rate_limit, monkeypatch):
+    monkeypatch.setenv("DATAPULSE_GITHUB_CACHE_TTL", "0")
+    calls: list[tuple[str, dict]] = []
+    with patch("requests.get", side_effect=_repo_api(calls, remaining="0")):
+        GitHubCollector().parse("https://github.com/acme/project")
+        assert github_module.github_rate_limited() is True
+        calls.clear()
+        cached = GitHubCollector().parse("https://github.com/acme/project")
+        uncached = GitHubCollector().parse("https://github.com/acme/other")
+
+    assert calls == []
+    assert cached.extra["cache"] == "stale"
+    assert cached.extra["stars"] == 321
+    assert uncached.extra["api_degraded"] is True
+    assert uncached.extra["degraded_reason"] == "github_rate_limited"
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
 
 from datapulse.collectors.base import ParseResult
 from datapulse.core.models import DataPulseItem, SourceType
@@ -96,3 +98,68 @@ def test_build_hotspot_evidence_pack(monkeypatch):
     assert rows[0]["github_repo"] == "openlineage/openlineage"
     assert rows[0]["repo_api_degraded"] is False
     assert rows[0]["confidence"] >= 0.86
+
+
+def test_build_hotspot_evidence_pack_dedupes_repos_and_runs_in_parallel(monkeypatch):
+    def _item(idx: int, source_type: SourceType, content: str) -> DataPulseItem:
+        return DataPulseItem(
+            source_type=source_type,
+            source_name="search",
+            title=f"Post {idx}",
+            content=content,
+            url=f"https://www.reddit.com/r/data/comments/{idx}/post" if source_type == SourceType.REDDIT else f"https://example.com/{idx}",
+            confidence=0.8 + idx / 100,
+            confidence_factors=["search_result"],
+        )
+
+    shared = "See https://github.com/acme/shared"
+    items = [_item(idx, SourceType.GENERIC, shared) for idx in range(4)]
+    items += [_item(10 + idx, SourceType.REDDIT, "no links") for idx in range(3)]
+    reads: list[str] = []
+    parses: list[str] = []
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class _FakeReader:
+        async def search(self, *args, **kwargs):  # noqa: ANN002, ANN003
+            return items
+
+        async def read(self, url: str, **kwargs):  # noqa: ANN003
+            reads.append(url)
+            await asyncio.sleep(0.02)
+            idx = url.split("/")[-2]
+            return _item(int(idx), SourceType.REDDIT, f"https://github.com/acme/repo{idx} https://github.com/acme/shared")
+
+    class _FakeGitHubCollector:
+        def parse(self, url: str) -> ParseResult:
+            nonlocal in_flight, peak
+            with lock:
+                parses.append(url)
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            repo = url.split("github.com/")[1]
+            return ParseResult(
+                url=url,
+                title=repo,
+                content="meta",
+                source_type=SourceType.GENERIC,
+                extra={"repo": repo, "stars": 10, "api_degraded": False},
+            )
+
+    monkeypatch.setattr(hotspot, "DataPulseReader", lambda: _FakeReader())
+    monkeypatch.setattr(hotspot, "GitHubCollector", lambda: _FakeGitHubCollector())
+
+    rows = asyncio.run(hotspot.build_hotspot_evidence_pack(query="q", platform="reddit", min_confidence=0.5))
+
+    assert len(reads) == 3
+    assert sorted(parses) == sorted(
+        ["https://github.com/acme/shared"] + [f"https://github.com/acme/repo{idx}" for idx in (10, 11, 12)]
+    )
+    assert peak > 1
+    assert {row["github_repo"] for row in rows} == {"acme/shared", "acme/repo10", "acme/repo11", "acme/repo12"}
+    shared_row = next(row for row in rows if row["github_repo"] == "acme/shared")
+    assert shared_row["source_url"] == "https://www.reddit.com/r/data/comments/12/post"
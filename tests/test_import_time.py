@@ -0,0 +1,114 @@
+"""Cold-start guards: short CLI/MCP entry points must not import the heavy stack."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = (
+    "requests",
+    "urllib3",
+    "bs4",
+    "lxml",
+    "feedparser",
+    "tldextract",
+    "datapulse.collectors.generic",
+    "datapulse.collectors.rss",
+    "datapulse.core.search_gateway",
+)
+
+# The eager path a cold CLI used to take: the reader plus the fetch/parse stack.
+EAGER_IMPORTS = "import datapulse.cli, datapulse.reader, " + ", ".join(
+    name for name in HEAVY_MODULES if name != "lxml"
+) + ", lxml.html"
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+
+
+def _loaded_after(statement: str) -> list[str]:
+    script = (
+        "import json, sys\n"
+        f"{statement}\n"
+        f"print(json.dumps([name for name in {list(HEAVY_MODULES)!r} if name in sys.modules]))\n"
+    )
+    return json.loads(_run_python("-c", script).stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import datapulse",
+        "import datapulse.cli",
+        "import datapulse.cli; import sys; assert 'datapulse.reader' not in sys.modules",
+        "import datapulse.mcp_server",
+        "from datapulse.reader import DataPulseReader",
+        "from datapulse.core.router import ParsePipeline; ParsePipeline()",
+    ],
+)
+def test_entry_points_do_not_import_heavy_modules(statement: str) -> None:
+    assert _loaded_after(statement) == []
+
+
+def test_package_exports_resolve_lazily() -> None:
+    script = (
+        "import sys, datapulse\n"
+        "assert 'datapulse.reader' not in sys.modules\n"
+        "from datapulse import DataPulseReader, SourceType\n"
+        "from datapulse.core import ParsePipeline, ReportStore\n"
+        "from datapulse.collectors import RssCollector\n"
+        "assert DataPulseReader.__module__ == 'datapulse.reader'\n"
+        "assert SourceType.GENERIC.value == 'generic'\n"
+        "assert 'feedparser' in sys.modules\n"
+        "print('ok')\n"
+    )
+    assert _run_python("-c", script).stdout.strip() == "ok"
+
+
+def test_parse_pipeline_builds_collectors_on_first_access() -> None:
+    loaded = _loaded_after(
+        "from datapulse.core.router import ParsePipeline\n"
+        "assert len(ParsePipeline().parsers) == 16"
+    )
+    assert "datapulse.collectors.generic" in loaded
+
+
+def test_unknown_lazy_attribute_raises_attribute_error() -> None:
+    import datapulse
+    import datapulse.collectors
+    import datapulse.core
+
+    for module in (datapulse, datapulse.core, datapulse.collectors):
+        with pytest.raises(AttributeError):
+            getattr(module, "DoesNotExist")
+
+
+def _import_us(statement: str, *, runs: int = 3) -> int:
+    """Best-of-``runs`` total of top-level cumulative times reported by ``-X importtime``."""
+    best = 0
+    for _ in range(runs):
+        result = _run_python("-X", "importtime", "-c", statement)
+        total = 0
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            # Nested imports are indented under their parent; only top-level rows add up.
+            if len(parts) == 3 and parts[1].strip().isdigit() and not parts[2].startswith("  "):
+                total += int(parts[1])
+        best = total if not best else min(best, total)
+    return best
+
+
+def test_cli_import_time_well_under_eager_path() -> None:
+    # Relative to the eager imports measured in the same run, so machine speed cancels out.
+    lazy_us = _import_us("import datapulse.cli")
+    eager_us = _import_us(EAGER_IMPORTS)
+    assert 0 < lazy_us < eager_us / 2, (lazy_us, eager_us)
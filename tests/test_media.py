@@ -1,13 +1,20 @@
-"""Tests for XHS media Referer injection utility."""
+"""Tests for media Referer injection, streamed downloads and the media cache."""
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import time
 from unittest.mock import MagicMock, patch
 
 from datapulse.core.media import (
+    MediaCache,
     build_media_headers,
     build_referer,
     download_media,
+    fetch_media,
+    multipart_file_body,
     needs_referer,
 )
 
@@ -82,3 +89,264 @@ class TestDownloadMedia:
         ):
             data = download_media("https://sns-img-qc.xhscdn.com/photo.jpg")
             assert data is None
+
+    def test_does_not_persist_without_a_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DATAPULSE_MEDIA_CACHE_DIR", str(tmp_path / "media"))
+        with patch("datapulse.core.media.requests.get", return_value=_StreamResp(b"image-bytes")):
+            assert download_media("https://cdn.example.com/a.jpg") == b"image-bytes"
+
+        assert not (tmp_path / "media").exists()
+
+
+class _StreamResp:
+    def __init__(self, body: bytes, *, status_code: int = 200, fail_after: int | None = None, headers: dict | None = None):
+        self.body = body
+        self.status_code = status_code
+        self.fail_after = fail_after
+        self.headers = headers or {"Content-Type": "image/jpeg"}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests as req_lib
+
+            raise req_lib.HTTPError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size: int = 8192):
+        import requests as req_lib
+
+        for start in range(0, len(self.body), 4):
+            if self.fail_after is not None and start >= self.fail_after:
+                raise req_lib.ConnectionError("connection reset")
+            yield self.body[start:start + 4]
+
+    def close(self):
+        pass
+
+
+class TestFetchMedia:
+    def test_streams_to_disk_and_serves_repeat_urls_from_cache(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"))
+        calls: list[dict] = []
+
+        def _get(url, headers=None, **kwargs):
+            calls.append(dict(headers or {}))
+            return _StreamResp(b"image-bytes-0123")
+
+        with patch("datapulse.core.media.requests.get", side_effect=_get):
+            first = fetch_media("https://cdn.example.com/a.jpg", cache=cache)
+            second = fetch_media("https://cdn.example.com/a.jpg", cache=cache)
+
+        assert len(calls) == 1
+        assert first is not None and second is not None
+        assert first.path.read_bytes() == b"image-bytes-0123"
+        assert first.sha256 == hashlib.sha256(b"image-bytes-0123").hexdigest()
+        assert first.content_type == "image/jpeg"
+        assert second.cached is True
+        assert second.path == first.path
+
+    def test_identical_bodies_are_stored_once(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"))
+        with patch("datapulse.core.media.requests.get", side_effect=lambda *a, **k: _StreamResp(b"same-body")):
+            one = fetch_media("https://cdn.example.com/one.jpg", cache=cache)
+            two = fetch_media("https://mirror.example.com/two.jpg", cache=cache)
+
+        assert one.path == two.path
+        assert len(list(cache.blob_dir.iterdir())) == 1
+
+    def test_interrupted_download_resumes_with_range(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"))
+        body = b"0123456789abcdef"
+        calls: list[dict] = []
+
+        def _get(url, headers=None, **kwargs):
+            calls.append(dict(headers or {}))
+            if len(calls) == 1:
+                return _StreamResp(body, fail_after=8, headers={"Content-Type": "video/mp4", "ETag": '"v1"'})
+            offset = int(headers["Range"].split("=")[1].rstrip("-"))
+            return _StreamResp(body[offset:], status_code=206, headers={"Content-Type": "video/mp4"})
+
+        with patch("datapulse.core.media.requests.get", side_effect=_get):
+            media = fetch_media("https://cdn.example.com/video.mp4", cache=cache)
+
+        assert media is not None
+        assert calls[1]["Range"] == "bytes=8-"
+        assert calls[1]["If-Range"] == '"v1"'
+        assert media.path.read_bytes() == body
+        assert media.sha256 == hashlib.sha256(body).hexdigest()
+        assert not list(cache.partial_dir.glob("*.part"))
+        assert not list(cache.partial_dir.glob("*.meta"))
+
+    def test_changed_body_answered_with_200_restarts_from_scratch(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"))
+        old, new = b"0123456789abcdef", b"NEW-BODY-0123456789"
+        calls: list[dict] = []
+
+        def _get(url, headers=None, **kwargs):
+            calls.append(dict(headers or {}))
+            if len(calls) == 1:
+                return _StreamResp(old, fail_after=8, headers={"ETag": '"v1"'})
+            return _StreamResp(new, status_code=200, headers={"ETag": '"v2"'})
+
+        with patch("datapulse.core.media.requests.get", side_effect=_get):
+            media = fetch_media("https://cdn.example.com/video.mp4", cache=cache)
+
+        assert calls[1]["If-Range"] == '"v1"'
+        assert media.path.read_bytes() == new
+
+    def test_part_without_validator_is_not_resumed(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"))
+        body = b"0123456789abcdef"
+        calls: list[dict] = []
+
+        def _get(url, headers=None, **kwargs):
+            calls.append(dict(headers or {}))
+            return _StreamResp(body, fail_after=8 if len(calls) == 1 else None, headers={"Content-Type": "video/mp4"})
+
+        with patch("datapulse.core.media.requests.get", side_effect=_get):
+            media = fetch_media("https://cdn.example.com/video.mp4", cache=cache)
+
+        assert "Range" not in calls[1]
+        assert media.path.read_bytes() == body
+
+    def test_416_commits_the_part_only_when_its_length_matches(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"))
+        url = "https://cdn.example.com/clip.mp4"
+        part = cache.partial_path(url)
+        part.parent.mkdir(parents=True)
+        part.write_bytes(b"stale-part-bytes")
+        part.with_suffix(".meta").write_text(json.dumps({"etag": '"v1"', "content_type": "video/mp4"}))
+        responses = iter(
+            [
+                _StreamResp(b"", status_code=416, headers={"Content-Range": "bytes */99"}),
+                _StreamResp(b"fresh-body", headers={"Content-Type": "video/mp4"}),
+            ]
+        )
+
+        with patch("datapulse.core.media.requests.get", side_effect=lambda *a, **k: next(responses)):
+            media = fetch_media(url, cache=cache)
+        assert media.path.read_bytes() == b"fresh-body"
+
+        complete = "https://cdn.example.com/done.mp4"
+        cache.partial_path(complete).write_bytes(b"whole-body")
+        cache.partial_path(complete).with_suffix(".meta").write_text(json.dumps({"etag": '"v1"', "content_type": "video/mp4"}))
+        with patch(
+            "datapulse.core.media.requests.get",
+            return_value=_StreamResp(b"", status_code=416, headers={"Content-Range": "bytes */10"}),
+        ):
+            done = fetch_media(complete, cache=cache)
+        assert done.path.read_bytes() == b"whole-body"
+        assert done.content_type == "video/mp4"
+
+    def test_oversized_body_is_discarded(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"))
+        with patch("datapulse.core.media.requests.get", return_value=_StreamResp(b"x" * 64)):
+            assert fetch_media("https://cdn.example.com/big.bin", cache=cache, max_bytes=16) is None
+
+        assert not list(cache.partial_dir.glob("*.part"))
+
+    def test_cache_is_trimmed_oldest_first(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"), max_bytes=20)
+        with patch("datapulse.core.media.requests.get", side_effect=[_StreamResp(b"a" * 12), _StreamResp(b"b" * 12)]):
+            first = fetch_media("https://cdn.example.com/a.bin", cache=cache)
+            second = fetch_media("https://cdn.example.com/b.bin", cache=cache)
+
+        assert not first.path.exists()
+        assert second.path.exists()
+        assert cache.lookup("https://cdn.example.com/a.bin") is None
+        assert set(cache.urls) == {"https://cdn.example.com/b.bin"}
+        assert set(MediaCache(str(tmp_path / "media")).urls) == {"https://cdn.example.com/b.bin"}
+
+    def test_commits_append_to_the_journal_instead_of_rewriting_the_index(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"))
+        bodies = iter([_StreamResp(b"one"), _StreamResp(b"two")])
+        with patch("datapulse.core.media.requests.get", side_effect=lambda *a, **k: next(bodies)):
+            fetch_media("https://cdn.example.com/1.jpg", cache=cache)
+            fetch_media("https://cdn.example.com/2.jpg", cache=cache)
+
+        assert not cache.path.exists()
+        assert len(cache.journal_path.read_text(encoding="utf-8").splitlines()) == 2
+        other_process = MediaCache(str(tmp_path / "media"))
+        assert other_process.lookup("https://cdn.example.com/2.jpg").read_bytes() == b"two"
+
+    def test_stale_entries_are_revalidated_with_their_validators(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"), ttl_seconds=0)
+        url = "https://cdn.example.com/logo.png"
+        calls: list[dict] = []
+        responses = iter(
+            [
+                _StreamResp(b"logo-v1", headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2026 00:00:00 GMT"}),
+                _StreamResp(b"", status_code=304),
+                _StreamResp(b"logo-v2", headers={"ETag": '"v2"'}),
+            ]
+        )
+
+        def _get(url, headers=None, **kwargs):
+            calls.append(dict(headers or {}))
+            return next(responses)
+
+        with patch("datapulse.core.media.requests.get", side_effect=_get):
+            first = fetch_media(url, cache=cache)
+            confirmed = fetch_media(url, cache=cache)
+            changed = fetch_media(url, cache=cache)
+
+        assert "If-None-Match" not in calls[0]
+        assert calls[1]["If-None-Match"] == '"v1"'
+        assert calls[1]["If-Modified-Since"] == "Mon, 01 Jan 2026 00:00:00 GMT"
+        assert confirmed.path == first.path and confirmed.cached is True
+        assert calls[2]["If-None-Match"] == '"v1"'
+        assert changed.read_bytes() == b"logo-v2"
+        assert MediaCache(str(tmp_path / "media")).urls[url]["etag"] == '"v2"'
+
+    def test_fresh_entries_are_served_without_a_request(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"), ttl_seconds=3600)
+        with patch("datapulse.core.media.requests.get", return_value=_StreamResp(b"body")) as get:
+            fetch_media("https://cdn.example.com/a.jpg", cache=cache)
+            fetch_media("https://cdn.example.com/a.jpg", cache=cache)
+            cache.urls["https://cdn.example.com/a.jpg"]["stored_at"] -= 7200
+            fetch_media("https://cdn.example.com/a.jpg", cache=cache)
+
+        assert get.call_count == 2
+
+    def test_sweep_removes_abandoned_partials_and_locks(self, tmp_path):
+        cache = MediaCache(str(tmp_path / "media"))
+        cache.partial_dir.mkdir(parents=True)
+        old = time.time() - 2 * 24 * 3600
+        abandoned = cache.partial_dir / "abandoned.part"
+        orphan_lock = cache.partial_dir / "finished.part.lock"
+        fresh = cache.partial_dir / "fresh.part"
+        for path in (abandoned, cache.partial_dir / "abandoned.meta", cache.partial_dir / "abandoned.part.lock", orphan_lock, fresh):
+            path.write_bytes(b"x")
+        for path in (abandoned, cache.partial_dir / "abandoned.meta", cache.partial_dir / "abandoned.part.lock", orphan_lock):
+            os.utime(path, (old, old))
+
+        assert cache.sweep_partials() == 4
+        assert [path.name for path in cache.partial_dir.iterdir()] == ["fresh.part"]
+
+
+class TestMultipartFileBody:
+    def test_streams_file_with_fields_and_exact_length(self, tmp_path):
+        audio = tmp_path / "audio.m4a"
+        audio.write_bytes(b"\x00\x01" * 50_000)
+
+        with multipart_file_body("file", audio, content_type="audio/mp4", fields={"model": "whisper"}) as body:
+            chunks = list(body)
+            payload = b"".join(chunks)
+            assert len(payload) == len(body)
+            assert body.content_type.startswith("multipart/form-data; boundary=")
+            assert max(len(chunk) for chunk in chunks) <= 64 * 1024
+
+        assert b'name="model"\r\n\r\nwhisper\r\n' in payload
+        assert b'name="file"; filename="audio.m4a"\r\nContent-Type: audio/mp4' in payload
+        assert b"\x00\x01" * 50_000 in payload
+        assert payload.endswith(f"--{body.boundary}--\r\n".encode())
+
+    def test_requests_sends_it_with_content_length(self, tmp_path):
+        import requests as req_lib
+
+        audio = tmp_path / "audio.m4a"
+        audio.write_bytes(b"abc" * 1000)
+        with multipart_file_body("file", audio) as body:
+            prepared = req_lib.Request("POST", "https://example.com/upload", data=body).prepare()
+
+        assert prepared.headers["Content-Length"] == str(len(body))
+        assert "Transfer-Encoding" not in prepared.headers
@@ -0,0 +1,167 @@
+"""Tests for persistent native bridge workers and the JSON-lines protocol."""
+
+from __future__ import annotations
+
+import os
+import shlex
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from datapulse.collectors.native_bridge import NativeBridgeCollector
+from datapulse.collectors.native_bridge_pool import (
+    BridgeWorker,
+    BridgeWorkerPool,
+    close_bridge_pools,
+    running_bridge_pools,
+)
+
+SIDECAR = r'''
+import json, os, sys, threading, time
+
+def result(request, mode):
+    return {
+        "schema_version": "native_collector_bridge_result.v1",
+        "ok": True,
+        "source_type": request.get("source_type_hint", ""),
+        "title": "Native title",
+        "content": "Native bridge content for " + request["url"],
+        "extra": {"pid": os.getpid(), "mode": mode},
+    }
+
+if os.environ.get("DATAPULSE_NATIVE_COLLECTOR_BRIDGE_PROTOCOL") != "jsonl":
+    print(json.dumps(result(json.load(sys.stdin), "oneshot")))
+    sys.exit(0)
+if "--oneshot-only" in sys.argv:
+    sys.exit(2)
+
+lock = threading.Lock()
+
+def reply(payload):
+    with lock:
+        sys.stdout.write(json.dumps(payload) + "\n")
+        sys.stdout.flush()
+
+def handle(request):
+    if request.get("schema_version") == "native_collector_bridge_ping.v1":
+        reply({"request_id": request["request_id"], "ok": True})
+        return
+    if "crash" in request["url"]:
+        os._exit(3)
+    if "slow" in request["url"]:
+        time.sleep(0.4)
+    reply({**result(request, "persistent"), "request_id": request["request_id"]})
+
+for line in sys.stdin:
+    threading.Thread(target=handle, args=(json.loads(line),)).start()
+'''
+
+
+@pytest.fixture()
+def sidecar(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    script = tmp_path / "sidecar.py"
+    script.write_text(SIDECAR, encoding="utf-8")
+    monkeypatch.setenv("DATAPULSE_NATIVE_COLLECTOR_BRIDGE_CMD", f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}")
+    monkeypatch.setenv("DATAPULSE_NATIVE_COLLECTOR_BRIDGE_MODE", "persistent")
+    monkeypatch.setenv("DATAPULSE_NATIVE_COLLECTOR_BRIDGE_TIMEOUT_SECONDS", "10")
+    monkeypatch.setenv("DATAPULSE_NATIVE_COLLECTOR_STATE_DIR", str(tmp_path / "state"))
+    yield script
+    close_bridge_pools()
+
+
+def test_persistent_worker_serves_pipelined_requests_from_one_process(sidecar: Path) -> None:
+    collector = NativeBridgeCollector()
+    results: dict[str, object] = {}
+
+    def _read(url: str) -> None:
+        results[url] = collector.parse(url)
+
+    urls = ["https://www.xiaohongshu.com/explore/slow", "https://www.douyin.com/video/1", "https://www.zhihu.com/question/2"]
+    threads = [threading.Thread(target=_read, args=(url,)) for url in urls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(results[url].success for url in urls)
+    assert all(results[url].content.endswith(url) for url in urls)
+    assert {results[url].extra["pid"] for url in urls} == {results[urls[0]].extra["pid"]}
+    assert results[urls[0]].extra["mode"] == "persistent"
+    assert results[urls[0]].extra["collector_provenance"]["transport"] == "subprocess_jsonl"
+    assert "request_id" not in results[urls[0]].extra
+    (pool,) = running_bridge_pools()
+    assert pool.stats()["completed"] == 3
+    assert "1/1 workers healthy" in collector.check()["message"]
+
+
+def test_crashed_worker_fails_in_flight_request_and_restarts(sidecar: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("datapulse.collectors.native_bridge_pool.BACKOFF_BASE_SECONDS", 0.0)
+    collector = NativeBridgeCollector()
+    first = collector.parse("https://www.douyin.com/video/1")
+
+    crashed = collector.parse("https://www.douyin.com/video/crash")
+    recovered = collector.parse("https://www.douyin.com/video/2")
+
+    # The crash is not retried persistently: the one-shot path answers instead.
+    assert crashed.success and crashed.extra["mode"] == "oneshot"
+    assert recovered.success and recovered.extra["mode"] == "persistent"
+    assert recovered.extra["pid"] != first.extra["pid"]
+    assert running_bridge_pools()[0].stats()["restarts"] == 1
+
+
+def test_sidecar_without_jsonl_support_falls_back_to_one_shot(sidecar: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(
+        "DATAPULSE_NATIVE_COLLECTOR_BRIDGE_CMD",
+        f"{shlex.quote(sys.executable)} {shlex.quote(str(sidecar))} --oneshot-only",
+    )
+
+    result = NativeBridgeCollector().parse("https://www.zhihu.com/question/2")
+
+    assert result.success
+    assert result.extra["mode"] == "oneshot"
+    assert result.extra["collector_provenance"]["transport"] == "subprocess_json"
+
+
+def test_exited_process_reader_cannot_fail_the_restarted_process_requests(
+    sidecar: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    original = BridgeWorker._read_stdout
+    release = threading.Event()
+    held: list[object] = []
+
+    def _late_reader(self, process, pending) -> None:
+        if not held:
+            held.append(process)
+            release.wait(5)
+        original(self, process, pending)
+
+    monkeypatch.setattr(BridgeWorker, "_read_stdout", _late_reader)
+    worker = BridgeWorker([sys.executable, str(sidecar)], cwd=None, env=dict(os.environ))
+    worker.start()
+    worker.stop()
+    worker.start()
+    try:
+        _, future = worker.submit({"url": "https://www.douyin.com/video/slow"})
+        release.set()  # the first process's reader now sees EOF and fails its own (empty) pending map
+        assert future.result(timeout=10)["extra"]["mode"] == "persistent"
+    finally:
+        worker.stop()
+
+
+def test_health_check_leaves_busy_workers_running(sidecar: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(BridgeWorker, "ping", lambda self, timeout=0: False)
+    pool = BridgeWorkerPool([sys.executable, str(sidecar)], cwd=None, env=dict(os.environ))
+    try:
+        worker = pool._ready_worker()
+        _, future = worker.submit({"url": "https://www.douyin.com/video/slow"})
+
+        health = pool.health_check(timeout=0.1)
+
+        assert health["healthy"] == 1
+        assert future.result(timeout=10)["extra"]["mode"] == "persistent"
+        assert pool.health_check(timeout=0.1)["healthy"] == 0
+        assert not worker.alive
+    finally:
+        pool.close()
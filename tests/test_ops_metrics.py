@@ -0,0 +1,175 @@
+"""Tests for the materialized ops / scorecard aggregates."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from datapulse.core.alerts import AlertEvent
+from datapulse.core.filestore import read_generation
+from datapulse.core.models import DataPulseItem, SourceType
+from datapulse.core.storage import UnifiedInbox
+from datapulse.core.watchlist import MissionRun
+from datapulse.reader import DataPulseReader
+
+
+@pytest.fixture()
+def reader(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> DataPulseReader:
+    monkeypatch.setenv("DATAPULSE_WATCHLIST_PATH", str(tmp_path / "watchlist.json"))
+    monkeypatch.setenv("DATAPULSE_ALERTS_PATH", str(tmp_path / "alerts.json"))
+    monkeypatch.setenv("DATAPULSE_ALERT_ROUTING_PATH", str(tmp_path / "alert-routes.json"))
+    monkeypatch.setenv("DATAPULSE_STORIES_PATH", str(tmp_path / "stories.json"))
+    monkeypatch.setenv("DATAPULSE_WATCH_STATUS_PATH", str(tmp_path / "status.json"))
+    monkeypatch.setenv("DATAPULSE_WATCH_STATUS_HTML", str(tmp_path / "status.html"))
+    return DataPulseReader(inbox_path=str(tmp_path / "inbox.json"))
+
+
+def _item(index: int) -> DataPulseItem:
+    return DataPulseItem(
+        source_type=SourceType.GENERIC,
+        source_name="Example News",
+        title=f"Launch update {index}",
+        content=f"Launch update body {index} " * 10,
+        url=f"https://www.example.com/launch/{index}",
+        parser="generic",
+        fetched_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+def _ingest(reader: DataPulseReader, items: list[DataPulseItem]) -> None:
+    base_generation = reader.inbox.generation
+    added = [item for item in items if reader.inbox.add(item)]
+    reader.inbox.save()
+    reader.ops_metrics.record_items_added(added, base_generation=base_generation)
+
+
+def _without_stamps(sections: dict[str, dict]) -> dict[str, dict]:
+    return {
+        name: {key: value for key, value in section.items() if key != "generations"}
+        for name, section in sections.items()
+    }
+
+
+def test_incremental_updates_match_a_full_rebuild(reader: DataPulseReader, monkeypatch) -> None:
+    mission = reader.watchlist.get(reader.create_watch(name="Launch Watch", query="launch", sites=["example.com"])["id"])
+    reader.create_alert_route(name="ops-webhook", channel="webhook", webhook_url="https://hooks.example.com/ops")
+    reader.ops_metrics.snapshot()
+    full_rebuild = reader.ops_metrics.rebuild
+    monkeypatch.setattr(reader.ops_metrics, "_build_section", lambda name: pytest.fail(f"rebuilt {name}"))
+
+    items = [_item(index) for index in range(3)]
+    _ingest(reader, items)
+    reader._tag_items_with_watch(mission, items[:2])
+    reader.triage_update(items[0].id, state="verified", note="checked")
+    reader.triage_note(items[1].id, note="looking")
+    reader.watch_service._record_run(mission, MissionRun(mission_id=mission.id, status="success", item_count=2))
+    reader.create_story_from_triage([items[0].id], title="Launch story")
+
+    base_generation = reader.alert_store.generation
+    event = AlertEvent(
+        mission_id=mission.id,
+        mission_name=mission.name,
+        rule_name="launch",
+        summary="launch matched",
+        delivered_channels=["webhook:ops-webhook"],
+        extra={"rule": {"routes": ["ops-webhook"]}},
+    )
+    reader.alert_store.add(event)
+    reader.ops_metrics.record_alerts([event], base_generation=base_generation)
+
+    incremental = reader.ops_metrics.snapshot()
+    monkeypatch.delattr(reader.ops_metrics, "_build_section")
+    assert incremental["inbox"]["states"]["verified"] == 1
+    assert incremental["inbox"]["missions"][mission.id]["result_count"] == 2
+    assert incremental["alerts"]["routes"]["ops-webhook"]["delivered_count"] == 1
+    assert incremental["stories"]["converted_item_count"] == 1
+    assert _without_stamps(incremental) == _without_stamps(full_rebuild())
+
+
+def test_scorecard_and_ops_read_aggregates_without_rescanning(reader: DataPulseReader, monkeypatch) -> None:
+    items = [_item(index) for index in range(2)]
+    _ingest(reader, items)
+    reader.governance_scorecard_snapshot()
+
+    def _no_scan(*args, **kwargs):
+        raise AssertionError("scorecard must not rescan the stores")
+
+    monkeypatch.setattr(reader.triage, "stats", _no_scan)
+    monkeypatch.setattr(reader.story_store, "list_stories", _no_scan)
+    monkeypatch.setattr(reader.ops_metrics, "_build_section", _no_scan)
+    monkeypatch.setattr(reader, "doctor", lambda: {"tier_0": [], "tier_1": [], "tier_2": []})
+
+    reader.triage_update(items[0].id, state="triaged")
+    scorecard = reader.governance_scorecard_snapshot()
+    ops = reader.ops_snapshot()
+
+    triage_signal = scorecard["signals"]["triage_throughput"]
+    assert triage_signal["total_items"] == 2
+    assert triage_signal["acted_on_items"] == 1
+    assert ops["governance_scorecard"]["mission_scope"]["items"] == 2
+    assert ops["route_summary"]["total"] == 0
+    assert "aggregates" not in ops["daemon"]
+
+
+def test_write_without_counter_update_rebuilds_section(reader: DataPulseReader, tmp_path: Path) -> None:
+    _ingest(reader, [_item(1)])
+    assert reader.ops_metrics.snapshot()["inbox"]["total"] == 1
+
+    other_process = UnifiedInbox(str(tmp_path / "inbox.json"))
+    other_process.add(_item(2))
+    other_process.save()
+
+    assert reader.ops_metrics.snapshot()["inbox"]["total"] == 2
+    assert reader.governance_scorecard_snapshot()["mission_scope"]["items"] == 2
+
+
+def test_aggregates_are_shared_through_the_status_file(reader: DataPulseReader, tmp_path: Path) -> None:
+    _ingest(reader, [_item(1), _item(2)])
+    reader.ops_metrics.snapshot()
+    reader.triage_update(reader.inbox.items[0].id, state="ignored")
+
+    console = DataPulseReader(inbox_path=str(tmp_path / "inbox.json"))
+    build_section = console.ops_metrics._build_section
+
+    def _build_unless_inbox(name: str) -> dict:
+        assert name != "inbox", "console should reuse the daemon's aggregates"
+        return build_section(name)
+
+    console.ops_metrics._build_section = _build_unless_inbox  # type: ignore[method-assign]
+
+    inbox_section = console.ops_metrics.snapshot()["inbox"]
+    assert inbox_section["states"]["ignored"] == 1
+    assert inbox_section["total"] == 2
+
+
+def test_snapshot_never_writes_and_persists_only_counters(reader: DataPulseReader, tmp_path: Path) -> None:
+    items = [_item(1), _item(2)]
+    _ingest(reader, items)
+    reader.triage_update(items[0].id, state="verified")
+    reader.create_story_from_triage([items[0].id], title="Launch story")
+    status_path = tmp_path / "status.json"
+
+    other_process = UnifiedInbox(str(tmp_path / "inbox.json"))
+    other_process.add(_item(3))
+    other_process.save()
+    before = read_generation(status_path)
+    sections = reader.ops_metrics.snapshot()
+    reader.governance_scorecard_snapshot()
+
+    assert read_generation(status_path) == before
+    assert sections["inbox"]["total"] == 3
+    assert sections["inbox"]["story_eligible_count"] == 1
+    assert sections["stories"]["converted_item_count"] == 1
+
+    persisted = json.loads(status_path.read_text(encoding="utf-8"))["aggregates"]
+    assert "story_eligible_ids" not in persisted["inbox"]
+    assert "item_ids" not in persisted["stories"]
+
+    reader.triage_update(items[1].id, state="triaged")
+    persisted = json.loads(status_path.read_text(encoding="utf-8"))["aggregates"]
+    assert persisted["inbox"]["total"] == 3
+    assert persisted["inbox"]["story_eligible_count"] == 2
+    assert persisted["stories"]["converted_item_count"] == 1
@@ -241,6 +241,35 @@ class TestBuildJsonFeed:
         feed = reader_with_items.build_json_feed(limit=1)
         assert len(feed["items"]) <= 1
 
+    def test_iter_json_feed_matches_built_feed(self, reader_with_items):
+        feed = reader_with_items.build_json_feed()
+        streamed = json.loads("".join(reader_with_items.iter_json_feed(chunk_size=1)))
+        streamed["generated_at"] = feed["generated_at"]
+        assert streamed == feed
+
+    def test_query_feed_streams_inbox_without_materializing_it(self, reader_with_items, monkeypatch):
+        monkeypatch.setattr(
+            reader_with_items.inbox,
+            "all_items",
+            lambda *args, **kwargs: pytest.fail("query_feed should stream the inbox lazily"),
+        )
+        newest_first = sorted(reader_with_items.inbox.items, key=lambda it: it.fetched_at, reverse=True)
+
+        assert [item.id for item in reader_with_items.query_feed(limit=1)] == [newest_first[0].id]
+        assert [item.id for item in reader_with_items.iter_query_feed(limit=5)] == [item.id for item in newest_first]
+
+    def test_iter_json_feed_jsonl_emits_header_then_items(self, reader_with_items):
+        lines = "".join(reader_with_items.iter_json_feed(output_format="jsonl")).splitlines()
+        header = json.loads(lines[0])
+        rows = [json.loads(line) for line in lines[1:]]
+        assert header["version"] == "https://jsonfeed.org/version/1.1"
+        assert "items" not in header
+        assert [row["id"] for row in rows] == [row["id"] for row in reader_with_items.build_json_feed()["items"]]
+
+    def test_iter_json_feed_rejects_unknown_format(self, reader_with_items):
+        with pytest.raises(ValueError, match="Unsupported stream format"):
+            reader_with_items.iter_json_feed(output_format="xml")
+
     def test_json_feed_includes_trend_seed_context(self, tmp_path, monkeypatch):
         inbox_path = str(tmp_path / "inbox.json")
         catalog_path = str(tmp_path / "catalog.json")
@@ -379,6 +408,17 @@ class TestFeedBundleAndDigestPayload:
         assert bundle["stats"]["sources_selected"] == 1
         assert bundle["errors"] == []
 
+        streamed = json.loads("".join(reader.iter_feed_bundle(profile="default", limit=10, chunk_size=1)))
+        streamed["generated_at"] = bundle["generated_at"]
+        assert streamed == bundle
+
+        lines = "".join(reader.iter_feed_bundle(profile="default", limit=10, output_format="jsonl")).splitlines()
+        header = json.loads(lines[0])
+        assert header["schema_version"] == "feed_bundle.v1"
+        assert header["stats"]["items_selected"] == 2
+        assert "items" not in header
+        assert [json.loads(line)["title"] for line in lines[1:]] == ["Newer item", "Older item"]
+
     def test_prepare_digest_payload_projects_shared_config_and_prompt_provenance(self, tmp_path, monkeypatch):
         inbox_path = str(tmp_path / "inbox.json")
         catalog_path = str(tmp_path / "catalog.json")
@@ -508,6 +548,13 @@ class TestBuildRssFeed:
         assert channel is not None
         assert channel.find("title") is not None
 
+    def test_iter_rss_feed_yields_one_chunk_per_item(self, reader_with_items):
+        chunks = list(reader_with_items.iter_rss_feed())
+        assert chunks[0].startswith('<?xml version="1.0" encoding="UTF-8"?><rss')
+        assert chunks[-1] == "</channel></rss>"
+        assert all(chunk.startswith("<item>") for chunk in chunks[1:-1])
+        assert ET.fromstring("".join(chunks)).tag == "rss"
+
     def test_rss_items_present(self, reader_with_items):
         xml_str = reader_with_items.build_rss_feed()
         root = ET.fromstring(xml_str)
@@ -589,6 +636,13 @@ class TestBuildAtomFeed:
         title = entry.find("atom:title", ns).text
         assert title == "Atom Test <Item> & More"
 
+    def test_iter_atom_feed_yields_one_chunk_per_entry(self, reader_with_items):
+        chunks = list(reader_with_items.iter_atom_feed())
+        assert chunks[-1] == "</feed>"
+        assert all(chunk.startswith("<entry>") for chunk in chunks[1:-1])
+        root = ET.fromstring("".join(chunks))
+        assert len(root.findall("{http://www.w3.org/2005/Atom}entry")) == len(chunks) - 2
+
     def test_atom_limit(self, reader_with_items):
         xml_str = reader_with_items.build_atom_feed(limit=1)
         root = ET.fromstring(xml_str)
@@ -9,6 +9,7 @@ from pathlib import Path
 import pytest
 
 import datapulse.reader as reader_module
+from datapulse.core.report import ReportStore
 from datapulse.reader import DataPulseReader
 
 
@@ -191,12 +192,10 @@ def test_report_objects_can_be_created_loaded_updated_and_listed(tmp_path):
     assert reloaded_reader.show_export_profile(profile["id"]) is not None
 
     payload = json.loads(Path(os.environ["DATAPULSE_REPORTS_PATH"]).read_text(encoding="utf-8"))
-    assert "report_briefs" in payload
-    assert "claim_cards" in payload
-    assert "report_sections" in payload
-    assert "citation_bundles" in payload
-    assert "reports" in payload
-    assert "export_profiles" in payload
+    collections = payload["collections"]
+    for name in ("report_briefs", "claim_cards", "report_sections", "citation_bundles", "reports", "export_profiles"):
+        rows = json.loads((Path(os.environ["DATAPULSE_REPORTS_PATH"]).parent / collections[name]["file"]).read_text(encoding="utf-8"))
+        assert len(rows) == collections[name]["count"] >= 1
 
 
 def test_report_creation_seeds_default_export_profiles_and_watch_pack(tmp_path):
@@ -820,3 +819,93 @@ def test_ai_report_draft_returns_fail_closed_runtime_projection_when_contract_is
     assert payload["runtime_facts"]["schema_valid"] is False
     assert payload["runtime_facts"]["served_by_alias"] == "dp.report.draft"
     assert "missing_structured_contract" in payload["runtime_facts"]["errors"]
+
+
+def test_report_store_rewrites_only_the_changed_collection(tmp_path):
+    path = tmp_path / "reports.json"
+    store = ReportStore(str(path))
+    report = store.create_report({"title": "Shard Report"})
+    store.create_report_section({"title": "Opening", "report_id": report.id})
+    claim_generation = store._collection_generations["claim_cards"]
+    section_generation = store._collection_generations["report_sections"]
+
+    other_process = ReportStore(str(path))
+    other_process.create_claim_card({"statement": "Sharded claim", "source_item_ids": ["item-1"]})
+
+    assert store._collection_generations["report_sections"] == section_generation
+    assert store.reload_if_changed() is True
+    assert store._collection_generations["claim_cards"] > claim_generation
+    assert store._collection_generations["report_sections"] == section_generation
+    assert [claim.statement for claim in store.claim_cards.values()] == ["Sharded claim"]
+    assert [section.title for section in store._indexed(store.report_sections, store._sections_by_report, report.id)] == [
+        "Opening"
+    ]
+
+
+def test_report_store_refiles_only_changed_records_in_fk_indexes(tmp_path, monkeypatch):
+    store = ReportStore(str(tmp_path / "reports.json"))
+    first = store.create_report({"title": "First"})
+    second = store.create_report({"title": "Second"})
+    section = store.create_report_section({"title": "Opening", "report_id": first.id})
+    monkeypatch.setattr(store, "_reindex", lambda name=None: pytest.fail(f"full reindex of {name}"))
+
+    store.update_report_section(section.id, report_id=second.id)
+    store.create_report_section({"title": "Closing", "report_id": second.id})
+
+    def titles(report_id: str) -> list[str]:
+        return sorted(row.title for row in store._indexed(store.report_sections, store._sections_by_report, report_id))
+
+    assert titles(first.id) == []
+    assert titles(second.id) == ["Closing", "Opening"]
+    assert first.id not in store._sections_by_report
+
+
+def test_report_store_splits_a_legacy_single_file_on_first_save(tmp_path):
+    path = tmp_path / "reports.json"
+    path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "reports": [{"id": "report-legacy", "title": "Legacy Report"}],
+                "report_sections": [{"id": "section-legacy", "title": "Legacy", "report_id": "report-legacy"}],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    store = ReportStore(str(path))
+    assert store.assemble_report("report-legacy") is not None
+    store.update_report("report-legacy", section_ids=["section-legacy"])
+
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    assert manifest["layout"] == "collections"
+    assert manifest["collections"]["report_sections"]["count"] == 1
+    reloaded = ReportStore(str(path))
+    assert [row["id"] for row in reloaded.assemble_report("report-legacy")["sections"]] == ["section-legacy"]
+
+
+def test_dispatch_records_are_capped_dropping_settled_records_first(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATAPULSE_MAX_DISPATCH_RECORDS", "3")
+    store = ReportStore(str(tmp_path / "reports.json"))
+    for index in range(5):
+        store.create_delivery_dispatch_record(
+            {
+                "id": f"dispatch-{index}",
+                "subscription_id": "sub-1",
+                "subject_kind": "report",
+                "subject_ref": "report-1",
+                "output_kind": "report_full",
+                "status": "pending" if index == 0 else "delivered",
+                "created_at": f"2026-10-0{index + 1}T00:00:00Z",
+            }
+        )
+
+    remaining = {record.id for record in store.list_delivery_dispatch_records(limit=10, subscription_id="sub-1")}
+    assert remaining == {"dispatch-0", "dispatch-3", "dispatch-4"}
+    assert store._dispatch_by_subscription["sub-1"] == remaining
+
+
+def test_invalid_dispatch_record_cap_falls_back_to_default(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATAPULSE_MAX_DISPATCH_RECORDS", "lots")
+
+    assert ReportStore(str(tmp_path / "reports.json")).max_dispatch_records == 2000
@@ -0,0 +1,127 @@
+"""Tests for the append-only watch run history and its rollups."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from datapulse.core.run_history import RunHistoryStore
+from datapulse.core.watchlist import MissionRun, WatchlistStore
+
+
+def _run(mission_id: str, when: datetime, *, status: str = "success", items: int = 2, seconds: int = 30) -> MissionRun:
+    return MissionRun(
+        mission_id=mission_id,
+        status=status,
+        item_count=items,
+        started_at=when.isoformat(),
+        finished_at=(when + timedelta(seconds=seconds)).isoformat(),
+    )
+
+
+def test_history_keeps_runs_beyond_the_recent_window(tmp_path: Path) -> None:
+    path = str(tmp_path / "watchlist.json")
+    store = WatchlistStore(path)
+    mission = store.create_mission(name="Launch Watch", query="launch")
+    now = datetime.now(timezone.utc)
+    for index in range(15):
+        status = "error" if index % 5 == 0 else "success"
+        store.record_run(mission.id, _run(mission.id, now - timedelta(minutes=15 - index), status=status))
+
+    assert len(mission.runs) == 10
+    assert mission.last_run_status == "success"
+    lifetime = store.history.summary(mission.id)["lifetime"]
+    assert lifetime["runs"] == 15
+    assert lifetime["error"] == 3
+    assert lifetime["item_count"] == 30
+    assert lifetime["average_duration_seconds"] == 30.0
+
+    segment_lines = sum(len(segment.read_text(encoding="utf-8").splitlines()) for segment in store.history.segment_paths())
+    assert segment_lines == 15
+
+
+def test_record_run_leaves_the_watchlist_file_config_only(tmp_path: Path) -> None:
+    path = tmp_path / "watchlist.json"
+    store = WatchlistStore(str(path))
+    mission = store.create_mission(name="Launch Watch", query="launch")
+    generation = store.generation
+
+    store.record_run(mission.id, MissionRun(mission_id=mission.id, item_count=4))
+    store.disable(mission.id)
+
+    assert store.generation == generation + 1
+    row = json.loads(path.read_text(encoding="utf-8"))["missions"][0]
+    assert "runs" not in row
+    assert "last_run_count" not in row
+
+    restored = WatchlistStore(str(path)).get(mission.id)
+    assert restored is not None
+    assert restored.last_run_count == 4
+    assert len(restored.runs) == 1
+
+
+def test_hourly_and_daily_rollups_fill_empty_buckets(tmp_path: Path) -> None:
+    history = RunHistoryStore(str(tmp_path / "runs"))
+    now = datetime.now(timezone.utc).replace(minute=30, second=0, microsecond=0)
+    history.append(_run("m1", now - timedelta(hours=2), items=3).to_dict())
+    history.append(_run("m1", now - timedelta(hours=2, minutes=10), status="error", items=0).to_dict())
+    history.append(_run("m1", now - timedelta(days=3)).to_dict())
+
+    hourly = history.rollups("m1", granularity="hourly", limit=4, now=now)
+    assert [row["bucket"] for row in hourly] == [
+        (now - timedelta(hours=offset)).strftime("%Y-%m-%dT%H") for offset in (3, 2, 1, 0)
+    ]
+    assert [row["runs"] for row in hourly] == [0, 2, 0, 0]
+    assert hourly[1]["success_rate"] == 0.5
+
+    summary = history.summary("m1", now=now)
+    assert summary["last_24h"]["runs"] == 2
+    assert summary["last_7d"]["runs"] == 3
+
+
+def test_legacy_inline_runs_migrate_and_rollups_rebuild_from_segments(tmp_path: Path) -> None:
+    path = tmp_path / "watchlist.json"
+    legacy_run = _run("launch", datetime.now(timezone.utc) - timedelta(hours=1), items=7).to_dict()
+    path.write_text(
+        json.dumps({"version": 1, "missions": [{"id": "launch", "name": "Launch", "query": "launch", "runs": [legacy_run]}]}),
+        encoding="utf-8",
+    )
+
+    store = WatchlistStore(str(path))
+    assert store.history.summary("launch")["lifetime"]["item_count"] == 7
+
+    store.history.path.unlink()
+    rebuilt = RunHistoryStore(str(store.history.directory))
+    assert rebuilt.recent_runs("launch")[0]["id"] == legacy_run["id"]
+    assert rebuilt.summary("launch")["lifetime"]["runs"] == 1
+
+
+def test_other_process_runs_are_picked_up_on_reload(tmp_path: Path) -> None:
+    path = str(tmp_path / "watchlist.json")
+    console_view = WatchlistStore(path)
+    mission = console_view.create_mission(name="Launch Watch", query="launch")
+    daemon_view = WatchlistStore(path)
+
+    daemon_view.record_run(mission.id, MissionRun(mission_id=mission.id, item_count=2))
+
+    assert console_view.has_changed() is True
+    assert console_view.reload_if_changed() is True
+    assert console_view.get(mission.id).last_run_count == 2
+    assert console_view.reload_if_changed() is False
+
+
+def test_forgotten_missions_stay_gone_after_a_rebuild(tmp_path: Path) -> None:
+    history = RunHistoryStore(str(tmp_path / "history"))
+    earlier = datetime.now(timezone.utc) - timedelta(hours=2)
+    for mission_id in ("kept", "deleted"):
+        history.append({"id": f"{mission_id}-1", "mission_id": mission_id, "status": "success", "finished_at": earlier.isoformat()})
+
+    assert history.forget("deleted") is True
+    history.append({"id": "deleted-2", "mission_id": "deleted", "status": "success"})
+    history.path.unlink()
+
+    rebuilt = RunHistoryStore(str(tmp_path / "history"))
+    assert rebuilt.mission_ids() == ["deleted", "kept"]
+    assert [row["id"] for row in rebuilt.recent_runs("deleted")] == ["deleted-2"]
+    assert [row["id"] for row in rebuilt.iter_runs()] == ["kept-1", "deleted-2"]
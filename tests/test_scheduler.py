@@ -6,6 +6,7 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from datapulse.core.ops import WatchStatusStore
 from datapulse.core.scheduler import (
     WatchDaemon,
     WatchDaemonLock,
@@ -89,3 +90,25 @@ async def test_watch_daemon_runs_one_cycle_and_releases_lock(tmp_path):
     assert payload["cycles"] == 1
     assert reader.calls == 1
     assert not (tmp_path / "daemon.lock").exists()
+
+
+@pytest.mark.asyncio
+async def test_watch_daemon_refreshes_reader_stores_each_cycle(tmp_path):
+    class _Reader:
+        def __init__(self):
+            self.refreshes = 0
+
+        def refresh_stores(self):
+            self.refreshes += 1
+            return []
+
+        async def run_due_watches(self, **kwargs):
+            return {"due_count": 0, "run_count": 0, "results": []}
+
+    reader = _Reader()
+    status_store = WatchStatusStore(str(tmp_path / "status.json"), str(tmp_path / "status.html"))
+    daemon = WatchDaemon(reader, lock_path=str(tmp_path / "daemon.lock"), status_store=status_store)
+
+    await daemon.run_forever(max_cycles=2, poll_seconds=0.1)
+
+    assert reader.refreshes == 2
@@ -228,6 +228,62 @@ class TestFingerprintDedup:
         assert inbox.add(item2) is False
 
 
+class TestMissionIndex:
+    def _make_item(self, url: str, mission_id: str = "", fetched_at: str | None = None) -> DataPulseItem:
+        item = DataPulseItem(source_type=SourceType.GENERIC, source_name="test", title=url, content="C", url=url)
+        if mission_id:
+            item.extra["watch_mission_id"] = mission_id
+        if fetched_at:
+            item.fetched_at = fetched_at
+        return item
+
+    def test_add_and_reload_index_items_by_mission(self, tmp_path):
+        inbox = UnifiedInbox(str(tmp_path / "inbox.json"))
+        first = self._make_item("https://a.com", "m1")
+        second = self._make_item("https://b.com", "m2")
+        inbox.add(first)
+        inbox.add(second)
+        inbox.add(self._make_item("https://c.com"))
+
+        assert [item.id for item in inbox.mission_items("m1")] == [first.id]
+        assert inbox.get(second.id) is second
+        inbox.save()
+
+        reloaded = UnifiedInbox(str(tmp_path / "inbox.json"))
+        assert sorted(reloaded.mission_ids()) == ["m1", "m2"]
+        assert [item.id for item in reloaded.mission_items("m2")] == [second.id]
+
+    def test_assign_and_delete_update_index(self, tmp_path):
+        inbox = UnifiedInbox(str(tmp_path / "inbox.json"))
+        item = self._make_item("https://a.com")
+        inbox.add(item)
+        assert inbox.mission_items("m1") == []
+
+        item.extra["watch_mission_id"] = "m1"
+        inbox.assign_mission(item, "m1")
+        assert inbox.mission_items("m1") == [item]
+
+        item.extra["watch_mission_id"] = "m2"
+        inbox.assign_mission(item, "m2")
+        assert inbox.mission_items("m1") == []
+        assert inbox.mission_ids() == ["m2"]
+
+        assert inbox.delete(item.id) is item
+        assert inbox.mission_items("m2") == []
+        assert inbox.get(item.id) is None
+
+    def test_items_past_capacity_leave_the_index(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DATAPULSE_MAX_INBOX", "1")
+        inbox = UnifiedInbox(str(tmp_path / "inbox.json"))
+        older = self._make_item("https://old.com", "m1", fetched_at="2026-03-01T00:00:00+00:00")
+        newer = self._make_item("https://new.com", "m1", fetched_at="2026-03-02T00:00:00+00:00")
+        inbox.add(newer)
+        inbox.add(older)
+
+        assert inbox.mission_items("m1") == [newer]
+        assert inbox.get(older.id) is None
+
+
 class TestMarkdownProjection:
     def _make_item(self) -> DataPulseItem:
         return DataPulseItem(
@@ -10,7 +10,6 @@ from pathlib import Path
 import pytest
 import tldextract
 
-from datapulse.core import utils as core_utils
 from datapulse.core.entities import Entity, EntityType, Relation
 from datapulse.core.entity_store import EntityStore
 from datapulse.core.models import DataPulseItem, SourceType
@@ -61,11 +60,6 @@ def _reader(
     os.environ["DATAPULSE_SOURCE_CATALOG"] = str(catalog_path)
     os.environ["DATAPULSE_STORIES_PATH"] = str(stories_path)
     os.environ["DATAPULSE_ENTITY_STORE"] = str(entity_store_path)
-    os.environ["TLDEXTRACT_CACHE"] = str(tmp_path / "tldextract-cache")
-    core_utils.tldextract.extract = tldextract.TLDExtract(
-        suffix_list_urls=(),
-        cache_dir=str(tmp_path / "tldextract-cache"),
-    )
     if entities or relations:
         store = EntityStore(path=str(entity_store_path))
         for entity in entities or []:
@@ -75,6 +69,16 @@ def _reader(
     return DataPulseReader(inbox_path=str(inbox_path))
 
 
+@pytest.fixture(autouse=True)
+def _offline_tldextract(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TLDEXTRACT_CACHE", str(tmp_path / "tldextract-cache"))
+    monkeypatch.setattr(
+        tldextract,
+        "extract",
+        tldextract.TLDExtract(suffix_list_urls=(), cache_dir=str(tmp_path / "tldextract-cache")),
+    )
+
+
 @pytest.fixture(autouse=True)
 def _cleanup_env():
     yield
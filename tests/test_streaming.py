@@ -0,0 +1,46 @@
+"""Tests for chunked feed serializers."""
+
+from __future__ import annotations
+
+import json
+
+from datapulse.core.streaming import iter_json_lines, iter_json_object, xml_escape
+
+
+def test_iter_json_object_matches_json_dumps():
+    head = {"schema_version": "feed_bundle.v1", "selection": {"profile": "default"}}
+    rows = [{"id": str(index), "title": f"标题 {index}"} for index in range(5)]
+    tail = {"stats": {"items_selected": 5}, "errors": []}
+
+    chunks = list(iter_json_object(head, "items", iter(rows), tail, chunk_size=2))
+
+    expected = json.dumps({**head, "items": rows, **tail}, ensure_ascii=False)
+    assert "".join(chunks) == expected
+    # head + three row chunks (2, 2, 1) + closing
+    assert len(chunks) == 5
+
+
+def test_iter_json_object_handles_empty_rows_and_tail():
+    assert "".join(iter_json_object({"a": 1}, "items", [])) == json.dumps({"a": 1, "items": []})
+
+
+def test_iter_json_object_indent_matches_pretty_json_dumps():
+    head = {"schema_version": "feed_bundle.v1", "selection": {"profile": "default", "ids": [1, 2]}, "empty": {}}
+    rows = [{"id": str(index), "tags": [], "meta": {"title": f"标题 {index}"}} for index in range(3)]
+    tail = {"stats": {"items_selected": 3}, "errors": []}
+
+    for chunk_size in (1, 2, 50):
+        payload = "".join(iter_json_object(head, "items", iter(rows), tail, chunk_size=chunk_size, indent=2))
+        assert payload == json.dumps({**head, "items": rows, **tail}, ensure_ascii=False, indent=2)
+    assert "".join(iter_json_object({}, "items", [], indent=2)) == json.dumps({"items": []}, indent=2)
+
+
+def test_iter_json_lines_writes_header_then_rows():
+    payload = "".join(iter_json_lines([{"id": "1"}, {"id": "2"}], header={"kind": "bundle"}, chunk_size=1))
+
+    assert payload.splitlines() == ['{"kind": "bundle"}', '{"id": "1"}', '{"id": "2"}']
+    assert payload.endswith("\n")
+
+
+def test_xml_escape_covers_markup_characters():
+    assert xml_escape('<a href="x">&</a>') == "&lt;a href=&quot;x&quot;&gt;&amp;&lt;/a&gt;"
@@ -0,0 +1,189 @@
+"""Tests for the pooled Telegram client manager and channel cursors."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import types
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from datapulse.collectors import telegram
+from datapulse.collectors.base import read_scope
+from datapulse.collectors.telegram_pool import TelegramClientManager, TelegramCursorStore
+
+KEY = ("./tg_session", 12345, "hash")
+
+
+@dataclass
+class _Message:
+    id: int
+    text: str
+    date: datetime
+
+
+class _FakeClient:
+    instances: list["_FakeClient"] = []
+
+    def __init__(self, channels: dict[str, list[_Message]]):
+        self.channels = channels
+        self.connected = False
+        self.starts = 0
+        self.entity_calls: list[str] = []
+        self.reads: list[tuple[str, int]] = []
+        self.drop_next_read = False
+        _FakeClient.instances.append(self)
+
+    async def start(self) -> None:
+        self.starts += 1
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def disconnect(self) -> None:
+        self.connected = False
+
+    async def get_entity(self, channel: str) -> str:
+        self.entity_calls.append(channel)
+        return channel.lower()
+
+    async def iter_messages(self, entity: str, *, limit: int, min_id: int = 0):
+        if self.drop_next_read:
+            self.drop_next_read = False
+            raise ConnectionError("link reset")
+        self.reads.append((entity, min_id))
+        newest_first = sorted(self.channels.get(entity, []), key=lambda msg: msg.id, reverse=True)
+        for msg in [msg for msg in newest_first if msg.id > min_id][:limit]:
+            yield msg
+
+
+@pytest.fixture()
+def channels() -> dict[str, list[_Message]]:
+    now = datetime.now(timezone.utc)
+    return {
+        "launches": [_Message(id=index, text=f"launch {index}", date=now - timedelta(minutes=10 - index)) for index in range(1, 4)],
+        "markets": [
+            _Message(id=7, text="old market note", date=now - timedelta(days=3)),
+            _Message(id=8, text="", date=now),
+            _Message(id=9, text="fresh market note", date=now),
+        ],
+    }
+
+
+@pytest.fixture()
+def manager(channels: dict[str, list[_Message]]):
+    _FakeClient.instances = []
+    manager = TelegramClientManager(client_factory=lambda *_key: _FakeClient(channels))
+    yield manager
+    manager.close()
+
+
+def test_channels_share_one_connection_and_entity_cache(manager: TelegramClientManager) -> None:
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+    batches: dict[str, object] = {}
+
+    def _read(channel: str) -> None:
+        batches[channel] = manager.fetch_sync(KEY, channel, timeout=5, limit=20, cutoff=cutoff)
+
+    threads = [threading.Thread(target=_read, args=(channel,)) for channel in ("launches", "markets")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    manager.fetch_sync(KEY, "Launches", timeout=5, limit=20)
+
+    (client,) = _FakeClient.instances
+    assert client.starts == 1
+    assert sorted(client.entity_calls) == ["launches", "markets"]
+    assert [row.split("] ")[1] for row in batches["launches"].rows] == ["launch 3", "launch 2", "launch 1"]
+    assert batches["markets"].rows[0].endswith("fresh market note")
+    assert len(batches["markets"].rows) == 1
+    assert batches["markets"].newest_id == 9
+    assert manager.stats()["connects"] == 1
+
+
+def test_min_id_limits_reads_to_new_messages(manager: TelegramClientManager, channels) -> None:
+    first = manager.fetch_sync(KEY, "launches", timeout=5, limit=20)
+    channels["launches"].append(_Message(id=4, text="launch 4", date=datetime.now(timezone.utc)))
+
+    second = manager.fetch_sync(KEY, "launches", timeout=5, limit=20, min_id=first.newest_id)
+    third = manager.fetch_sync(KEY, "launches", timeout=5, limit=20, min_id=second.newest_id)
+
+    assert first.newest_id == 3
+    assert [row.split("] ")[1] for row in second.rows] == ["launch 4"]
+    assert third.rows == [] and third.newest_id == 4
+    assert _FakeClient.instances[0].reads[-1] == ("launches", 4)
+
+
+def test_dropped_connection_reconnects_once(manager: TelegramClientManager) -> None:
+    manager.fetch_sync(KEY, "launches", timeout=5, limit=20)
+    _FakeClient.instances[0].drop_next_read = True
+
+    batch = manager.fetch_sync(KEY, "launches", timeout=5, limit=20)
+
+    assert len(batch.rows) == 3
+    assert len(_FakeClient.instances) == 2
+    assert not _FakeClient.instances[0].connected
+    assert _FakeClient.instances[1].entity_calls == ["launches"]
+
+
+def test_cursor_store_only_moves_forward_and_is_shared_across_processes(tmp_path: Path) -> None:
+    path = tmp_path / "cursors.json"
+    store = TelegramCursorStore(str(path))
+    other = TelegramCursorStore(str(path))
+
+    assert store.advance("@Launches", 12, scope="watch:a")
+    assert not store.advance("launches", 5, scope="watch:a")
+    assert store.advance("launches", 4, scope="watch:b")
+    assert other.min_id("launches", scope="watch:a") == 12
+
+    other.reset("launches", scope="watch:a")
+    assert store.min_id("@launches", scope="watch:a") == 0
+    assert store.min_id("launches", scope="watch:b") == 4
+
+
+def test_sessions_keep_separate_clients(manager: TelegramClientManager) -> None:
+    other_session = ("./other_session", 67890, "hash")
+
+    manager.fetch_sync(KEY, "launches", timeout=5, limit=20)
+    manager.fetch_sync(other_session, "launches", timeout=5, limit=20)
+    manager.fetch_sync(KEY, "launches", timeout=5, limit=20)
+
+    assert len(_FakeClient.instances) == 2
+    assert all(client.connected for client in _FakeClient.instances)
+    assert manager.stats()["clients"] == 2
+    assert manager.stats()["connects"] == 2
+
+
+def test_ad_hoc_reads_return_the_recent_window_and_watch_cursors_are_scoped(
+    manager: TelegramClientManager, channels, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setitem(sys.modules, "telethon", types.ModuleType("telethon"))
+    monkeypatch.setattr(telegram, "get_telegram_manager", lambda: manager)
+    monkeypatch.setenv("TG_API_ID", "12345")
+    monkeypatch.setenv("TG_API_HASH", "hash")
+    monkeypatch.setenv("DATAPULSE_TG_CURSOR_PATH", str(tmp_path / "cursors.json"))
+    collector = telegram.TelegramCollector()
+
+    first, second = collector.parse("https://t.me/launches"), collector.parse("https://t.me/launches")
+    with read_scope("watch:a"):
+        watch_first = collector.parse("https://t.me/launches")
+        watch_again = collector.parse("https://t.me/launches")
+    with read_scope("watch:b"):
+        other_watch = collector.parse("https://t.me/launches")
+
+    assert first.success and second.success and second.extra["count"] == 3
+    assert watch_first.extra["count"] == 3
+    assert not watch_again.success and "since message 3" in watch_again.error
+    assert other_watch.success and other_watch.extra["min_id"] == 0
+    assert TelegramCursorStore(str(tmp_path / "cursors.json")).cursors.keys() == {"watch:a|launches", "watch:b|launches"}
+
+
+def test_channel_is_taken_from_the_url_path() -> None:
+    assert telegram.TelegramCollector._extract_channel("https://t.me/launches/42") == "launches"
+    assert telegram.TelegramCollector._extract_channel("t.me/markets") == "markets"
+    assert telegram.TelegramCollector._extract_channel("https://t.me/") == ""
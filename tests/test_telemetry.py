@@ -0,0 +1,95 @@
+"""Tests for the span / histogram / trace instrumentation layer."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from datapulse.console_server import create_app
+from datapulse.core.telemetry import TELEMETRY, Telemetry, traced
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    TELEMETRY.clear()
+    yield
+    TELEMETRY.clear()
+    TELEMETRY.configure_tracing()
+
+
+def test_spans_feed_histograms_outcomes_and_percentiles() -> None:
+    telemetry = Telemetry(buckets=(0.1, 1.0))
+    for _ in range(3):
+        with telemetry.span("collector.parse", collector="generic"):
+            pass
+    with pytest.raises(RuntimeError):
+        with telemetry.span("collector.parse", collector="generic"):
+            raise RuntimeError("boom")
+    with telemetry.span("collector.parse", collector="generic") as soft:
+        soft.status = "failed"
+
+    row = telemetry.snapshot()[0]
+    assert row["span"] == "collector.parse"
+    assert row["labels"] == {"collector": "generic"}
+    assert row["count"] == 5
+    assert row["outcomes"] == {"ok": 3, "error": 1, "failed": 1}
+    assert row["p95_ms"] >= row["p50_ms"] >= 0.0
+
+    text = telemetry.render_prometheus()
+    assert 'datapulse_span_duration_seconds_bucket{span="collector.parse",collector="generic",le="0.1"} 5' in text
+    assert 'datapulse_span_duration_seconds_bucket{span="collector.parse",collector="generic",le="+Inf"} 5' in text
+    assert 'datapulse_span_duration_seconds_count{span="collector.parse",collector="generic"} 5' in text
+    assert 'datapulse_span_total{span="collector.parse",collector="generic",status="error"} 1' in text
+
+
+def test_nested_spans_are_written_to_the_trace_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    trace_path = tmp_path / "traces" / "spans.jsonl"
+    monkeypatch.setenv("DATAPULSE_TRACE_PATH", str(trace_path))
+    TELEMETRY.configure_tracing()
+
+    @traced("reader.read")
+    async def read() -> str:
+        with TELEMETRY.span("pipeline.route"):
+            return "ok"
+
+    assert asyncio.run(read()) == "ok"
+
+    inner, outer = [json.loads(line) for line in trace_path.read_text(encoding="utf-8").splitlines()]
+    assert (inner["span"], outer["span"]) == ("pipeline.route", "reader.read")
+    assert inner["trace_id"] == outer["trace_id"]
+    assert inner["parent_id"] == outer["span_id"]
+    assert outer["parent_id"] == ""
+
+
+def test_trace_settings_are_read_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    trace_path = tmp_path / "spans.jsonl"
+    telemetry = Telemetry()
+    monkeypatch.setenv("DATAPULSE_TRACE_PATH", str(trace_path))
+    with telemetry.span("first"):
+        pass
+    monkeypatch.delenv("DATAPULSE_TRACE_PATH")
+    with telemetry.span("second"):
+        pass
+
+    assert [json.loads(line)["span"] for line in trace_path.read_text(encoding="utf-8").splitlines()] == ["first", "second"]
+
+    telemetry.configure_tracing()
+    with telemetry.span("third"):
+        pass
+    assert len(trace_path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_console_exposes_prometheus_metrics() -> None:
+    client = TestClient(create_app(reader_factory=lambda: None))
+
+    assert client.get("/healthz").status_code == 200
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'span="http.request"' in response.text
+    assert 'route="/healthz"' in response.text
@@ -2,17 +2,34 @@
 
 from __future__ import annotations
 
+import threading
+import time
+from datetime import datetime, timezone
 from unittest.mock import patch
 
 import pytest
 
+from datapulse.collectors import trending as trending_module
 from datapulse.collectors.trending import (
     TrendingCollector,
+    TrendingHistoryStore,
+    TrendItem,
+    TrendSnapshot,
     build_trending_url,
+    clear_snapshot_cache,
+    location_key,
     normalize_location,
     parse_volume,
 )
 
+
+@pytest.fixture(autouse=True)
+def _fresh_snapshot_cache(monkeypatch):
+    monkeypatch.delenv("DATAPULSE_TRENDING_HISTORY_PATH", raising=False)
+    clear_snapshot_cache()
+    yield
+    clear_snapshot_cache()
+
 # ---------------------------------------------------------------------------
 # Embedded HTML fixtures
 # ---------------------------------------------------------------------------
@@ -211,6 +228,24 @@ class TestParse:
         assert result.extra["trends"][0]["name"] == "#USATrend"
         assert result.extra["trends"][0]["volume_raw"] == 1_200_000
 
+    def test_country_page_parsed_in_worker_process(self, monkeypatch):
+        from datapulse.core.cpu_pool import shutdown_cpu_pool
+
+        monkeypatch.setenv("DATAPULSE_CPU_WORKERS", "1")
+        monkeypatch.setenv("DATAPULSE_CPU_POOL_MIN_CHARS", "0")
+        c = self._make_collector()
+        try:
+            with patch.object(c, "_fetch_page", return_value=SAMPLE_COUNTRY_HTML), patch.object(
+                c, "_parse_html", side_effect=AssertionError("parsing should run in the worker process")
+            ):
+                result = c.parse("https://trends24.in/united-states/")
+        finally:
+            shutdown_cpu_pool()
+
+        assert result.success is True
+        assert result.extra["trend_count"] == 3
+        assert result.extra["trends"][0]["volume_raw"] == 1_200_000
+
     def test_worldwide_page(self):
         c = self._make_collector()
         with patch.object(c, "_fetch_page", return_value=SAMPLE_CARD_HTML):
@@ -294,6 +329,165 @@ class TestFetchSnapshots:
                 c.fetch_snapshots("us")
 
 
+# ---------------------------------------------------------------------------
+# TestSnapshotCache
+# ---------------------------------------------------------------------------
+
+class TestSnapshotCache:
+    def test_repeat_reads_within_the_hour_fetch_once(self):
+        c = TrendingCollector()
+        with patch.object(c, "_fetch_page", return_value=SAMPLE_COUNTRY_HTML) as fetch:
+            first = c.fetch_snapshots("us", top_n=1)
+            second = TrendingCollector.fetch_snapshots(c, "United-States", top_n=50)
+            result = c.parse(build_trending_url("usa"))
+
+        assert fetch.call_count == 1
+        assert len(first[0].trends) == 1
+        assert len(second[0].trends) == 3
+        assert result.extra["trend_count"] == 3
+
+    def test_cache_expires_at_top_of_hour(self):
+        assert trending_module._seconds_until_next_hour(3600 * 5 + 1800) == 1800
+        assert trending_module._seconds_until_next_hour(3600 * 5) == 3600
+
+    def test_fetch_errors_are_not_cached(self):
+        import requests as req
+
+        c = TrendingCollector()
+        with patch.object(c, "_fetch_page", side_effect=req.RequestException("timeout")):
+            with pytest.raises(req.RequestException):
+                c.fetch_snapshots("jp")
+        with patch.object(c, "_fetch_page", return_value=SAMPLE_COUNTRY_HTML):
+            assert c.fetch_snapshots("jp")[0].trends[0].name == "#USATrend"
+
+    @pytest.mark.parametrize("html", [EMPTY_PAGE_HTML, LOW_SIGNAL_HTML])
+    def test_degraded_pages_are_cached_briefly(self, html, monkeypatch):
+        cached: list[float] = []
+        monkeypatch.setattr(trending_module, "_seconds_until_next_hour", lambda: 1800.0)
+        original_set = trending_module._snapshot_cache.set
+        monkeypatch.setattr(
+            trending_module._snapshot_cache,
+            "set",
+            lambda key, value, ttl=None: (cached.append(ttl), original_set(key, value, ttl=ttl)),
+        )
+        c = TrendingCollector()
+        with patch.object(c, "_fetch_page", return_value=html):
+            c.parse(build_trending_url("jp"))
+        with patch.object(c, "_fetch_page", return_value=SAMPLE_COUNTRY_HTML):
+            c.parse(build_trending_url("us"))
+
+        assert cached == [trending_module.DEGRADED_SNAPSHOT_TTL_SECONDS, 1800.0]
+
+    def test_fetch_many_dedupes_aliases_and_reports_errors(self):
+        c = TrendingCollector()
+        fetched: list[str] = []
+
+        def _fake_fetch(url):
+            fetched.append(url)
+            if "japan" in url:
+                raise ValueError("boom")
+            return SAMPLE_COUNTRY_HTML
+
+        with patch.object(c, "_fetch_page", side_effect=_fake_fetch):
+            results, errors = c.fetch_snapshots_many(["us", "usa", "united-states", "jp", ""], top_n=2)
+
+        assert sorted(fetched) == sorted([
+            "https://trends24.in/united-states/",
+            "https://trends24.in/japan/",
+            "https://trends24.in/",
+        ])
+        assert set(results) == {"united-states", "worldwide"}
+        assert len(results["united-states"][0].trends) == 2
+        assert errors == {"japan": "boom"}
+
+    def test_fetch_many_runs_locations_concurrently(self):
+        c = TrendingCollector()
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def _slow_fetch(url):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return SAMPLE_COUNTRY_HTML
+
+        with patch.object(c, "_fetch_page", side_effect=_slow_fetch):
+            results, errors = c.fetch_snapshots_many(["us", "jp", "de", "fr"], concurrency=4)
+
+        assert peak > 1
+        assert len(results) == 4
+        assert errors == {}
+
+    def test_host_rate_limiter_spaces_requests(self):
+        limiter = trending_module._HostRateLimiter()
+        started = time.monotonic()
+        for _ in range(3):
+            limiter.wait(0.05)
+
+        assert time.monotonic() - started >= 0.09
+
+
+# ---------------------------------------------------------------------------
+# TestTrendingHistory
+# ---------------------------------------------------------------------------
+
+def _snapshot(stamp: str, names: list[str]) -> TrendSnapshot:
+    return TrendSnapshot(
+        timestamp=stamp[11:16],
+        timestamp_utc=stamp,
+        trends=[TrendItem(rank=idx, name=name) for idx, name in enumerate(names, 1)],
+    )
+
+
+class TestTrendingHistory:
+    def test_record_dedupes_snapshots_and_computes_deltas(self, tmp_path):
+        store = TrendingHistoryStore(str(tmp_path / "trends.json"))
+        older = _snapshot("2026-03-01T06:00:00Z", ["A", "B", "C"])
+        newer = _snapshot("2026-03-01T07:00:00Z", ["C", "A", "D"])
+
+        assert store.record("us", [older]) == 1
+        assert store.record("united-states", [newer, older]) == 1
+        deltas = TrendingHistoryStore(str(tmp_path / "trends.json")).deltas("usa")
+
+        assert deltas["location"] == "united-states"
+        assert deltas["current"] == "2026-03-01T07:00:00Z"
+        assert deltas["previous"] == "2026-03-01T06:00:00Z"
+        assert deltas["new"] == ["D"]
+        assert deltas["dropped"] == ["B"]
+        assert deltas["movers"][0] == {"name": "C", "rank": 1, "previous_rank": 3, "change": 2}
+
+    def test_history_is_bounded(self, tmp_path):
+        store = TrendingHistoryStore(str(tmp_path / "trends.json"), max_snapshots=2)
+        for hour in range(4):
+            store.record("", [_snapshot(f"2026-03-01T0{hour}:00:00Z", ["A"])])
+
+        rows = store.snapshots("worldwide")
+        assert [row["snapshot_time"] for row in rows] == ["2026-03-01T03:00:00Z", "2026-03-01T02:00:00Z"]
+
+    def test_snapshot_without_utc_stamp_uses_fetch_hour(self, tmp_path):
+        store = TrendingHistoryStore(str(tmp_path / "trends.json"))
+        fetched_at = datetime(2026, 3, 1, 7, 42, tzinfo=timezone.utc)
+        store.record("", [TrendSnapshot(timestamp="07:03", trends=[TrendItem(rank=1, name="A")])], fetched_at=fetched_at)
+
+        assert store.snapshots("")[0]["snapshot_time"] == "2026-03-01T07:00:00+00:00"
+
+    def test_fetch_records_history_when_configured(self, tmp_path, monkeypatch):
+        path = tmp_path / "trends.json"
+        monkeypatch.setenv("DATAPULSE_TRENDING_HISTORY_PATH", str(path))
+        c = TrendingCollector()
+        with patch.object(c, "_fetch_page", return_value=SAMPLE_CARD_HTML):
+            c.fetch_snapshots("", top_n=1)
+
+        rows = TrendingHistoryStore(str(path)).snapshots(location_key(""))
+        assert [row["snapshot_time"] for row in rows] == ["2026-03-01T07:03:28Z", "2026-03-01T06:03:28Z"]
+        assert len(rows[0]["trends"]) == 4
+
+
 # ---------------------------------------------------------------------------
 # TestFallbackParsing
 # ---------------------------------------------------------------------------
@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from unittest.mock import patch
 
+import pytest
 import requests
 
+from datapulse.collectors import twitter as twitter_module
 from datapulse.collectors.twitter import TwitterCollector
 
 
+@pytest.fixture(autouse=True)
+def _clear_media_alt_cache():
+    twitter_module._media_alt_cache.clear()
+    yield
+    twitter_module._media_alt_cache.clear()
+
+
 class _FakeHTTPResponse:
     def __init__(self, payload: dict):
         self._payload = payload
@@ -176,6 +187,107 @@ class TestTwitterMediaExtraction:
         assert payload["failed"] == 1
         assert payload["error_code"] == "auth_unauthorized"
 
+    def test_generated_alt_runs_concurrently_and_keeps_media_order(self, monkeypatch):
+        monkeypatch.setenv("DATAPULSE_TWITTER_MEDIA_EXTRACT", "1")
+        monkeypatch.setenv("DATAPULSE_TWITTER_MEDIA_CONCURRENCY", "4")
+        collector = TwitterCollector()
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def _slow_extract(media_url, *, timeout):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.1)
+            with lock:
+                in_flight -= 1
+            return f"Generated description for {media_url}"
+
+        with patch.object(collector, "_extract_media_text_via_jina", side_effect=_slow_extract), patch(
+            "datapulse.collectors.twitter.get_secret",
+            return_value="test-key",
+        ):
+            payload = collector._build_media_extraction([
+                {"type": "photo", "url": f"https://img.example.com/c{i}.jpg"} for i in range(4)
+            ])
+
+        assert peak > 1
+        assert payload["status"] == "ok"
+        assert payload["attempted"] == 4
+        assert [item["index"] for item in payload["items"]] == [1, 2, 3, 4]
+        assert payload["items"][0]["url"] == "https://img.example.com/c0.jpg"
+
+    def test_generated_alt_is_cached_per_media_url(self, monkeypatch):
+        monkeypatch.setenv("DATAPULSE_TWITTER_MEDIA_EXTRACT", "1")
+        collector = TwitterCollector()
+        media = [
+            {"type": "photo", "url": "https://img.example.com/shared.jpg"},
+            {"type": "photo", "url": "https://img.example.com/shared.jpg"},
+        ]
+
+        with patch.object(
+            collector,
+            "_extract_media_text_via_jina",
+            return_value="Chart of quarterly revenue by segment.",
+        ) as mocked_extract, patch("datapulse.collectors.twitter.get_secret", return_value="test-key"):
+            first = collector._build_media_extraction(media)
+            second = TwitterCollector()._build_media_extraction(media[:1])
+
+        mocked_extract.assert_called_once()
+        assert first["attempted"] == 1
+        assert len(first["items"]) == 2
+        assert second["attempted"] == 0
+        assert second["status"] == "ok"
+        assert second["items"][0]["method"] == "jina_generated_alt"
+
+    def test_overall_deadline_degrades_pending_media(self, monkeypatch):
+        monkeypatch.setenv("DATAPULSE_TWITTER_MEDIA_EXTRACT", "1")
+        monkeypatch.setattr(twitter_module, "read_env_int", lambda name, default, **_: 0 if name.endswith("DEADLINE") else default)
+        collector = TwitterCollector()
+        release = threading.Event()
+
+        def _extract(media_url, *, timeout):
+            if media_url.endswith("slow.jpg"):
+                release.wait(5)
+            return "Slide listing the eight prompts in full."
+
+        started = time.monotonic()
+        with patch.object(collector, "_extract_media_text_via_jina", side_effect=_extract), patch(
+            "datapulse.collectors.twitter.get_secret",
+            return_value="test-key",
+        ):
+            payload = collector._build_media_extraction([
+                {"type": "photo", "url": "https://img.example.com/slow.jpg"},
+            ])
+        release.set()
+
+        assert time.monotonic() - started < 2
+        assert payload["status"] == "degraded"
+        assert payload["failed"] == 1
+        assert payload["error_code"] == "deadline_exceeded"
+        assert twitter_module._media_alt_cache.get("https://img.example.com/slow.jpg") is None
+
+    def test_shares_one_jina_client_across_media_and_collectors(self):
+        collector = TwitterCollector()
+
+        assert collector._jina_media_client(20) is TwitterCollector()._jina_media_client(20)
+        assert collector._jina_media_client(30).timeout == 30
+
+    def test_empty_generated_alt_is_not_cached(self, monkeypatch):
+        monkeypatch.setenv("DATAPULSE_TWITTER_MEDIA_EXTRACT", "1")
+        media = [{"type": "photo", "url": "https://img.example.com/blank.jpg"}]
+
+        with patch.object(TwitterCollector, "_extract_media_text_via_jina", return_value="") as mocked_extract, patch(
+            "datapulse.collectors.twitter.get_secret", return_value="test-key"
+        ):
+            TwitterCollector()._build_media_extraction(media)
+            TwitterCollector()._build_media_extraction(media)
+
+        assert mocked_extract.call_count == 2
+        assert twitter_module._media_alt_cache.get("https://img.example.com/blank.jpg") is None
+
     def test_parse_fxtwitter_exposes_structured_media_extraction(self, monkeypatch):
         monkeypatch.delenv("DATAPULSE_TWITTER_MEDIA_EXTRACT", raising=False)
         collector = TwitterCollector()
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
 from datapulse.core.utils import (
     _session_ttl_cache,
+    analyze_url,
     clean_text,
+    clear_url_analysis_cache,
     content_fingerprint,
     content_hash,
     extract_urls,
@@ -30,6 +35,7 @@ from datapulse.core.utils import (
     session_valid,
     split_graphemes,
     truncate_graphemes,
+    url_analysis_cache_stats,
     validate_external_url,
     watchlist_path_from_env,
 )
@@ -239,6 +245,22 @@ class TestGraphemeUtilities:
         text = "Launch 👩🏽‍💻 review"
         assert truncate_graphemes(text, 8, preserve_words=False) == "Launch 👩🏽‍💻…"
 
+    def test_truncate_graphemes_stops_after_max_length_clusters(self, monkeypatch):
+        import datapulse.core.utils as utils_module
+
+        seen: list[str] = []
+        original = utils_module._is_grapheme_extend
+
+        def counting(char: str) -> bool:
+            seen.append(char)
+            return original(char)
+
+        monkeypatch.setattr(utils_module, "_is_grapheme_extend", counting)
+        text = "🇺🇳 " + "word " * 20_000
+
+        assert truncate_graphemes(text, 4) == "🇺🇳…"
+        assert len(seen) < 10
+
 
 class TestNormalizeLanguage:
     def test_chinese(self):
@@ -269,6 +291,48 @@ class TestGetDomain:
     def test_subdomain(self):
         assert get_domain("https://blog.example.com") == "example.com"
 
+    def test_invalid_url_falls_back_to_unknown(self):
+        assert get_domain("http://[::1") == "unknown"
+
+
+class TestAnalyzeUrl:
+    def test_returns_host_domain_tag_and_platform(self):
+        analysis = analyze_url("https://Mobile.Twitter.com:443/user/status/1")
+        assert analysis.netloc == "mobile.twitter.com:443"
+        assert analysis.host == "mobile.twitter.com"
+        assert analysis.domain == "twitter.com"
+        assert analysis.domain_tag == "twitter_com"
+        assert analysis.platform_hint == "twitter"
+
+    def test_ip_host_is_its_own_domain(self):
+        assert analyze_url("http://8.8.8.8/path").domain == "8.8.8.8"
+
+    def test_repeated_lookups_hit_cache(self):
+        clear_url_analysis_cache()
+        for _ in range(3):
+            get_domain("https://news.example.org/a")
+        stats = url_analysis_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["size"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.6667)
+
+    def test_distinct_urls_on_one_host_share_the_domain_lookup(self):
+        clear_url_analysis_cache()
+        for index in range(4):
+            analysis = analyze_url(f"https://blog.example.co.uk/posts/{index}?ref=feed")
+            assert analysis.domain == "example.co.uk"
+        stats = url_analysis_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 3
+
+    def test_clear_resets_stats(self):
+        analyze_url("https://example.com")
+        clear_url_analysis_cache()
+        stats = url_analysis_cache_stats()
+        assert stats["hits"] == 0 and stats["misses"] == 0
+        assert stats["hit_rate"] is None
+
 
 class TestGenerateSlug:
     def test_basic(self):
@@ -375,3 +439,15 @@ class TestSessionValid:
         (tmp_path / "xhs.json").write_text("{}")
         # Should now find it (negative was NOT cached)
         assert session_valid("xhs") is True
+
+
+def test_invalid_url_cache_size_falls_back_to_default() -> None:
+    completed = subprocess.run(
+        [sys.executable, "-c", "import datapulse.core.utils as u; print(u._URL_ANALYSIS_CACHE_SIZE)"],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        env={**os.environ, "DATAPULSE_URL_CACHE_SIZE": "abc"},
+        check=True,
+    )
+    assert completed.stdout.strip() == "4096"
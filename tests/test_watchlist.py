@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from datapulse.collectors.base import current_read_scope
 from datapulse.core.models import DataPulseItem, SourceType
 from datapulse.core.story import Story
 from datapulse.core.watchlist import MissionRun, WatchlistStore
@@ -783,6 +785,25 @@ async def test_reader_run_watch_rejects_disabled(tmp_path, monkeypatch):
         await reader.run_watch(mission["id"])
 
 
+@pytest.mark.asyncio
+async def test_reader_run_watch_reads_inside_the_mission_scope(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATAPULSE_WATCHLIST_PATH", str(tmp_path / "watchlist.json"))
+    reader = DataPulseReader(inbox_path=str(tmp_path / "inbox.json"))
+    mission = reader.create_watch(name="Channel Watch", query="launch")
+    scopes: list[str] = []
+
+    async def fake_search(query, **kwargs):
+        scopes.append(await asyncio.to_thread(current_read_scope))
+        return []
+
+    monkeypatch.setattr(reader, "search", fake_search)
+
+    await reader.run_watch(mission["id"])
+
+    assert scopes == [f"watch:{mission['id']}"]
+    assert current_read_scope() == ""
+
+
 @pytest.mark.asyncio
 async def test_reader_run_due_watches_executes_due_only(tmp_path, monkeypatch):
     watch_path = tmp_path / "watchlist.json"
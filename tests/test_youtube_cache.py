@@ -0,0 +1,141 @@
+"""Tests for the persistent YouTube metadata and transcript cache."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+from datapulse.collectors.youtube import YouTubeCollector
+from datapulse.collectors.youtube_cache import WHISPER_LANGUAGE, YouTubeCache
+
+URL = "https://www.youtube.com/watch?v=abc123XYZ"
+DESCRIPTION = "Talk\n0:00 Intro\n1:30 Main topic"
+
+
+class TestYouTubeCache:
+    def test_transcript_lookup_follows_preference_order(self, tmp_path):
+        cache = YouTubeCache(str(tmp_path))
+        cache.store_transcript("vid", WHISPER_LANGUAGE, "whisper text")
+        cache.store_transcript("vid", "ja", "japanese text")
+        cache.store_transcript("vid", "en (auto)", "auto english")
+
+        assert cache.transcript("vid", ["en", "ja"]) == ("japanese text", "ja")
+        assert cache.transcript("vid", ["en"]) == ("auto english", "en (auto)")
+        cache.invalidate("vid", language="en (auto)")
+        assert cache.transcript("vid", ["en"]) is None
+        assert cache.transcript("vid", ["en"], any_language=True) == ("japanese text", "ja")
+        cache.invalidate("vid", language="ja")
+        assert cache.transcript("vid", ["en"], any_language=True) == ("whisper text", WHISPER_LANGUAGE)
+
+    def test_metadata_and_transcripts_share_one_entry(self, tmp_path):
+        cache = YouTubeCache(str(tmp_path))
+        cache.store_metadata("vid", title="T", author="A", description="D", chapters=[])
+        cache.store_transcript("vid", "en", "hello")
+
+        reopened = YouTubeCache(str(tmp_path))
+        assert reopened.metadata("vid")["title"] == "T"
+        assert reopened.transcript("vid", ["en"]) == ("hello", "en")
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_invalidate_all(self, tmp_path):
+        cache = YouTubeCache(str(tmp_path))
+        cache.store_transcript("one", "en", "a")
+        cache.store_transcript("two", "en", "b")
+
+        assert cache.invalidate() == 2
+        assert cache.transcript("one", ["en"]) is None
+
+    def test_concurrent_writers_keep_each_others_transcripts(self, tmp_path):
+        cache = YouTubeCache(str(tmp_path))
+        languages = [f"lang{index}" for index in range(16)]
+        threads = [
+            threading.Thread(target=cache.store_transcript, args=("vid", lang, f"text {lang}")) for lang in languages
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(cache.transcript("vid", [lang]) == (f"text {lang}", lang) for lang in languages)
+
+
+class TestYouTubeCollectorCache:
+    def test_second_parse_makes_no_network_calls(self):
+        collector = YouTubeCollector()
+        with patch.object(collector, "_fetch_metadata", return_value=("Title", "Channel", DESCRIPTION)) as meta, patch.object(
+            collector, "_fetch_transcript", return_value=("spoken words here", "en")
+        ) as transcript:
+            first = collector.parse(URL)
+            second = YouTubeCollector().parse(URL)
+
+        assert meta.call_count == 1
+        assert transcript.call_count == 1
+        assert first.extra["cache_hits"] == []
+        assert second.extra["cache_hits"] == ["metadata", "transcript"]
+        assert second.content == first.content
+        assert second.title == "Title"
+        assert second.extra["chapters"] == first.extra["chapters"]
+        assert second.extra["lang"] == "en"
+        assert "lang:en" in second.confidence_flags
+
+    def test_whisper_transcription_is_not_rebilled(self):
+        collector = YouTubeCollector()
+        with patch.object(collector, "_fetch_metadata", return_value=("Title", "Channel", "")), patch.object(
+            collector, "_fetch_transcript", return_value=("", "")
+        ), patch.object(collector, "_fallback_whisper", return_value="transcribed audio text") as whisper:
+            first = collector.parse(URL)
+            second = collector.parse(URL)
+
+        assert whisper.call_count == 1
+        assert "whisper" in first.confidence_flags
+        assert "whisper" in second.confidence_flags
+        assert second.content == "transcribed audio text"
+        assert second.extra["has_transcript"] is False
+
+    def test_preferred_language_is_fetched_before_other_cached_languages(self):
+        YouTubeCache().store_transcript("abc123XYZ", "it", "italian text")
+        collector = YouTubeCollector()
+        with patch.object(collector, "_fetch_metadata", return_value=("Title", "Channel", "")), patch.object(
+            collector, "_fetch_transcript", side_effect=[("english words", "en"), ("", "")]
+        ) as transcript:
+            fetched = collector.parse(URL)
+            collector.invalidate_cache(URL, language="en")
+            fallback = collector.parse(URL)
+
+        assert transcript.call_count == 2
+        assert fetched.content == "english words" and fetched.extra["cache_hits"] == []
+        assert fallback.content == "italian text" and fallback.extra["lang"] == "it"
+        assert "transcript" in fallback.extra["cache_hits"]
+
+    def test_missing_transcript_is_retried(self):
+        collector = YouTubeCollector()
+        with patch.object(collector, "_fetch_metadata", return_value=("Title", "Channel", DESCRIPTION)), patch.object(
+            collector, "_fetch_transcript", return_value=("", "")
+        ) as transcript, patch.object(collector, "_fallback_whisper", return_value=""):
+            collector.parse(URL)
+            result = collector.parse(URL)
+
+        assert transcript.call_count == 2
+        assert "metadata-only" in result.confidence_flags
+
+    def test_invalidate_cache_by_url_refetches(self):
+        collector = YouTubeCollector()
+        with patch.object(collector, "_fetch_metadata", return_value=("Title", "Channel", DESCRIPTION)) as meta, patch.object(
+            collector, "_fetch_transcript", return_value=("spoken words here", "en")
+        ):
+            collector.parse(URL)
+            assert collector.invalidate_cache(URL) == 1
+            collector.parse(URL)
+
+        assert meta.call_count == 2
+
+    def test_cache_can_be_disabled(self, monkeypatch):
+        monkeypatch.setenv("DATAPULSE_YOUTUBE_CACHE", "0")
+        collector = YouTubeCollector()
+        with patch.object(collector, "_fetch_metadata", return_value=("Title", "Channel", DESCRIPTION)) as meta, patch.object(
+            collector, "_fetch_transcript", return_value=("spoken words here", "en")
+        ):
+            collector.parse(URL)
+            collector.parse(URL)
+
+        assert meta.call_count == 2